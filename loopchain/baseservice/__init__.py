@@ -19,6 +19,7 @@ from .stub_manager import *
 from .object_manager import *
 from .peer_object import *
 from .peer_manager import *
+from .peer_health_tracker import *
 from .common_thread import *
 from .common_process import *
 from .monitor import *
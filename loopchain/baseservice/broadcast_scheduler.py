@@ -13,6 +13,7 @@
 # limitations under the License.
 """gRPC broadcast thread"""
 
+import bisect
 import logging
 import pickle
 import queue
@@ -48,6 +49,9 @@ class BroadcastScheduler(CommonThread):
     SELF_PEER_TARGET_KEY = "self_peer_target"
     LEADER_PEER_TARGET_KEY = "leader_peer_target"
 
+    # upper bounds of the number of txs in AddTxList for the batch size distribution
+    TX_LIST_COUNT_BUCKETS = (1, 8, 32, 128, 512)
+
     def __init__(self, channel="", self_target=""):
         super().__init__()
 
@@ -79,7 +83,21 @@ class BroadcastScheduler(CommonThread):
             "BroadcastVote"
         }
 
-        self.stored_tx = queue.Queue()
+        self.stored_tx = queue.Queue()  # (tx_item, stored time)
+        self.__stored_tx_lock = threading.Lock()
+        self.__stored_tx_bytes = 0
+        self.__relay_tx_count = 0  # txs scheduled by CREATE_TX and not sent yet
+        self.__carried_tx = None  # the tx over the limit of the last AddTxList, it goes first to the next.
+        self.__relay_status = {
+            "max_queue_depth": 0,
+            "rejected_tx": 0,
+            "tx_list_count": 0,
+            "zipped_tx_list_count": 0,
+            "tx_list_size": {self.__get_count_bucket_name(i): 0 for i in range(len(self.TX_LIST_COUNT_BUCKETS) + 1)},
+            "last_latency_seconds": 0,
+            "max_latency_seconds": 0,
+            "total_latency_seconds": 0
+        }
 
         self.__broadcast_pool = futures.ThreadPoolExecutor(conf.MAX_BROADCAST_WORKERS, "BroadcastThread")
         self.__broadcast_queue = queue.PriorityQueue()
@@ -117,6 +135,10 @@ class BroadcastScheduler(CommonThread):
     def schedule_job(self, command, params):
         if command == BroadcastCommand.CREATE_TX:
             priority = (10, time.time())
+            with self.__stored_tx_lock:
+                self.__relay_tx_count += 1
+                self.__relay_status["max_queue_depth"] = max(self.__relay_status["max_queue_depth"],
+                                                             self.__relay_tx_count)
         elif isinstance(params, tuple) and params[0] == "AddTx":
             priority = (10, time.time())
         else:
@@ -127,6 +149,29 @@ class BroadcastScheduler(CommonThread):
         util.logger.spam(f"broadcast_scheduler:schedule_job qsize({self.__broadcast_queue.qsize()})")
         return future
 
+    def is_tx_relay_full(self) -> bool:
+        """Whether txs waiting for AddTxList reach conf.MAX_STORED_TX_COUNT.
+        New txs are refused over it instead of being stored without limit while peers are slow.
+        """
+        if self.__relay_tx_count < conf.MAX_STORED_TX_COUNT:
+            return False
+
+        with self.__stored_tx_lock:
+            self.__relay_status["rejected_tx"] += 1
+        return True
+
+    def get_tx_relay_status(self) -> dict:
+        with self.__stored_tx_lock:
+            status = dict(self.__relay_status)
+            status["tx_list_size"] = dict(self.__relay_status["tx_list_size"])
+            status["queue_depth"] = self.__relay_tx_count
+            status["queue_bytes"] = self.__stored_tx_bytes
+
+        total_latency_seconds = status.pop("total_latency_seconds")
+        status["avg_latency_seconds"] = total_latency_seconds / status["tx_list_count"] \
+            if status["tx_list_count"] else 0
+        return status
+
     def schedule_broadcast(self, method_name, method_param, *, retry_times=None, timeout=None):
         """등록된 모든 Peer 의 동일한 gRPC method 를 같은 파라미터로 호출한다.
         """
@@ -282,26 +327,65 @@ class BroadcastScheduler(CommonThread):
         # logging.debug("BroadcastThread method param: " + str(broadcast_method_param))
         self.__broadcast_run(broadcast_method_name, broadcast_method_param, **broadcast_method_kwparam)
 
-    def __make_tx_list_message(self):
-        tx_list = []
+    def __get_count_bucket_name(self, index):
+        if index < len(self.TX_LIST_COUNT_BUCKETS):
+            return f"<={self.TX_LIST_COUNT_BUCKETS[index]}"
+        return f">{self.TX_LIST_COUNT_BUCKETS[-1]}"
+
+    def __get_stored_tx(self):
+        if self.__carried_tx:
+            stored_tx, self.__carried_tx = self.__carried_tx, None
+            return stored_tx
+        try:
+            return self.stored_tx.get_nowait()
+        except queue.Empty:
+            return None
+
+    def __get_tx_list(self):
+        """coalesce stored txs up to conf.MAX_TX_COUNT_IN_ADDTX_LIST and conf.MAX_TX_BYTES_IN_ADDTX_LIST
+
+        :return: whether txs remain, tx items, stored time of the oldest tx
+        """
+        tx_items = []
         tx_list_size = 0
-        tx_list_count = 0
+        oldest_stored_time = None
         remains = False
-        while not self.stored_tx.empty():
-            stored_tx_item = self.stored_tx.get()
-            tx_list_size += len(stored_tx_item)
-            tx_list_count += 1
-            if tx_list_size >= conf.MAX_TX_SIZE_IN_BLOCK or tx_list_count >= conf.MAX_TX_COUNT_IN_ADDTX_LIST:
-                self.stored_tx.put(stored_tx_item)
+        while True:
+            stored_tx = self.__get_stored_tx()
+            if stored_tx is None:
+                break
+
+            tx_item, stored_time = stored_tx
+            if tx_items and (tx_list_size + len(tx_item) > conf.MAX_TX_BYTES_IN_ADDTX_LIST
+                             or len(tx_items) >= conf.MAX_TX_COUNT_IN_ADDTX_LIST):
+                self.__carried_tx = stored_tx
                 remains = True
                 break
-            tx_list.append(stored_tx_item.get_tx_message())
-        message = loopchain_pb2.TxSendList(
-            channel=self.__channel,
-            tx_list=tx_list
-        )
 
-        return remains, message
+            tx_items.append(tx_item)
+            tx_list_size += len(tx_item)
+            if oldest_stored_time is None:
+                oldest_stored_time = stored_time
+
+        with self.__stored_tx_lock:
+            self.__stored_tx_bytes -= tx_list_size
+            self.__relay_tx_count -= len(tx_items)
+
+        return remains, tx_items, oldest_stored_time
+
+    def __update_relay_status(self, message, tx_count, oldest_stored_time):
+        latency = time.monotonic() - oldest_stored_time
+        bucket_index = bisect.bisect_left(self.TX_LIST_COUNT_BUCKETS, tx_count)
+
+        with self.__stored_tx_lock:
+            status = self.__relay_status
+            status["tx_list_count"] += 1
+            if message.zipped_tx_list:
+                status["zipped_tx_list_count"] += 1
+            status["tx_list_size"][self.__get_count_bucket_name(bucket_index)] += 1
+            status["last_latency_seconds"] = latency
+            status["max_latency_seconds"] = max(status["max_latency_seconds"], latency)
+            status["total_latency_seconds"] += latency
 
     def __send_tx_by_timer(self, **kwargs):
         # util.logger.spam(f"broadcast_scheduler:__send_tx_by_timer")
@@ -314,20 +398,35 @@ class BroadcastScheduler(CommonThread):
             # self.__broadcast_run("AddTx", stored_tx_item.get_tx_message())
 
             # Send multiple tx
-            remains, message = self.__make_tx_list_message()
+            remains, tx_items, oldest_stored_time = self.__get_tx_list()
+            if not tx_items:
+                return
+
+            message = make_tx_list_message(self.__channel, tx_items, conf.ADDTX_LIST_ZIP_THRESHOLD)
             self.__broadcast_run("AddTxList", message)
+            self.__update_relay_status(message, len(tx_items), oldest_stored_time)
             ObjectManager().channel_service.start_leader_complain_timer()
             if remains:
                 self.__send_tx_in_timer()
 
     def __send_tx_in_timer(self, tx_item=None):
+        """Send stored txs after conf.SEND_TX_LIST_DURATION from the first of them,
+        or right away if they fill AddTxList or remain after the last AddTxList.
+        """
         # util.logger.spam(f"broadcast_scheduler:__send_tx_in_timer")
         duration = 0
         if tx_item:
-            self.stored_tx.put(tx_item)
-            duration = conf.SEND_TX_LIST_DURATION
-
-        if TimerService.TIMER_KEY_ADD_TX not in self.__timer_service.timer_list:
+            self.stored_tx.put((tx_item, time.monotonic()))
+            with self.__stored_tx_lock:
+                self.__stored_tx_bytes += len(tx_item)
+                is_full = self.__stored_tx_bytes >= conf.MAX_TX_BYTES_IN_ADDTX_LIST \
+                    or self.stored_tx.qsize() >= conf.MAX_TX_COUNT_IN_ADDTX_LIST
+            if not is_full:
+                duration = conf.SEND_TX_LIST_DURATION
+
+        timer = self.__timer_service.timer_list.get(TimerService.TIMER_KEY_ADD_TX)
+        if timer is None or timer.remain_time() > duration:
+            # A replaced timer does not call back.
             self.__timer_service.add_timer(
                 TimerService.TIMER_KEY_ADD_TX,
                 Timer(
@@ -337,14 +436,14 @@ class BroadcastScheduler(CommonThread):
                     callback_kwargs={}
                 )
             )
-        else:
-            pass
 
     def __handler_create_tx(self, create_tx_param):
         # logging.debug(f"Broadcast create_tx....")
         try:
             tx_item = TxItem.create_tx_item(create_tx_param, self.__channel)
         except Exception as e:
+            with self.__stored_tx_lock:
+                self.__relay_tx_count -= 1
             logging.warning(f"tx in channel({self.__channel})")
             logging.warning(f"__handler_create_tx: meta({create_tx_param})")
             logging.warning(f"tx dumps fail ({e})")
@@ -359,6 +458,8 @@ class BroadcastScheduler(CommonThread):
         # stub_to_self_peer = __thread_variables[self.THREAD_VARIABLE_STUB_TO_SELF_PEER]
 
         self.__thread_variables[self.THREAD_VARIABLE_PEER_STATUS] = PeerThreadStatus.normal
+        if not self.stored_tx.empty():
+            self.__send_tx_in_timer()
 
     def __handler_connect_to_self_peer(self, connect_param):
         # 자신을 생성한 부모 Peer 에 접속하기 위한 stub 을 만든다.
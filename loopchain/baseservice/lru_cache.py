@@ -0,0 +1,101 @@
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""LRU cache which is limited by the total size of items instead of the number of items"""
+
+import threading
+from collections import OrderedDict
+
+
+class SizedLRUCache:
+    """The size of an item is given when it is put, e.g. the length of the record which the item is decoded from.
+    Least recently used items are evicted while the total size is over max_size.
+    The cache does not measure the memory of items, so max_size bounds only the sizes given by put.
+    """
+
+    def __init__(self, max_size: int):
+        self._max_size = max_size
+        self._size = 0
+        self._lock = threading.Lock()
+        self.d = OrderedDict()
+
+        self.hit_count = 0
+        self.miss_count = 0
+
+    @property
+    def max_size(self):
+        return self._max_size
+
+    @property
+    def size(self):
+        return self._size
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value, _ = self.d[key]
+            except KeyError:
+                self.miss_count += 1
+                return default
+
+            self.d.move_to_end(key)
+            self.hit_count += 1
+            return value
+
+    def put(self, key, value, size: int):
+        with self._lock:
+            self.__pop(key)
+            if size > self._max_size:
+                return
+
+            self.d[key] = (value, size)
+            self._size += size
+            while self._size > self._max_size:
+                _, (_, evicted_size) = self.d.popitem(last=False)
+                self._size -= evicted_size
+
+    def pop(self, key):
+        with self._lock:
+            return self.__pop(key)
+
+    def clear(self):
+        with self._lock:
+            self.d.clear()
+            self._size = 0
+
+    def __pop(self, key):
+        item = self.d.pop(key, None)
+        if item is None:
+            return None
+
+        value, size = item
+        self._size -= size
+        return value
+
+    def get_status(self) -> dict:
+        return {
+            "count": len(self.d),
+            "size": self._size,
+            "max_size": self._max_size,
+            "hit": self.hit_count,
+            "miss": self.miss_count
+        }
+
+    def __contains__(self, key):
+        return key in self.d
+
+    def __len__(self):
+        return len(self.d)
+
+    def __repr__(self):
+        return repr(self.d)
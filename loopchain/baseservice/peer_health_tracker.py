@@ -0,0 +1,46 @@
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Check health of peers in background for leader rotation"""
+
+import logging
+import threading
+
+from loopchain import configure as conf
+from loopchain.baseservice import CommonThread, PeerManager
+
+
+class PeerHealthTracker(CommonThread):
+    """Check health of peers of the peer manager every SLEEP_SECONDS_IN_PEER_HEALTH_TRACKER.
+    Leader rotation reads the result without calling peers.
+    """
+
+    def __init__(self, peer_manager: PeerManager):
+        CommonThread.__init__(self)
+        self.__peer_manager = peer_manager
+        self.__stop_event = threading.Event()
+
+    def stop(self):
+        super().stop()
+        self.__stop_event.set()
+
+    def run(self, event: threading.Event):
+        event.set()
+
+        while self.is_run():
+            try:
+                self.__peer_manager.check_peer_health()
+            except Exception as e:
+                logging.warning(f"PeerHealthTracker fail to check health of peers ({e})")
+
+            self.__stop_event.wait(conf.SLEEP_SECONDS_IN_PEER_HEALTH_TRACKER)
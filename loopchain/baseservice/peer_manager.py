@@ -17,6 +17,8 @@ import logging
 import math
 import pickle
 import threading
+import time
+from collections import OrderedDict
 from typing import Union
 
 import loopchain.utils as util
@@ -40,6 +42,19 @@ class PeerListData:
         self.__peer_leader: dict = {}
         # { group_id : { order:peer_id } 인 order 순서 정보
         self.__peer_order_list: dict = {}
+        # version of the peer list. It increases whenever a peer or a leader changes.
+        self.__version = 0
+        # { peer_id : version when the peer is changed } in order of the version
+        self.__peer_versions: OrderedDict = OrderedDict()
+        # { peer_id : version when the peer is removed } in order of the version
+        self.__removed_peer_versions: OrderedDict = OrderedDict()
+        # changes before this version are not remembered.
+        self.__base_version = 0
+
+    def __setstate__(self, state):
+        """peer list data pickled before the version has no versions of peers"""
+        self.__init__()
+        self.__dict__.update(state)
 
     @property
     def peer_leader(self):
@@ -65,6 +80,115 @@ class PeerListData:
     def peer_info_list(self, peer_info_list):
         self.__peer_info_list = peer_info_list
 
+    @property
+    def version(self):
+        return self.__version
+
+    def reset_version(self, version):
+        """Forget changes before the version. Changes since an older version are the whole peer list."""
+        self.__version = version
+        self.__base_version = version
+        self.__peer_versions.clear()
+        self.__removed_peer_versions.clear()
+
+    def change_peer(self, peer_id):
+        self.__version += 1
+        self.__peer_versions.pop(peer_id, None)
+        self.__peer_versions[peer_id] = self.__version
+        self.__removed_peer_versions.pop(peer_id, None)
+
+    def remove_peer(self, peer_id):
+        self.__version += 1
+        self.__peer_versions.pop(peer_id, None)
+        self.__removed_peer_versions.pop(peer_id, None)
+        self.__removed_peer_versions[peer_id] = self.__version
+
+        if len(self.__removed_peer_versions) > conf.PEER_LIST_REMOVED_HISTORY_SIZE:
+            _, self.__base_version = self.__removed_peer_versions.popitem(last=False)
+
+    def change_leader(self):
+        self.__version += 1
+
+    def get_changes(self, since_version):
+        """
+        :return: (changed peer_ids, removed peer_ids) since the version, None if the whole peer list is needed
+        """
+        if since_version < self.__base_version or since_version > self.__version:
+            return None
+
+        return self.__get_peer_ids_since(self.__peer_versions, since_version), \
+            self.__get_peer_ids_since(self.__removed_peer_versions, since_version)
+
+    @staticmethod
+    def __get_peer_ids_since(peer_versions: OrderedDict, since_version):
+        peer_ids = []
+        for peer_id, version in reversed(peer_versions.items()):
+            if version <= since_version:
+                break
+            peer_ids.append(peer_id)
+        return peer_ids
+
+
+class PeerOrderRing:
+    """Orders of peers in a ring, to find the next order of a peer in constant time.
+    Orders are added in ascending order mostly, so adding the largest order takes constant time too.
+    """
+    def __init__(self, orders=()):
+        # { order : next order } and { order : previous order }
+        self.__next: dict = {}
+        self.__prev: dict = {}
+        self.__last = None
+
+        for order in sorted(orders):
+            self.add(order)
+
+    def __len__(self):
+        return len(self.__next)
+
+    def __contains__(self, order):
+        return order in self.__next
+
+    def next(self, order):
+        """:return: the next order of the order. It raises KeyError if the order is not in the ring."""
+        return self.__next[order]
+
+    def add(self, order):
+        if order in self.__next:
+            return
+
+        if self.__last is None:
+            self.__next[order] = self.__prev[order] = order
+            self.__last = order
+            return
+
+        if order > self.__last:
+            prev_order = self.__last
+            self.__last = order
+        else:
+            # an order between others, ex) peers loaded out of order.
+            prev_order = max((each for each in self.__next if each < order), default=self.__last)
+
+        next_order = self.__next[prev_order]
+        self.__next[prev_order] = order
+        self.__prev[order] = prev_order
+        self.__next[order] = next_order
+        self.__prev[next_order] = order
+
+    def remove(self, order):
+        next_order = self.__next.pop(order, None)
+        if next_order is None:
+            return
+
+        prev_order = self.__prev.pop(order)
+        if next_order == order:
+            self.__last = None
+            return
+
+        self.__next[prev_order] = next_order
+        self.__prev[next_order] = prev_order
+        if self.__last == order:
+            self.__last = prev_order
+
 
 class PeerManager:
     def __init__(self, channel_name):
@@ -74,6 +198,8 @@ class PeerManager:
         self.peer_list_data = PeerListData()
         self.__channel_name = channel_name
         self.__peer_object_list = {}
+        # { group_id : PeerOrderRing } of peer_order_list for leader rotation
+        self.__peer_order_rings = {}
 
         # peer group 은 전체 peer 가 등록된 ALL GROUP 과 개별 group_id 로 구분된 리스트가 존재한다.
         self.__init_peer_group(conf.ALL_GROUP_ID)
@@ -82,6 +208,13 @@ class PeerManager:
 
         self.__leader_complain_count = 0
         self.__highest_block_height = -1    # for RS heartbeat
+        self.__heartbeat_status = {
+            "count": 0,
+            "peer_count": 0,
+            "fail_count": 0,
+            "last_seconds": 0,
+            "max_seconds": 0
+        }
 
     @property
     def peer_object_list(self) -> dict:
@@ -132,15 +265,96 @@ class PeerManager:
         if do_reset:
             self.__reset_peer_status()
         self.__set_peer_object_list()
+        self.__set_peer_order_rings()
 
         return self
 
+    def dump_delta(self, since_version) -> bytes:
+        """Dump changes of the peer list since the version in JSON.
+        It has the whole peer list if since_version is 0 or changes since it are not remembered.
+
+        :param since_version: version of the peer list which the requester has
+        :return: dump data of the peer list delta
+        """
+        changes = self.peer_list_data.get_changes(since_version) if since_version > 0 else None
+        all_peers = self.peer_list[conf.ALL_GROUP_ID]
+        if changes is None:
+            peers, removed_peer_ids = list(all_peers.values()), []
+        else:
+            changed_peer_ids, removed_peer_ids = changes
+            peers = [all_peers[peer_id] for peer_id in changed_peer_ids if peer_id in all_peers]
+
+        delta = {
+            "version": self.peer_list_data.version,
+            "full": changes is None,
+            "peers": [peer.to_dict() for peer in peers],
+            "removed": removed_peer_ids,
+            "leader": self.peer_leader
+        }
+        return json.dumps(delta).encode(encoding='UTF-8')
+
+    def load_delta(self, delta_dumped: bytes, do_reset=False):
+        """Apply a peer list delta from dump_delta.
+
+        :param delta_dumped: dump data of the peer list delta
+        :param do_reset: reset status of peers if the delta has the whole peer list
+        :return: version of the delta, changed peers, removed peers
+        """
+        delta = json.loads(delta_dumped)
+        peers = [PeerInfo.from_dict(peer_info_data) for peer_info_data in delta["peers"]]
+
+        if delta["full"]:
+            peer_ids = {peer.peer_id for peer in peers}
+            removed_peers = [peer for peer_id, peer in self.peer_list[conf.ALL_GROUP_ID].items()
+                             if peer_id not in peer_ids]
+            self.load_peers(peers, delta["leader"], delta["version"], do_reset)
+            return delta["version"], peers, removed_peers
+
+        removed_peers = []
+        for peer_id in delta["removed"]:
+            removed_peer = self.peer_list[conf.ALL_GROUP_ID].get(peer_id)
+            if removed_peer:
+                self.__remove_peer_from_group(peer_id, removed_peer.group_id)
+                removed_peers.append(removed_peer)
+
+        for peer in peers:
+            self.add_peer(peer)
+        self.peer_leader.update(delta["leader"])
+
+        return delta["version"], peers, removed_peers
+
+    def load_peers(self, peers: list, peer_leader: dict, version, do_reset=True):
+        """Rebuild the peer list with peers at the version
+
+        :param peers: [PeerInfo]
+        :param peer_leader: { group_id : leader_order }
+        :param version: version of the peer list
+        :param do_reset: reset status of peers
+        """
+        self.peer_list_data = PeerListData()
+        self.__peer_object_list = {}
+        self.__peer_order_rings = {}
+        self.__init_peer_group(conf.ALL_GROUP_ID)
+
+        for peer in peers:
+            self.add_peer(peer)
+        self.peer_leader.update(peer_leader)
+
+        if do_reset:
+            self.__reset_peer_status()
+        self.peer_list_data.reset_version(version)
+
     def __set_peer_object_list(self):
         """ peer_info_list convert peer_object_list"""
 
         for group_id in list(self.peer_list_data.peer_info_list.keys()):
             self.__peer_object_list[group_id] = self.__set_peer_object_list_in_group(group_id)
 
+    def __set_peer_order_rings(self):
+        self.__peer_order_rings = {
+            group_id: PeerOrderRing(peer_order_list) for group_id, peer_order_list in self.peer_order_list.items()
+        }
+
     def __set_peer_object_list_in_group(self, group_id):
         """peer_info_list[group_id] -> peer_object_list[group_id]
 
@@ -209,6 +423,9 @@ class PeerManager:
 
         # add_peer logic must be atomic
         with self.__add_peer_lock:
+            prev_peer = self.peer_list[conf.ALL_GROUP_ID].get(peer_info.peer_id)
+            is_leader_changed = False
+
             if peer_info.order <= 0:
                 if peer_info.peer_id in self.peer_list[peer_info.group_id]:
                     peer_info.order = self.peer_list[peer_info.group_id][peer_info.peer_id].order
@@ -221,26 +438,42 @@ class PeerManager:
             if (self.peer_leader[peer_info.group_id] == 0) or (len(self.peer_list[peer_info.group_id]) == 0):
                 logging.debug("Set Group Leader Peer: " + str(peer_info.order))
                 self.peer_leader[peer_info.group_id] = peer_info.order
+                is_leader_changed = True
 
             if (self.peer_leader[conf.ALL_GROUP_ID] == 0) or (len(self.peer_list[conf.ALL_GROUP_ID]) == 0):
                 logging.debug("Set ALL Leader Peer: " + str(peer_info.order))
                 self.peer_leader[conf.ALL_GROUP_ID] = peer_info.order
+                is_leader_changed = True
 
             self.peer_list[peer_info.group_id][peer_info.peer_id] = peer_info
             self.peer_list[conf.ALL_GROUP_ID][peer_info.peer_id] = peer_info
             self.peer_order_list[peer_info.group_id][peer_info.order] = peer_info.peer_id
             self.peer_order_list[conf.ALL_GROUP_ID][peer_info.order] = peer_info.peer_id
+            self.__peer_order_rings[peer_info.group_id].add(peer_info.order)
+            self.__peer_order_rings[conf.ALL_GROUP_ID].add(peer_info.order)
             self.__peer_object_list[peer_info.group_id][peer_info.peer_id] = peer
             self.__peer_object_list[conf.ALL_GROUP_ID][peer_info.peer_id] = peer
 
+            if prev_peer is None or self.__is_peer_changed(prev_peer, peer_info):
+                self.peer_list_data.change_peer(peer_info.peer_id)
+            elif is_leader_changed:
+                self.peer_list_data.change_leader()
+
         return peer_info.order
 
+    @staticmethod
+    def __is_peer_changed(prev_peer: PeerInfo, peer_info: PeerInfo):
+        """A peer added again with the same data is not a change even if its status_update_time is new."""
+        prev_peer_data, peer_data = prev_peer.to_dict(), peer_info.to_dict()
+        del prev_peer_data["status_update_time"], peer_data["status_update_time"]
+        return prev_peer_data != peer_data
+
     def update_peer_status(self, peer_id, group_id=None, peer_status=PeerStatus.connected):
         if group_id is None:
             group_id = conf.ALL_GROUP_ID
         try:
             peer = self.peer_list[group_id][peer_id]
-            peer.status = peer_status
+            self.__set_peer_status(peer, peer_status)
             return peer
         except Exception as e:
             logging.warning(f"fail update peer status peer_id({group_id}, {peer_id})")
@@ -261,9 +494,16 @@ class PeerManager:
             self.add_peer(peer)
 
         if group_id is None:
-            self.peer_leader[conf.ALL_GROUP_ID] = peer.order
-        else:
+            group_id = conf.ALL_GROUP_ID
+
+        if self.peer_leader.get(group_id) != peer.order:
             self.peer_leader[group_id] = peer.order
+            self.peer_list_data.change_leader()
+
+    def __set_peer_status(self, peer: PeerInfo, peer_status: PeerStatus):
+        if peer.status != peer_status:
+            peer.status = peer_status
+            self.peer_list_data.change_peer(peer.peer_id)
 
     def get_leader_peer(self, group_id=None, is_complain_to_rs=False, is_peer=True) -> PeerInfo:
         """현재는 sub leader 에 대한 처리는 하지 않는다.
@@ -361,8 +601,14 @@ class PeerManager:
 
         return leader_peer
 
-    def get_next_leader_peer(self, group_id=None, current_leader_peer_id=None, is_only_alive=False):
+    def get_next_leader_peer(self, group_id=None, current_leader_peer_id=None, is_only_alive=None):
+        """
+        :param is_only_alive: skip peers which are not alive. None follows conf.ENABLE_PEER_HEALTH_TRACKER,
+        so leader rotation skips dead peers when PeerHealthTracker checks them.
+        """
         util.logger.spam(f"peer_manager:get_next_leader_peer current_leader_peer_id({current_leader_peer_id})")
+        if is_only_alive is None:
+            is_only_alive = conf.ENABLE_PEER_HEALTH_TRACKER
 
         if not current_leader_peer_id:
             leader_peer = self.get_leader_peer(group_id, is_complain_to_rs=True)
@@ -372,73 +618,49 @@ class PeerManager:
         return self.__get_next_peer(leader_peer, group_id, is_only_alive)
 
     def __get_next_peer(self, peer, group_id=None, is_only_alive=False):
+        """Find the next peer of the peer in the order ring.
+        With is_only_alive, it skips peers which are not connected or failed at the last health check
+        of PeerHealthTracker. It does not call peers, so a dead peer does not delay leader rotation.
+        If no peer is alive, it returns the next peer.
+        """
         if peer is None:
             return None
 
         if group_id is None:
             group_id = conf.ALL_GROUP_ID
 
-        order_list = list(self.peer_order_list[group_id].keys())
-        order_list.sort()
-
-        # logging.debug("order list: " + str(order_list))
-        # logging.debug("peer.order: " + str(peer.order))
-
-        peer_order_position = order_list.index(peer.order)
-        next_order_position = peer_order_position + 1
-        peer_count = len(order_list)
-
-        util.logger.spam(f"peer_manager:__get_next_peer peer_count({peer_count})")
-
-        for i in range(peer_count):
-            # Prevent out of range
-            if next_order_position >= peer_count:
-                next_order_position = 0
-
-            # It doesn't matter that peer status is connected or not, when 'is_only_alive' is false.
-            if not is_only_alive:
-                break
-
-            peer_order = order_list[next_order_position]
-            peer_id = self.peer_order_list[group_id][peer_order]
-            peer_each = self.peer_list[group_id][peer_id]
-
-            # It need to check real time status of peer, if 'is_only_alive' is true and status is connected.
-            if is_only_alive and peer_each.status == PeerStatus.connected:
-
-                next_peer_id = self.peer_order_list[group_id][order_list[next_order_position]]
-                leader_peer = self.peer_list[group_id][next_peer_id]
-                stub_manager = self.get_peer_stub_manager(leader_peer)
-
-                response = stub_manager.call_in_times(
-                    "Request", loopchain_pb2.Message(
-                        code=message_code.Request.status,
-                        channel=self.__channel_name
-                    ), is_stub_reuse=True)
-
-                # If it has no response, increase count of 'next_order_position' for checking next peer.
-                if response is not None:
-                    break  # LABEL 1
-
-            next_order_position += 1
-            util.logger.spam(f"peer_manager:__get_next_peer next_order_position({next_order_position})")
-
-        if next_order_position >= peer_count:
-            util.logger.spam(f"peer_manager:__get_next_peer Fail break at LABEL 1")
-            next_order_position = 0
-
         try:
-            next_peer_id = self.peer_order_list[group_id][order_list[next_order_position]]
-            logging.debug("peer_manager:__get_next_peer next_leader_peer_id: " + str(next_peer_id))
+            peer_order_ring = self.__peer_order_rings[group_id]
+            next_order = peer_order_ring.next(peer.order)
+            util.logger.spam("peer_manager:__get_next_peer peer_count(%s)", len(peer_order_ring))
+
+            if is_only_alive:
+                alive_order = next_order
+                for _ in range(len(peer_order_ring)):
+                    if self.__is_alive_peer(self.peer_order_list[group_id][alive_order], group_id):
+                        next_order = alive_order
+                        break
+                    alive_order = peer_order_ring.next(alive_order)
+                else:
+                    util.logger.spam("peer_manager:__get_next_peer there is no alive peer")
+
+            next_peer_id = self.peer_order_list[group_id][next_order]
+            logging.debug("peer_manager:__get_next_peer next_leader_peer_id: %s", next_peer_id)
             return self.peer_list[group_id][next_peer_id]
-        except (IndexError, KeyError) as e:
+        except KeyError as e:
             logging.warning(f"peer_manager:__get_next_peer there is no next peer ({e})")
-            util.logger.spam(f"peer_manager:__get_next_peer "
-                             f"\npeer_id({peer.peer_id}), group_id({group_id}), "
-                             f"\npeer_order_list({self.peer_object_list}), "
-                             f"\npeer_list[group_id]({self.peer_list[group_id]})")
+            util.logger.spam("peer_manager:__get_next_peer "
+                             "\npeer_id(%s), group_id(%s), "
+                             "\npeer_order_list(%s), "
+                             "\npeer_list[group_id](%s)",
+                             peer.peer_id, group_id, self.peer_object_list, self.peer_list.get(group_id))
             return None
 
+    def __is_alive_peer(self, peer_id, group_id):
+        peer_object = self.__peer_object_list[group_id].get(peer_id)
+        return peer_object is not None \
+            and peer_object.peer_info.status == PeerStatus.connected and peer_object.is_alive is not False
+
     def get_next_leader_stub_manager(self, group_id=None):
         """다음 리더 peer, stub manager 을 식별한다.
 
@@ -592,17 +814,66 @@ class PeerManager:
                     )
         return new_leader
 
+    @staticmethod
+    def __probe_peers(peers_with_stub, method_name, message) -> list:
+        """call a gRPC method of peers concurrently. Each call is limited by conf.GRPC_TIMEOUT_PEER_PROBE,
+        so a round takes the time of the slowest peer, not the sum of them.
+
+        :param peers_with_stub: [(peer, stub_manager)]
+        :return: [(peer, future of the call or None if it could not be called)] in the same order
+        """
+        probes = []
+        for peer_each, stub_manager in peers_with_stub:
+            future = None
+            if stub_manager is not None:
+                future = stub_manager.call_async(method_name, message,
+                                                 call_back=lambda result: None,
+                                                 timeout=conf.GRPC_TIMEOUT_PEER_PROBE)
+            probes.append((peer_each, future))
+        return probes
+
+    @staticmethod
+    def __get_probe_result(future):
+        """:return: the response of a probe. It raises the exception of the call."""
+        if future is None:
+            raise Exception("fail to call")
+        return future.result()
+
+    def check_peer_health(self, group_id=None):
+        """Call peers concurrently and keep whether each peer responds in its PeerObject.
+        PeerHealthTracker calls it in background for __get_next_peer.
+        """
+        if group_id is None:
+            group_id = conf.ALL_GROUP_ID
+
+        peer_objects = list(self.__peer_object_list[group_id].values())
+        probes = self.__probe_peers(
+            [(peer_object.peer_info, peer_object.stub_manager) for peer_object in peer_objects],
+            "Request", loopchain_pb2.Message(code=message_code.Request.status, channel=self.__channel_name))
+
+        for peer_object, (peer_each, future) in zip(peer_objects, probes):
+            try:
+                self.__get_probe_result(future)
+                peer_object.is_alive = True
+            except Exception as e:
+                if peer_object.is_alive is not False:
+                    logging.warning(f"peer({peer_each.peer_id}) is not alive. ({e})")
+                peer_object.is_alive = False
+
+    def get_heartbeat_status(self) -> dict:
+        return dict(self.__heartbeat_status)
+
     def __find_highest_peer(self, group_id) -> PeerInfo:
         # 강제로 list 를 적용하여 값을 복사한 다음 사용한다. (중간에 값이 변경될 때 발생하는 오류를 방지하기 위해서)
         most_height = 0
         most_height_peer = None
-        for peer_id in list(self.peer_list[group_id]):
-            peer_each = self.peer_list[group_id][peer_id]
-            stub_manager = peer_each.stub_manager
+        probes = self.__probe_peers(
+            [(peer_each, peer_each.stub_manager) for peer_each in list(self.peer_list[group_id].values())],
+            "GetStatus", loopchain_pb2.StatusRequest(request="find highest peer"))
+
+        for peer_each, future in probes:
             try:
-                response = stub_manager.call("GetStatus",
-                                             loopchain_pb2.StatusRequest(request="find highest peer"),
-                                             is_stub_reuse=True)
+                response = self.__get_probe_result(future)
 
                 peer_status = json.loads(response.status)
                 if int(peer_status["block_height"]) >= most_height:
@@ -624,25 +895,30 @@ class PeerManager:
         delete_doubt_peers = []
         check_leader_peer_count = 0
         highest_peer = None
+        start_time = time.monotonic()
 
+        peers_with_stub = []
         for peer_id in list(self.__peer_object_list[group_id]):
             peer_each = self.peer_list[group_id][peer_id]
-            stub_manager = self.get_peer_stub_manager(peer_each, group_id)
-            peer_object_each = self.__peer_object_list[group_id][peer_id]
+            peers_with_stub.append((peer_each, self.get_peer_stub_manager(peer_each, group_id)))
+        probes = self.__probe_peers(peers_with_stub, "Request", loopchain_pb2.Message(
+            code=message_code.Request.status,
+            channel=self.__channel_name,
+            message="check peer status by rs",
+            meta=json.dumps({"highest_block_height": self.__highest_block_height})
+        ))
+
+        for peer_each, future in probes:
+            peer_object_each = self.__peer_object_list[group_id][peer_each.peer_id]
 
             try:
-                response = stub_manager.call(
-                    "Request", loopchain_pb2.Message(
-                        code=message_code.Request.status,
-                        channel=self.__channel_name,
-                        message="check peer status by rs",
-                        meta=json.dumps({"highest_block_height": self.__highest_block_height})
-                    ), is_stub_reuse=True)
+                response = self.__get_probe_result(future)
                 if response.code != message_code.Response.success:
                     raise Exception
 
                 peer_object_each.no_response_count_reset()
-                peer_each.status = PeerStatus.connected
+                peer_object_each.is_alive = True
+                self.__set_peer_status(peer_each, PeerStatus.connected)
                 peer_status = json.loads(response.meta)
 
                 if peer_status["state"] == "BlockGenerate":
@@ -663,6 +939,7 @@ class PeerManager:
                 logging.warning("there is disconnected peer peer_id(" + peer_each.peer_id +
                                 ") gRPC Exception: " + str(e))
                 peer_object_each.no_response_count_up()
+                peer_object_each.is_alive = False
 
                 util.logger.spam(
                     f"peer_manager::check_peer_status "
@@ -672,7 +949,7 @@ class PeerManager:
                 delete_doubt_peers.append(peer_each)
 
                 if peer_object_each.no_response_count >= conf.NO_RESPONSE_COUNT_ALLOW_BY_HEARTBEAT:
-                    peer_each.status = PeerStatus.disconnected
+                    self.__set_peer_status(peer_each, PeerStatus.disconnected)
                     logging.debug(f"peer status update time: {peer_each.status_update_time}")
                     logging.debug(f"this peer will remove {peer_each.peer_id}")
                     self.remove_peer(peer_each.peer_id, peer_each.group_id)
@@ -685,6 +962,8 @@ class PeerManager:
                 #     self.remove_peer(peer_each.peer_id, peer_each.group_id)
                 #     delete_peer_list.append(peer_each)
 
+        self.__update_heartbeat_status(len(probes), len(delete_doubt_peers), time.monotonic() - start_time)
+
         # if len(delete_peer_list) > 0 and check_leader_peer_count != 1:
         if check_leader_peer_count != 1:
             logging.warning(f"({self.__channel_name}) Leader Peer Count: ({check_leader_peer_count}) "
@@ -717,6 +996,18 @@ class PeerManager:
         # return delete confirmed peers only when leader is alive (while network is working).
         return delete_peer_list
 
+    def __update_heartbeat_status(self, peer_count, fail_count, seconds):
+        status = self.__heartbeat_status
+        status["count"] += 1
+        status["peer_count"] = peer_count
+        status["fail_count"] = fail_count
+        status["last_seconds"] = seconds
+        status["max_seconds"] = max(status["max_seconds"], seconds)
+
+        if seconds > conf.SLEEP_SECONDS_IN_RADIOSTATION_HEARTBEAT:
+            logging.warning(f"({self.__channel_name}) heartbeat to {peer_count} peers took {seconds:.3f}s, "
+                            f"longer than its interval({conf.SLEEP_SECONDS_IN_RADIOSTATION_HEARTBEAT}s)")
+
     def reset_peers(self, group_id, reset_action):
         if group_id is None:
             for search_group in list(self.peer_list.keys()):
@@ -726,12 +1017,14 @@ class PeerManager:
 
     def __reset_peers_in_group(self, group_id, reset_action):
         # 강제로 list 를 적용하여 값을 복사한 다음 사용한다. (중간에 값이 변경될 때 발생하는 오류를 방지하기 위해서)
-        for peer_id in list(self.peer_list[group_id]):
-            peer_each = self.peer_list[group_id][peer_id]
-            stub_manager = self.get_peer_stub_manager(peer_each, group_id)
+        probes = self.__probe_peers(
+            [(peer_each, self.get_peer_stub_manager(peer_each, group_id))
+             for peer_each in list(self.peer_list[group_id].values())],
+            "GetStatus", loopchain_pb2.StatusRequest(request="reset peers in group"))
+
+        for peer_each, future in probes:
             try:
-                stub_manager.call("GetStatus", loopchain_pb2.StatusRequest(request="reset peers in group"),
-                                  is_stub_reuse=True)
+                self.__get_probe_result(future)
             except Exception as e:
                 logging.warning("gRPC Exception: " + str(e))
                 logging.debug("remove this peer(target): " + str(peer_each.target))
@@ -745,7 +1038,6 @@ class PeerManager:
             del self.peer_object_list[group_id]
 
     def __init_peer_group(self, group_id):
-        logging.debug(f"before init order list {self.peer_order_list}")
         if group_id not in self.peer_list.keys():
             logging.debug("init group peer_list: " + str(group_id))
             self.peer_list[group_id] = {}
@@ -762,6 +1054,9 @@ class PeerManager:
             logging.debug("init group __peer_object_list: " + str(group_id))
             self.__peer_object_list[group_id] = {}
 
+        if group_id not in self.__peer_order_rings:
+            self.__peer_order_rings[group_id] = PeerOrderRing(self.peer_order_list[group_id])
+
     def __make_peer_order(self, peer):
         """소속된 그룹과 상관없이 전체 peer 가 순서에 대한 order 값을 가진다.
         이 과정은 중복된 order 발급을 방지하기 위하여 atomic 하여야 한다.
@@ -769,18 +1064,8 @@ class PeerManager:
         :param peer:
         :return:
         """
-        last_order = 0
-        # logging.debug("Peer List is: " + str(self.peer_list))
-        # logging.debug("Peer List of peer group: " + str(self.peer_list[peer.group_id]))
-
-        # 기존에 등록된 peer_id 는 같은 order 를 재사용한다.
-
-        for group_id in list(self.peer_list.keys()):
-            for peer_id in self.peer_list[group_id]:
-                peer_each = self.peer_list[group_id][peer_id]
-                logging.debug("peer each: " + str(peer_each))
-                last_order = [last_order, peer_each.order][last_order < peer_each.order]
-
+        # every peer is in ALL group, so the last order is the last one of ALL group.
+        last_order = max(self.peer_order_list[conf.ALL_GROUP_ID], default=0)
         last_order += 1
 
         return last_order
@@ -824,6 +1109,8 @@ class PeerManager:
             del self.__peer_object_list[group_id]
         if group_id in self.peer_order_list:
             del self.peer_order_list[group_id]
+        if group_id in self.__peer_order_rings:
+            del self.__peer_order_rings[group_id]
         if group_id in self.peer_leader:
             del self.peer_leader[group_id]
 
@@ -835,8 +1122,13 @@ class PeerManager:
             self.__peer_object_list[group_id].pop(peer_id, None)
         if group_id in self.peer_order_list and removed_peer:
             self.peer_order_list[group_id].pop(removed_peer.order, None)
+        if group_id in self.__peer_order_rings and removed_peer:
+            self.__peer_order_rings[group_id].remove(removed_peer.order)
         self.peer_leader.pop(peer_id, None)
 
+        if group_id == conf.ALL_GROUP_ID and removed_peer:
+            self.peer_list_data.remove_peer(peer_id)
+
         if group_id != conf.ALL_GROUP_ID:
             self.__remove_peer_from_group(peer_id, conf.ALL_GROUP_ID)
             self.__clear_group(group_id)
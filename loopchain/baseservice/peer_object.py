@@ -32,7 +32,8 @@ class PeerInfo:
     """Peer Object"""
 
     def __init__(self, peer_id: str, group_id: str,
-                 target: str = "", status: PeerStatus = PeerStatus.unknown, order: int = 0):
+                 target: str = "", status: PeerStatus = PeerStatus.unknown, order: int = 0,
+                 status_update_time: datetime.datetime = None):
         """ create PeerInfo
         if connected peer status PeerStatus.connected
 
@@ -41,6 +42,7 @@ class PeerInfo:
         :param target: grpc target info default ""
         :param status: connect status if db loaded peer to PeerStatus.unknown default ""
         :param order:
+        :param status_update_time: the time of the last status change, default now
         :return:
         """
         self.__peer_id = peer_id
@@ -48,7 +50,7 @@ class PeerInfo:
         self.__order: int = order
         self.__target: str = target
 
-        self.__status_update_time = datetime.datetime.now()
+        self.__status_update_time = status_update_time or datetime.datetime.now()
         self.__status = status
 
     @property
@@ -89,6 +91,27 @@ class PeerInfo:
     def status_update_time(self):
         return self.__status_update_time
 
+    def to_dict(self) -> dict:
+        """portable data of PeerInfo for the peer list delta and the peer list db of RS"""
+        return {
+            "peer_id": self.__peer_id,
+            "group_id": self.__group_id,
+            "target": self.__target,
+            "order": self.__order,
+            "status": int(self.__status),
+            "status_update_time": self.__status_update_time.timestamp()
+        }
+
+    @staticmethod
+    def from_dict(peer_info_data: dict) -> 'PeerInfo':
+        # data of older nodes has no status_update_time.
+        status_update_time = peer_info_data.get("status_update_time")
+        if status_update_time is not None:
+            status_update_time = datetime.datetime.fromtimestamp(status_update_time)
+
+        return PeerInfo(peer_info_data["peer_id"], peer_info_data["group_id"], peer_info_data["target"],
+                        PeerStatus(peer_info_data["status"]), peer_info_data["order"], status_update_time)
+
 
 class PeerObject:
     """Peer object has PeerInfo and live data"""
@@ -103,6 +126,8 @@ class PeerObject:
         self.__stub_manager: StubManager = None
         self.__cert_verifier = None
         self.__no_response_count = 0
+        # result of the last health check, None if it is not checked yet.
+        self.__is_alive: bool = None
         self.__channel = channel
 
         self.__create_live_data()
@@ -132,6 +157,14 @@ class PeerObject:
     def channel(self):
         return self.__channel
 
+    @property
+    def is_alive(self) -> bool:
+        return self.__is_alive
+
+    @is_alive.setter
+    def is_alive(self, is_alive: bool):
+        self.__is_alive = is_alive
+
     def no_response_count_up(self):
         self.__no_response_count += 1
 
@@ -15,17 +15,23 @@
 This object has same interface with gRPC stub manager"""
 
 import logging
+import threading
 import requests
 
 from concurrent.futures import ThreadPoolExecutor
 from jsonrpcclient.exceptions import ReceivedErrorResponse
 from jsonrpcclient.http_client import HTTPClient
+from requests.adapters import HTTPAdapter
 
 import loopchain.utils as util
 from loopchain import configure as conf
 
 
 class RestStubManager:
+    # HTTP adapters by target. Stubs to the same target share the keep-alive connections in the pool of the adapter.
+    __adapters = {}
+    __adapters_lock = threading.Lock()
+
     def __init__(self, target, channel=None, for_rs_target=True):
         util.logger.spam(f"RestStubManager:init target({target})")
         if channel is None:
@@ -66,6 +72,29 @@ class RestStubManager:
 
         self.__executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="RestStubThread")
 
+        self.__session = self.__mount_adapter(requests.Session())
+        self.__clients = {}
+
+    def __mount_adapter(self, session: requests.Session) -> requests.Session:
+        with RestStubManager.__adapters_lock:
+            adapter = RestStubManager.__adapters.get(self.__target)
+            if adapter is None:
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=conf.REST_CLIENT_POOL_SIZE)
+                RestStubManager.__adapters[self.__target] = adapter
+
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.verify = conf.REST_SSL_VERIFY
+        return session
+
+    def __get_client(self, url) -> HTTPClient:
+        client = self.__clients.get(url)
+        if client is None:
+            client = HTTPClient(url)
+            self.__mount_adapter(client.session)
+            self.__clients[url] = client
+        return client
+
     @property
     def target(self):
         return self.__target
@@ -74,7 +103,7 @@ class RestStubManager:
         method_name = "GetBlockByHeight"
 
         try:
-            HTTPClient(self.__version_urls[conf.ApiVersion.node]).request(
+            self.__get_client(self.__version_urls[conf.ApiVersion.node]).request(
                 method_name="node_GetBlockByHeight",
                 message={'channel': self.__channel_name, 'height': str(0)}
             )
@@ -100,13 +129,12 @@ class RestStubManager:
 
             if version == conf.ApiVersion.v1:
                 url += method_name
-                response = requests.get(url, params={'channel': self.__channel_name})
+                response = self.__session.get(url, params={'channel': self.__channel_name})
             else:
                 if method_name == "icx_getBlockByHeight" and 'channel' in message:
                     del message['channel']
 
-                client = HTTPClient(url)
-                client.session.verify = conf.REST_SSL_VERIFY
+                client = self.__get_client(url)
                 response = client.request(method_name, message) if message else client.request(method_name)
             util.logger.spam(f"RestStubManager:call complete request_url({url}), "
                              f"method_name({method_name})")
@@ -109,10 +109,23 @@ class TimerService(CommonThread):
         CommonThread.__init__(self)
         self.__timer_list = {}
         self.__loop: asyncio.BaseEventLoop = asyncio.new_event_loop()
+        self.__loop_lag = {
+            "last_seconds": 0,
+            "max_seconds": 0,
+            "avg_seconds": 0,
+            "warning_count": 0
+        }
+        self.__loop_lag_count = 0
 
     def get_event_loop(self):
         return self.__loop
 
+    def get_loop_lag(self) -> dict:
+        """lag of the event loop measured every conf.TIMER_LOOP_LAG_INTERVAL.
+        Timers are late as much as the lag, since a blocking callback delays all of them.
+        """
+        return dict(self.__loop_lag)
+
     @property
     def timer_list(self):
         return self.__timer_list
@@ -217,8 +230,24 @@ class TimerService(CommonThread):
         e.set()
 
         asyncio.set_event_loop(self.__loop)
+        self.__loop.create_task(self.__measure_loop_lag())
         self.__loop.run_forever()
 
+    async def __measure_loop_lag(self):
+        while True:
+            expected_time = self.__loop.time() + conf.TIMER_LOOP_LAG_INTERVAL
+            await asyncio.sleep(conf.TIMER_LOOP_LAG_INTERVAL)
+            lag = max(self.__loop.time() - expected_time, 0)
+
+            self.__loop_lag_count += 1
+            loop_lag = self.__loop_lag
+            loop_lag["last_seconds"] = lag
+            loop_lag["max_seconds"] = max(loop_lag["max_seconds"], lag)
+            loop_lag["avg_seconds"] += (lag - loop_lag["avg_seconds"]) / self.__loop_lag_count
+            if lag > conf.TIMER_LOOP_LAG_WARNING:
+                loop_lag["warning_count"] += 1
+                logging.warning(f"timer service loop lag({lag:.3f}s) timers({list(self.__timer_list)})")
+
     async def __run(self, key, timer: Timer):
         while not timer.is_timeout():
             util.logger.spam(f"sleep {timer.remain_time()}, {key}")
@@ -0,0 +1,157 @@
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Transaction pool indexed by status. A drop-in replacement of AgingCache for tx queues."""
+
+import time
+import threading
+from collections import OrderedDict, MutableMapping
+
+from loopchain.baseservice.aging_cache import AgingCacheItem
+
+
+class TransactionPool(MutableMapping):
+    """Mempool that keeps one FIFO per item status.
+
+    Every item lives in two indexes.
+    - age index: all items in insertion order. Because re-inserting a key renews its timestamp and moves it to the end,
+      the front is always the oldest item, so expiry only ever pops from the front.
+    - status index: one FIFO per status. An item is appended to the FIFO of its new status when its status changes.
+
+    get_item_in_status, pop_item_in_status and set_item_status are O(1) regardless of how many items are queued.
+    """
+    DEFAULT_ITEM_STATUS = 1
+
+    def __init__(self, max_age_seconds, items=None, default_item_status=DEFAULT_ITEM_STATUS):
+        self.__default_item_status = default_item_status
+        self._max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+
+        self.d = OrderedDict()
+        self.__status_index = {}
+        if items:
+            for k, v in items:
+                self[k] = v
+
+    @property
+    def max_age_seconds(self):
+        return self._max_age_seconds
+
+    def count_in_status(self, status):
+        return len(self.__status_index.get(status, ()))
+
+    def pop_item(self):
+        with self._lock:
+            key, item = self.d.popitem(last=False)
+            self.__status_index[item.status].pop(key)
+            return item.value
+
+    def pop_item_in_status(self, status=DEFAULT_ITEM_STATUS):
+        with self._lock:
+            fifo = self.__status_index.get(status)
+            if not fifo:
+                return None
+
+            key, item = fifo.popitem(last=False)
+            del self.d[key]
+            return item
+
+    def get_item_in_status(self, get_status, set_status):
+        with self._lock:
+            fifo = self.__status_index.get(get_status)
+            if not fifo:
+                return None
+
+            key, item = next(iter(fifo.items()))
+            if get_status != set_status:
+                self.__move(key, item, set_status)
+            return item.value
+
+    def get_item_status(self, key):
+        return self.d[key].status
+
+    def set_item_status(self, key, status):
+        with self._lock:
+            item = self.d[key]
+            if item.status != status:
+                self.__move(key, item, status)
+
+    def set_item_status_by_time(self, timestamp_seconds, status):
+        with self._lock:
+            for key, item in self.d.items():
+                if item.timestamp_seconds >= timestamp_seconds:
+                    break
+                if item.status != status:
+                    self.__move(key, item, status)
+
+    def is_empty_in_status(self, status):
+        return not self.__status_index.get(status)
+
+    def __move(self, key, item, status):
+        del self.__status_index[item.status][key]
+        item.status = status
+        self.__status_index.setdefault(status, OrderedDict())[key] = item
+
+    def __expire(self, now_timestamp_seconds):
+        expire_timestamp_seconds = now_timestamp_seconds - self._max_age_seconds
+        while self.d:
+            key, item = next(iter(self.d.items()))
+            if item.timestamp_seconds > expire_timestamp_seconds:
+                break
+            self.d.popitem(last=False)
+            del self.__status_index[item.status][key]
+
+    def __getitem__(self, key):
+        return self.d[key].value
+
+    def __setitem__(self, key, value):
+        now_timestamp_seconds = int(time.time())
+
+        with self._lock:
+            item = self.d.pop(key, None)
+            if item is None:
+                self.__expire(now_timestamp_seconds)
+            else:
+                del self.__status_index[item.status][key]
+
+            item = AgingCacheItem(value, now_timestamp_seconds, self.__default_item_status)
+            self.d[key] = item
+            self.__status_index.setdefault(item.status, OrderedDict())[key] = item
+
+    def __delitem__(self, key):
+        with self._lock:
+            item = self.d.pop(key)
+            del self.__status_index[item.status][key]
+
+    def pop(self, key, *args):
+        with self._lock:
+            item = self.d.pop(key, None)
+            if item is None:
+                if args:
+                    return args[0]
+                raise KeyError(key)
+
+            del self.__status_index[item.status][key]
+            return item.value
+
+    def __contains__(self, key):
+        return key in self.d
+
+    def __iter__(self):
+        return iter(self.d)
+
+    def __len__(self):
+        return len(self.d)
+
+    def __repr__(self):
+        return repr(self.d)
@@ -15,6 +15,7 @@
 
 import json
 import sys
+import zlib
 
 from loopchain.blockchain import Transaction, TransactionVersioner, TransactionSerializer
 from loopchain.protos import loopchain_pb2
@@ -52,3 +53,23 @@ class TxItem:
         if tx.version not in cls.tx_serializers:
             cls.tx_serializers[tx.version] = TransactionSerializer.new(tx.version, tx_versioner)
         return cls.tx_serializers[tx.version]
+
+
+def make_tx_list_message(channel: str, tx_items: list, zip_threshold: int) -> loopchain_pb2.TxSendList:
+    """make AddTxList message. tx_list is compressed if the size of tx_items is over zip_threshold (0: never)"""
+    tx_list = [tx_item.get_tx_message() for tx_item in tx_items]
+    if not zip_threshold or sum(len(tx_item) for tx_item in tx_items) < zip_threshold:
+        return loopchain_pb2.TxSendList(channel=channel, tx_list=tx_list)
+
+    zipped_tx_list = zlib.compress(loopchain_pb2.TxSendList(channel=channel, tx_list=tx_list).SerializeToString())
+    return loopchain_pb2.TxSendList(channel=channel, zipped_tx_list=zipped_tx_list)
+
+
+def unzip_tx_list_message(message: loopchain_pb2.TxSendList) -> loopchain_pb2.TxSendList:
+    if not message.zipped_tx_list:
+        return message
+
+    # the same class as the message, loopchain_pb2 is imported in two locations.
+    unzipped_message = type(message)()
+    unzipped_message.ParseFromString(zlib.decompress(message.zipped_tx_list))
+    return unzipped_message
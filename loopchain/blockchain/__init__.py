@@ -15,6 +15,10 @@
 from .vote import *
 from .exception import *
 from .types import *
+from .merkle import *
+from .record import *
+from .address_index import *
+from .tx_hash_filter import *
 from .score_base import *
 from .transactions import *
 from .blocks import *
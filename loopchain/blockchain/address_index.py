@@ -0,0 +1,87 @@
+from typing import List, Tuple
+
+
+class AddressTxIndex:
+    """Index of tx hashes by address in the block DB.
+
+    prefix | address | "_" | sequence(8) -> tx hash
+    count prefix | address -> the number of txs of the address(8)
+
+    The sequence of an address starts from 1 and a tx is appended by writing its own key,
+    so the cost of adding a tx does not grow with the number of txs of the address.
+    Pages are read from the newest tx by range iteration. A page index is the sequence to start from
+    and 0 means the newest tx.
+    """
+    PREFIX = b'tx_by_address_'
+    COUNT_PREFIX = b'tx_count_by_address_'
+    SEQUENCE_BYTES = 8
+
+    def __init__(self, db):
+        self._db = db
+
+    @classmethod
+    def get_key(cls, address: str, sequence: int) -> bytes:
+        return cls.PREFIX + address.encode("utf-8") + b"_" + sequence.to_bytes(cls.SEQUENCE_BYTES, byteorder='big')
+
+    @classmethod
+    def get_count_key(cls, address: str) -> bytes:
+        return cls.COUNT_PREFIX + address.encode("utf-8")
+
+    def get_count(self, address: str) -> int:
+        try:
+            count_bytes = self._db.Get(self.get_count_key(address))
+        except KeyError:
+            return 0
+        return int.from_bytes(count_bytes, byteorder='big')
+
+    def put(self, batch, address: str, tx_hash: str, counts: dict):
+        """Append tx_hash to the txs of address with batch.
+
+        :param counts: counts by address which are put to batch but not written yet.
+        It has to be kept until batch is written.
+        """
+        count = counts.get(address)
+        if count is None:
+            count = self.get_count(address)
+
+        count += 1
+        batch.Put(self.get_key(address, count), tx_hash.encode("utf-8"))
+        batch.Put(self.get_count_key(address), count.to_bytes(self.SEQUENCE_BYTES, byteorder='big'))
+        counts[address] = count
+
+    def get_page(self, address: str, index: int, size: int) -> Tuple[List[str], int]:
+        """
+        :return: tx hashes from the newest, the index of the next page. 0 means there is no next page.
+        """
+        last = self.get_count(address) if index <= 0 else index
+        if last <= 0:
+            return [], 0
+
+        first = max(last - size + 1, 1)
+        tx_hashes = [bytes(tx_hash).decode("utf-8")
+                     for _, tx_hash in self._db.RangeIter(key_from=self.get_key(address, first),
+                                                          key_to=self.get_key(address, last),
+                                                          include_value=True)]
+        tx_hashes.reverse()
+        return tx_hashes, first - 1
+
+    def has_keys(self, prefix: bytes) -> bool:
+        """:return: True if the DB has a key starting with prefix, ex) tx lists by address of old versions"""
+        for key in self._db.RangeIter(key_from=prefix, include_value=False):
+            return bytes(key).startswith(prefix)
+        return False
+
+    def clear(self, batch) -> int:
+        """Delete all keys of the index with batch.
+
+        :return: the number of deleted keys
+        """
+        deleted_count = 0
+        for prefix in (self.PREFIX, self.COUNT_PREFIX):
+            for key in self._db.RangeIter(key_from=prefix, include_value=False):
+                key = bytes(key)
+                if not key.startswith(prefix):
+                    break
+                batch.Delete(key)
+                deleted_count += 1
+        return deleted_count
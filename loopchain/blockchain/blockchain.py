@@ -14,16 +14,17 @@
 """Block chain class with authorized blocks only"""
 import json
 import leveldb
-import pickle
 import threading
+import time
 from enum import Enum
 
 import loopchain.utils as util
 from loopchain import configure as conf
 from loopchain.baseservice import ScoreResponse, ObjectManager
-from loopchain.blockchain import (Block, BlockBuilder, BlockSerializer, BlockVersioner,
-                                  Transaction, TransactionBuilder, TransactionSerializer,
-                                  Hash32, ExternalAddress, TransactionVersioner, Vote, Epoch)
+from loopchain.baseservice.lru_cache import SizedLRUCache
+from loopchain.blockchain import (Block, BlockBuilder, BlockSerializer, BlockVersioner, BlockRecord, BlockWire,
+                                  TxInfoRecord, AddressTxIndex, TxHashFilter, Transaction, TransactionBuilder,
+                                  TransactionSerializer, Hash32, ExternalAddress, TransactionVersioner, Vote, Epoch)
 from loopchain.blockchain.exception import *
 from loopchain.blockchain.score_base import *
 from loopchain.channel.channel_property import ChannelProperty
@@ -36,6 +37,25 @@ class NID(Enum):
     unknown = "0x3"
 
 
+class _BlockWriteBatch:
+    """leveldb.WriteBatch of a block.
+
+    It keeps tx counts by address which are not written yet, so that they are updated by every tx of the block,
+    and the items which are cached or popped from the tx queue after the batch is written.
+    """
+
+    def __init__(self):
+        self.batch = leveldb.WriteBatch()
+        self.key_count = 0
+        self.address_tx_counts = {}
+        self.cache_items = []
+        self.tx_hashes = []
+
+    def Put(self, key, value):
+        self.batch.Put(key, value)
+        self.key_count += 1
+
+
 class BlockChain:
     """Block chain with only committed blocks."""
 
@@ -44,6 +64,7 @@ class BlockChain:
     TRANSACTION_COUNT_KEY = b'TRANSACTION_COUNT'
     LAST_BLOCK_KEY = b'last_block_key'
     BLOCK_HEIGHT_KEY = b'block_height_key'
+    TX_HASH_FILTER_KEY = b'tx_hash_filter_key'
 
     # Additional information of the block is generated when the add_block phase of the consensus is reached.
     BLOCK_INFO_KEY = b'block_info_key'
@@ -71,6 +92,17 @@ class BlockChain:
             except leveldb.LevelDBError:
                 raise leveldb.LevelDBError("Fail To Create Level DB(path): " + conf.DEFAULT_LEVEL_DB_PATH)
 
+        self.__address_tx_index = AddressTxIndex(self.__confirmed_block_db)
+        # False if the DB has tx lists by address of old versions which are not rebuilt to the index yet.
+        self.__address_tx_index_ready = True
+        # committed tx hashes. It is made by init_block_chain if conf.TX_HASH_FILTER.
+        self.__tx_hash_filter: TxHashFilter = None
+
+        # decoded blocks by block hash key and block hash keys by block height key, bounded by their record bytes
+        self.__block_cache = SizedLRUCache(conf.BLOCK_CACHE_RECORD_BYTES)
+        # decoded tx info by tx hash key, bounded by their record bytes
+        self.__tx_info_cache = SizedLRUCache(conf.TX_INFO_CACHE_RECORD_BYTES)
+
         # made block count as a leader
         self.__invoke_results = {}
 
@@ -79,6 +111,16 @@ class BlockChain:
 
         self.__total_tx = 0
 
+        # latency of writing blocks to block db
+        self.__commit_status = {
+            "count": 0,
+            "last_keys": 0,
+            "last_write_seconds": 0.0,
+            "last_commit_seconds": 0.0,
+            "max_commit_seconds": 0.0,
+            "total_commit_seconds": 0.0
+        }
+
         channel_option = conf.CHANNEL_OPTION[channel_name]
 
         self.__block_versioner = BlockVersioner()
@@ -147,7 +189,7 @@ class BlockChain:
             block_dump = self.__confirmed_block_db.Get(block_hash.encode(encoding='UTF-8'))
             block_version = self.__block_versioner.get_version(block_height)
             block_serializer = BlockSerializer.new(block_version, self.tx_versioner)
-            block = block_serializer.deserialize(json.loads(block_dump))
+            block = block_serializer.deserialize(BlockRecord.loads(block_dump), trusted=True)
 
             # Count only normal block`s tx count, not genesis block`s
             if block.header.height > 0:
@@ -162,18 +204,112 @@ class BlockChain:
         tx_count_bytes = self.__confirmed_block_db.Get(BlockChain.TRANSACTION_COUNT_KEY)
         return int.from_bytes(tx_count_bytes, byteorder='big')
 
+    def get_cache_status(self) -> dict:
+        return {
+            "block": self.__block_cache.get_status(),
+            "tx_info": self.__tx_info_cache.get_status()
+        }
+
+    def get_tx_hash_filter_status(self) -> dict:
+        if self.__tx_hash_filter is None:
+            return {}
+        return self.__tx_hash_filter.get_status()
+
+    def get_commit_status(self) -> dict:
+        status = dict(self.__commit_status)
+        total_commit_seconds = status.pop("total_commit_seconds")
+        status["avg_commit_seconds"] = total_commit_seconds / status["count"] if status["count"] else 0.0
+        return status
+
     def __find_block_by_key(self, key):
+        # The precommit block is replaced under the same key, so it is not cached.
+        is_cacheable = key != BlockChain.PRECOMMIT_BLOCK_KEY
+        if is_cacheable:
+            key = bytes(key)
+            block = self.__block_cache.get(key)
+            if block is not None:
+                return block
+
         try:
             block_bytes = self.__confirmed_block_db.Get(key)
-            block_dumped = json.loads(block_bytes)
-            block_height = self.__block_versioner.get_height(block_dumped)
-            block_version = self.__block_versioner.get_version(block_height)
-            return BlockSerializer.new(block_version, self.tx_versioner).deserialize(block_dumped)
+            block = self.load_block_record(block_bytes, trusted=True)
+            if is_cacheable:
+                self.__block_cache.put(key, block, len(block_bytes))
+            return block
         except KeyError as e:
             logging.error(f"__find_block_by_key::KeyError block_hash({key}) error({e})")
 
         return None
 
+    def load_block_record(self, block_record: bytes, trusted=False) -> Block:
+        """deserialize a record of the block DB. Blocks from other peers must not be trusted.
+
+        :param block_record: BlockRecord or JSON of a serialized block
+        :param trusted: if True, tx hashes are not generated again.
+        """
+        block_dumped = BlockRecord.loads(block_record)
+        block_height = self.__block_versioner.get_height(block_dumped)
+        block_version = self.__block_versioner.get_version(block_height)
+        return BlockSerializer.new(block_version, self.tx_versioner).deserialize(block_dumped, trusted=trusted)
+
+    def dumps_block_wire(self, block: Block, pickle_dumps=None) -> bytes:
+        """encode a block to send to other peers. It is pickled if not conf.BLOCK_WIRE_FORMAT.
+
+        :param pickle_dumps: function to pickle the block, util.block_dumps by default.
+        Old versions read some RPCs, ex) GetPrecommitBlock, with pickle.loads instead of util.block_loads.
+        """
+        if not conf.BLOCK_WIRE_FORMAT:
+            return (pickle_dumps or util.block_dumps)(block)
+
+        block_dumped = BlockSerializer.new(block.header.version, self.tx_versioner).serialize(block)
+        # The fields which are not stored in the block DB are sent too.
+        if "next_leader" not in block_dumped and block.header.next_leader:
+            block_dumped["next_leader"] = block.header.next_leader.hex_xx()
+        block_dumped["confirm_prev_block"] = block.body.confirm_prev_block
+
+        zip_threshold = conf.BLOCK_WIRE_ZIP_THRESHOLD if conf.USE_ZIPPED_DUMPS else 0
+        return BlockWire.dumps(block_dumped, zip_threshold)
+
+    def loads_block_wire(self, block_wire: bytes, pickle_loads=None) -> Block:
+        """decode a block from other peers. Tx hashes are generated again.
+
+        :param pickle_loads: function to load a pickled block, util.block_loads by default.
+        It has to match pickle_dumps of dumps_block_wire of the RPC.
+        """
+        if not BlockWire.is_wire(block_wire):
+            if not conf.ALLOW_PICKLED_BLOCK:
+                raise ValueError("A pickled block is not allowed.")
+            return (pickle_loads or util.block_loads)(block_wire)
+
+        block_dumped = BlockWire.loads(block_wire)
+        block_version = self.__block_versioner.get_version(BlockWire.get_height(block_wire))
+        return BlockSerializer.new(block_version, self.tx_versioner).deserialize(block_dumped)
+
+    def get_block_records(self, start_height: int, count: int, max_bytes: int) -> list:
+        """Read records of contiguous confirmed blocks from start_height as they are in the block DB.
+        The height keys are iterated in order by a LevelDB iterator.
+
+        :return: records of the blocks, it has fewer than count at the last block or over max_bytes.
+        """
+        key_from = BlockChain.BLOCK_HEIGHT_KEY + start_height.to_bytes(conf.BLOCK_HEIGHT_BYTES_LEN, byteorder='big')
+        key_to = BlockChain.BLOCK_HEIGHT_KEY + \
+            (start_height + count - 1).to_bytes(conf.BLOCK_HEIGHT_BYTES_LEN, byteorder='big')
+
+        block_records = []
+        records_size = 0
+        for height_key, block_hash in self.__confirmed_block_db.RangeIter(key_from=key_from, key_to=key_to):
+            block_height = int.from_bytes(height_key[len(BlockChain.BLOCK_HEIGHT_KEY):], byteorder='big')
+            if block_height != start_height + len(block_records):
+                break
+
+            block_record = bytes(self.__confirmed_block_db.Get(bytes(block_hash)))
+            records_size += len(block_record)
+            if block_records and records_size > max_bytes:
+                break
+            block_records.append(block_record)
+
+        return block_records
+
     def find_block_by_hash(self, block_hash):
         """find block by block hash.
 
@@ -193,14 +329,17 @@ class BlockChain:
         if block_height == -1:
             return self.__last_block
 
-        try:
-            key = self.__confirmed_block_db.Get(BlockChain.BLOCK_HEIGHT_KEY +
-                                                block_height.to_bytes(conf.BLOCK_HEIGHT_BYTES_LEN, byteorder='big'))
-        except KeyError:
-            if self.last_unconfirmed_block:
-                if self.last_unconfirmed_block.header.height == block_height:
-                    return self.last_unconfirmed_block
-            return None
+        height_key = BlockChain.BLOCK_HEIGHT_KEY + block_height.to_bytes(conf.BLOCK_HEIGHT_BYTES_LEN, byteorder='big')
+        key = self.__block_cache.get(height_key)
+        if key is None:
+            try:
+                key = bytes(self.__confirmed_block_db.Get(height_key))
+            except KeyError:
+                if self.last_unconfirmed_block:
+                    if self.last_unconfirmed_block.header.height == block_height:
+                        return self.last_unconfirmed_block
+                return None
+            self.__block_cache.put(height_key, key, len(height_key) + len(key))
 
         return self.__find_block_by_key(key)
 
@@ -229,8 +368,12 @@ class BlockChain:
                 else:
                     block, invoke_results = ObjectManager().channel_service.score_invoke(block)
 
+            # tx info, tx lists by address and the block are written at once after the score commits the state.
+            batch = _BlockWriteBatch()
+            commit_start_time = time.perf_counter()
             try:
-                self.__add_tx_to_block_db(block, invoke_results)
+                self.__add_tx_to_block_db(block, invoke_results, batch)
+                commit_seconds = time.perf_counter() - commit_start_time
                 ObjectManager().channel_service.score_write_precommit_state(block)
             except Exception as e:
                 logging.warning(f"blockchain:add_block FAIL "
@@ -239,7 +382,11 @@ class BlockChain:
             finally:
                 self.__invoke_results.pop(block.header.hash, None)
 
-            next_total_tx = self.__write_block_data(block, vote)
+            commit_start_time = time.perf_counter()
+            next_total_tx = self.__write_block_data(block, vote, batch)
+            write_seconds = self.__write_batch(batch)
+            commit_seconds += time.perf_counter() - commit_start_time
+            self.__update_commit_status(batch.key_count, write_seconds, commit_seconds)
 
             self.__last_block = block
             self.__block_height = self.__last_block.header.height
@@ -258,7 +405,8 @@ class BlockChain:
                 'peer_name': conf.PEER_NAME,
                 'channel_name': self.__channel_name,
                 'data': {
-                    'block_height': self.__block_height
+                    'block_height': self.__block_height,
+                    'commit_seconds': commit_seconds
                 }})
 
             # stop leader complain timer
@@ -269,10 +417,14 @@ class BlockChain:
 
             # notify new block
             ObjectManager().channel_service.inner_service.notify_new_block()
+            # the peer refreshes the status snapshot of the channel right away.
+            ObjectManager().channel_service.inner_service.update_peer_status(
+                {"block_height": self.__block_height, "total_tx": self.__total_tx})
 
             return True
 
-    def __write_block_data(self, block: Block, vote: Vote = None):
+    def __write_block_data(self, block: Block, vote: Vote, batch: _BlockWriteBatch):
+        """Put the block to batch. The cache is filled after the batch is written."""
         # a condition for the exception case of genesis block.
         next_total_tx = self.__total_tx
         if block.header.height > 0:
@@ -284,17 +436,22 @@ class BlockChain:
 
         block_version = self.__block_versioner.get_version(block.header.height)
         block_serializer = BlockSerializer.new(block_version, self.tx_versioner)
-        block_serialized = json.dumps(block_serializer.serialize(block))
+        block_serialized = self.__dumps_record(BlockRecord, block_serializer.serialize(block))
         block_hash_encoded = block.header.hash.hex().encode(encoding='UTF-8')
 
-        batch = leveldb.WriteBatch()
-        batch.Put(block_hash_encoded, block_serialized.encode("utf-8"))
+        block_height_key = \
+            BlockChain.BLOCK_HEIGHT_KEY + block.header.height.to_bytes(conf.BLOCK_HEIGHT_BYTES_LEN, byteorder='big')
+
+        batch.Put(block_hash_encoded, block_serialized)
         batch.Put(BlockChain.LAST_BLOCK_KEY, block_hash_encoded)
         batch.Put(BlockChain.TRANSACTION_COUNT_KEY, next_total_tx_bytes)
-        batch.Put(
-            BlockChain.BLOCK_HEIGHT_KEY +
-            block.header.height.to_bytes(conf.BLOCK_HEIGHT_BYTES_LEN, byteorder='big'),
-            block_hash_encoded)
+        batch.Put(block_height_key, block_hash_encoded)
+
+        if self.__tx_hash_filter is not None:
+            # txs of the block are added to the filter already by __add_tx_to_block_db.
+            self.__tx_hash_filter.height = block.header.height
+            if block.header.height % conf.TX_HASH_FILTER_SAVE_INTERVAL == 0:
+                batch.Put(BlockChain.TX_HASH_FILTER_KEY, self.__tx_hash_filter.dumps())
 
         if vote:
             batch.Put(
@@ -302,10 +459,49 @@ class BlockChain:
                 Vote.save_to(vote)
             )
 
-        self.__confirmed_block_db.Write(batch)
+        batch.cache_items.append((self.__block_cache, block_hash_encoded, block, len(block_serialized)))
+        batch.cache_items.append((self.__block_cache, block_height_key, block_hash_encoded,
+                                  len(block_height_key) + len(block_hash_encoded)))
 
         return next_total_tx
 
+    def __write_batch(self, batch: _BlockWriteBatch) -> float:
+        """Write batch at once, then fill caches and pop txs from the tx queue.
+
+        :return: seconds taken to write the batch
+        """
+        write_start_time = time.perf_counter()
+        self.__confirmed_block_db.Write(batch.batch, sync=conf.BLOCK_DB_SYNC_WRITE)
+        write_seconds = time.perf_counter() - write_start_time
+
+        for cache, key, value, size in batch.cache_items:
+            cache.put(key, value, size)
+
+        if batch.tx_hashes:
+            tx_queue = ObjectManager().channel_service.block_manager.get_tx_queue()
+            for tx_hash in batch.tx_hashes:
+                tx_queue.pop(tx_hash, None)
+
+        return write_seconds
+
+    def __update_commit_status(self, key_count, write_seconds, commit_seconds):
+        status = self.__commit_status
+        status["count"] += 1
+        status["last_keys"] = key_count
+        status["last_write_seconds"] = write_seconds
+        status["last_commit_seconds"] = commit_seconds
+        status["max_commit_seconds"] = max(status["max_commit_seconds"], commit_seconds)
+        status["total_commit_seconds"] += commit_seconds
+
+        logging.debug(f"blockchain:commit block keys({key_count}) "
+                      f"write({write_seconds:.4f}s) commit({commit_seconds:.4f}s)")
+
+    @staticmethod
+    def __dumps_record(record_class, data: dict) -> bytes:
+        if conf.BLOCK_DB_BINARY_RECORD:
+            return record_class.dumps(data)
+        return json.dumps(data).encode(encoding=conf.PEER_DATA_ENCODING)
+
     def prevent_next_block_mismatch(self, next_height: int) -> bool:
         logging.debug(f"prevent_block_mismatch...")
         score_stub = StubCollection().icon_score_stubs[self.__channel_name]
@@ -359,16 +555,18 @@ class BlockChain:
                               f"loopchain({next_height})/score({score_last_block_height})")
             return True
 
-    def __add_tx_to_block_db(self, block, invoke_results):
+    def __add_tx_to_block_db(self, block, invoke_results, batch: _BlockWriteBatch=None):
         """block db 에 block_hash - block_object 를 저장할때, tx_hash - block_hash 를 저장한다.
         get tx by tx_hash 시 해당 block 을 효율적으로 찾기 위해서
         :param block:
+        :param batch: tx data are written with the batch. If it is None, they are written at once here.
         """
+        is_own_batch = batch is None
+        if is_own_batch:
+            batch = _BlockWriteBatch()
+
         # loop all tx in block
         logging.debug("try add all tx in block to block db, block hash: " + block.header.hash.hex())
-        block_manager = ObjectManager().channel_service.block_manager
-        tx_queue = block_manager.get_tx_queue()
-        # util.logger.spam(f"blockchain:__add_tx_to_block_db::tx_queue : {tx_queue}")
         # util.logger.spam(
         #     f"blockchain:__add_tx_to_block_db::confirmed_transaction_list : {block.confirmed_transaction_list}")
 
@@ -385,29 +583,31 @@ class BlockChain:
                 'result': invoke_result
             }
 
-            self.__confirmed_block_db.Put(
-                tx_hash.encode(encoding=conf.HASH_KEY_ENCODING),
-                json.dumps(tx_info).encode(encoding=conf.PEER_DATA_ENCODING))
+            tx_hash_encoded = tx_hash.encode(encoding=conf.HASH_KEY_ENCODING)
+            tx_info_serialized = self.__dumps_record(TxInfoRecord, tx_info)
+            batch.Put(tx_hash_encoded, tx_info_serialized)
+            batch.cache_items.append((self.__tx_info_cache, tx_hash_encoded, tx_info, len(tx_info_serialized)))
 
-            # try:
-            #     util.logger.spam(
-            #         f"blockchain:__add_tx_to_block_db::{tx_hash}'s status : {tx_queue.get_item_status(tx_hash)}")
-            # except KeyError as e:
-            #     util.logger.spam(f"__add_tx_to_block_db :: {e}")
+            # popped from the tx queue after the batch is written.
+            batch.tx_hashes.append(tx_hash)
 
-            tx_queue.pop(tx_hash, None)
-            # util.logger.spam(f"pop tx from queue:{tx_hash}")
+            # A tx in the filter which is not written for a failure only makes a false positive.
+            if self.__tx_hash_filter is not None:
+                self.__tx_hash_filter.add(tx.hash)
 
             if block.header.height > 0:
-                self.__save_tx_by_address(tx)
+                self.__save_tx_by_address(tx, batch)
+
+        self.__save_invoke_result_block_height(block.header.height, batch)
 
-        self.__save_invoke_result_block_height(block.header.height)
+        if is_own_batch:
+            self.__write_batch(batch)
 
-    def __save_invoke_result_block_height(self, height):
+    def __save_invoke_result_block_height(self, height, batch: _BlockWriteBatch):
         bit_length = height.bit_length()
         byte_length = (bit_length + 7) // 8
         block_height_bytes = height.to_bytes(byte_length, byteorder='big')
-        self.__confirmed_block_db.Put(
+        batch.Put(
             BlockChain.INVOKE_RESULT_BLOCK_HEIGHT_KEY,
             block_height_bytes
         )
@@ -423,7 +623,7 @@ class BlockChain:
 
         for tx in precommit_block.body.transactions.values():
             tx_hash = tx.hash.hex()
-            if tx_queue.get_item_in_status(TransactionStatusInQueue.normal, TransactionStatusInQueue.normal):
+            if not tx_queue.is_empty_in_status(TransactionStatusInQueue.normal):
                 try:
                     tx_queue.set_item_status(tx_hash, TransactionStatusInQueue.precommited_to_block)
                     # util.logger.spam(
@@ -431,25 +631,20 @@ class BlockChain:
                 except KeyError as e:
                     logging.warning(f"blockchain:__precommit_tx::KeyError:There is no tx by hash({tx_hash})")
 
-    def __save_tx_by_address(self, tx: 'Transaction'):
+    def __save_tx_by_address(self, tx: 'Transaction', batch: _BlockWriteBatch):
         address = tx.from_address.hex_hx()
-        return self.add_tx_to_list_by_address(address, tx.hash.hex())
-
-    @staticmethod
-    def __get_tx_list_key(address, index):
-        return conf.TX_LIST_ADDRESS_PREFIX + (address + str(index)).encode(encoding=conf.HASH_KEY_ENCODING)
+        return self.add_tx_to_list_by_address(address, tx.hash.hex(), batch)
 
     def get_tx_list_by_address(self, address, index=0):
-        list_key = self.__get_tx_list_key(address, index)
-
-        try:
-            tx_list = pickle.loads(self.__confirmed_block_db.Get(list_key))
-            next_index = tx_list[-1]
-        except KeyError:
-            tx_list = [0]  # 0 means there is no more list after this.
-            next_index = 0
-
-        return tx_list, next_index
+        """
+        :param index: 0 for the newest txs or next_index of the previous page.
+        It is the sequence of a tx of the address, not the key of a list as of the pickled lists of old versions.
+        :return: tx hashes from the newest, next_index. 0 means there is no more list after this.
+        """
+        if not self.__address_tx_index_ready:
+            raise BlockchainError("The tx index by address is not built from the tx lists of an old version. "
+                                  "Run python3 -m loopchain.tools.address_index_rebuilder with the block DB.")
+        return self.__address_tx_index.get_page(address, index, conf.MAX_TX_LIST_SIZE_BY_ADDRESS)
 
     def get_precommit_block(self):
         return self.__find_block_by_key(BlockChain.PRECOMMIT_BLOCK_KEY)
@@ -462,18 +657,15 @@ class BlockChain:
             logging.debug(f"blockchain:get_nid::There is no NID.")
             return None
 
-    def add_tx_to_list_by_address(self, address, tx_hash):
-        current_list, current_index = self.get_tx_list_by_address(address, 0)
+    def add_tx_to_list_by_address(self, address, tx_hash, batch: _BlockWriteBatch=None):
+        is_own_batch = batch is None
+        if is_own_batch:
+            batch = _BlockWriteBatch()
 
-        if len(current_list) > conf.MAX_TX_LIST_SIZE_BY_ADDRESS:
-            new_index = current_index + 1
-            new_list_key = self.__get_tx_list_key(address, new_index)
-            self.__confirmed_block_db.Put(new_list_key, pickle.dumps(current_list))
-            current_list = [new_index]
+        self.__address_tx_index.put(batch, address, tx_hash, batch.address_tx_counts)
 
-        current_list.insert(0, tx_hash)
-        list_key = self.__get_tx_list_key(address, 0)
-        self.__confirmed_block_db.Put(list_key, pickle.dumps(current_list))
+        if is_own_batch:
+            self.__write_batch(batch)
 
         return True
 
@@ -500,6 +692,21 @@ class BlockChain:
         tx_serializer = TransactionSerializer.new(tx_version, self.tx_versioner)
         return tx_serializer.from_(tx_data)
 
+    def has_tx(self, tx_hash: Hash32) -> bool:
+        """Check if the tx is in the block DB. The block DB is read only if the tx hash filter may have it."""
+        tx_hash_filter = self.__tx_hash_filter
+        if tx_hash_filter is not None and not tx_hash_filter.check(tx_hash):
+            return False
+
+        try:
+            has_tx = self.find_tx_info(tx_hash) is not None
+        except KeyError:
+            has_tx = False
+
+        if not has_tx and tx_hash_filter is not None:
+            tx_hash_filter.count_false_positive()
+        return has_tx
+
     def find_invoke_result_by_tx_hash(self, tx_hash):
         """find invoke result matching tx_hash and return result if not in blockchain return code delay
 
@@ -525,10 +732,15 @@ class BlockChain:
         if isinstance(tx_hash_key, Hash32):
             tx_hash_key = tx_hash_key.hex()
 
+        tx_hash_encoded = tx_hash_key.encode(encoding=conf.HASH_KEY_ENCODING)
+        tx_info_json = self.__tx_info_cache.get(tx_hash_encoded)
+        if tx_info_json is not None:
+            return tx_info_json
+
         try:
-            tx_info = self.__confirmed_block_db.Get(
-                tx_hash_key.encode(encoding=conf.HASH_KEY_ENCODING))
-            tx_info_json = json.loads(tx_info, encoding=conf.PEER_DATA_ENCODING)
+            tx_info = self.__confirmed_block_db.Get(tx_hash_encoded)
+            tx_info_json = TxInfoRecord.loads(tx_info)
+            self.__tx_info_cache.put(tx_hash_encoded, tx_info_json, len(tx_info))
 
         except UnicodeDecodeError as e:
             logging.warning("blockchain::find_tx_info: UnicodeDecodeError: " + str(e))
@@ -578,8 +790,7 @@ class BlockChain:
 
             block_serializer = BlockSerializer.new(precommit_block.header.version, self.tx_versioner)
             block_serialized = block_serializer.serialize(precommit_block)
-            block_serialized = json.dumps(block_serialized)
-            block_serialized = block_serialized.encode('utf-8')
+            block_serialized = self.__dumps_record(BlockRecord, block_serialized)
             results = self.__confirmed_block_db.Put(BlockChain.PRECOMMIT_BLOCK_KEY, block_serialized)
 
             util.logger.spam(f"result of to write to db ({results})")
@@ -665,10 +876,11 @@ class BlockChain:
 
         if last_block_key:
             block_dump = self.__confirmed_block_db.Get(last_block_key)
-            block_dump = json.loads(block_dump)
+            block_dump = BlockRecord.loads(block_dump)
             block_height = self.__block_versioner.get_height(block_dump)
             block_version = self.__block_versioner.get_version(block_height)
-            self.__last_block = BlockSerializer.new(block_version, self.tx_versioner).deserialize(block_dump)
+            block_serializer = BlockSerializer.new(block_version, self.tx_versioner)
+            self.__last_block = block_serializer.deserialize(block_dump, trusted=True)
 
             logging.debug("restore from last block hash(" + str(self.__last_block.header.hash.hex()) + ")")
             logging.debug("restore from last block height(" + str(self.__last_block.header.height) + ")")
@@ -680,6 +892,71 @@ class BlockChain:
             self.__block_height = self.__last_block.header.height
         logging.debug(f"ENGINE-303 init_block_chain: {self.__block_height}")
 
+        self.__address_tx_index_ready = self.__check_address_tx_index()
+
+        if conf.TX_HASH_FILTER:
+            self.__tx_hash_filter = self.__load_tx_hash_filter()
+
+    def __check_address_tx_index(self) -> bool:
+        """tools/address_index_rebuilder deletes the pickled tx lists by address of old versions.
+        If any of them is left, the index does not have the txs before the upgrade and is not served,
+        even after new blocks add their txs to it.
+        """
+        if not self.__address_tx_index.has_keys(conf.TX_LIST_ADDRESS_PREFIX):
+            return True
+
+        logging.error(f"The block DB has tx lists by address of an old version. "
+                      f"Tx lists by address are not served until the index is rebuilt by "
+                      f"python3 -m loopchain.tools.address_index_rebuilder <block db path> "
+                      f"of channel({self.__channel_name})")
+        return False
+
+    def __load_tx_hash_filter(self) -> TxHashFilter or None:
+        """Load the tx hash filter saved in the block DB and add txs of the blocks after it.
+        If there is no filter to use, it is made from blocks only on a chain shorter than
+        TX_HASH_FILTER_SAVE_INTERVAL. On a longer chain it would read every block before the node starts,
+        so the filter is not used until tools/tx_hash_filter_rebuilder makes it offline.
+        """
+        tx_hash_filter = None
+        try:
+            tx_hash_filter = TxHashFilter.loads(self.__confirmed_block_db.Get(BlockChain.TX_HASH_FILTER_KEY),
+                                                conf.TX_HASH_FILTER_CAPACITY, conf.TX_HASH_FILTER_ERROR_RATE)
+        except KeyError:
+            logging.info("There is no tx hash filter in the block DB.")
+        except ValueError as e:
+            logging.warning(f"Fail to load the tx hash filter. ({e})")
+
+        if tx_hash_filter is None or tx_hash_filter.height > self.__block_height:
+            if self.__block_height >= conf.TX_HASH_FILTER_SAVE_INTERVAL:
+                logging.error(f"The tx hash filter is not used, since the block DB has no filter to use. "
+                              f"Run python3 -m loopchain.tools.tx_hash_filter_rebuilder <block db path> "
+                              f"of channel({self.__channel_name}) with the peer stopped.")
+                return None
+            tx_hash_filter = TxHashFilter(conf.TX_HASH_FILTER_CAPACITY, conf.TX_HASH_FILTER_ERROR_RATE)
+
+        start_height = tx_hash_filter.height + 1
+        for height in range(start_height, self.__block_height + 1):
+            height_key = BlockChain.BLOCK_HEIGHT_KEY + height.to_bytes(conf.BLOCK_HEIGHT_BYTES_LEN, byteorder='big')
+            block_hash_encoded = bytes(self.__confirmed_block_db.Get(height_key))
+            block = self.load_block_record(self.__confirmed_block_db.Get(block_hash_encoded), trusted=True)
+            for tx_hash in block.body.transactions:
+                tx_hash_filter.add(tx_hash)
+            tx_hash_filter.height = height
+
+        # tx info of the precommit block is written before the block.
+        try:
+            precommit_block = self.load_block_record(self.__confirmed_block_db.Get(BlockChain.PRECOMMIT_BLOCK_KEY),
+                                                     trusted=True)
+        except KeyError:
+            pass
+        else:
+            for tx_hash in precommit_block.body.transactions:
+                tx_hash_filter.add(tx_hash)
+
+        logging.info(f"tx hash filter has {tx_hash_filter.count} txs until block height({tx_hash_filter.height}), "
+                     f"{self.__block_height - start_height + 1} blocks are added.")
+        return tx_hash_filter
+
     def generate_genesis_block(self):
         tx_info = None
         nid = NID.unknown.value
@@ -1,3 +1,4 @@
+import dataclasses
 import hashlib
 from abc import ABC, abstractmethod
 from collections import OrderedDict
@@ -109,6 +110,16 @@ class BlockBuilder(ABC):
 
         raise NotImplementedError(f"BlockBuilder Version({version}) not supported.")
 
+    @staticmethod
+    def replace_commit_state(block: 'Block', commit_state: dict) -> 'Block':
+        """Attach commit_state which is given by the score invoke to block.
+
+        Neither the hash nor the signature of a block depends on commit_state, so the body and
+        the other fields of the header are taken as they are without building the block again.
+        """
+        header = dataclasses.replace(block.header, commit_state=commit_state)
+        return Block(header, block.body)
+
     @classmethod
     def from_new(cls, block: 'Block', tx_versioner: 'TransactionVersioner'):
         block_builder = cls.new(block.header.version, tx_versioner)
@@ -26,17 +26,22 @@ class BlockSerializer(ABC):
     def _serialize(self, block: 'Block') -> dict:
         raise NotImplementedError
 
-    def deserialize(self, block_dumped: dict) -> 'Block':
+    def deserialize(self, block_dumped: dict, trusted=False) -> 'Block':
+        """
+        :param block_dumped:
+        :param trusted: take tx hashes from block_dumped instead of generating them.
+        Use it only for the blocks which this node verified and stored by itself.
+        """
         if block_dumped['version'] != self.version:
             raise BlockVersionNotMatch(block_dumped['version'], self.version,
                                        "The block of this version cannot be deserialized by the serializer.")
-        return self._deserialize(block_dumped)
+        return self._deserialize(block_dumped, trusted)
 
-    def _deserialize(self, json_data):
+    def _deserialize(self, json_data, trusted=False):
         header_data = self._deserialize_header_data(json_data)
         header = self.BlockHeaderClass(**header_data)
 
-        body_data = self._deserialize_body_data(json_data)
+        body_data = self._deserialize_body_data(json_data, trusted)
         body = self.BlockBodyClass(**body_data)
         return Block(header, body)
 
@@ -45,7 +50,7 @@ class BlockSerializer(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def _deserialize_body_data(self, json_data: dict):
+    def _deserialize_body_data(self, json_data: dict, trusted=False):
         raise NotImplementedError
 
     @classmethod
@@ -1,6 +1,7 @@
 import json
 from collections import namedtuple
 from typing import List, Union
+from ..record import BlockRecord
 
 BlockVersion = namedtuple("BlockVersion", ("height", "name"))
 
@@ -31,9 +32,13 @@ class BlockVersioner:
         else:
             return version.name
 
-    def get_height(self, block_dumped: Union[str, dict]):
-        if isinstance(block_dumped, str):
-           block_dumped = json.loads(block_dumped)
+    def get_height(self, block_dumped: Union[str, bytes, bytearray, memoryview, dict]):
+        if isinstance(block_dumped, (bytearray, memoryview)):
+            block_dumped = bytes(block_dumped)
+        if isinstance(block_dumped, bytes) and BlockRecord.is_binary(block_dumped):
+            return BlockRecord.get_height(block_dumped)
+        if isinstance(block_dumped, (str, bytes)):
+            block_dumped = json.loads(block_dumped)
         return block_dumped["height"]
 
 
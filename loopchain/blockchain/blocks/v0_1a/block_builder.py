@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING
 
 from . import BlockHeader, BlockBody
 from .. import Block, BlockBuilder as BaseBlockBuilder
-from ... import Hash32, Address
+from ... import Hash32, Address, MerkleTree
 
 if TYPE_CHECKING:
     from ... import TransactionVersioner
@@ -30,6 +30,9 @@ class BlockBuilder(BaseBlockBuilder):
 
         self._timestamp: int = None
 
+        # kept over reset_cache, so that it is updated only by txs added after the last build.
+        self._merkle_tree: MerkleTree = None
+
     def reset_cache(self):
         super().reset_cache()
 
@@ -75,33 +78,30 @@ class BlockBuilder(BaseBlockBuilder):
         return self.merkle_tree_root_hash
 
     def _build_merkle_tree_root_hash(self):
-        merkle_tree_root_hash = None
-        mt_list = [tx_hash.hex() for tx_hash in self.transactions.keys()]
-
-        while True:
-            tree_length = len(mt_list)
-            tmp_mt_list = []
-            if tree_length <= 1:
-                break
-            elif tree_length % 2 == 1:
-                mt_list.append(mt_list[tree_length-1])
-                tree_length += 1
-
-            for row in range(int(tree_length/2)):
-                idx = row * 2
-                mt_nodes = [mt_list[idx].encode(encoding='UTF-8'), mt_list[idx+1].encode(encoding='UTF-8')]
-                mk_sum = b''.join(mt_nodes)
-                mk_hash = hashlib.sha256(mk_sum).hexdigest()
-                tmp_mt_list.append(mk_hash)
-            mt_list = tmp_mt_list
-
-        if len(mt_list) == 1:
-            merkle_tree_root_hash = mt_list[0]
-
-        if merkle_tree_root_hash:
-            return Hash32.fromhex(merkle_tree_root_hash, True)
-
-        return Hash32(bytes(Hash32.size))
+        return Hash32(self.build_merkle_tree().root)
+
+    def build_merkle_tree(self) -> MerkleTree:
+        """Build the merkle tree of the transactions.
+
+        If the transactions are the transactions of the last built tree and more, only the new ones are appended.
+        """
+        tx_hashes = list(self.transactions.keys())
+        merkle_tree = self._merkle_tree
+        if merkle_tree is not None and len(merkle_tree) <= len(tx_hashes) and \
+                merkle_tree.leaves == tx_hashes[:len(merkle_tree)]:
+            merkle_tree.extend(tx_hashes[len(merkle_tree):])
+        else:
+            merkle_tree = MerkleTree(tx_hashes)
+
+        self._merkle_tree = merkle_tree
+        return merkle_tree
+
+    def get_merkle_proof(self, tx_hash: 'Hash32'):
+        """
+        :return: proof of the tx to be verified with MerkleTree.verify_proof and the merkle tree root hash.
+        """
+        merkle_tree = self.build_merkle_tree()
+        return merkle_tree.get_proof(merkle_tree.leaves.index(tx_hash))
 
     def build_hash(self):
         if self.hash is not None:
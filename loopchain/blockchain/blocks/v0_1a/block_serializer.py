@@ -57,14 +57,14 @@ class BlockSerializer(BaseBlockSerializer):
             "commit_state": json_data["commit_state"]
         }
 
-    def _deserialize_body_data(self, json_data: dict):
+    def _deserialize_body_data(self, json_data: dict, trusted=False):
         confirm_prev_block = json_data.get("confirm_prev_block")
 
         transactions = OrderedDict()
         for tx_data in json_data['confirmed_transaction_list']:
             tx_version = self._tx_versioner.get_version(tx_data)
             ts = TransactionSerializer.new(tx_version, self._tx_versioner)
-            tx = ts.from_(tx_data)
+            tx = ts.from_(tx_data, trusted)
             transactions[tx.hash] = tx
 
         return {
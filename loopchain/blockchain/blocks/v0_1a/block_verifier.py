@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING
 from . import BlockHeader
 from .. import BlockBuilder, BlockVerifier as BaseBlockVerifier
-from ... import TransactionVerifier
+from ... import TransactionVerifier, TransactionBatchVerifier
 
 if TYPE_CHECKING:
     from . import BlockBody
@@ -42,14 +42,7 @@ class BlockVerifier(BaseBlockVerifier):
 
         invoke_result = None
         if self.invoke_func:
-            new_block, invoke_result = self.invoke_func(block)
-            if not header.commit_state and len(body.transactions) == 0:
-                # vote block
-                pass
-            elif header.commit_state != new_block.header.commit_state:
-                raise RuntimeError(f"Block({header.height}, {header.hash.hex()}, "
-                                   f"CommitState({header.commit_state}), "
-                                   f"Expected({new_block.header.commit_state}).")
+            invoke_result = self.verify_invoke(block)
 
         builder.build_merkle_tree_root_hash()
         if header.merkle_tree_root_hash != builder.merkle_tree_root_hash:
@@ -74,15 +67,48 @@ class BlockVerifier(BaseBlockVerifier):
 
         return invoke_result
 
+    def verify_prevalidated(self, block: 'Block', prev_block: 'Block', blockchain=None):
+        """Verify only the parts which depend on the blockchain.
+        The block must be verified already by verify_loosely without prev_block and blockchain.
+        """
+        if blockchain:
+            for tx in block.body.transactions.values():
+                tv = TransactionVerifier.new(tx.version, self._tx_versioner)
+                tv.verify_tx_hash_unique(tx, blockchain)
+
+        if prev_block:
+            self.verify_prev_block(block, prev_block)
+
+        if self.invoke_func:
+            return self.verify_invoke(block)
+        return None
+
+    def verify_invoke(self, block: 'Block'):
+        header: BlockHeader = block.header
+        body: BlockBody = block.body
+
+        new_block, invoke_result = self.invoke_func(block)
+        if not header.commit_state and len(body.transactions) == 0:
+            # vote block
+            pass
+        elif header.commit_state != new_block.header.commit_state:
+            raise RuntimeError(f"Block({header.height}, {header.hash.hex()}, "
+                               f"CommitState({header.commit_state}), "
+                               f"Expected({new_block.header.commit_state}).")
+        return invoke_result
+
     def verify_transactions(self, block: 'Block', blockchain=None):
-        for tx in block.body.transactions.values():
-            tv = TransactionVerifier.new(tx.version, self._tx_versioner)
-            tv.verify(tx, blockchain)
+        tbv = TransactionBatchVerifier(self._tx_versioner)
+        self._raise_first_exception(tbv.verify(list(block.body.transactions.values()), blockchain))
 
     def verify_transactions_loosely(self, block: 'Block', blockchain=None):
-        for tx in block.body.transactions.values():
-            tv = TransactionVerifier.new(tx.version, self._tx_versioner)
-            tv.verify_loosely(tx, blockchain)
+        tbv = TransactionBatchVerifier(self._tx_versioner)
+        self._raise_first_exception(tbv.verify_loosely(list(block.body.transactions.values()), blockchain))
+
+    def _raise_first_exception(self, exceptions: list):
+        exception = next((e for e in exceptions if e is not None), None)
+        if exception is not None:
+            raise exception
 
     def verify_prev_block(self, block: 'Block', prev_block: 'Block'):
         if block.header.prev_hash != prev_block.header.hash:
@@ -61,7 +61,7 @@ class CandidateBlock:
         if self.hash != block.header.hash:
             raise CandidateBlockSetBlock
         else:
-            logging.debug(f"set block({block.header.hash.hex()}) in CandidateBlock")
+            logging.debug("set block(%s) in CandidateBlock", block.header.hash.hex())
             self.__block = block
 
 
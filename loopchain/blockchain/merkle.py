@@ -0,0 +1,99 @@
+import binascii
+import hashlib
+from typing import Iterable, List, Tuple
+
+_EMPTY_ROOT = bytes(32)
+
+
+def _hash_level(level: List[bytes]) -> List[bytes]:
+    """Hash every pair of nodes in a level. The last node is paired with itself if the number of nodes is odd.
+
+    A parent is sha256 of the hex strings of its children, the same as the hex based tree of old versions.
+    The whole level is hex encoded at once.
+    """
+    if len(level) % 2 == 1:
+        level = level + level[-1:]
+
+    hexed = binascii.hexlify(b"".join(level))
+    pair_size = len(level[0]) * 4
+    sha256 = hashlib.sha256
+    return [sha256(hexed[i:i + pair_size]).digest() for i in range(0, len(hexed), pair_size)]
+
+
+def _hash_pair(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(binascii.hexlify(left + right)).digest()
+
+
+class MerkleTree:
+    """Merkle tree of tx hashes on raw bytes.
+
+    All levels are kept, so appending leaves updates only the nodes on the right of them and
+    a proof of a leaf is read from the levels.
+    """
+
+    def __init__(self, leaves: Iterable[bytes]=()):
+        self._levels: List[List[bytes]] = [[bytes(leaf) for leaf in leaves]]
+        level = self._levels[0]
+        while len(level) > 1:
+            level = _hash_level(level)
+            self._levels.append(level)
+
+    @property
+    def leaves(self) -> List[bytes]:
+        return self._levels[0]
+
+    @property
+    def root(self) -> bytes:
+        if not self._levels[0]:
+            return _EMPTY_ROOT
+        return self._levels[-1][0]
+
+    def append(self, leaf: bytes):
+        self.extend((leaf, ))
+
+    def extend(self, leaves: Iterable[bytes]):
+        """Append leaves and update the nodes from the first new leaf to the end in each level."""
+        levels = self._levels
+        index = len(levels[0])
+        levels[0].extend(bytes(leaf) for leaf in leaves)
+        if index == len(levels[0]):
+            return
+
+        depth = 0
+        while len(levels[depth]) > 1:
+            level = levels[depth]
+            index -= index % 2
+            parents = _hash_level(level[index:])
+
+            if depth + 1 == len(levels):
+                levels.append([])
+            upper_level = levels[depth + 1]
+            index //= 2
+            del upper_level[index:]
+            upper_level.extend(parents)
+            depth += 1
+
+    def get_proof(self, index: int) -> List[Tuple[bool, bytes]]:
+        """
+        :return: (whether the sibling is on the left, sibling) from the leaf to the root
+        """
+        if not 0 <= index < len(self._levels[0]):
+            raise IndexError(f"There is no leaf of index({index}). count({len(self._levels[0])})")
+
+        proof = []
+        for level in self._levels[:-1]:
+            sibling_index = index ^ 1
+            sibling = level[sibling_index] if sibling_index < len(level) else level[index]
+            proof.append((sibling_index < index, sibling))
+            index //= 2
+        return proof
+
+    @staticmethod
+    def verify_proof(leaf: bytes, proof: List[Tuple[bool, bytes]], root: bytes) -> bool:
+        node = bytes(leaf)
+        for is_left, sibling in proof:
+            node = _hash_pair(sibling, node) if is_left else _hash_pair(node, sibling)
+        return node == root
+
+    def __len__(self):
+        return len(self._levels[0])
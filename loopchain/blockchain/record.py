@@ -0,0 +1,330 @@
+import base64
+import binascii
+import json
+import struct
+import zlib
+from typing import List, Optional, Tuple, Union
+
+
+class _Column:
+    """A str field which is stored as raw bytes of a fixed size.
+
+    The field of every item is stored in a column, a flag per item and the raw bytes of flagged items,
+    so that a column is decoded at once. A value which is not canonical stays in the JSON part of the record,
+    so the record is always restored as it was.
+    """
+
+    def __init__(self, key: str, size: int, prefix: str="", is_base64=False):
+        self.key = key
+        self.size = size
+        self.prefix = prefix
+        self.is_base64 = is_base64
+
+    def pack(self, items: List[dict], buffer: List[bytes]) -> List[dict]:
+        """Append the column to buffer.
+
+        :return: copies of items. The packed fields are replaced with None to keep the order of keys.
+        """
+        flags = bytearray(len(items))
+        raws = []
+        packed_items = []
+        for index, item in enumerate(items):
+            raw = self._to_raw(item.get(self.key))
+            if raw is not None:
+                item = dict(item)
+                item[self.key] = None
+                flags[index] = 1
+                raws.append(raw)
+            packed_items.append(item)
+
+        buffer.append(bytes(flags))
+        buffer.append(b"".join(raws))
+        return packed_items
+
+    def unpack(self, record: bytes, offset: int, count: int) -> Tuple[bytes, List[str], int]:
+        """
+        :return: flags, values of flagged items, next offset
+        """
+        flags = record[offset:offset + count]
+        offset += count
+
+        size = self.size
+        packed_count = flags.count(1)
+        blob = record[offset:offset + packed_count * size]
+        offset += packed_count * size
+
+        prefix = self.prefix
+        if self.is_base64:
+            values = [prefix + binascii.b2a_base64(blob[i:i + size], newline=False).decode()
+                      for i in range(0, len(blob), size)]
+        else:
+            hexed = blob.hex()
+            hex_size = size * 2
+            values = [prefix + hexed[i:i + hex_size] for i in range(0, len(hexed), hex_size)]
+        return flags, values, offset
+
+    def restore(self, items: List[dict], flags: bytes, values: List[str]):
+        key = self.key
+        if len(values) == len(items):
+            for item, value in zip(items, values):
+                item[key] = value
+        elif values:
+            values = iter(values)
+            for item, flag in zip(items, flags):
+                if flag:
+                    item[key] = next(values)
+
+    def _to_raw(self, value) -> Optional[bytes]:
+        if not isinstance(value, str) or not value.startswith(self.prefix):
+            return None
+
+        contents = value[len(self.prefix):]
+        try:
+            if self.is_base64:
+                raw = base64.b64decode(contents, validate=True)
+                canonical = base64.b64encode(raw).decode()
+            else:
+                raw = bytes.fromhex(contents)
+                canonical = raw.hex()
+        except (ValueError, binascii.Error):
+            return None
+
+        if canonical != contents or len(raw) != self.size:
+            return None
+        return raw
+
+
+def _pack_columns(items: List[dict], columns: Tuple[_Column, ...], buffer: List[bytes]) -> List[dict]:
+    for column in columns:
+        items = column.pack(items, buffer)
+    return items
+
+
+def _unpack_columns(record: bytes, offset: int, count: int, columns: Tuple[_Column, ...]) -> Tuple[list, int]:
+    unpacked = []
+    for column in columns:
+        flags, values, offset = column.unpack(record, offset, count)
+        unpacked.append((column, flags, values))
+    return unpacked, offset
+
+
+def _restore_columns(items: List[dict], unpacked: list):
+    for column, flags, values in unpacked:
+        column.restore(items, flags, values)
+
+
+_TX_COLUMNS = (
+    _Column("txHash", 32),
+    _Column("tx_hash", 32),
+    _Column("signature", 65, is_base64=True),
+    _Column("from", 20, "hx"),
+)
+
+
+class BlockRecord:
+    """Binary record of a serialized block in the block DB.
+
+    magic(2) | format version(1) | height(8) | block columns | tx count(4) | tx columns | JSON of the rest
+
+    Hashes, addresses and signatures are stored as raw bytes. Everything else is stored as JSON.
+    A record written by json.dumps before this format is read as it is.
+    """
+    MAGIC = b"\xffB"
+    FORMAT_VERSION = 1
+
+    _HEAD = struct.Struct(">2sBQ")
+    _TX_COUNT = struct.Struct(">I")
+    _COLUMNS = (
+        _Column("block_hash", 32),
+        _Column("prev_block_hash", 32),
+        _Column("merkle_tree_root_hash", 32),
+        _Column("peer_id", 20, "hx"),
+        _Column("next_leader", 20, "hx"),
+        _Column("signature", 65, is_base64=True),
+    )
+
+    @classmethod
+    def is_binary(cls, record: bytes) -> bool:
+        return record[:len(cls.MAGIC)] == cls.MAGIC
+
+    @classmethod
+    def dumps(cls, block_dumped: dict) -> bytes:
+        buffer = [cls._HEAD.pack(cls.MAGIC, cls.FORMAT_VERSION, block_dumped["height"])]
+        block_rest, = _pack_columns([block_dumped], cls._COLUMNS, buffer)
+
+        txs = block_rest.get("confirmed_transaction_list") or []
+        buffer.append(cls._TX_COUNT.pack(len(txs)))
+        txs_rest = _pack_columns(txs, _TX_COLUMNS, buffer)
+
+        if "confirmed_transaction_list" in block_rest:
+            block_rest = dict(block_rest)
+            block_rest["confirmed_transaction_list"] = None
+        buffer.append(json.dumps([block_rest, txs_rest], separators=(',', ':')).encode("utf-8"))
+        return b"".join(buffer)
+
+    @classmethod
+    def loads(cls, record: Union[bytes, bytearray, memoryview, str]) -> dict:
+        """:param record: a record of the block DB. LevelDB.Get returns bytearray."""
+        if isinstance(record, (bytearray, memoryview)):
+            record = bytes(record)
+        if not isinstance(record, bytes) or not cls.is_binary(record):
+            return json.loads(record)
+
+        _, format_version, _ = cls._HEAD.unpack_from(record)
+        if format_version != cls.FORMAT_VERSION:
+            raise ValueError(f"Not supported block record format version({format_version})")
+
+        block_columns, offset = _unpack_columns(record, cls._HEAD.size, 1, cls._COLUMNS)
+        tx_count, = cls._TX_COUNT.unpack_from(record, offset)
+        tx_columns, offset = _unpack_columns(record, offset + cls._TX_COUNT.size, tx_count, _TX_COLUMNS)
+
+        block_dumped, txs = json.loads(record[offset:].decode("utf-8"))
+        _restore_columns([block_dumped], block_columns)
+        _restore_columns(txs, tx_columns)
+        if "confirmed_transaction_list" in block_dumped:
+            block_dumped["confirmed_transaction_list"] = txs
+        return block_dumped
+
+    @classmethod
+    def get_height(cls, record: bytes) -> int:
+        _, _, height = cls._HEAD.unpack_from(record)
+        return height
+
+
+class BlockWire:
+    """Binary encoding of a serialized block sent to other peers instead of a pickled Block.
+
+    magic(2) | format version(1) | flags(1) | height(8) | header size(4) | header | body
+
+    header: JSON of the block without its txs. It is read without the body, see loads_header.
+    body: tx count(4) | tx columns | JSON of the rest of txs. It is compressed by zlib if FLAG_ZLIB is set.
+    """
+    MAGIC = b"\xffW"
+    FORMAT_VERSION = 1
+    FLAG_ZLIB = 0x01
+
+    _HEAD = struct.Struct(">2sBBQI")
+    _TX_COUNT = struct.Struct(">I")
+
+    @classmethod
+    def is_wire(cls, data: bytes) -> bool:
+        return data[:len(cls.MAGIC)] == cls.MAGIC
+
+    @classmethod
+    def dumps(cls, block_dumped: dict, zip_threshold=0) -> bytes:
+        """
+        :param zip_threshold: the body is compressed if it is larger than this. 0 means no compression.
+        """
+        header = block_dumped
+        txs = header.get("confirmed_transaction_list") or []
+        if "confirmed_transaction_list" in header:
+            header = dict(header)
+            header["confirmed_transaction_list"] = None
+        header_bytes = json.dumps(header, separators=(',', ':')).encode("utf-8")
+
+        body = [cls._TX_COUNT.pack(len(txs))]
+        txs_rest = _pack_columns(txs, _TX_COLUMNS, body)
+        body.append(json.dumps(txs_rest, separators=(',', ':')).encode("utf-8"))
+        body = b"".join(body)
+
+        flags = 0
+        if 0 < zip_threshold < len(body):
+            body = zlib.compress(body)
+            flags |= cls.FLAG_ZLIB
+
+        head = cls._HEAD.pack(cls.MAGIC, cls.FORMAT_VERSION, flags, block_dumped["height"], len(header_bytes))
+        return b"".join((head, header_bytes, body))
+
+    @classmethod
+    def loads_header(cls, data: bytes) -> dict:
+        """Read the block without txs. confirmed_transaction_list is None."""
+        _, header_end = cls.__unpack_head(data)
+        return json.loads(data[cls._HEAD.size:header_end].decode("utf-8"))
+
+    @classmethod
+    def loads(cls, data: bytes) -> dict:
+        flags, header_end = cls.__unpack_head(data)
+        block_dumped = json.loads(data[cls._HEAD.size:header_end].decode("utf-8"))
+
+        # The columns are read by offsets in the body without copying them.
+        if flags & cls.FLAG_ZLIB:
+            body, offset = zlib.decompress(data[header_end:]), 0
+        else:
+            body, offset = data, header_end
+
+        tx_count, = cls._TX_COUNT.unpack_from(body, offset)
+        tx_columns, offset = _unpack_columns(body, offset + cls._TX_COUNT.size, tx_count, _TX_COLUMNS)
+        txs = json.loads(body[offset:].decode("utf-8"))
+        _restore_columns(txs, tx_columns)
+
+        if "confirmed_transaction_list" in block_dumped:
+            block_dumped["confirmed_transaction_list"] = txs
+        return block_dumped
+
+    @classmethod
+    def get_height(cls, data: bytes) -> int:
+        _, _, _, height, _ = cls._HEAD.unpack_from(data)
+        return height
+
+    @classmethod
+    def __unpack_head(cls, data: bytes) -> Tuple[int, int]:
+        magic, format_version, flags, _, header_size = cls._HEAD.unpack_from(data)
+        if magic != cls.MAGIC:
+            raise ValueError("Not block wire data")
+        if format_version != cls.FORMAT_VERSION:
+            raise ValueError(f"Not supported block wire format version({format_version})")
+        return flags, cls._HEAD.size + header_size
+
+
+class TxInfoRecord:
+    """Binary record of tx info in the block DB.
+
+    magic(2) | format version(1) | tx info columns | tx columns | JSON of the rest
+    """
+    MAGIC = b"\xffT"
+    FORMAT_VERSION = 1
+
+    _HEAD = struct.Struct(">2sB")
+    _COLUMNS = (
+        _Column("block_hash", 32),
+    )
+
+    @classmethod
+    def is_binary(cls, record: bytes) -> bool:
+        return record[:len(cls.MAGIC)] == cls.MAGIC
+
+    @classmethod
+    def dumps(cls, tx_info: dict) -> bytes:
+        buffer = [cls._HEAD.pack(cls.MAGIC, cls.FORMAT_VERSION)]
+        tx_info_rest, = _pack_columns([tx_info], cls._COLUMNS, buffer)
+
+        tx_data = tx_info_rest.get("transaction")
+        txs = [tx_data] if isinstance(tx_data, dict) else [{}]
+        txs_rest = _pack_columns(txs, _TX_COLUMNS, buffer)
+        if isinstance(tx_data, dict):
+            tx_info_rest = dict(tx_info_rest)
+            tx_info_rest["transaction"] = txs_rest[0]
+
+        buffer.append(json.dumps(tx_info_rest, separators=(',', ':')).encode("utf-8"))
+        return b"".join(buffer)
+
+    @classmethod
+    def loads(cls, record: Union[bytes, bytearray, memoryview, str]) -> dict:
+        """:param record: a record of the block DB. LevelDB.Get returns bytearray."""
+        if isinstance(record, (bytearray, memoryview)):
+            record = bytes(record)
+        if not isinstance(record, bytes) or not cls.is_binary(record):
+            return json.loads(record)
+
+        _, format_version = cls._HEAD.unpack_from(record)
+        if format_version != cls.FORMAT_VERSION:
+            raise ValueError(f"Not supported tx info record format version({format_version})")
+
+        tx_info_columns, offset = _unpack_columns(record, cls._HEAD.size, 1, cls._COLUMNS)
+        tx_columns, offset = _unpack_columns(record, offset, 1, _TX_COLUMNS)
+
+        tx_info = json.loads(record[offset:].decode("utf-8"))
+        _restore_columns([tx_info], tx_info_columns)
+        if isinstance(tx_info.get("transaction"), dict):
+            _restore_columns([tx_info["transaction"]], tx_columns)
+        return tx_info
@@ -2,4 +2,5 @@ from .transaction import Transaction
 from .transaction_builder import TransactionBuilder
 from .transaction_serializer import TransactionSerializer
 from .transaction_verifier import TransactionVerifier
+from .transaction_batch_verifier import TransactionBatchVerifier
 from .transaction_versioner import TransactionVersioner
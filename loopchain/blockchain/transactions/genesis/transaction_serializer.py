@@ -17,7 +17,7 @@ class TransactionSerializer(BaseTransactionSerializer):
     def to_db_data(self, tx: 'Transaction'):
         return tx.raw_data
 
-    def from_(self, tx_data: dict) -> 'Transaction':
+    def from_(self, tx_data: dict, trusted=False) -> 'Transaction':
         hash_ = self._hash_generator.generate_hash(tx_data)
         nid = tx_data.get('nid')
         if nid:
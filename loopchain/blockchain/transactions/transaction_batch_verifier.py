@@ -0,0 +1,121 @@
+import logging
+import multiprocessing
+import threading
+from functools import partial
+from multiprocessing.pool import Pool
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple, Union
+
+from loopchain import configure as conf
+from .transaction_verifier import TransactionVerifier, recover_address
+
+if TYPE_CHECKING:
+    from . import Transaction, TransactionVersioner
+
+
+def _recover_addresses(items: List[Tuple[bytes, bytes]]) -> List[Union[bytes, Exception]]:
+    results = []
+    for tx_hash, signature in items:
+        try:
+            results.append(recover_address(tx_hash, signature))
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+class TransactionBatchVerifier:
+    """Verify many transactions at once.
+
+    Recovering the signer of each tx is the most expensive part of verification,
+    so it is done for the whole batch in worker processes first.
+    The other checks run in the calling process and use the recovered addresses.
+
+    Workers are started by a forkserver, because forking the channel process which runs grpc, timer and
+    message queue threads can deadlock in the child. ProcessPoolExecutor of Python 3.6 cannot take the context.
+    """
+    _executor: Pool = None
+    _executor_lock = threading.Lock()
+
+    def __init__(self, tx_versioner: 'TransactionVersioner'):
+        self._tx_versioner = tx_versioner
+
+    def verify(self, txs: Sequence['Transaction'], blockchain=None) -> List[Optional[Exception]]:
+        """
+        :return: the exception raised while verifying each tx or None if it is valid. It has the same order as txs.
+        """
+        return self._verify(txs, blockchain, is_loosely=False)
+
+    def verify_loosely(self, txs: Sequence['Transaction'], blockchain=None) -> List[Optional[Exception]]:
+        return self._verify(txs, blockchain, is_loosely=True)
+
+    def _verify(self, txs: Sequence['Transaction'], blockchain, is_loosely: bool) -> List[Optional[Exception]]:
+        results = []
+        for tx, address in zip(txs, self.recover_addresses(txs)):
+            try:
+                tv = TransactionVerifier.new(tx.version, self._tx_versioner)
+                if address is not None:
+                    tv.recover_address_func = partial(self._get_recovered_address, address)
+                if is_loosely:
+                    tv.verify_loosely(tx, blockchain)
+                else:
+                    tv.verify(tx, blockchain)
+            except Exception as e:
+                results.append(e)
+            else:
+                results.append(None)
+        return results
+
+    @staticmethod
+    def _get_recovered_address(address: Union[bytes, Exception], tx: 'Transaction'):
+        if isinstance(address, Exception):
+            raise address
+        return address
+
+    def recover_addresses(self, txs: Sequence['Transaction']) -> List[Union[bytes, Exception, None]]:
+        """Recover signers of txs.
+
+        :return: the address or the exception raised while recovering it, None if a tx does not have a signature.
+        It has the same order as txs.
+        """
+        indexes = [index for index, tx in enumerate(txs) if tx.signature]
+        items = [(bytes(txs[index].hash), bytes(txs[index].signature)) for index in indexes]
+        addresses = [None] * len(txs)
+        if not items:
+            return addresses
+
+        executor = self._get_executor() if len(items) >= conf.TX_BATCH_VERIFY_MIN_SIZE else None
+        if executor is None:
+            recovered = _recover_addresses(items)
+        else:
+            chunk_size = -(-len(items) // conf.TX_BATCH_VERIFY_WORKERS)
+            chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+            try:
+                # A chunk of a worker which is killed never returns, so it waits until the timeout.
+                recovered = [address
+                             for chunk_addresses in executor.map_async(_recover_addresses, chunks).get(
+                                 conf.TX_BATCH_VERIFY_TIMEOUT)
+                             for address in chunk_addresses]
+            except multiprocessing.TimeoutError:
+                logging.warning("TransactionBatchVerifier process pool does not respond. It will be restarted.")
+                self.shutdown()
+                recovered = _recover_addresses(items)
+
+        for index, address in zip(indexes, recovered):
+            addresses[index] = address
+        return addresses
+
+    @classmethod
+    def _get_executor(cls) -> Optional[Pool]:
+        if conf.TX_BATCH_VERIFY_WORKERS <= 1:
+            return None
+
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = multiprocessing.get_context("forkserver").Pool(conf.TX_BATCH_VERIFY_WORKERS)
+            return cls._executor
+
+    @classmethod
+    def shutdown(cls):
+        with cls._executor_lock:
+            if cls._executor is not None:
+                cls._executor.terminate()
+                cls._executor = None
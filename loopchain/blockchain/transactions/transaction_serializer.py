@@ -30,7 +30,12 @@ class TransactionSerializer(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def from_(self, tx_dumped: dict) -> 'Transaction':
+    def from_(self, tx_dumped: dict, trusted=False) -> 'Transaction':
+        """
+        :param tx_dumped:
+        :param trusted: take the tx hash from tx_dumped instead of generating it.
+        Use it only for the data which this node verified and stored by itself.
+        """
         raise NotImplementedError
 
     @abstractmethod
@@ -1,7 +1,7 @@
 import hashlib
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 from secp256k1 import PublicKey, PrivateKey
 from loopchain.crypto.hashing import build_hash_generator
 from .. import Hash32, ExternalAddress
@@ -10,14 +10,34 @@ if TYPE_CHECKING:
     from .. import TransactionVersioner
 
 
+_ecdsa = PrivateKey()
+
+
+def recover_address(tx_hash: bytes, signature: bytes) -> bytes:
+    """Recover the address which signed tx_hash.
+    It is a module level function so that it can be pickled and called in worker processes.
+    """
+    recoverable_sig = _ecdsa.ecdsa_recoverable_deserialize(signature[:-1], signature[-1])
+    raw_public_key = _ecdsa.ecdsa_recover(tx_hash,
+                                          recover_sig=recoverable_sig,
+                                          raw=True,
+                                          digest=hashlib.sha3_256)
+
+    public_key = PublicKey(raw_public_key, ctx=_ecdsa.ctx)
+    hash_pub = hashlib.sha3_256(public_key.serialize(compressed=False)[1:]).digest()
+    return hash_pub[-20:]
+
+
 class TransactionVerifier(ABC):
-    _ecdsa = PrivateKey()
     _hash_salt = None
 
     def __init__(self, hash_generator_version: int):
         self._hash_generator = build_hash_generator(hash_generator_version, self._hash_salt)
         self._tx_serializer = None
 
+        # It returns the address recovered from the signature of tx. e.g. already recovered by TransactionBatchVerifier
+        self.recover_address_func: Callable[['Transaction'], bytes] = None
+
     @abstractmethod
     def verify(self, tx: 'Transaction', blockchain=None):
         raise NotImplementedError
@@ -27,7 +47,7 @@ class TransactionVerifier(ABC):
         raise NotImplementedError
 
     def verify_tx_hash_unique(self, tx: 'Transaction', blockchain):
-        if blockchain.find_tx_by_key(tx.hash.hex()):
+        if blockchain.has_tx(tx.hash):
             raise RuntimeError(f"tx({tx})\n"
                                f"hash {tx.hash.hex()} already exists in blockchain.")
 
@@ -40,17 +60,11 @@ class TransactionVerifier(ABC):
                                f"expected {Hash32(tx_hash_expected).hex()}")
 
     def verify_signature(self, tx: 'Transaction'):
-        recoverable_sig = self._ecdsa.ecdsa_recoverable_deserialize(
-            tx.signature.signature(),
-            tx.signature.recover_id())
-        raw_public_key = self._ecdsa.ecdsa_recover(tx.hash,
-                                                   recover_sig=recoverable_sig,
-                                                   raw=True,
-                                                   digest=hashlib.sha3_256)
-
-        public_key = PublicKey(raw_public_key, ctx=self._ecdsa.ctx)
-        hash_pub = hashlib.sha3_256(public_key.serialize(compressed=False)[1:]).digest()
-        expect_address = hash_pub[-20:]
+        if self.recover_address_func:
+            expect_address = self.recover_address_func(tx)
+        else:
+            expect_address = recover_address(tx.hash, tx.signature)
+
         if expect_address != tx.from_address:
             raise RuntimeError(f"tx({tx})\n"
                                f"from address {tx.from_address.hex_xx()}\n"
@@ -24,7 +24,7 @@ class TransactionSerializer(BaseTransactionSerializer):
     def to_db_data(self, tx: 'Transaction'):
         return self.to_full_data(tx)
 
-    def from_(self, tx_data: dict) -> 'Transaction':
+    def from_(self, tx_data: dict, trusted=False) -> 'Transaction':
         tx_data_copied = dict(tx_data)
 
         tx_data_copied.pop('method', None)
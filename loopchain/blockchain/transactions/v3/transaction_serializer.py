@@ -22,13 +22,16 @@ class TransactionSerializer(BaseTransactionSerializer):
     def to_db_data(self, tx: 'Transaction'):
         return dict(tx.raw_data)
 
-    def from_(self, tx_data: dict) -> 'Transaction':
+    def from_(self, tx_data: dict, trusted=False) -> 'Transaction':
         tx_data_copied = dict(tx_data)
-        tx_data_copied.pop('txHash', None)
+        tx_hash = tx_data_copied.pop('txHash', None)
         raw_data = dict(tx_data_copied)
 
         tx_data_copied.pop('signature', None)
-        tx_hash = self._hash_generator.generate_hash(tx_data_copied)
+        if trusted and tx_hash:
+            tx_hash = Hash32.fromhex(tx_hash, ignore_prefix=True)
+        else:
+            tx_hash = Hash32(self._hash_generator.generate_hash(tx_data_copied))
 
         nonce = tx_data.get('nonce')
         if nonce is not None:
@@ -40,7 +43,7 @@ class TransactionSerializer(BaseTransactionSerializer):
 
         return Transaction(
             raw_data=raw_data,
-            hash=Hash32(tx_hash),
+            hash=tx_hash,
             signature=Signature.from_base64str(tx_data['signature']),
             timestamp=int(tx_data['timestamp'], 16),
             from_address=Address.fromhex_address(tx_data['from']),
@@ -0,0 +1,197 @@
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Scalable bloom filter of committed tx hashes"""
+
+import math
+import struct
+from typing import List
+
+
+class _BloomSlice:
+    """A bloom filter of a fixed capacity.
+
+    Tx hashes are SHA3-256 already, so the bit indexes are taken from the hash itself by double hashing
+    instead of hashing it again.
+    """
+    HEADER = struct.Struct(">QdQQ")  # capacity, error rate, count, bit count
+
+    def __init__(self, capacity: int, error_rate: float, count=0, bit_count=None, bits: bytes=None):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.count = count
+        self.hash_count = max(1, math.ceil(math.log2(1 / error_rate)))
+        self.bit_count = bit_count or max(8, math.ceil(capacity * math.log(1 / error_rate) / (math.log(2) ** 2)))
+        self.bits = bytearray(bits) if bits else bytearray((self.bit_count + 7) // 8)
+
+    def is_full(self):
+        return self.count >= self.capacity
+
+    def __indexes(self, key: bytes):
+        bit_count = self.bit_count
+        h1 = int.from_bytes(key[:8], byteorder='big')
+        h2 = int.from_bytes(key[8:16], byteorder='big') | 1
+        return [(h1 + i * h2) % bit_count for i in range(self.hash_count)]
+
+    def __contains__(self, key: bytes):
+        bits = self.bits
+        for index in self.__indexes(key):
+            if not bits[index >> 3] & (1 << (index & 7)):
+                return False
+        return True
+
+    def add(self, key: bytes):
+        bits = self.bits
+        for index in self.__indexes(key):
+            bits[index >> 3] |= 1 << (index & 7)
+        self.count += 1
+
+    def get_fill_ratio(self) -> float:
+        return sum(bin(byte).count("1") for byte in self.bits) / self.bit_count
+
+    def dumps(self) -> bytes:
+        return self.HEADER.pack(self.capacity, self.error_rate, self.count, self.bit_count) + bytes(self.bits)
+
+    @classmethod
+    def loads(cls, data: bytes, offset: int):
+        """:return: the slice, next offset"""
+        capacity, error_rate, count, bit_count = cls.HEADER.unpack_from(data, offset)
+        offset += cls.HEADER.size
+        bits_size = (bit_count + 7) // 8
+        bits = data[offset:offset + bits_size]
+        if len(bits) != bits_size:
+            raise ValueError("The tx hash filter record is truncated.")
+        return cls(capacity, error_rate, count, bit_count, bits), offset + bits_size
+
+
+class TxHashFilter:
+    """Scalable bloom filter of the tx hashes in the block DB.
+
+    A tx hash which is not in the filter is not in the block DB for sure.
+    When a slice is full, a new slice is added with twice the capacity and half the error rate,
+    so the total false positive rate stays under error_rate however many txs are added.
+
+    It also counts the results of checks to report the false positive rate in the status of the channel.
+    """
+    VERSION = 1
+    HEADER = struct.Struct(">BqI")  # version, height, slice count
+    GROWTH = 2
+    TIGHTENING_RATIO = 0.5
+
+    def __init__(self, capacity: int, error_rate: float, height=-1):
+        """
+        :param capacity: the number of tx hashes of the first slice
+        :param error_rate: the false positive rate of the filter
+        :param height: the height of the last block whose txs are in the filter
+        """
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.height = height
+        self.__slices: List[_BloomSlice] = []
+
+        self.__check_count = 0
+        self.__hit_count = 0
+        self.__false_positive_count = 0
+
+    @property
+    def count(self):
+        return sum(bloom_slice.count for bloom_slice in self.__slices)
+
+    def __contains__(self, tx_hash: bytes):
+        return any(tx_hash in bloom_slice for bloom_slice in reversed(self.__slices))
+
+    def add(self, tx_hash: bytes) -> bool:
+        """:return: False if tx_hash is in the filter already."""
+        if tx_hash in self:
+            return False
+
+        if not self.__slices or self.__slices[-1].is_full():
+            self.__slices.append(self.__new_slice())
+        self.__slices[-1].add(tx_hash)
+        return True
+
+    def __new_slice(self) -> _BloomSlice:
+        index = len(self.__slices)
+        capacity = self.capacity * (self.GROWTH ** index)
+        error_rate = self.error_rate * (1 - self.TIGHTENING_RATIO) * (self.TIGHTENING_RATIO ** index)
+        return _BloomSlice(capacity, error_rate)
+
+    def check(self, tx_hash: bytes) -> bool:
+        """Check tx_hash before reading the block DB. Call count_false_positive if the block DB does not have it.
+
+        :return: False if tx_hash is not in the block DB for sure.
+        """
+        self.__check_count += 1
+        if tx_hash in self:
+            self.__hit_count += 1
+            return True
+        return False
+
+    def count_false_positive(self):
+        self.__false_positive_count += 1
+
+    def get_status(self) -> dict:
+        # Every check of a new tx is a negative or a false positive.
+        new_count = self.__check_count - self.__hit_count + self.__false_positive_count
+        return {
+            "height": self.height,
+            "count": self.count,
+            "slices": len(self.__slices),
+            "bytes": sum(len(bloom_slice.bits) for bloom_slice in self.__slices),
+            "checks": self.__check_count,
+            "hits": self.__hit_count,
+            "false_positives": self.__false_positive_count,
+            "false_positive_rate": self.__false_positive_count / new_count if new_count else 0.0,
+            "expected_false_positive_rate": self.get_expected_false_positive_rate()
+        }
+
+    def get_expected_false_positive_rate(self) -> float:
+        """:return: the false positive rate by the fill ratio of the slices"""
+        true_negative_rate = 1.0
+        for bloom_slice in self.__slices:
+            true_negative_rate *= 1 - bloom_slice.get_fill_ratio() ** bloom_slice.hash_count
+        return 1 - true_negative_rate
+
+    def dumps(self) -> bytes:
+        return b"".join([self.HEADER.pack(self.VERSION, self.height, len(self.__slices))] +
+                        [bloom_slice.dumps() for bloom_slice in self.__slices])
+
+    @classmethod
+    def loads(cls, data: bytes, capacity: int, error_rate: float) -> 'TxHashFilter':
+        """
+        :param capacity: capacity of the filter. A filter of another capacity or error rate is not loaded.
+        :param error_rate: error rate of the filter
+        :raise ValueError: data is not a tx hash filter of capacity and error_rate.
+        """
+        data = bytes(data)
+        try:
+            version, height, slice_count = cls.HEADER.unpack_from(data)
+        except struct.error as e:
+            raise ValueError(f"The tx hash filter record is invalid. ({e})")
+        if version != cls.VERSION:
+            raise ValueError(f"The version of the tx hash filter record({version}) is not supported.")
+
+        tx_hash_filter = cls(capacity, error_rate, height)
+        offset = cls.HEADER.size
+        for _ in range(slice_count):
+            try:
+                bloom_slice, offset = _BloomSlice.loads(data, offset)
+            except struct.error as e:
+                raise ValueError(f"The tx hash filter record is invalid. ({e})")
+
+            expected_slice = tx_hash_filter.__new_slice()
+            if (bloom_slice.capacity, bloom_slice.error_rate) != (expected_slice.capacity, expected_slice.error_rate):
+                raise ValueError("The capacity or the error rate of the tx hash filter is changed.")
+            tx_hash_filter.__slices.append(bloom_slice)
+
+        return tx_hash_filter
@@ -12,10 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """data object for peer votes to one block"""
+import json
 import logging
 import pickle
+from collections import Counter
 from enum import Enum
 
+import loopchain.utils as util
 from loopchain import configure as conf
 from loopchain.baseservice import PeerManager
 
@@ -44,6 +47,7 @@ class Vote:
         self.__data = data
         # self.__votes is { group_id : { peer_id : [vote_result, vote_sign] }, }:
         self.__votes = self.__make_vote_init(audience)
+        self.__init_tally()
 
     @property
     def type(self):
@@ -72,19 +76,120 @@ class Vote:
                     vote_init[group_id][peer_id] = []
         else:
             for peer_id in audience:
-                vote_init[audience[peer_id].group_id] = {}
-                vote_init[audience[peer_id].group_id][peer_id] = []
+                vote_init.setdefault(audience[peer_id].group_id, {})[peer_id] = []
 
         logging.debug("vote_init: " + str(vote_init))
         return vote_init
 
+    def __init_tally(self):
+        """Count votes once. add_vote keeps the counts after then."""
+        # self.__tally is { group_id : [peer_count, agree_peer_count, disagree_peer_count] }
+        self.__tally = {}
+        self.__agree_results = Counter()
+        self.__agree_peer_count = 0
+        self.__total_peer_count = 0
+        # count of groups by the voting_ratio last asked. get_result_detail recounts them when it changes.
+        self.__voting_ratio = None
+        self.__agree_vote_group_count = 0
+        self.__total_vote_group_count = 0
+
+        for group_id, group_votes in (self.__votes or {}).items():
+            self.__tally[group_id] = [len(group_votes), 0, 0]
+            self.__total_peer_count += len(group_votes)
+            for vote in group_votes.values():
+                if len(vote) > 0:
+                    self.__count_vote(group_id, vote[0], 1)
+
+    def __count_vote(self, group_id, vote_result, count):
+        group_tally = self.__tally[group_id]
+        if vote_result:
+            group_tally[1] += count
+            self.__agree_peer_count += count
+            self.__agree_results[vote_result] += count
+            if self.__agree_results[vote_result] <= 0:
+                del self.__agree_results[vote_result]
+        else:
+            group_tally[2] += count
+
+    def __get_group_state(self, group_id, voting_ratio):
+        """
+        :return: 2 if the group agrees, 1 if the group votes but does not agree, 0 if the group is still voting
+        """
+        peer_count, agree_peer_count, disagree_peer_count = self.__tally[group_id]
+        # don't treat with null group
+        if peer_count == 0:
+            return 0
+        if agree_peer_count > peer_count * voting_ratio:
+            return 2
+        if (disagree_peer_count - agree_peer_count) >= peer_count * (1 - voting_ratio):
+            return 1
+        return 0
+
+    def __count_group(self, group_state, count):
+        if group_state > 0:
+            self.__total_vote_group_count += count
+        if group_state > 1:
+            self.__agree_vote_group_count += count
+
+    def __set_vote(self, group_id, peer_id, vote):
+        prev_vote = self.__votes[group_id][peer_id]
+        if self.__voting_ratio is not None:
+            self.__count_group(self.__get_group_state(group_id, self.__voting_ratio), -1)
+
+        if len(prev_vote) > 0:
+            self.__count_vote(group_id, prev_vote[0], -1)
+        self.__votes[group_id][peer_id] = vote
+        if len(vote) > 0:
+            self.__count_vote(group_id, vote[0], 1)
+
+        if self.__voting_ratio is not None:
+            self.__count_group(self.__get_group_state(group_id, self.__voting_ratio), 1)
+
+    def __count_groups(self, voting_ratio):
+        self.__voting_ratio = voting_ratio
+        self.__agree_vote_group_count = 0
+        self.__total_vote_group_count = 0
+        for group_id in self.__tally:
+            self.__count_group(self.__get_group_state(group_id, voting_ratio), 1)
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state.pop("_Vote__tally")
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__init_tally()
+
     @staticmethod
     def save_to(obj):
-        return pickle.dumps(obj)
+        """Dump the vote results for the BLOCK_INFO_KEY record. A vote sign is the vote result itself.
+        The vote of a peer is [vote_result] or null if the peer did not vote.
+        """
+        vote_dumped = {
+            "type": obj.type.name,
+            "target_hash": obj.target_hash,
+            "votes": {
+                group_id: {peer_id: [vote[0]] if len(vote) > 0 else None for peer_id, vote in group_votes.items()}
+                for group_id, group_votes in (obj.votes or {}).items()
+            }
+        }
+        return json.dumps(vote_dumped, separators=(',', ':')).encode(encoding='UTF-8')
 
     @staticmethod
     def load_from(obj):
-        return pickle.loads(obj)
+        """Load a vote from save_to or a pickled vote of old records"""
+        if not obj.startswith(b'{'):
+            return pickle.loads(obj)
+
+        vote_dumped = json.loads(obj)
+        vote = Vote(vote_dumped["target_hash"], None, vote_type=VoteType[vote_dumped["type"]])
+        vote.__votes = {
+            group_id: {peer_id: [] if vote is None else (vote[0], vote[0]) for peer_id, vote in group_votes.items()}
+            for group_id, group_votes in vote_dumped["votes"].items()
+        }
+        vote.__init_tally()
+        return vote
 
     @staticmethod
     def __parse_vote_sign(vote_sign):
@@ -97,7 +202,7 @@ class Vote:
             return False
         if peer_id not in self.__votes[group_id].keys():
             return False
-        self.__votes[group_id][peer_id] = (self.__parse_vote_sign(vote_sign), vote_sign)
+        self.__set_vote(group_id, peer_id, (self.__parse_vote_sign(vote_sign), vote_sign))
         return True
 
     def get_result(self, block_hash, voting_ratio):
@@ -116,52 +221,25 @@ class Vote:
         if self.__target_hash != block_hash:
             return False, 0, 0, 0, 0, 0, 0
 
-        total_group_count = len(self.__votes)
-        total_peer_count = sum([len(self.__votes[group_id]) for group_id in list(self.__votes.keys())])
-        agree_vote_group_count = 0
-        total_vote_group_count = 0
-        agree_vote_peer_count = 0
-        result = None
+        if voting_ratio != self.__voting_ratio:
+            self.__count_groups(voting_ratio)
 
-        for group_id in list(self.__votes.keys()):
-            # don't treat with null group
-            if len(self.__votes[group_id]) == 0:
-                continue
+        total_group_count = len(self.__tally)
+        agree_vote_group_count = self.__agree_vote_group_count
 
-            total_peer_count_in_group = 0
-            agree_peer_count_in_group = 0
-            vote_peer_count_in_group = 0
-            for peer_id in list(self.__votes[group_id].keys()):
-                total_peer_count_in_group += 1
-                if len(self.__votes[group_id][peer_id]) > 0 and self.__votes[group_id][peer_id][0]:
-                    if result and result != self.__votes[group_id][peer_id][0]:
-                        result = False
-                    else:
-                        agree_peer_count_in_group += 1
-                        agree_vote_peer_count += 1
-                        result = self.__votes[group_id][peer_id][0]
-                if len(self.__votes[group_id][peer_id]) > 0 and not self.__votes[group_id][peer_id][0]:
-                    vote_peer_count_in_group += 1
-
-            if agree_peer_count_in_group > total_peer_count_in_group * voting_ratio:
-                agree_vote_group_count += 1
-                total_vote_group_count += 1
-            elif (vote_peer_count_in_group - agree_peer_count_in_group) \
-                    >= total_peer_count_in_group * (1 - voting_ratio):
-                total_vote_group_count += 1
-
-        if agree_vote_group_count < total_group_count * voting_ratio:
+        # agreed peers must vote the same result.
+        if agree_vote_group_count < total_group_count * voting_ratio or len(self.__agree_results) > 1:
             result = False
+        else:
+            result = next(iter(self.__agree_results), None)
 
-        logging.debug("==result: " + str(result))
-        logging.debug("=agree_vote_group_count: " + str(agree_vote_group_count))
-        logging.debug("=total_vote_group_count: " + str(total_vote_group_count))
-        logging.debug("=total_group_count: " + str(total_group_count))
-        logging.debug("=agree_vote_peer_count: " + str(agree_vote_peer_count))
-        logging.debug("=total_peer_count: " + str(total_peer_count))
+        util.logger.spam(f"vote result({result}) agree_vote_group_count({agree_vote_group_count}) "
+                      f"total_vote_group_count({self.__total_vote_group_count}) "
+                      f"total_group_count({total_group_count}) agree_vote_peer_count({self.__agree_peer_count}) "
+                      f"total_peer_count({self.__total_peer_count})")
 
-        return result, agree_vote_group_count, total_vote_group_count, \
-            total_group_count, agree_vote_peer_count, total_peer_count, voting_ratio
+        return result, agree_vote_group_count, self.__total_vote_group_count, \
+            total_group_count, self.__agree_peer_count, self.__total_peer_count, voting_ratio
 
     def is_failed_vote(self, block_hash, voting_ratio):
         result, agree_vote_group_count, total_vote_group_count, total_group_count, \
@@ -184,7 +262,7 @@ class Vote:
             for peer_id in list(self.__votes[group_id].keys()):
                 if peer_id not in prev_vote.votes[group_id].keys():
                     continue
-                self.__votes[group_id][peer_id] = prev_vote.votes[group_id][peer_id]
+                self.__set_vote(group_id, peer_id, prev_vote.votes[group_id][peer_id])
 
     def check_vote_init(self, audience):
         """check leader's vote init is same on this peer
@@ -24,11 +24,13 @@ from earlgrey import *
 from loopchain import configure as conf
 from loopchain import utils as util
 from loopchain.baseservice import BroadcastCommand, ScoreResponse
-from loopchain.blockchain import (Transaction, TransactionSerializer, TransactionVerifier, Block, BlockBuilder,
-                                  BlockSerializer, blocks, Hash32)
+from loopchain.blockchain import (Transaction, TransactionSerializer, TransactionVerifier, TransactionBatchVerifier,
+                                  Block, BlockBuilder, BlockSerializer, blocks, Hash32)
 from loopchain.blockchain.exception import *
 from loopchain.channel.channel_property import ChannelProperty
 from loopchain.protos import loopchain_pb2, message_code
+from loopchain.tools.grpc_helper import GRPCChannelPool
+from loopchain.utils.message_queue import StubCollection
 
 if TYPE_CHECKING:
     from loopchain.channel.channel_service import ChannelService
@@ -132,6 +134,12 @@ class ChannelInnerTask:
         status_data["unconfirmed_tx"] = block_manager.get_count_of_unconfirmed_tx()
         status_data["peer_target"] = ChannelProperty().peer_target
         status_data["leader_complaint"] = 1
+        status_data["cache"] = block_manager.get_blockchain().get_cache_status()
+        status_data["block_commit"] = block_manager.get_blockchain().get_commit_status()
+        status_data["tx_hash_filter"] = block_manager.get_blockchain().get_tx_hash_filter_status()
+        status_data["tx_relay"] = self._channel_service.broadcast_scheduler.get_tx_relay_status()
+        status_data["timer_loop_lag"] = self._channel_service.timer_service.get_loop_lag()
+        status_data["grpc_channels"] = GRPCChannelPool().get_status()
 
         return status_data
 
@@ -178,6 +186,10 @@ class ChannelInnerTask:
         tx = None
 
         try:
+            if self._channel_service.broadcast_scheduler.is_tx_relay_full():
+                logging.warning(f"create_icx_tx: tx relay queue is full. ({conf.MAX_STORED_TX_COUNT})")
+                return message_code.Response.fail_tx_relay_queue_full, None
+
             tx_versioner = self._channel_service.block_manager.get_blockchain().tx_versioner
             tx_version = tx_versioner.get_version(kwargs)
 
@@ -236,32 +248,42 @@ class ChannelInnerTask:
 
     @message_queue_task(type_=MessageQueueType.Worker)
     def add_tx_list(self, request) -> tuple:
-        tx_validate_count = 0
+        tx_versioner = self._channel_service.block_manager.get_blockchain().tx_versioner
+        txs = []
 
         for tx_item in request.tx_list:
-            tx_json = json.loads(tx_item.tx_json)
+            try:
+                tx_json = json.loads(tx_item.tx_json)
+                tx_version = tx_versioner.get_version(tx_json)
 
-            tx_versioner = self._channel_service.block_manager.get_blockchain().tx_versioner
-            tx_version = tx_versioner.get_version(tx_json)
+                ts = TransactionSerializer.new(tx_version, tx_versioner)
+                txs.append(ts.from_(tx_json))
+            except Exception as e:
+                logging.warning(f"add_tx_list: tx restore fail.\n"
+                                f"tx_json({tx_item.tx_json})\n"
+                                f"exception({e})")
 
-            ts = TransactionSerializer.new(tx_version, tx_versioner)
-            tx = ts.from_(tx_json)
+        tx_validate_count = 0
+        object_has_queue = self._channel_service.get_object_has_queue_by_consensus()
 
-            tv = TransactionVerifier.new(tx_version, tx_versioner)
-            tv.verify(tx)
+        tbv = TransactionBatchVerifier(tx_versioner)
+        for tx, exception in zip(txs, tbv.verify(txs)):
+            if exception:
+                logging.warning(f"add_tx_list: tx verify fail.\n"
+                                f"tx({tx})\n"
+                                f"exception({exception})")
+                continue
 
             # util.logger.spam(f"channel_inner_service:add_tx tx({tx.get_data_string()})")
 
-            object_has_queue = self._channel_service.get_object_has_queue_by_consensus()
-            if tx is not None:
-                object_has_queue.add_tx_obj(tx)
-                tx_validate_count += 1
-                util.apm_event(ChannelProperty().peer_id, {
-                    'event_type': 'AddTx',
-                    'peer_id': ChannelProperty().peer_id,
-                    'peer_name': conf.PEER_NAME,
-                    'channel_name': ChannelProperty().name,
-                    'data': {'tx_hash': tx.hash.hex()}})
+            object_has_queue.add_tx_obj(tx)
+            tx_validate_count += 1
+            util.apm_event(ChannelProperty().peer_id, {
+                'event_type': 'AddTx',
+                'peer_id': ChannelProperty().peer_id,
+                'peer_name': conf.PEER_NAME,
+                'channel_name': ChannelProperty().name,
+                'data': {'tx_hash': tx.hash.hex()}})
 
         if tx_validate_count == 0:
             response_code = message_code.Response.fail
@@ -300,13 +322,12 @@ class ChannelInnerTask:
                 return response_code, None
 
     @message_queue_task(type_=MessageQueueType.Worker)
-    async def announce_unconfirmed_block(self, block_pickled) -> None:
-        unconfirmed_block = util.block_loads(block_pickled)
+    async def announce_unconfirmed_block(self, block_dumped) -> None:
+        unconfirmed_block = self._channel_service.block_manager.get_blockchain().loads_block_wire(block_dumped)
 
-        logging.debug(f"#block \n"
-                      f"peer_id({unconfirmed_block.header.peer_id.hex()})\n"
-                      f"height({unconfirmed_block.header.height})\n"
-                      f"hash({unconfirmed_block.header.hash.hex()})")
+        logging.debug("#block \npeer_id(%s)\nheight(%s)\nhash(%s)",
+                      unconfirmed_block.header.peer_id.hex(), unconfirmed_block.header.height,
+                      unconfirmed_block.header.hash.hex())
 
         self._channel_service.block_manager.add_unconfirmed_block(unconfirmed_block)
         self._channel_service.state_machine.vote()
@@ -383,9 +404,37 @@ class ChannelInnerTask:
 
         logging.info(f"block header : {block.header}")
 
-        block_dumped = util.block_dumps(block)
+        block_dumped = blockchain.dumps_block_wire(block)
         return message_code.Response.success, block.header.height, blockchain.block_height, block_dumped
 
+    @message_queue_task
+    def block_range_sync(self, start_height, count):
+        blockchain = self._channel_service.block_manager.get_blockchain()
+
+        blocks_dumped = []
+        blocks_size = 0
+        for block_height in range(start_height, start_height + min(count, conf.BLOCK_SYNC_RANGE_SIZE)):
+            block = blockchain.find_block_by_height(block_height)
+            if block is None:
+                break
+
+            block_dumped = blockchain.dumps_block_wire(block)
+            blocks_size += len(block_dumped)
+            if blocks_dumped and blocks_size > conf.BLOCK_SYNC_RANGE_MAX_BYTES:
+                break
+            blocks_dumped.append(block_dumped)
+
+        if not blocks_dumped:
+            return message_code.Response.fail_wrong_block_height, blockchain.block_height, []
+
+        return message_code.Response.success, blockchain.block_height, blocks_dumped
+
+    @message_queue_task
+    def get_block_records(self, start_height, count):
+        blockchain = self._channel_service.block_manager.get_blockchain()
+        block_records = blockchain.get_block_records(start_height, count, conf.BLOCK_SYNC_RANGE_MAX_BYTES)
+        return blockchain.block_height, block_records
+
     @message_queue_task(type_=MessageQueueType.Worker)
     def block_height_sync(self):
         self._channel_service.state_machine.block_sync()
@@ -426,10 +475,10 @@ class ChannelInnerTask:
     @message_queue_task(type_=MessageQueueType.Worker)
     def vote_unconfirmed_block(self, peer_id, group_id, block_hash: Hash32, vote_code) -> None:
         block_manager = self._channel_service.block_manager
-        util.logger.spam(f"channel_inner_service:vote_unconfirmed_block "
-                         f"({ChannelProperty().name}) block_hash({block_hash})")
+        util.logger.spam("channel_inner_service:vote_unconfirmed_block (%s) block_hash(%s)",
+                         ChannelProperty().name, block_hash)
 
-        util.logger.debug("Peer vote to : " + block_hash.hex()[:8] + " " + str(vote_code) + f"from {peer_id[:8]}")
+        util.logger.debug("Peer vote to : %.8s %s from %.8s", block_hash.hex(), vote_code, peer_id)
 
         self._channel_service.block_manager.candidate_blocks.add_vote(
             block_hash,
@@ -588,15 +637,17 @@ class ChannelInnerTask:
 
     @message_queue_task
     def get_precommit_block(self, last_block_height: int):
-        block_manager = self._channel_service.block_manager
-        precommit_block = block_manager.get_blockchain().get_precommit_block()
+        blockchain = self._channel_service.block_manager.get_blockchain()
+        precommit_block = blockchain.get_precommit_block()
 
         if precommit_block is None:
             return message_code.Response.fail, "there is no precommit block.", b""
-        if precommit_block.height != last_block_height + 1:
+        if precommit_block.header.height != last_block_height + 1:
             return message_code.Response.fail, "need block height sync.", b""
 
-        return message_code.Response.success, "success", pickle.dumps(precommit_block)
+        # old versions load the precommit block with pickle.loads, not with util.block_loads.
+        return message_code.Response.success, "success", \
+            blockchain.dumps_block_wire(precommit_block, pickle_dumps=pickle.dumps)
 
     @message_queue_task
     def get_tx_by_address(self, address, index):
@@ -654,6 +705,11 @@ class ChannelInnerService(MessageQueueService[ChannelInnerTask]):
 
         asyncio.run_coroutine_threadsafe(_notify(), self.loop)
 
+    def update_peer_status(self, status: dict):
+        """Push the status of the channel to the peer, without waiting for the peer."""
+        asyncio.run_coroutine_threadsafe(
+            StubCollection().peer_stub.async_task().update_status(ChannelProperty().name, status), self.loop)
+
 
 class ChannelInnerStub(MessageQueueStub[ChannelInnerTask]):
     TaskType = ChannelInnerTask
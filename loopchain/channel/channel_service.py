@@ -26,7 +26,7 @@ import loopchain.utils as util
 from loopchain import configure as conf
 from loopchain.baseservice import BroadcastScheduler, BroadcastCommand, ObjectManager, CommonSubprocess
 from loopchain.baseservice import RestStubManager, NodeSubscriber
-from loopchain.baseservice import StubManager, PeerManager, PeerStatus, TimerService
+from loopchain.baseservice import StubManager, PeerManager, PeerStatus, TimerService, PeerHealthTracker
 from loopchain.blockchain import Block, BlockBuilder, TransactionSerializer
 from loopchain.channel.channel_inner_service import ChannelInnerService
 from loopchain.channel.channel_property import ChannelProperty
@@ -36,7 +36,7 @@ from loopchain.peer import BlockManager
 from loopchain.protos import loopchain_pb2_grpc, message_code, loopchain_pb2
 from loopchain.utils import loggers, command_arguments
 from loopchain.utils.icon_service import convert_params, ParamType, response_to_json_query
-from loopchain.utils.message_queue import StubCollection
+from loopchain.utils.message_queue import StubCollection, connect_service
 
 
 class ChannelService:
@@ -46,8 +46,11 @@ class ChannelService:
         self.__score_info: dict = None
         self.__peer_auth: Signer = None
         self.__peer_manager: PeerManager = None
+        self.__peer_health_tracker: PeerHealthTracker = None
         self.__broadcast_scheduler: BroadcastScheduler = None
         self.__radio_station_stub = None
+        # version of the peer list from RS which is loaded to the peer manager
+        self.__peer_list_version = 0
         self.__consensus = None
         # self.__proposer: Proposer = None
         # self.__acceptor: Acceptor = None
@@ -177,6 +180,12 @@ class ChannelService:
             self.__consensus.wait()
             logging.info("Cleanup Consensus.")
 
+        if self.__peer_health_tracker:
+            self.__peer_health_tracker.stop()
+            self.__peer_health_tracker.wait()
+            self.__peer_health_tracker = None
+            logging.info("Cleanup PeerHealthTracker.")
+
         if self.__timer_service.is_run():
             self.__timer_service.stop()
             self.__timer_service.wait()
@@ -196,13 +205,14 @@ class ChannelService:
         ChannelProperty().score_package = score_package
 
         self.__peer_manager = PeerManager(ChannelProperty().name)
+        self.__init_peer_health_tracker()
         self.__init_peer_auth()
         self.__init_broadcast_scheduler()
         self.__init_block_manager()
         self.__init_radio_station_stub()
 
         await self.__init_score_container()
-        await self.__inner_service.connect(conf.AMQP_CONNECTION_ATTEMPS, conf.AMQP_RETRY_DELAY, exclusive=True)
+        await connect_service(self.__inner_service, exclusive=True)
 
         # if conf.CONSENSUS_ALGORITHM == conf.ConsensusAlgorithm.lft:
         #     util.logger.spam(f"init consensus !")
@@ -307,6 +317,11 @@ class ChannelService:
     #     self.__consensus.register_subscriber(acceptor)
     #     self.__acceptor = acceptor
 
+    def __init_peer_health_tracker(self):
+        if conf.ENABLE_PEER_HEALTH_TRACKER:
+            self.__peer_health_tracker = PeerHealthTracker(self.__peer_manager)
+            self.__peer_health_tracker.start()
+
     def __init_broadcast_scheduler(self):
         scheduler = BroadcastScheduler(channel=ChannelProperty().name, self_target=ChannelProperty().peer_target)
         scheduler.start()
@@ -435,7 +450,8 @@ class ChannelService:
                 peer_object=b'',
                 peer_id=ChannelProperty().peer_id,
                 peer_target=ChannelProperty().peer_target,
-                group_id=ChannelProperty().group_id),
+                group_id=ChannelProperty().group_id,
+                peer_list_version=self.__peer_list_version),
             retry_times=conf.CONNECTION_RETRY_TIMES_TO_RS,
             is_stub_reuse=True,
             timeout=conf.CONNECTION_TIMEOUT_TO_RS)
@@ -446,20 +462,29 @@ class ChannelService:
                                                   callback=self.connect_to_radio_station,
                                                   callback_kwargs={"is_reconnect": True})
 
-        if is_reconnect:
+        if not response or response.status != message_code.Response.success:
             return
 
-        if response and response.status == message_code.Response.success:
+        if response.HasField("peer_list_delta"):
+            # RS replies changes since the peer list version, it is empty mostly when reconnecting.
+            self.__peer_list_version, peer_list, removed_peer_list = \
+                self.__peer_manager.load_delta(response.peer_list_delta)
+            for each_peer in removed_peer_list:
+                self.__broadcast_scheduler.schedule_job(BroadcastCommand.UNSUBSCRIBE, each_peer.target)
+        elif is_reconnect:
+            return
+        else:
             peer_list_data = pickle.loads(response.peer_list)
             self.__peer_manager.load(peer_list_data, False)
-            peers, peer_list = self.__peer_manager.get_peers_for_debug()
-            logging.debug("peer list update: " + peers)
+            peer_list = self.__peer_manager.get_peers_for_debug()[1]
 
-            # add connected peer to processes audience
-            for each_peer in peer_list:
-                util.logger.spam(f"peer_service:connect_to_radio_station peer({each_peer.target}-{each_peer.status})")
-                if each_peer.status == PeerStatus.connected:
-                    self.__broadcast_scheduler.schedule_job(BroadcastCommand.SUBSCRIBE, each_peer.target)
+        logging.debug(f"peer list update: {len(peer_list)} peers, version({self.__peer_list_version})")
+
+        # add connected peer to processes audience
+        for each_peer in peer_list:
+            util.logger.spam(f"peer_service:connect_to_radio_station peer({each_peer.target}-{each_peer.status})")
+            if each_peer.status == PeerStatus.connected:
+                self.__broadcast_scheduler.schedule_job(BroadcastCommand.SUBSCRIBE, each_peer.target)
 
     def __subscribe_to_peer_list(self):
         peer_object = self.peer_manager.get_peer(ChannelProperty().peer_id)
@@ -775,11 +800,9 @@ class ChannelService:
         response = stub.sync_task().invoke(request)
         response_to_json_query(response)
 
-        block_builder = BlockBuilder.from_new(block, self.block_manager.get_blockchain().tx_versioner)
-        block_builder.commit_state = {
+        new_block = BlockBuilder.replace_commit_state(block, {
             ChannelProperty().name: response['stateRootHash']
-        }
-        new_block = block_builder.build()
+        })
         return new_block, response["txResults"]
 
     def score_invoke(self, _block: Block) -> dict or None:
@@ -808,11 +831,9 @@ class ChannelService:
         response = stub.sync_task().invoke(request)
         response_to_json_query(response)
 
-        block_builder = BlockBuilder.from_new(_block, self.__block_manager.get_blockchain().tx_versioner)
-        block_builder.commit_state = {
+        new_block = BlockBuilder.replace_commit_state(_block, {
             ChannelProperty().name: response['stateRootHash']
-        }
-        new_block = block_builder.build()
+        })
 
         return new_block, response["txResults"]
 
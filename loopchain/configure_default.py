@@ -66,6 +66,9 @@ LOG_FILE_ROTATE_MAX_BYTES = 0  # Default 0, Do not rotate log files by max bytes
 LOG_FILE_ROTATE_BACKUP_COUNT = 10
 LOG_FILE_ROTATE_UTC = False
 
+LOG_ASYNC = True  # Write logs to console, file and fluent in a background thread.
+LOG_QUEUE_SIZE = 10000  # Log records over this size of the queue are dropped and counted.
+
 MONITOR_LOG = False
 MONITOR_LOG_HOST = 'localhost'
 MONITOR_LOG_PORT = 24224
@@ -117,9 +120,22 @@ SLEEP_SECONDS_IN_SERVICE_NONE = 2  # _아무일도 하지 않는 대기 thread 
 GRPC_TIMEOUT = 30  # seconds
 GRPC_TIMEOUT_SHORT = 5  # seconds
 GRPC_TIMEOUT_BROADCAST_RETRY = 6  # seconds
+GRPC_TIMEOUT_PEER_PROBE = GRPC_TIMEOUT_SHORT  # seconds, heartbeat and status probes of peers by RS
 GRPC_TIMEOUT_TEST = 30  # seconds
 GRPC_CONNECTION_TIMEOUT = GRPC_TIMEOUT * 2  # seconds, Connect Peer 메시지는 처리시간이 좀 더 필요함
 STUB_REUSE_TIMEOUT = 60  # minutes
+# gRPC channels and servers send and receive messages up to this size. (gRPC default: 4MB)
+GRPC_MAX_MESSAGE_LENGTH = 64 * 1024 * 1024  # bytes
+# Channels in GRPCChannelPool send keepalive pings while idle to find broken connections.
+# Servers of old versions close connections which send pings more often than every 5 minutes or without calls,
+# so set this True only after every node of the network is upgraded.
+GRPC_KEEPALIVE = False
+GRPC_KEEPALIVE_TIME = 30  # seconds
+GRPC_KEEPALIVE_TIMEOUT = 10  # seconds
+# Channels retry to connect at most in this interval, so a peer restarted is reached soon.
+GRPC_MAX_RECONNECT_BACKOFF = 5  # seconds
+# A failed channel replaced in GRPCChannelPool is closed after this, so that calls of its stubs end first.
+GRPC_RETIRED_CHANNEL_CLOSE_DELAY = GRPC_TIMEOUT  # seconds
 
 GRPC_SSL_TYPE = SSLAuthType.none
 GRPC_SSL_KEY_LOAD_TYPE = KeyLoadType.FILE_LOAD
@@ -147,6 +163,9 @@ class ConsensusAlgorithm(IntEnum):
 # 블록 생성 간격, tx 가 없을 경우 다음 간격까지 건너 뛴다.
 INTERVAL_BLOCKGENERATION = 2
 INTERVAL_BROADCAST_SEND_UNCONFIRMED_BLOCK = INTERVAL_BLOCKGENERATION
+# TimerService measures the lag of its event loop in this interval. The lag is in the status of a channel.
+TIMER_LOOP_LAG_INTERVAL = 0.5  # seconds
+TIMER_LOOP_LAG_WARNING = 1  # seconds, a lag over this is logged as a warning.
 # blockchain 용 level db 생성 재시도 횟수, 테스트가 아닌 경우 1로 설정하여도 무방하다.
 MAX_RETRY_CREATE_DB = 10
 # default level db path
@@ -164,25 +183,65 @@ CONSENSUS_ALGORITHM = ConsensusAlgorithm.siever
 MAX_BLOCK_KBYTES = 3000  # default: 3000
 # The total size of the transactions in a block.
 MAX_TX_SIZE_IN_BLOCK = 1 * 1024 * 1024  # 1 MB is better than 2 MB (because tx invoke need CPU time)
-MAX_TX_COUNT_IN_ADDTX_LIST = 32  # AddTxList can send multiple tx in one message.
-SEND_TX_LIST_DURATION = 0.3  # seconds
+MAX_TX_COUNT_IN_ADDTX_LIST = 512  # AddTxList can send multiple tx in one message.
+MAX_TX_BYTES_IN_ADDTX_LIST = 512 * 1024  # AddTxList is sent right away when the stored txs reach this size.
+SEND_TX_LIST_DURATION = 0.3  # seconds, the latency target of a tx stored for AddTxList
+# AddTxList larger than this is sent zlib compressed. (0: never)
+# Older nodes read a zipped AddTxList as an empty tx list and drop its txs without an error,
+# so set this (e.g. 64 * 1024) only after every node of the network is upgraded.
+ADDTX_LIST_ZIP_THRESHOLD = 0  # bytes
+# The number of txs waiting for AddTxList. create_icx_tx fails with fail_tx_relay_queue_full over this.
+MAX_STORED_TX_COUNT = 10000
 USE_ZIPPED_DUMPS = True  # Rolling update does not work if this option is different from the running node.
+# Send blocks to other peers in BlockWire format instead of pickle. Older nodes can not read BlockWire,
+# so set this True only after every node of the network is upgraded.
+BLOCK_WIRE_FORMAT = False
+# Accept pickled blocks from other peers. BlockWire blocks are always accepted.
+# Pickle can run any code while loading, so set this False once every node sends BlockWire.
+ALLOW_PICKLED_BLOCK = True
+# The txs of a block in BlockWire format are compressed over this size if USE_ZIPPED_DUMPS.
+BLOCK_WIRE_ZIP_THRESHOLD = 64 * 1024  # bytes
 # Consensus Vote Ratio 1 = 100%, 0.5 = 50%
 VOTING_RATIO = 0.67  # for Add Block
 LEADER_COMPLAIN_RATIO = 0.51  # for Leader Complain
 # Block Height 를 level_db 의 key(bytes)로 변환할때 bytes size
 BLOCK_HEIGHT_BYTES_LEN = 12
+# Write blocks and tx info to the block DB as binary records. JSON records are read either way.
+# Older versions can not read binary records, so a rollback needs tools/block_db_migrator --to-json after this is set.
+# Set this True only when the network does not need to roll back to a version before binary records.
+BLOCK_DB_BINARY_RECORD = False
+# Caches of decoded blocks and tx info in BlockChain, limited by the total bytes of the DB records they are decoded
+# from. This is not the memory they take: a decoded block or tx info takes several times its record bytes.
+BLOCK_CACHE_RECORD_BYTES = 64 * 1024 * 1024
+TX_INFO_CACHE_RECORD_BYTES = 16 * 1024 * 1024
+# Sync the block DB to disk when a block is written. It is safer on a power failure but slower.
+BLOCK_DB_SYNC_WRITE = False
+# Scalable bloom filter of committed tx hashes in BlockChain. A tx which is not in the filter is new without reading
+# the block DB. It is saved to the block DB every TX_HASH_FILTER_SAVE_INTERVAL blocks and caught up at start.
+# On a chain which has no filter saved, make it by tools/tx_hash_filter_rebuilder before setting this True.
+TX_HASH_FILTER = False
+TX_HASH_FILTER_CAPACITY = 1000000  # tx hashes in the first slice. Each next slice has twice the capacity.
+TX_HASH_FILTER_ERROR_RATE = 0.001  # false positive rate, a false positive reads the block DB.
+TX_HASH_FILTER_SAVE_INTERVAL = 100  # blocks
 # Block vote timeout
 BLOCK_VOTE_TIMEOUT = 60 * 5  # seconds
 CANDIDATE_BLOCK_TIMEOUT = 60 * 60  # seconds
 # default storage path
 DEFAULT_STORAGE_PATH = os.getenv('DEFAULT_STORAGE_PATH', os.path.join(LOOPCHAIN_ROOT_PATH, '.storage'))
-# max tx list size by address
+# pickled tx lists by address before AddressTxIndex. They are deleted by tools/address_index_rebuilder.
 TX_LIST_ADDRESS_PREFIX = b'tx_list_by_address_'
+# page size of tx list by address
 MAX_TX_LIST_SIZE_BY_ADDRESS = 100
 MAX_PRE_VALIDATE_TX_CACHE = 10000
 ALLOW_TIMESTAMP_BOUNDARY_SECOND = 60 * 5
 MAX_TX_QUEUE_AGING_SECONDS = 60 * 5
+# Signatures of txs are recovered in this number of worker processes. 1 means recovering in the calling process.
+# e.g. os.cpu_count() to use every core
+TX_BATCH_VERIFY_WORKERS = 1
+# A smaller batch than this is verified in the calling process, because of the cost of IPC.
+TX_BATCH_VERIFY_MIN_SIZE = 64
+# A batch is verified in the calling process again if the workers do not return in this time.
+TX_BATCH_VERIFY_TIMEOUT = 30  # seconds
 READ_CACHED_TX_COUNT = True
 
 
@@ -243,6 +302,10 @@ DEFAULT_SSL_KEY_PATH = 'resources/ssl_test_cert/ssl.key'
 DEFAULT_SSL_TRUST_CERT_PATH = 'resources/ssl_test_cert/root_ca.crt'
 REST_ADDITIONAL_TIMEOUT = 30  # seconds
 REST_PROXY_DEFAULT_PORT = 5000
+# Keep-alive of the REST server and pooled connections of REST clients, e.g. RestStubManager for citizen sync.
+REST_KEEP_ALIVE_TIMEOUT = 15  # seconds
+REST_CLIENT_POOL_SIZE = 10  # connections per host
+REST_CLIENT_POOL_LIMIT = 100  # connections of a client session to all hosts
 USE_GUNICORN_HA_SERVER = False   # Use high aviability gunicorn web server.
 GUNICORN_WORKER_COUNT = int(os.cpu_count() * 0.5) or 1
 DISABLE_V1_API = True
@@ -285,6 +348,13 @@ SUBSCRIBE_USE_HTTPS = False
 SHUTDOWN_TIMER = 60 * 120
 GET_LAST_BLOCK_TIMER = 30
 BLOCK_SYNC_RETRY_NUMBER = 5
+BLOCK_SYNC_RANGE_SIZE = 100  # blocks per BlockRangeSync request
+BLOCK_SYNC_RANGE_MAX_BYTES = 3 * 1024 * 1024  # below the gRPC message limit (4MB)
+BLOCK_STREAM_SYNC_MAX_COUNT = 10000  # max blocks a peer serves for a BlockStreamSync request
+BLOCK_SYNC_WINDOW = 8  # ranges being downloaded and verified ahead of the commit
+BLOCK_STREAM_SYNC_RANGE_SIZE = 1000  # blocks per BlockStreamSync request in block height sync
+BLOCK_STREAM_SYNC_WINDOW = 3  # streams being downloaded and verified ahead of the commit
+BLOCK_SYNC_PROGRESS_INTERVAL = 10  # seconds
 
 
 class NodeFunction(IntEnum):
@@ -310,6 +380,8 @@ class NodeType(IntEnum):
 ALL_GROUP_ID = "all_group_id"  # "98fad20a-0df1-11e7-bc4b-acbc32b0aaa1"
 TEST_GROUP_ID = "test_group_id"  # "ea8f365c-7fb8-11e6-af03-38c98627c586"
 LEVEL_DB_KEY_FOR_PEER_LIST = "peer_manager_key"
+# Removed peers are remembered for this many to send a peer list delta. An older peer list version gets the whole list.
+PEER_LIST_REMOVED_HISTORY_SIZE = 1000
 # RS heartbeat 으로 리더선정 및 무응답피어 제거를 할지 여부를 정한다. False 일때 네트워크는 더 안정적이 된다.
 # LFT 에 의한 장애 처리 전까지 임시적으로만 True 로 사용한다. by winDy
 ENABLE_RADIOSTATION_HEARTBEAT = True
@@ -321,6 +393,11 @@ NO_RESPONSE_COUNT_ALLOW_BY_HEARTBEAT_LEADER = 1
 CONNECTION_RETRY_TIMER = SLEEP_SECONDS_IN_RADIOSTATION_HEARTBEAT * 2 + 2  # The duration of the ConnectPeer timer by peer.
 # If the cache is not updated within this time, the channel is considered dead.
 ALLOW_STATUS_CACHE_LAST_UPDATE_IN_MINUTES = 10
+# The status of channels and MQ is collected at this interval and whenever a block is added.
+STATUS_COLLECT_INTERVAL = 2  # seconds
+# Peers check health of other peers in background, so leader rotation to alive peers does not wait for dead peers.
+ENABLE_PEER_HEALTH_TRACKER = False
+SLEEP_SECONDS_IN_PEER_HEALTH_TRACKER = 2  # seconds
 # Peer 의 중복 재접속을 허용한다.
 ALLOW_PEER_RECONNECT = True
 # 토큰 유효시간(분)
@@ -350,6 +427,12 @@ SCORE_QUEUE_NAME_FORMAT = "Score.{score_package_name}.{channel_name}.{amqp_key}"
 ICON_SCORE_QUEUE_NAME_FORMAT = "IconScore.{channel_name}.{amqp_key}"
 AMQP_KEY_DEFAULT = "amqp_key"
 AMQP_KEY = AMQP_KEY_DEFAULT
+# Peer, channel and score processes on one host call each other on Unix domain sockets instead of RabbitMQ.
+# IconServiceEngine is still called through RabbitMQ.
+LOCAL_MESSAGE_QUEUE = False
+# Unix domain sockets of the services are in this directory. It must be owned by the user of the node and
+# not writable by group or others, since the services unpickle what they receive on the sockets.
+LOCAL_MESSAGE_QUEUE_PATH = os.getenv('LOCAL_MESSAGE_QUEUE_PATH', os.path.join(DEFAULT_STORAGE_PATH, 'mq'))
 
 
 ####################
@@ -25,7 +25,7 @@ from loopchain.blockchain import Block, TransactionStatusInQueue
 from loopchain.channel.channel_property import ChannelProperty
 from loopchain.consensus import Publisher, Epoch, EpochStatus
 from loopchain.baseservice import ObjectManager, CommonThread, Timer, BlockGenerationScheduler
-from loopchain.baseservice.aging_cache import AgingCache
+from loopchain.baseservice.transaction_pool import TransactionPool
 
 
 class Consensus(CommonThread, Publisher):
@@ -49,8 +49,8 @@ class Consensus(CommonThread, Publisher):
         self.__precommit_block: Block = None
         self.__epoch: Epoch = None
         self.__leader_id = None
-        self.__tx_queue = AgingCache(max_age_seconds=conf.MAX_TX_QUEUE_AGING_SECONDS,
-                                     default_item_status=TransactionStatusInQueue.normal)
+        self.__tx_queue = TransactionPool(max_age_seconds=conf.MAX_TX_QUEUE_AGING_SECONDS,
+                                          default_item_status=TransactionStatusInQueue.normal)
         self.__sleep_time = None
         self.__run_logic = None
         self.__block_generation_scheduler = BlockGenerationScheduler(self.channel_name)
@@ -126,7 +126,7 @@ class Consensus(CommonThread, Publisher):
             epoch=self.__epoch,
             tx_queue=self.__tx_queue)
 
-    def get_tx_queue(self) -> AgingCache:
+    def get_tx_queue(self) -> TransactionPool:
         return self.__tx_queue
 
     def add_tx_obj(self, tx):
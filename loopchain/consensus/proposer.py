@@ -21,7 +21,7 @@ from loopchain import configure as conf
 from loopchain.blockchain import *
 from loopchain.baseservice import ObjectManager
 from loopchain.consensus import Consensus, Epoch, Subscriber
-from loopchain.baseservice.aging_cache import AgingCache
+from loopchain.baseservice.transaction_pool import TransactionPool
 
 
 # Changing the import location will cause a pickle error.
@@ -58,7 +58,7 @@ class Proposer(Subscriber):
         self.__block = Block(channel_name=self.__channel)
         self.__block_tx_size = 0
 
-    def __makeup_block(self, tx_queue: AgingCache):
+    def __makeup_block(self, tx_queue: TransactionPool):
         """Queue 에 수집된 tx 를 block 으로 만든다.
         setttings 에 정의된 조건에 따라 한번의 작업으로 여러개의 candidate_block 으로 나뉘어진 블럭을 생성할 수 있다.
         (주의! 성능상의 이유로 가능한 운행 조건에서 블럭이 나누어지지 않도록 설정하는 것이 좋다.)
@@ -97,7 +97,7 @@ class Proposer(Subscriber):
         self.__block.peer_id = consensus.leader_id
         self.__block.generate_block(self.__precommit_block)
 
-    def __create_block(self, tx_queue: AgingCache):
+    def __create_block(self, tx_queue: TransactionPool):
         logging.debug(f"proposer.py:__create_block::CREATE BLOCK !!")
         self.__generate_block(tx_queue)
 
@@ -153,7 +153,7 @@ class Proposer(Subscriber):
 
         self.__channel_service.acceptor.create_vote(block=self.__block, epoch=self.__epoch)
 
-    def __generate_block(self, tx_queue: AgingCache):
+    def __generate_block(self, tx_queue: TransactionPool):
         util.logger.spam(f"proposer.py:__generate_block::GENERATE BLOCK")
         self.__init_block()
         self.__block.peer_id = self.__peer_id
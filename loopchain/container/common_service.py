@@ -37,8 +37,10 @@ class CommonService(CommonThread):
         self.__peer_id = None if ObjectManager().peer_service is None else ObjectManager().peer_service.peer_id
 
         # for peer_service, it refers to peer_inner_service / for rs_service, it refers to rs_admin_service
-        self.inner_server = grpc.server(futures.ThreadPoolExecutor(conf.MAX_WORKERS, "CommonInnerThread"))
-        self.outer_server = grpc.server(futures.ThreadPoolExecutor(conf.MAX_WORKERS, "CommonOuterThread"))
+        self.inner_server = grpc.server(futures.ThreadPoolExecutor(conf.MAX_WORKERS, "CommonInnerThread"),
+                                        options=GRPCHelper.get_server_options())
+        self.outer_server = grpc.server(futures.ThreadPoolExecutor(conf.MAX_WORKERS, "CommonOuterThread"),
+                                        options=GRPCHelper.get_server_options())
 
         # members for private, It helps simplicity of code intelligence
         self.__gRPC_module = gRPC_module
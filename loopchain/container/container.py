@@ -88,7 +88,8 @@ class Container(CommonProcess, MonitorAdapter):
 
             setproctitle.setproctitle(f"{setproctitle.getproctitle()} {self._process_name}")
 
-            server = grpc.server(futures.ThreadPoolExecutor(conf.MAX_WORKERS, "ContainerThread"))
+            server = grpc.server(futures.ThreadPoolExecutor(conf.MAX_WORKERS, "ContainerThread"),
+                                 options=GRPCHelper.get_server_options())
             loopchain_pb2_grpc.add_ContainerServicer_to_server(self, server)
             GRPCHelper().add_server_port(server, '[::]:' + str(self._port), conf.SSLAuthType.none)
 
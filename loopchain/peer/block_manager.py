@@ -14,6 +14,7 @@
 """A management class for blockchain."""
 import json
 import logging
+import math
 import pickle
 import queue
 import shutil
@@ -23,20 +24,22 @@ from collections import namedtuple
 from concurrent.futures import ThreadPoolExecutor, Future
 from typing import TYPE_CHECKING
 
+import grpc
 from jsonrpcclient.exceptions import ReceivedErrorResponse
 
 import loopchain.utils as util
 from loopchain import configure as conf
 from loopchain.baseservice import TimerService, BlockGenerationScheduler, ObjectManager, Timer
-from loopchain.baseservice.aging_cache import AgingCache
+from loopchain.baseservice.transaction_pool import TransactionPool
 from loopchain.blockchain import TransactionStatusInQueue, BlockChain, CandidateBlocks, Block, Epoch, Transaction, \
     TransactionInvalidDuplicatedHash, TransactionInvalidOutOfTimeBound, BlockchainError, Vote, NID, BlockSerializer, \
     exception, BlockVerifier
 from loopchain.channel.channel_property import ChannelProperty
 from loopchain.peer import status_code
+from loopchain.peer.block_sync_pipeline import BlockSyncPipeline
 from loopchain.peer.consensus_siever import ConsensusSiever
 from loopchain.protos import loopchain_pb2_grpc, message_code
-from loopchain.tools.grpc_helper import GRPCHelper
+from loopchain.tools.grpc_helper import GRPCChannelPool
 from loopchain.utils.message_queue import StubCollection
 
 if TYPE_CHECKING:
@@ -64,18 +67,24 @@ class BlockManager:
             level_db_identity=f"{level_db_identity}_{channel_name}",
             allow_rename_path=False
         )
-        self.__txQueue = AgingCache(max_age_seconds=conf.MAX_TX_QUEUE_AGING_SECONDS,
-                                    default_item_status=TransactionStatusInQueue.normal)
+        self.__txQueue = TransactionPool(max_age_seconds=conf.MAX_TX_QUEUE_AGING_SECONDS,
+                                         default_item_status=TransactionStatusInQueue.normal)
         self.__unconfirmedBlockQueue = queue.Queue()
         self.__blockchain = BlockChain(self.__level_db, channel_name)
         self.__peer_type = None
         self.__consensus = None
         self.__consensus_algorithm = None
+        # A consensus round runs its blocking stages here. The lock and the executor are shared by every
+        # ConsensusSiever of this channel, so a round of a stopped siever never overlaps a round of a new one.
+        self.__consensus_lock = threading.Lock()
+        self.__consensus_executor = ThreadPoolExecutor(1, 'ConsensusThread')
         self.candidate_blocks = CandidateBlocks()
         self.__block_height_sync_lock = threading.Lock()
         self.__block_height_thread_pool = ThreadPoolExecutor(1, 'BlockHeightSyncThread')
         self.__block_height_future: Future = None
         self.__subscribe_target_peer_stub = None
+        self.__block_range_unsupported_peer_stubs = set()
+        self.__block_stream_unsupported_peer_stubs = set()
         self.__block_generation_scheduler = BlockGenerationScheduler(self.__channel_name)
         self.__precommit_block: Block = None
         self.set_peer_type(loopchain_pb2.PEER)
@@ -132,6 +141,14 @@ class BlockManager:
     def consensus_algorithm(self):
         return self.__consensus_algorithm
 
+    @property
+    def consensus_lock(self):
+        return self.__consensus_lock
+
+    @property
+    def consensus_executor(self):
+        return self.__consensus_executor
+
     @property
     def precommit_block(self):
         return self.__precommit_block
@@ -203,7 +220,7 @@ class BlockManager:
                           f"{ObjectManager().channel_service.peer_manager.get_peer_count()}")
 
             # util.logger.spam(f'block_manager:zip_test num of tx is {block_.confirmed_tx_len}')
-            block_dump = util.block_dumps(block_)
+            block_dump = self.__blockchain.dumps_block_wire(block_)
 
             ObjectManager().channel_service.broadcast_scheduler.schedule_broadcast(
                 "AnnounceUnconfirmedBlock",
@@ -242,7 +259,7 @@ class BlockManager:
         """
         return self.__blockchain.find_invoke_result_by_tx_hash(tx_hash)
 
-    def get_tx_queue(self):
+    def get_tx_queue(self) -> TransactionPool:
         if conf.CONSENSUS_ALGORITHM == conf.ConsensusAlgorithm.lft:
             return self.__consensus.get_tx_queue()
 
@@ -356,11 +373,98 @@ class BlockManager:
                 block_height=block_height,
                 channel=self.__channel_name
             ), conf.GRPC_TIMEOUT)
-            return util.block_loads(response.block), response.max_block_height, response.response_code
+            block = self.__blockchain.loads_block_wire(response.block)
+            return block, response.max_block_height, response.response_code
         else:
             # request REST(json-rpc) way to radiostation (mother peer)
             return self.__block_request_by_citizen(block_height, ObjectManager().channel_service.radio_station_stub)
 
+    def __block_range_request(self, peer_stub, start_height, count):
+        """request blocks from start_height by gRPC.
+        It requests by BlockRangeSync if the peer does not support BlockStreamSync,
+        and one block by __block_request if the peer does not support BlockRangeSync either.
+
+        :param peer_stub:
+        :param start_height:
+        :param count:
+        :return: an iterator of (blocks, max_block_height) as blocks arrive
+        """
+        if ObjectManager().channel_service.is_support_node_function(conf.NodeFunction.Vote) \
+                and peer_stub not in self.__block_stream_unsupported_peer_stubs:
+            try:
+                yield from self.__block_stream_request(peer_stub, start_height, count)
+                return
+            except grpc.RpcError as e:
+                if e.code() != grpc.StatusCode.UNIMPLEMENTED:
+                    raise
+                self.__block_stream_unsupported_peer_stubs.add(peer_stub)
+
+        end_height = start_height + count
+        while start_height < end_height:
+            blocks, max_block_height = self.__block_chunk_request(peer_stub, start_height, end_height - start_height)
+            if not blocks:
+                return
+            yield blocks, max_block_height
+            start_height += len(blocks)
+
+    def __block_chunk_request(self, peer_stub, start_height, count):
+        """request blocks from start_height by BlockRangeSync, or one block by __block_request.
+
+        :return blocks, max_block_height
+        """
+        if ObjectManager().channel_service.is_support_node_function(conf.NodeFunction.Vote) \
+                and peer_stub not in self.__block_range_unsupported_peer_stubs:
+            try:
+                response = peer_stub.BlockRangeSync(loopchain_pb2.BlockRangeSyncRequest(
+                    start_height=start_height,
+                    count=min(count, conf.BLOCK_SYNC_RANGE_SIZE),
+                    channel=self.__channel_name
+                ), conf.GRPC_TIMEOUT)
+            except grpc.RpcError as e:
+                if e.code() != grpc.StatusCode.UNIMPLEMENTED:
+                    raise
+                self.__block_range_unsupported_peer_stubs.add(peer_stub)
+            else:
+                if response.response_code != message_code.Response.success:
+                    raise ConnectionError(message_code.get_response_msg(response.response_code))
+                blocks = [self.__blockchain.loads_block_wire(block_dumped) for block_dumped in response.blocks]
+                return blocks, response.max_block_height
+
+        block, max_block_height, response_code = self.__block_request(peer_stub, start_height)
+        if response_code != message_code.Response.success:
+            raise ConnectionError(message_code.get_response_msg(response_code))
+        return [block], max_block_height
+
+    def __block_stream_request(self, peer_stub, start_height, count):
+        """request blocks from start_height by a stream of block DB records.
+        The stream may take GRPC_TIMEOUT for each BLOCK_SYNC_RANGE_SIZE blocks, as many BlockRangeSync would.
+
+        :return: an iterator of (blocks, max_block_height) for each BLOCK_SYNC_RANGE_SIZE blocks
+        """
+        responses = peer_stub.BlockStreamSync(loopchain_pb2.BlockRangeSyncRequest(
+            start_height=start_height,
+            count=count,
+            channel=self.__channel_name
+        ), conf.GRPC_TIMEOUT * math.ceil(count / conf.BLOCK_SYNC_RANGE_SIZE))
+
+        try:
+            blocks = []
+            max_block_height = -1
+            for response in responses:
+                if response.response_code != message_code.Response.success:
+                    raise ConnectionError(message_code.get_response_msg(response.response_code))
+                max_block_height = response.max_block_height
+                blocks.append(self.__blockchain.load_block_record(response.block))
+                if len(blocks) >= conf.BLOCK_SYNC_RANGE_SIZE:
+                    yield blocks, max_block_height
+                    blocks = []
+
+            if blocks:
+                yield blocks, max_block_height
+        finally:
+            # the stream is cancelled if the pipeline stops reading it.
+            responses.cancel()
+
     def __block_request_by_citizen(self, block_height, rs_rest_stub):
         try:
             get_block_result = rs_rest_stub.call(
@@ -399,7 +503,8 @@ class BlockManager:
         if response.block == b"":
             return None, response.response_code, response.response_message
         else:
-            precommit_block = pickle.loads(response.block)
+            # a precommit block is pickled without zlib, as old versions send it.
+            precommit_block = self.__blockchain.loads_block_wire(response.block, pickle_loads=pickle.loads)
             # util.logger.spam(
             #     f"GetPrecommitBlock:response::{response.response_code}/{response.response_message}/"
             #     f"{precommit_block}/{precommit_block.confirmed_transaction_list}")
@@ -450,22 +555,56 @@ class BlockManager:
         else:
             return self.__blockchain.block_height
 
-    def __add_block_by_sync(self, block_):
+    def __verify_blocks_by_sync(self, blocks):
+        """verify blocks which do not depend on the blockchain. It runs in the threads of BlockSyncPipeline.
+
+        :param blocks: contiguous blocks
+        """
+        prev_block = None
+        for block in blocks:
+            block_version = self.__blockchain.block_versioner.get_version(block.header.height)
+            block_verifier = BlockVerifier.new(block_version, self.__blockchain.tx_versioner)
+            block_verifier.verify_loosely(block, prev_block)
+            prev_block = block
+
+    def __add_block_by_sync(self, block_, max_height):
         commit_state = block_.header.commit_state
         logging.debug(f"block_manager.py >> block_height_sync :: "
                       f"height({block_.header.height}) commit_state({commit_state})")
 
-        block_version = self.get_blockchain().block_versioner.get_version(block_.header.height)
-        block_verifier = BlockVerifier.new(block_version, self.get_blockchain().tx_versioner)
-        if block_.header.height == 0:
-            block_verifier.invoke_func = self.__channel_service.genesis_invoke
-        else:
-            block_verifier.invoke_func = self.__channel_service.score_invoke
-        invoke_results = block_verifier.verify_loosely(block_,
-                                                       self.__blockchain.last_block,
-                                                       self.__blockchain)
-        self.__blockchain.set_invoke_results(block_.header.hash.hex(), invoke_results)
-        return self.add_block(block_)
+        try:
+            if max_height > 0 and max_height == block_.header.height:
+                self.candidate_blocks.add_block(block_)
+                self.__blockchain.last_unconfirmed_block = block_
+            else:
+                block_version = self.get_blockchain().block_versioner.get_version(block_.header.height)
+                block_verifier = BlockVerifier.new(block_version, self.get_blockchain().tx_versioner)
+                if block_.header.height == 0:
+                    block_verifier.invoke_func = self.__channel_service.genesis_invoke
+                else:
+                    block_verifier.invoke_func = self.__channel_service.score_invoke
+                invoke_results = block_verifier.verify_prevalidated(block_,
+                                                                    self.__blockchain.last_block,
+                                                                    self.__blockchain)
+                self.__blockchain.set_invoke_results(block_.header.hash.hex(), invoke_results)
+                if not self.add_block(block_):
+                    return False
+
+            if block_.header.height == 0:
+                self.__rebuild_nid(block_)
+            elif self.__blockchain.find_nid() is None:
+                genesis_block = self.get_blockchain().find_block_by_height(0)
+                self.__rebuild_nid(genesis_block)
+            return True
+
+        except KeyError as e:
+            logging.error("fail block height sync: " + str(e))
+            return False
+        except exception.BlockError:
+            logging.error("Block Error Clear all block and restart peer.")
+            self.clear_all_blocks()
+            util.exit_and_msg("Block Error Clear all block and restart peer.")
+            return False
 
     def __block_height_sync(self, target_peer_stub=None, target_height=None):
         """synchronize block height with other peers"""
@@ -488,7 +627,6 @@ class BlockManager:
             max_height = target_height
 
         my_height = self.__current_block_height()
-        retry_number = 0
         util.logger.spam(f"block_manager:block_height_sync my_height({my_height})")
 
         if len(peer_stubs) == 0:
@@ -499,68 +637,22 @@ class BlockManager:
 
         self.get_blockchain().prevent_next_block_mismatch(self.__blockchain.block_height)
 
+        self.__block_range_unsupported_peer_stubs = set()
+        self.__block_stream_unsupported_peer_stubs = set()
+        # a range is requested by a stream of BlockStreamSync, so ranges are longer and fewer.
+        is_vote_node = channel_service.is_support_node_function(conf.NodeFunction.Vote)
+        pipeline = BlockSyncPipeline(peer_stubs,
+                                     fetch_func=self.__block_range_request,
+                                     verify_func=self.__verify_blocks_by_sync,
+                                     commit_func=self.__add_block_by_sync,
+                                     start_height=my_height + 1,
+                                     max_height=max_height,
+                                     follow_max_height=target_height is None,
+                                     range_size=conf.BLOCK_STREAM_SYNC_RANGE_SIZE if is_vote_node else None,
+                                     window=conf.BLOCK_STREAM_SYNC_WINDOW if is_vote_node else None)
         try:
-            while max_height > my_height:
-                for peer_stub in peer_stubs:
-                    response_code = message_code.Response.fail
-                    try:
-                        block, max_block_height, response_code = self.__block_request(peer_stub, my_height + 1)
-                    except Exception as e:
-                        logging.warning("There is a bad peer, I hate you: " + str(e))
-                        traceback.print_exc()
-
-                    if response_code == message_code.Response.success:
-                        logging.debug(f"try add block height: {block.header.height}")
-
-                        try:
-                            result = False
-                            if max_height > 0 and max_height == block.header.height:
-                                self.candidate_blocks.add_block(block)
-                                self.__blockchain.last_unconfirmed_block = block
-                                result = True
-                            else:
-                                result = self.__add_block_by_sync(block)
-
-                            if result:
-                                if block.header.height == 0:
-                                    self.__rebuild_nid(block)
-                                elif self.__blockchain.find_nid() is None:
-                                    genesis_block = self.get_blockchain().find_block_by_height(0)
-                                    self.__rebuild_nid(genesis_block)
-
-                        except KeyError as e:
-                            result = False
-                            logging.error("fail block height sync: " + str(e))
-                            break
-                        except exception.BlockError:
-                            result = False
-                            logging.error("Block Error Clear all block and restart peer.")
-                            self.clear_all_blocks()
-                            util.exit_and_msg("Block Error Clear all block and restart peer.")
-                            break
-                        finally:
-                            if result:
-                                my_height += 1
-                                retry_number = 0
-                            else:
-                                retry_number += 1
-                                logging.warning(f"Block height({my_height}) synchronization is fail. "
-                                                f"{retry_number}/{conf.BLOCK_SYNC_RETRY_NUMBER}")
-                                if retry_number >= conf.BLOCK_SYNC_RETRY_NUMBER:
-                                    util.exit_and_msg(f"This peer already tried to synchronize {my_height} block "
-                                                      f"for max retry number({conf.BLOCK_SYNC_RETRY_NUMBER}). "
-                                                      f"Peer will be down.")
-
-                        if target_height is None:
-                            if max_block_height > max_height:
-                                util.logger.spam(f"set max_height :{max_height} -> {max_block_height}")
-                                max_height = max_block_height
-                    else:
-                        peer_stubs.remove(peer_stub)
-                        logging.warning(f"Not responding peer({peer_stub}) is removed from the peer stubs target.")
-
-                        if len(peer_stubs) < 1:
-                            raise ConnectionError
+            my_height = pipeline.run()
+            max_height = pipeline.max_height
         except Exception as e:
             logging.warning(f"block_manager.py >>> block_height_sync :: {e}")
             traceback.print_exc()
@@ -580,7 +672,7 @@ class BlockManager:
                 and channel_service.is_support_node_function(conf.NodeFunction.Vote):
             last_block = self.__blockchain.last_block
             precommit_block = None
-            for peer_stub in peer_stubs:
+            for peer_stub in pipeline.peer_stubs:
                 if peer_stub is not None:
                     precommit_block, response_code, response_message = \
                         self.__precommit_block_request(peer_stub, last_block.height)
@@ -632,7 +724,7 @@ class BlockManager:
         for target in target_list:
             if target != peer_target:
                 logging.debug(f"try to target({target})")
-                channel = GRPCHelper().create_client_channel(target)
+                channel = GRPCChannelPool().get_channel(target)
                 stub = loopchain_pb2_grpc.PeerServiceStub(channel)
                 try:
                     if ObjectManager().channel_service.is_support_node_function(conf.NodeFunction.Vote):
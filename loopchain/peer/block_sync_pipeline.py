@@ -0,0 +1,245 @@
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A pipeline which downloads, verifies and adds blocks for block height synchronization."""
+
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Tuple
+
+import loopchain.utils as util
+from loopchain import configure as conf
+
+
+class BlockRange:
+    """A range of heights requested to a peer. The download worker puts verified chunks of blocks in `chunks`,
+    then None at the end or the exception which stopped it.
+    """
+    def __init__(self, start_height: int, count: int, peer_stub):
+        self.start_height = start_height
+        self.count = count
+        self.peer_stub = peer_stub
+        self.committed_count = 0
+        self.chunks = queue.Queue()
+        self.cancelled = threading.Event()
+
+
+class BlockSyncPipeline:
+    """Synchronize blocks in three stages.
+
+    1. download: ranges of heights are requested to several peers at once, up to `window` ranges ahead.
+       fetch_func returns the blocks of a range in chunks as they arrive, e.g. from a stream.
+    2. verify: each chunk is verified by verify_func in the download worker,
+       so hashes and signatures are checked in parallel and ahead of the commit.
+    3. commit: blocks are passed to commit_func strictly in order of height in the calling thread,
+       as soon as their chunk is verified.
+    """
+
+    def __init__(self,
+                 peer_stubs: list,
+                 fetch_func: Callable[[object, int, int], Iterable[Tuple[list, int]]],
+                 verify_func: Callable[[list], None],
+                 commit_func: Callable[[object, int], bool],
+                 start_height: int,
+                 max_height: int,
+                 follow_max_height=True,
+                 range_size=None,
+                 window=None):
+        """
+        :param peer_stubs: peers to request blocks
+        :param fetch_func: (peer_stub, start_height, count) -> iterable of (blocks, max_block_height of the peer)
+            for contiguous chunks of the range. It may end before the range does.
+        :param verify_func: (contiguous blocks) -> None, it raises an exception if any block is invalid.
+        :param commit_func: (block, max_height) -> True if the block is added
+        :param start_height: the first height to synchronize
+        :param max_height: the last height to synchronize
+        :param follow_max_height: if true, max_height grows as peers report higher blocks.
+        """
+        self.__peer_stubs = list(peer_stubs)
+        self.__fetch_func = fetch_func
+        self.__verify_func = verify_func
+        self.__commit_func = commit_func
+        self.__follow_max_height = follow_max_height
+        self.__range_size = range_size or conf.BLOCK_SYNC_RANGE_SIZE
+        self.__window = window or conf.BLOCK_SYNC_WINDOW
+
+        self.__peer_index = 0
+        self.__retry_number = 0
+
+        self.my_height = start_height - 1
+        self.max_height = max_height
+
+        self.__start_time = None
+        self.__committed_count = 0
+        self.__last_progress_time = None
+        self.__last_progress_count = 0
+
+    @property
+    def peer_stubs(self) -> list:
+        """peers which have not failed while synchronizing"""
+        return self.__peer_stubs
+
+    @property
+    def blocks_per_second(self) -> float:
+        if not self.__start_time:
+            return 0.0
+
+        elapsed_time = time.monotonic() - self.__start_time
+        return self.__committed_count / elapsed_time if elapsed_time > 0 else 0.0
+
+    def run(self) -> int:
+        """
+        :return: the height of the last committed block
+        """
+        self.__start_time = self.__last_progress_time = time.monotonic()
+
+        ranges = deque()
+        executor = ThreadPoolExecutor(self.__window, thread_name_prefix="BlockSyncThread")
+        try:
+            self.__run(executor, ranges)
+        finally:
+            for block_range in ranges:
+                block_range.cancelled.set()
+            executor.shutdown(wait=False)
+
+        logging.info(f"block sync pipeline finished: height({self.my_height}/{self.max_height}) "
+                     f"blocks({self.__committed_count}) {self.blocks_per_second:.1f} blocks/s")
+        return self.my_height
+
+    def __run(self, executor: ThreadPoolExecutor, ranges: deque):
+        next_height = self.my_height + 1
+
+        while self.my_height < self.max_height:
+            while len(ranges) < self.__window and next_height <= self.max_height:
+                count = min(self.__range_size, self.max_height - next_height + 1)
+                ranges.append(self.__request(executor, next_height, count))
+                next_height += count
+
+            block_range: BlockRange = ranges[0]
+            chunk = block_range.chunks.get()
+            if chunk is None or isinstance(chunk, Exception):
+                ranges.popleft()
+                if isinstance(chunk, Exception):
+                    self.__remove_peer(block_range.peer_stub, chunk)
+                if block_range.committed_count < block_range.count:
+                    # request the rest of the range to the next peer.
+                    ranges.appendleft(self.__request(executor,
+                                                     block_range.start_height + block_range.committed_count,
+                                                     block_range.count - block_range.committed_count))
+                continue
+
+            blocks, max_block_height = chunk
+            if self.__follow_max_height and max_block_height > self.max_height:
+                util.logger.spam(f"set max_height :{self.max_height} -> {max_block_height}")
+                self.max_height = max_block_height
+
+            for block in blocks:
+                if not self.__commit(block):
+                    # discard the rest of the range and request it again to the next peer.
+                    ranges.popleft()
+                    block_range.cancelled.set()
+                    end_height = block_range.start_height + block_range.count
+                    ranges.appendleft(self.__request(executor, self.my_height + 1, end_height - self.my_height - 1))
+                    break
+                block_range.committed_count += 1
+
+    def __request(self, executor: ThreadPoolExecutor, start_height: int, count: int) -> BlockRange:
+        if not self.__peer_stubs:
+            raise ConnectionError("There is no peer to synchronize blocks.")
+
+        self.__peer_index = (self.__peer_index + 1) % len(self.__peer_stubs)
+        block_range = BlockRange(start_height, count, self.__peer_stubs[self.__peer_index])
+        executor.submit(self.__download, block_range)
+        return block_range
+
+    def __download(self, block_range: BlockRange):
+        try:
+            self.__download_chunks(block_range)
+        except Exception as e:
+            block_range.chunks.put(e)
+        else:
+            block_range.chunks.put(None)
+
+    def __download_chunks(self, block_range: BlockRange):
+        peer_stub = block_range.peer_stub
+        next_height = block_range.start_height
+        end_height = block_range.start_height + block_range.count
+
+        chunks = self.__fetch_func(peer_stub, block_range.start_height, block_range.count)
+        try:
+            for blocks, max_block_height in chunks:
+                blocks = blocks[:end_height - next_height]
+                if block_range.cancelled.is_set() or not blocks:
+                    break
+
+                for index, block in enumerate(blocks):
+                    if block.header.height != next_height + index:
+                        raise RuntimeError(f"Peer({peer_stub}) returned block height({block.header.height}), "
+                                           f"expected({next_height + index}).")
+
+                self.__verify_func(blocks)
+                block_range.chunks.put((blocks, max_block_height))
+                next_height += len(blocks)
+                if next_height >= end_height:
+                    break
+        finally:
+            # it stops the stream of the peer if the range is cancelled or fails.
+            close = getattr(chunks, "close", None)
+            if close:
+                close()
+
+        if next_height == block_range.start_height and not block_range.cancelled.is_set():
+            raise ConnectionError(f"Peer({peer_stub}) returned no block from height({block_range.start_height}).")
+
+    def __remove_peer(self, peer_stub, e: Exception):
+        logging.warning(f"There is a bad peer, I hate you: {e}")
+        if peer_stub in self.__peer_stubs:
+            self.__peer_stubs.remove(peer_stub)
+            logging.warning(f"Not responding peer({peer_stub}) is removed from the peer stubs target.")
+
+    def __commit(self, block) -> bool:
+        logging.debug(f"try add block height: {block.header.height}")
+
+        if self.__commit_func(block, self.max_height):
+            self.my_height = block.header.height
+            self.__retry_number = 0
+            self.__committed_count += 1
+            self.__log_progress()
+            return True
+
+        self.__retry_number += 1
+        logging.warning(f"Block height({self.my_height}) synchronization is fail. "
+                        f"{self.__retry_number}/{conf.BLOCK_SYNC_RETRY_NUMBER}")
+        if self.__retry_number >= conf.BLOCK_SYNC_RETRY_NUMBER:
+            util.exit_and_msg(f"This peer already tried to synchronize {self.my_height} block "
+                              f"for max retry number({conf.BLOCK_SYNC_RETRY_NUMBER}). "
+                              f"Peer will be down.")
+        return False
+
+    def __log_progress(self):
+        now = time.monotonic()
+        elapsed_time = now - self.__last_progress_time
+        if elapsed_time < conf.BLOCK_SYNC_PROGRESS_INTERVAL and self.my_height < self.max_height:
+            return
+
+        blocks_per_second = (self.__committed_count - self.__last_progress_count) / elapsed_time \
+            if elapsed_time > 0 else 0.0
+        logging.info(f"block sync progress: height({self.my_height}/{self.max_height}) "
+                     f"{blocks_per_second:.1f} blocks/s")
+
+        self.__last_progress_time = now
+        self.__last_progress_count = self.__committed_count
@@ -13,13 +13,12 @@
 # limitations under the License.
 """A base class of consensus for the loopchain"""
 import logging
-import traceback
 from abc import ABCMeta, abstractmethod
 
 import loopchain.utils as util
 from loopchain import configure as conf
 from loopchain.blockchain import BlockBuilder
-from loopchain.blockchain import Transaction, TransactionStatusInQueue, TransactionVerifier
+from loopchain.blockchain import Transaction, TransactionStatusInQueue, TransactionBatchVerifier
 
 
 class ConsensusBase(metaclass=ABCMeta):
@@ -66,30 +65,38 @@ class ConsensusBase(metaclass=ABCMeta):
         block_builder = BlockBuilder.new(block_version, self._blockchain.tx_versioner)
 
         tx_versioner = self._blockchain.tx_versioner
-        while self._txQueue:
-            if block_builder.size() >= conf.MAX_TX_SIZE_IN_BLOCK:
-                logging.debug(f"consensus_base total size({block_builder.size()}) "
-                              f"count({len(block_builder.transactions)}) "
-                              f"_txQueue size ({len(self._txQueue)})")
-                break
+        tbv = TransactionBatchVerifier(tx_versioner)
+        txs_size = 0  # size of the verified txs in block_builder
+        while txs_size < conf.MAX_TX_SIZE_IN_BLOCK:
+            # txs are taken up to the size left and verified in a batch.
+            # The size of rejected txs is not counted, so more txs are taken for it in the next batch.
+            txs = []
+            batch_size = txs_size
+            while batch_size < conf.MAX_TX_SIZE_IN_BLOCK:
+                tx: 'Transaction' = self._txQueue.get_item_in_status(
+                    TransactionStatusInQueue.normal,
+                    TransactionStatusInQueue.added_to_block
+                )
+                if tx is None:
+                    break
 
-            tx: 'Transaction' = self._txQueue.get_item_in_status(
-                TransactionStatusInQueue.normal,
-                TransactionStatusInQueue.added_to_block
-            )
-            if tx is None:
-                break
+                txs.append(tx)
+                batch_size += tx.size(tx_versioner)
 
-            tv = TransactionVerifier.new(tx.version, tx_versioner)
+            if not txs:
+                break
 
-            try:
-                tv.verify(tx, self._blockchain)
-            except Exception as e:
-                logging.warning(f"tx hash invalid.\n"
-                                f"tx: {tx}\n"
-                                f"exception: {e}")
-                traceback.print_exc()
-            else:
-                block_builder.transactions[tx.hash] = tx
+            for tx, exception in zip(txs, tbv.verify(txs, self._blockchain)):
+                if exception:
+                    logging.warning(f"tx hash invalid.\n"
+                                    f"tx: {tx}\n"
+                                    f"exception: {exception}")
+                else:
+                    block_builder.transactions[tx.hash] = tx
+                    txs_size += tx.size(tx_versioner)
 
+        if txs_size >= conf.MAX_TX_SIZE_IN_BLOCK:
+            logging.debug(f"consensus_base total size({txs_size}) "
+                          f"count({len(block_builder.transactions)}) "
+                          f"_txQueue size ({len(self._txQueue)})")
         return block_builder
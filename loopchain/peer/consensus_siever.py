@@ -12,14 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """A consensus class based on the Siever algorithm for the loopchain"""
+import asyncio
 import logging
-import threading
 from functools import partial
 
 import loopchain.utils as util
 from loopchain import configure as conf
 from loopchain.baseservice import ObjectManager, TimerService, SlotTimer, Timer
-from loopchain.blockchain import ExternalAddress, BlockVerifier, Hash32
+from loopchain.blockchain import ExternalAddress, BlockVerifier, Hash32, TransactionStatusInQueue
 from loopchain.channel.channel_property import ChannelProperty
 from loopchain.peer.consensus_base import ConsensusBase
 
@@ -28,7 +28,13 @@ class ConsensusSiever(ConsensusBase):
     def __init__(self, block_manager):
         super().__init__(block_manager)
         self.__block_generation_timer = None
-        self.__lock = threading.Lock()
+        # Blocking stages of consensus run in the executor, not to delay other timers in the event loop of
+        # TimerService. Both belong to BlockManager, so a round of a stopped siever can finish
+        # but a round of the next siever waits for it.
+        self.__lock = block_manager.consensus_lock
+        self.__executor = block_manager.consensus_executor
+        # A round which is running in the executor when the siever stops ends without side effects.
+        self.__stopped = False
 
     def start_timer(self, timer_service):
         self.__block_generation_timer = SlotTimer(
@@ -40,84 +46,129 @@ class ConsensusSiever(ConsensusBase):
         )
 
     def stop(self):
+        self.__stopped = True
         self.__block_generation_timer.stop()
         self.__stop_broadcast_send_unconfirmed_block_timer()
 
+    async def __run_in_executor(self, func, *args):
+        return await asyncio.get_event_loop().run_in_executor(self.__executor, func, *args)
+
     async def consensus(self):
         util.logger.debug(f"-------------------consensus "
                           f"candidate_blocks({len(self._blockmanager.candidate_blocks.blocks)})")
-        with self.__lock:
-            block_builder = self._makeup_block()
-            vote_result = None
-
-            if len(block_builder.transactions) > 0:
-                # util.logger.debug(f"-------------------consensus logic-1")
-                next_leader = ExternalAddress.fromhex(ChannelProperty().peer_id)
-
-                if self._blockchain.last_unconfirmed_block:
-                    if (len(self._blockchain.last_unconfirmed_block.body.transactions) > 0) or (
-                            len(self._blockchain.last_unconfirmed_block.body.transactions) == 0 and
-                            self._blockchain.last_unconfirmed_block.header.peer_id.hex_hx() != ChannelProperty().peer_id):
-                        # util.logger.debug(f"-------------------consensus logic-2")
-                        vote = self._blockmanager.candidate_blocks.get_vote(self._blockchain.last_unconfirmed_block.header.hash)
-                        vote_result = vote.get_result(self._blockchain.last_unconfirmed_block.header.hash.hex(), conf.VOTING_RATIO)
-                        if not vote_result:
-                            return self.__block_generation_timer.call()
-
-                        self._blockmanager.add_block(self._blockchain.last_unconfirmed_block, vote)
-                        self._made_block_count += 1
-
-                        next_leader = self._blockchain.last_unconfirmed_block.header.next_leader
-            else:
-                if self._blockchain.last_unconfirmed_block and len(self._blockchain.last_unconfirmed_block.body.transactions) > 0:
-                    # util.logger.debug(f"-------------------consensus logic-3")
+        # The lock is taken without blocking the event loop. SlotTimer calls again when the round in progress ends.
+        if not self.__lock.acquire(timeout=0):
+            util.logger.debug("consensus round in progress, skip this call")
+            return
+
+        try:
+            if not self.__stopped:
+                await self.__consensus()
+        finally:
+            self.__lock.release()
+
+    async def __consensus(self):
+        block_builder = await self.__run_in_executor(self._makeup_block)
+        if self.__stopped:
+            return self.__return_txs(block_builder)
+        vote_result = None
+
+        if len(block_builder.transactions) > 0:
+            # util.logger.debug(f"-------------------consensus logic-1")
+            next_leader = ExternalAddress.fromhex(ChannelProperty().peer_id)
+
+            if self._blockchain.last_unconfirmed_block:
+                if (len(self._blockchain.last_unconfirmed_block.body.transactions) > 0) or (
+                        len(self._blockchain.last_unconfirmed_block.body.transactions) == 0 and
+                        self._blockchain.last_unconfirmed_block.header.peer_id.hex_hx() != ChannelProperty().peer_id):
+                    # util.logger.debug(f"-------------------consensus logic-2")
                     vote = self._blockmanager.candidate_blocks.get_vote(self._blockchain.last_unconfirmed_block.header.hash)
                     vote_result = vote.get_result(self._blockchain.last_unconfirmed_block.header.hash.hex(), conf.VOTING_RATIO)
                     if not vote_result:
                         return self.__block_generation_timer.call()
 
-                    self._blockmanager.add_block(self._blockchain.last_unconfirmed_block, vote)
+                    await self.__run_in_executor(self._blockmanager.add_block,
+                                                 self._blockchain.last_unconfirmed_block, vote)
                     self._made_block_count += 1
-
-                    peer_manager = ObjectManager().channel_service.peer_manager
-                    next_leader = ExternalAddress.fromhex(peer_manager.get_next_leader_peer(
-                        current_leader_peer_id=ChannelProperty().peer_id).peer_id)
-                else:
-                    # util.logger.spam(f"tx count in block({len(block_builder.transactions)})")
+                    if self.__stopped:
+                        return self.__return_txs(block_builder)
+
+                    next_leader = self._blockchain.last_unconfirmed_block.header.next_leader
+        else:
+            if self._blockchain.last_unconfirmed_block and len(self._blockchain.last_unconfirmed_block.body.transactions) > 0:
+                # util.logger.debug(f"-------------------consensus logic-3")
+                vote = self._blockmanager.candidate_blocks.get_vote(self._blockchain.last_unconfirmed_block.header.hash)
+                vote_result = vote.get_result(self._blockchain.last_unconfirmed_block.header.hash.hex(), conf.VOTING_RATIO)
+                if not vote_result:
                     return self.__block_generation_timer.call()
 
-            last_block = self._blockchain.last_block
-            block_builder.height = last_block.header.height + 1
-            block_builder.prev_hash = last_block.header.hash
-            block_builder.next_leader = next_leader
-            block_builder.peer_private_key = ObjectManager().channel_service.peer_auth.private_key
-            block_builder.confirm_prev_block = vote_result or (self._made_block_count > 0)
-
-            candidate_block = block_builder.build()
-            candidate_block, invoke_results = ObjectManager().channel_service.score_invoke(candidate_block)
-            self._blockmanager.set_invoke_results(candidate_block.header.hash.hex(), invoke_results)
-
-            block_verifier = BlockVerifier.new(candidate_block.header.version, self._blockchain.tx_versioner)
-            block_verifier.verify(candidate_block, self._blockchain.last_block, self._blockchain)
-
-            logging.debug(f"candidate block : {candidate_block.header}")
-
-            self._blockmanager.vote_unconfirmed_block(candidate_block.header.hash, True)
-            self._blockmanager.candidate_blocks.add_block(candidate_block)
-
-            self._blockchain.last_unconfirmed_block = candidate_block
-            broadcast_func = partial(self._blockmanager.broadcast_send_unconfirmed_block, candidate_block)
-
-            # TODO Temporary ignore below line for developing leader complain
-            self.__start_broadcast_send_unconfirmed_block_timer(broadcast_func)
+                await self.__run_in_executor(self._blockmanager.add_block,
+                                             self._blockchain.last_unconfirmed_block, vote)
+                self._made_block_count += 1
+                if self.__stopped:
+                    return self.__return_txs(block_builder)
 
-            if len(block_builder.transactions) == 0 and not conf.ALLOW_MAKE_EMPTY_BLOCK and \
-                    next_leader.hex() != ChannelProperty().peer_id:
-                # util.logger.debug(f"-------------------turn_to_peer")
-                ObjectManager().channel_service.state_machine.turn_to_peer()
-                self._blockmanager.epoch.set_epoch_leader(next_leader.hex_hx())
+                peer_manager = ObjectManager().channel_service.peer_manager
+                next_leader = ExternalAddress.fromhex(peer_manager.get_next_leader_peer(
+                    current_leader_peer_id=ChannelProperty().peer_id).peer_id)
             else:
-                self.__block_generation_timer.call()
+                # util.logger.spam(f"tx count in block({len(block_builder.transactions)})")
+                return self.__block_generation_timer.call()
+
+        last_block = self._blockchain.last_block
+        block_builder.height = last_block.header.height + 1
+        block_builder.prev_hash = last_block.header.hash
+        block_builder.next_leader = next_leader
+        block_builder.peer_private_key = ObjectManager().channel_service.peer_auth.private_key
+        block_builder.confirm_prev_block = vote_result or (self._made_block_count > 0)
+
+        candidate_block = await self.__run_in_executor(self.__build_candidate_block, block_builder)
+        if self.__stopped:
+            util.logger.debug(f"consensus siever is stopped, drop the candidate block({candidate_block.header.hash})")
+            return self.__return_txs(block_builder)
+
+        logging.debug("candidate block : %s", candidate_block.header)
+
+        self._blockmanager.vote_unconfirmed_block(candidate_block.header.hash, True)
+        self._blockmanager.candidate_blocks.add_block(candidate_block)
+
+        self._blockchain.last_unconfirmed_block = candidate_block
+        broadcast_func = partial(self._blockmanager.broadcast_send_unconfirmed_block, candidate_block)
+
+        # TODO Temporary ignore below line for developing leader complain
+        self.__start_broadcast_send_unconfirmed_block_timer(broadcast_func)
+
+        if len(block_builder.transactions) == 0 and not conf.ALLOW_MAKE_EMPTY_BLOCK and \
+                next_leader.hex() != ChannelProperty().peer_id:
+            # util.logger.debug(f"-------------------turn_to_peer")
+            ObjectManager().channel_service.state_machine.turn_to_peer()
+            self._blockmanager.epoch.set_epoch_leader(next_leader.hex_hx())
+        else:
+            self.__block_generation_timer.call()
+
+    def __return_txs(self, block_builder):
+        """txs taken for a block which is not made any more are taken again by the next leader round"""
+        # the tx queue is keyed by the hex string of tx hash, see BlockManager.add_tx_obj
+        for tx_hash in block_builder.transactions:
+            tx_hash_hex = tx_hash.hex()
+            if tx_hash_hex not in self._txQueue:
+                util.logger.debug(f"tx({tx_hash_hex}) of the dropped block is not in the tx queue any more")
+                continue
+
+            if self._txQueue.get_item_status(tx_hash_hex) == TransactionStatusInQueue.added_to_block:
+                self._txQueue.set_item_status(tx_hash_hex, TransactionStatusInQueue.normal)
+
+    def __build_candidate_block(self, block_builder):
+        """build, invoke and verify a candidate block in the executor"""
+        candidate_block = block_builder.build()
+        candidate_block, invoke_results = ObjectManager().channel_service.score_invoke(candidate_block)
+        self._blockmanager.set_invoke_results(candidate_block.header.hash.hex(), invoke_results)
+
+        # txs of the candidate block are verified in _makeup_block and the block is built here,
+        # so only the parts which depend on the blockchain are verified again.
+        block_verifier = BlockVerifier.new(candidate_block.header.version, self._blockchain.tx_versioner)
+        block_verifier.verify_prevalidated(candidate_block, self._blockchain.last_block, self._blockchain)
+        return candidate_block
 
     def count_votes(self, block_hash: Hash32):
         # count votes
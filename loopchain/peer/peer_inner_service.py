@@ -54,13 +54,7 @@ class PeerInnerTask:
 
     @message_queue_task(type_=MessageQueueType.Worker)
     def update_status(self, channel, status: dict):
-        for item in status:
-            # util.logger.spam(f"peer_inner_service:update_status "
-            #                  f"{item}:{status[item]}")
-            try:
-                self._peer_service.status_cache[channel][item] = status[item]
-            except KeyError:
-                logging.debug(f"peer_inner_service:not init channel({channel})")
+        self._peer_service.status_collector.update_status(channel, status)
 
     @message_queue_task(type_=MessageQueueType.Worker)
     async def stop(self, message):
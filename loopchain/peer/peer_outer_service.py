@@ -13,13 +13,10 @@
 # limitations under the License.
 """gRPC service for Peer Outer Service"""
 import asyncio
-import copy
-import datetime
-from functools import partial
 
 from loopchain.baseservice import ObjectManager, Monitor, TimerService
+from loopchain.baseservice.tx_item_helper import unzip_tx_list_message
 from loopchain.blockchain import *
-from loopchain.peer import status_code
 from loopchain.protos import loopchain_pb2_grpc, message_code, ComplainLeaderRequest
 from loopchain.utils.message_queue import StubCollection
 
@@ -43,8 +40,6 @@ class PeerOuterService(loopchain_pb2_grpc.PeerServiceServicer):
             message_code.Request.peer_restart_channel: self.__handler_restart_channel
         }
 
-        self.__status_cache_update_time = {}
-
     @property
     def peer_service(self):
         return ObjectManager().peer_service
@@ -62,14 +57,7 @@ class PeerOuterService(loopchain_pb2_grpc.PeerServiceServicer):
         if request.message == "check peer status by rs":
             channel_stub.sync_task().reset_timer(TimerService.TIMER_KEY_CONNECT_PEER)
 
-        callback = partial(self.__status_update, request.channel)
-        future = asyncio.run_coroutine_threadsafe(
-            channel_stub.async_task().get_status(),
-            self.peer_service.inner_service.loop
-        )
-        future.add_done_callback(callback)
-
-        status = self.__get_status_peer_type_data(request.channel)
+        status = self.__get_status_peer_type_data(channel_name)
         if status is None:
             return loopchain_pb2.Message(code=message_code.Response.fail)
 
@@ -158,11 +146,16 @@ class PeerOuterService(loopchain_pb2_grpc.PeerServiceServicer):
             return loopchain_pb2.Message(code=message_code.Response.fail_illegal_params)
 
         channel_stub = StubCollection().channel_stubs[request.channel]
-        tx_list, next_index = channel_stub.sync_task().get_tx_by_address(address, index)
+        try:
+            tx_list, next_index = channel_stub.sync_task().get_tx_by_address(address, index)
+        except Exception as e:
+            logging.warning(f"fail to get txs by address({address}) index({index}) : {e}")
+            return loopchain_pb2.Message(code=message_code.Response.fail, meta=str(e))
 
+        # The pickled list ends with next_index as the lists of old versions did. Clients strip the last element.
         return loopchain_pb2.Message(code=message_code.Response.success,
                                      meta=str(next_index),
-                                     object=pickle.dumps(tx_list))
+                                     object=pickle.dumps(tx_list + [next_index]))
 
     def __handler_reconnect_to_rs(self, request, context):
         logging.warning(f"RS lost peer info (candidate reason: RS restart)")
@@ -189,38 +182,17 @@ class PeerOuterService(loopchain_pb2_grpc.PeerServiceServicer):
 
         return loopchain_pb2.Message(code=message_code.Response.not_treat_message_code)
 
-    def __status_update(self, channel, future):
-        # update peer outer status cache by channel
-        util.logger.spam(f"status_update channel({channel}) result({future.result()})")
-        self.__status_cache_update_time[channel] = datetime.datetime.now()
-        self.peer_service.status_cache[channel] = future.result()
-
-    def __get_status_data(self, channel: str):
-        return self.__get_status_from_cache(channel)
-
     def __get_status_peer_type_data(self, channel: str):
-        status_cache = self.__get_status_from_cache(channel)
+        snapshot = self.peer_service.status_collector.get_snapshot(channel)
+        if snapshot is None:
+            return None
+
         status = dict()
-        status['state'] = status_cache['state']
-        status['peer_type'] = status_cache['peer_type']
-        status['block_height'] = status_cache['block_height']
+        status['state'] = snapshot.status_data['state']
+        status['peer_type'] = snapshot.status_data['peer_type']
+        status['block_height'] = snapshot.status_data['block_height']
         return status
 
-    def __get_status_from_cache(self, channel: str):
-        if channel in self.peer_service.status_cache:
-            if channel in self.__status_cache_update_time:
-                if util.datetime_diff_in_mins(
-                        self.__status_cache_update_time[channel]) \
-                        > conf.ALLOW_STATUS_CACHE_LAST_UPDATE_IN_MINUTES:
-                    return None
-            status_data = self.peer_service.status_cache[channel]
-        else:
-            channel_stub = StubCollection().channel_stubs[channel]
-            status_data = channel_stub.sync_task().get_status()
-            self.peer_service.status_cache[channel] = status_data
-
-        return status_data
-
     def GetStatus(self, request, context):
         """Peer 의 현재 상태를 요청한다.
 
@@ -231,61 +203,11 @@ class PeerOuterService(loopchain_pb2_grpc.PeerServiceServicer):
         channel_name = conf.LOOPCHAIN_DEFAULT_CHANNEL if request.channel == '' else request.channel
         logging.debug("Peer GetStatus : %s", request)
 
-        try:
-            channel_stub = StubCollection().channel_stubs[channel_name]
-
-            callback = partial(self.__status_update, channel_name)
-            future = asyncio.run_coroutine_threadsafe(
-                channel_stub.async_task().get_status(),
-                self.peer_service.inner_service.loop)
-            future.add_done_callback(callback)
-
-        except BaseException as e:
-            logging.error(f"Peer GetStatus Exception : {e}")
-
-        status_data = self.__get_status_data(channel_name)
-        if status_data is None:
+        snapshot = self.peer_service.status_collector.get_snapshot(channel_name)
+        if snapshot is None:
             raise ChannelStatusError(f"Fail get status data from channel({channel_name})")
 
-        status_data = copy.deepcopy(status_data)
-
-        stubs = {
-            "peer": StubCollection().peer_stub,
-            "channel": StubCollection().channel_stubs.get(channel_name),
-            "score": StubCollection().icon_score_stubs.get(channel_name)
-        }
-
-        mq_status_data = {}
-        mq_down = False
-        for key, stub in stubs.items():
-            message_count = -1
-            message_error = None
-            try:
-                mq_info = stub.sync_info().queue_info()
-                message_count = mq_info.method.message_count
-            except AttributeError:
-                message_error = "Stub is not initialized."
-            except Exception as e:
-                message_error = f"{type(e).__name__}, {e}"
-
-            mq_status_data[key] = {}
-            mq_status_data[key]["message_count"] = message_count
-            if message_error:
-                mq_status_data[key]["error"] = message_error
-                mq_down = True
-
-        status_data["mq"] = mq_status_data
-        if mq_down:
-            reason = status_code.get_status_reason(status_code.Service.mq_down)
-            status_data["status"] = "Service is offline: " + reason
-
-        return loopchain_pb2.StatusReply(
-            status=json.dumps(status_data),
-            block_height=status_data["block_height"],
-            total_tx=status_data["total_tx"],
-            unconfirmed_block_height=status_data["unconfirmed_block_height"],
-            is_leader_complaining=status_data['leader_complaint'],
-            peer_id=status_data['peer_id'])
+        return snapshot.reply
 
     def GetScoreStatus(self, request, context):
         """Score Service 의 현재 상태를 요청 한다
@@ -393,6 +315,7 @@ class PeerOuterService(loopchain_pb2_grpc.PeerServiceServicer):
         :return:
         """
         util.logger.spam(f"peer_outer_service:AddTxList try validate_dumped_tx_message")
+        request = unzip_tx_list_message(request)
         channel_name = request.channel or conf.LOOPCHAIN_DEFAULT_CHANNEL
         StubCollection().channel_stubs[channel_name].sync_task().add_tx_list(request)
         return loopchain_pb2.CommonReply(response_code=message_code.Response.success, message="success")
@@ -527,7 +450,13 @@ class PeerOuterService(loopchain_pb2_grpc.PeerServiceServicer):
         :return:
         """
         channel_name = conf.LOOPCHAIN_DEFAULT_CHANNEL if request.channel == '' else request.channel
-        logging.debug(f"peer_outer_service::AnnounceUnconfirmedBlock channel({channel_name})")
+        if BlockWire.is_wire(request.block):
+            # Only the header is read. The txs are decoded in the channel.
+            block_header = BlockWire.loads_header(request.block)
+            logging.debug(f"peer_outer_service::AnnounceUnconfirmedBlock channel({channel_name}) "
+                          f"height({block_header['height']}) hash({block_header['block_hash']})")
+        else:
+            logging.debug(f"peer_outer_service::AnnounceUnconfirmedBlock channel({channel_name})")
 
         channel_stub = StubCollection().channel_stubs[channel_name]
         channel_stub.sync_task().announce_unconfirmed_block(request.block)
@@ -549,6 +478,57 @@ class PeerOuterService(loopchain_pb2_grpc.PeerServiceServicer):
             max_block_height=max_block_height,
             block=block_dumped)
 
+    def BlockRangeSync(self, request, context):
+        channel_name = conf.LOOPCHAIN_DEFAULT_CHANNEL if request.channel == '' else request.channel
+        logging.info(f"BlockRangeSync request start_height({request.start_height}) "
+                     f"count({request.count}) channel({channel_name})")
+
+        channel_stub = StubCollection().channel_stubs[channel_name]
+        response_code, max_block_height, blocks_dumped = \
+            channel_stub.sync_task().block_range_sync(request.start_height, request.count)
+
+        return loopchain_pb2.BlockRangeSyncReply(
+            response_code=response_code,
+            max_block_height=max_block_height,
+            blocks=blocks_dumped)
+
+    def BlockStreamSync(self, request, context):
+        channel_name = conf.LOOPCHAIN_DEFAULT_CHANNEL if request.channel == '' else request.channel
+        logging.info(f"BlockStreamSync request start_height({request.start_height}) "
+                     f"count({request.count}) channel({channel_name})")
+
+        channel_stub = StubCollection().channel_stubs[channel_name]
+        next_height = request.start_height
+        end_height = request.start_height + min(request.count, conf.BLOCK_STREAM_SYNC_MAX_COUNT)
+
+        future = self.__request_block_records(channel_stub, next_height, end_height)
+        while future is not None:
+            max_block_height, block_records = future.result(conf.GRPC_TIMEOUT)
+            if not block_records:
+                if next_height == request.start_height:
+                    yield loopchain_pb2.BlockStreamReply(
+                        response_code=message_code.Response.fail_wrong_block_height,
+                        max_block_height=max_block_height)
+                return
+
+            # The channel reads the next records while these are sent.
+            next_height += len(block_records)
+            future = self.__request_block_records(channel_stub, next_height, end_height)
+            for block_record in block_records:
+                yield loopchain_pb2.BlockStreamReply(
+                    response_code=message_code.Response.success,
+                    max_block_height=max_block_height,
+                    block=block_record)
+
+    def __request_block_records(self, channel_stub, start_height, end_height):
+        if start_height >= end_height:
+            return None
+
+        return asyncio.run_coroutine_threadsafe(
+            channel_stub.async_task().get_block_records(start_height, min(end_height - start_height,
+                                                                          conf.BLOCK_SYNC_RANGE_SIZE)),
+            self.peer_service.inner_service.loop)
+
     def Subscribe(self, request, context):
         """BlockGenerator 가 broadcast(unconfirmed or confirmed block) 하는 채널에
         Peer 를 등록한다.
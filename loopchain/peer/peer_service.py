@@ -26,11 +26,12 @@ from loopchain.baseservice import StubManager, Monitor, ObjectManager, RestStubM
 from loopchain.blockchain import *
 from loopchain.container import RestService, CommonService
 from loopchain.peer import PeerInnerService, PeerOuterService
+from loopchain.peer.status_collector import StatusCollector
 from loopchain.crypto.signature import Signer
 from loopchain.protos import loopchain_pb2, loopchain_pb2_grpc
 from loopchain.rest_server import RestProxyServer
 from loopchain.utils import loggers, command_arguments
-from loopchain.utils.message_queue import StubCollection
+from loopchain.utils.message_queue import StubCollection, connect_service
 
 
 class PeerService:
@@ -82,8 +83,8 @@ class PeerService:
         self.__rest_service = None
         self.__rest_proxy_server = None
 
-        # peer status cache for channel
-        self.status_cache = {}  # {channel:status}
+        # peer status snapshot for channel
+        self.status_collector = StatusCollector()
 
         self.__score = None
         self.__peer_target = None
@@ -173,6 +174,7 @@ class PeerService:
         return self.__radio_station_target
 
     def service_stop(self):
+        self.status_collector.stop()
         self.__common_service.stop()
 
     def __get_channel_infos(self):
@@ -332,11 +334,13 @@ class PeerService:
 
         async def _serve():
             await self.ready_tasks()
-            await self.__inner_service.connect(conf.AMQP_CONNECTION_ATTEMPS, conf.AMQP_RETRY_DELAY, exclusive=True)
+            await connect_service(self.__inner_service, exclusive=True)
 
             if conf.CHANNEL_BUILTIN:
                 await self.serve_channels()
 
+            self.status_collector.start(loop, self.__channel_infos.keys())
+
             if event_for_init is not None:
                 event_for_init.set()
 
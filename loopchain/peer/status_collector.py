@@ -0,0 +1,167 @@
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Collect status of channels in background for status requests of Peer"""
+
+import asyncio
+import json
+import logging
+import time
+from concurrent import futures
+
+from loopchain import configure as conf
+from loopchain.peer import status_code
+from loopchain.protos import loopchain_pb2
+from loopchain.utils.message_queue import StubCollection
+
+
+class StatusSnapshot:
+    """Status of a channel built at once. A status request uses it as it is."""
+
+    def __init__(self, status_data: dict, update_time: float):
+        self.status_data = status_data
+        self.update_time = update_time
+        self.reply = loopchain_pb2.StatusReply(
+            status=json.dumps(status_data),
+            block_height=status_data["block_height"],
+            total_tx=status_data["total_tx"],
+            unconfirmed_block_height=status_data["unconfirmed_block_height"],
+            is_leader_complaining=status_data['leader_complaint'],
+            peer_id=status_data['peer_id'])
+
+    def is_expired(self):
+        return time.monotonic() - self.update_time > conf.ALLOW_STATUS_CACHE_LAST_UPDATE_IN_MINUTES * 60
+
+
+class StatusCollector:
+    """Refresh status of channels and MQ queue depths every STATUS_COLLECT_INTERVAL
+    and right after a channel updates its status, ex) a block is added.
+    """
+
+    def __init__(self):
+        self.__loop: asyncio.AbstractEventLoop = None
+        self.__task: asyncio.Task = None
+        # MQ queue info is a blocking call.
+        self.__executor = futures.ThreadPoolExecutor(1, "StatusCollectorThread")
+
+        self.__channel_status = {}  # {channel: status of channel}
+        self.__mq_status = {}  # {channel: (mq status, mq down)}
+        self.__snapshots = {}  # {channel: StatusSnapshot}
+        self.__refreshing = {}  # {channel: asyncio.Task}
+
+    def start(self, loop: asyncio.AbstractEventLoop, channels):
+        self.__loop = loop
+        self.__task = loop.create_task(self.__run(list(channels)))
+
+    def stop(self):
+        if self.__task is not None:
+            self.__task.cancel()
+            self.__task = None
+
+    def get_snapshot(self, channel: str) -> StatusSnapshot:
+        """Get the status snapshot of the channel. Only the first request waits for a refresh.
+
+        :return: None if the status of the channel is not collected in ALLOW_STATUS_CACHE_LAST_UPDATE_IN_MINUTES
+        """
+        snapshot = self.__snapshots.get(channel)
+        if snapshot is None and self.__loop is not None:
+            future = asyncio.run_coroutine_threadsafe(self.refresh(channel), self.__loop)
+            try:
+                future.result(conf.GRPC_TIMEOUT)
+            except Exception as e:
+                logging.warning(f"StatusCollector refresh channel({channel}) fail : {type(e).__name__}, {e}")
+            snapshot = self.__snapshots.get(channel)
+
+        if snapshot is None or snapshot.is_expired():
+            return None
+        return snapshot
+
+    def update_status(self, channel: str, status: dict):
+        """Apply status pushed by the channel and refresh the rest of it soon.
+        It must be called in the loop of the collector.
+        """
+        channel_status = self.__channel_status.get(channel)
+        if channel_status is None:
+            logging.debug(f"StatusCollector:not init channel({channel})")
+            return
+
+        channel_status.update(status)
+        self.__build_snapshot(channel)
+        self.refresh_soon(channel)
+
+    def refresh_soon(self, channel: str):
+        if channel in self.__refreshing:
+            return
+
+        task = self.__loop.create_task(self.__refresh_safely(channel))
+        task.add_done_callback(lambda _: self.__refreshing.pop(channel, None))
+        self.__refreshing[channel] = task
+
+    async def refresh(self, channel: str):
+        channel_stub = StubCollection().channel_stubs[channel]
+        self.__channel_status[channel] = await channel_stub.async_task().get_status()
+        self.__mq_status[channel] = await self.__loop.run_in_executor(self.__executor, self.__get_mq_status, channel)
+        self.__build_snapshot(channel)
+
+    async def __refresh_safely(self, channel: str):
+        try:
+            await self.refresh(channel)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logging.warning(f"StatusCollector refresh channel({channel}) fail : {type(e).__name__}, {e}")
+
+    async def __run(self, channels):
+        while True:
+            for channel in channels:
+                await self.__refresh_safely(channel)
+            await asyncio.sleep(conf.STATUS_COLLECT_INTERVAL)
+
+    def __build_snapshot(self, channel: str):
+        status_data = dict(self.__channel_status[channel])
+        mq_status_data, mq_down = self.__mq_status.get(channel, ({}, False))
+        status_data["mq"] = mq_status_data
+        if mq_down:
+            reason = status_code.get_status_reason(status_code.Service.mq_down)
+            status_data["status"] = "Service is offline: " + reason
+
+        self.__snapshots[channel] = StatusSnapshot(status_data, time.monotonic())
+
+    @staticmethod
+    def __get_mq_status(channel: str):
+        stubs = {
+            "peer": StubCollection().peer_stub,
+            "channel": StubCollection().channel_stubs.get(channel),
+            "score": StubCollection().icon_score_stubs.get(channel)
+        }
+
+        mq_status_data = {}
+        mq_down = False
+        for key, stub in stubs.items():
+            message_count = -1
+            message_error = None
+            try:
+                mq_info = stub.sync_info().queue_info()
+                message_count = mq_info.method.message_count
+            except AttributeError:
+                message_error = "Stub is not initialized."
+            except Exception as e:
+                message_error = f"{type(e).__name__}, {e}"
+
+            mq_status_data[key] = {}
+            mq_status_data[key]["message_count"] = message_count
+            if message_error:
+                mq_status_data[key]["error"] = message_error
+                mq_down = True
+
+        return mq_status_data, mq_down
@@ -71,6 +71,7 @@ class Response:
     fail_subscribe_limit = -15
     fail_invalid_key_error = -16
     fail_wrong_block_height = -17
+    fail_tx_relay_queue_full = -18
     fail_tx_invalid_unknown = -100
     fail_tx_invalid_hash_format = -101
     fail_tx_invalid_hash_generation = -102
@@ -148,6 +149,9 @@ responseCodeMap = {
     Response.fail_wrong_block_height:
         (Response.fail_wrong_block_height, "fail wrong block height"),
 
+    Response.fail_tx_relay_queue_full:
+        (Response.fail_tx_relay_queue_full, "fail tx relay queue is full"),
+
     Response.fail_tx_invalid_unknown:
         (Response.fail_tx_invalid_unknown, "fail tx invalid unknown"),
 
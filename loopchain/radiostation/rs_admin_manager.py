@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """A management class for peer and channel list."""
-from loopchain.baseservice import PeerManager
+import leveldb
+
+from loopchain.baseservice import PeerManager, PeerInfo
 from loopchain.blockchain import *
 
 
@@ -27,24 +29,51 @@ class AdminManager:
             allow_rename_path=False
         )
 
+        # { channel : version of the peer list saved in leveldb }
+        self.__saved_peer_list_versions = {}
+
         self.__json_data = None
         self.load_json_data(conf.CHANNEL_MANAGE_DATA_PATH)
 
     def save_peer_manager(self, channel, peer_manager: PeerManager):
         """peer_list 를 leveldb 에 저장한다.
+        Only peers changed since the last save are written.
 
         :param channel:
         :param peer_manager:
         """
         # util.logger.spam(f"rs_admin_manager:save_peer_manager")
 
-        level_db_key_name = str.encode(
-            conf.LEVEL_DB_KEY_FOR_PEER_LIST + f"_{channel}")
+        peer_list_data = peer_manager.peer_list_data
+        saved_version = self.__saved_peer_list_versions.get(channel, 0)
+        if saved_version == peer_list_data.version:
+            return
 
         try:
-            dump = peer_manager.dump()
-            level_db = self.__level_db
-            level_db.Put(level_db_key_name, dump)
+            changes = peer_list_data.get_changes(saved_version) if saved_version > 0 else None
+            all_peers = peer_manager.peer_list[conf.ALL_GROUP_ID]
+            batch = leveldb.WriteBatch()
+
+            if changes is None:
+                # write the whole peer list instead of the old one.
+                batch.Delete(self.__get_peer_list_key(channel))
+                for peer_key, _ in self.__iter_peer_keys(channel):
+                    batch.Delete(peer_key)
+                changed_peer_ids, removed_peer_ids = list(all_peers), []
+            else:
+                changed_peer_ids, removed_peer_ids = changes
+
+            for peer_id in changed_peer_ids:
+                if peer_id in all_peers:
+                    batch.Put(self.__get_peer_list_key(channel, b"/peer/" + peer_id.encode()),
+                              json.dumps(all_peers[peer_id].to_dict()).encode())
+            for peer_id in removed_peer_ids:
+                batch.Delete(self.__get_peer_list_key(channel, b"/peer/" + peer_id.encode()))
+            batch.Put(self.__get_peer_list_key(channel, b"/leader"), json.dumps(peer_manager.peer_leader).encode())
+            batch.Put(self.__get_peer_list_key(channel, b"/version"), str(peer_list_data.version).encode())
+
+            self.__level_db.Write(batch)
+            self.__saved_peer_list_versions[channel] = peer_list_data.version
         except AttributeError as e:
             logging.warning("Fail Save Peer_list: " + str(e))
 
@@ -53,20 +82,40 @@ class AdminManager:
 
         :return: peer_manager
         """
-        level_db_key_name = str.encode(
-            conf.LEVEL_DB_KEY_FOR_PEER_LIST + f"_{channel}")
-
         peer_manager = PeerManager(channel)
 
         try:
-            peer_list_data = pickle.loads(self.__level_db.Get(level_db_key_name))
+            version = int(self.__level_db.Get(self.__get_peer_list_key(channel, b"/version")))
+            peer_leader = json.loads(self.__level_db.Get(self.__get_peer_list_key(channel, b"/leader")))
+            peers = [PeerInfo.from_dict(json.loads(peer_dumped)) for _, peer_dumped in self.__iter_peer_keys(channel)]
+            peer_manager.load_peers(peers, peer_leader, version)
+            self.__saved_peer_list_versions[channel] = version
+            logging.debug("load peer_list_data from db: " + peer_manager.get_peers_for_debug()[0])
+            return peer_manager
+        except KeyError:
+            pass
+
+        try:
+            # peer list pickled before peer list versions
+            peer_list_data = pickle.loads(self.__level_db.Get(self.__get_peer_list_key(channel)))
             peer_manager.load(peer_list_data)
+            # it is written in the new format at the next save.
+            peer_manager.peer_list_data.reset_version(1)
             logging.debug("load peer_list_data from db: " + peer_manager.get_peers_for_debug()[0])
         except KeyError:
             logging.warning("There is no peer_list_data in db")
 
+        self.__saved_peer_list_versions.pop(channel, None)
         return peer_manager
 
+    @staticmethod
+    def __get_peer_list_key(channel, suffix=b""):
+        return str.encode(conf.LEVEL_DB_KEY_FOR_PEER_LIST + f"_{channel}") + suffix
+
+    def __iter_peer_keys(self, channel):
+        key_from = self.__get_peer_list_key(channel, b"/peer/")
+        return self.__level_db.RangeIter(key_from=key_from, key_to=key_from + b"\xff")
+
     def load_json_data(self, channel_manage_data_path):
         """open channel_manage_data json file and load the data
         :param channel_manage_data_path:
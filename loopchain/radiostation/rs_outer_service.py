@@ -160,6 +160,12 @@ class OuterService(loopchain_pb2_grpc.RadioStationServicer):
             "peer_target": None
         }
 
+        try:
+            peer_manager = ObjectManager().rs_service.channel_manager.get_peer_manager(request.channel or None)
+            status_data["heartbeat"] = peer_manager.get_heartbeat_status()
+        except KeyError:
+            status_data["heartbeat"] = None
+
         return loopchain_pb2.StatusReply(
             status=json.dumps(status_data),
             block_height=status_data["block_height"],
@@ -261,11 +267,16 @@ class OuterService(loopchain_pb2_grpc.RadioStationServicer):
             peer_order = peer_manager.add_peer(peer)
 
             peer_list_dump = b''
+            peer_list_delta = None
             status, reason = message_code.get_response(message_code.Response.fail)
 
         if peer_order > 0:
             try:
-                peer_list_dump = peer_manager.dump()
+                # a peer which sends its peer list version gets changes since it only.
+                if request.HasField("peer_list_version"):
+                    peer_list_delta = peer_manager.dump_delta(request.peer_list_version)
+                else:
+                    peer_list_dump = peer_manager.dump()
                 status, reason = message_code.get_response(message_code.Response.success)
 
             except pickle.PicklingError as e:
@@ -279,7 +290,8 @@ class OuterService(loopchain_pb2_grpc.RadioStationServicer):
             status=status,
             peer_list=peer_list_dump,
             channels=None,
-            more_info=reason
+            more_info=reason,
+            peer_list_delta=peer_list_delta
         )
 
     def GetPeerList(self, request, context):
@@ -290,8 +302,16 @@ class OuterService(loopchain_pb2_grpc.RadioStationServicer):
         :return: PeerList
         """
         channel_name = conf.LOOPCHAIN_DEFAULT_CHANNEL if not request.channel else request.channel
+        peer_manager = ObjectManager().rs_service.channel_manager.get_peer_manager(channel_name)
+
+        if request.HasField("peer_list_version"):
+            return loopchain_pb2.PeerList(
+                peer_list=b'',
+                peer_list_delta=peer_manager.dump_delta(request.peer_list_version)
+            )
+
         try:
-            peer_list_dump = ObjectManager().rs_service.channel_manager.get_peer_manager(channel_name).dump()
+            peer_list_dump = peer_manager.dump()
         except pickle.PicklingError as e:
             logging.warning("fail peer_list dump")
             peer_list_dump = b''
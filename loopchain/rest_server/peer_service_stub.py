@@ -13,11 +13,14 @@
 # limitations under the License.
 """Wrapper for Stub to Peer Service"""
 
+import asyncio
 import json
 import logging
 import pickle
 from json import JSONDecodeError
 
+import grpc
+
 from loopchain import configure as conf
 from loopchain.baseservice import StubManager
 from loopchain.components import SingletonMetaClass
@@ -45,10 +48,42 @@ class PeerServiceStub(metaclass=SingletonMetaClass):
         # util.logger.spam(f"peer_service_stub:call target({self.__stub_to_peer_service.target})")
         return self.__stub_to_peer_service.call(*args)
 
-    def get_status(self, channel: str):
-        response = self.call("GetStatus",
-                             loopchain_pb2.StatusRequest(request="", channel=channel),
-                             self.REST_GRPC_TIMEOUT)
+    async def call_async(self, method_name, message, timeout=None):
+        """Call the peer service without blocking the event loop.
+
+        :return: response or None if the call fails, the same as call()
+        """
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+
+        def call_back(result):
+            loop.call_soon_threadsafe(self.__set_result, future, method_name, result)
+
+        grpc_future = self.__stub_to_peer_service.call_async(method_name, message, call_back, timeout)
+        if grpc_future is None:
+            return None
+
+        try:
+            return await future
+        except asyncio.CancelledError:
+            grpc_future.cancel()
+            raise
+
+    @staticmethod
+    def __set_result(future: asyncio.Future, method_name, result):
+        if future.done():
+            return
+
+        if result.code() == grpc.StatusCode.OK:
+            future.set_result(result.result())
+        else:
+            logging.warning(f"gRPC call fail method_name({method_name}): {result.details()}")
+            future.set_result(None)
+
+    async def get_status(self, channel: str):
+        response = await self.call_async("GetStatus",
+                                         loopchain_pb2.StatusRequest(request="", channel=channel),
+                                         self.REST_GRPC_TIMEOUT)
         status_json_data = json.loads(response.status)
         status_json_data['block_height'] = response.block_height
         status_json_data['unconfirmed_block_height'] = response.unconfirmed_block_height
@@ -57,40 +92,40 @@ class PeerServiceStub(metaclass=SingletonMetaClass):
 
         return status_json_data
 
-    def get_last_block_hash(self, channel: str) -> str:
-        response = self.call("GetLastBlockHash",
-                             loopchain_pb2.CommonRequest(request="", channel=channel),
-                             self.REST_GRPC_TIMEOUT)
+    async def get_last_block_hash(self, channel: str) -> str:
+        response = await self.call_async("GetLastBlockHash",
+                                         loopchain_pb2.CommonRequest(request="", channel=channel),
+                                         self.REST_GRPC_TIMEOUT)
         return str(response.block_hash)
 
-    def get_block(self, channel: str, block_hash: str= "", block_height: int=-1):
+    async def get_block(self, channel: str, block_hash: str= "", block_height: int=-1):
         block_data_filter = "prev_block_hash, height, block_hash, merkle_tree_root_hash," \
                             " time_stamp, peer_id, signature"
         tx_data_filter = "icx_origin_data"
 
-        response = self.call("GetBlock",
-                             loopchain_pb2.GetBlockRequest(
-                                  block_hash=block_hash,
-                                  block_height=block_height,
-                                  block_data_filter=block_data_filter,
-                                  tx_data_filter=tx_data_filter,
-                                  channel=channel),
-                             self.REST_GRPC_TIMEOUT)
+        response = await self.call_async("GetBlock",
+                                         loopchain_pb2.GetBlockRequest(
+                                              block_hash=block_hash,
+                                              block_height=block_height,
+                                              block_data_filter=block_data_filter,
+                                              tx_data_filter=tx_data_filter,
+                                              channel=channel),
+                                         self.REST_GRPC_TIMEOUT)
 
         return response
 
-    def get_transaction(self, tx_hash: str, channel: str):
-        return self.call("GetTx",
-                         loopchain_pb2.GetTxRequest(tx_hash=tx_hash, channel=channel),
-                         self.REST_GRPC_TIMEOUT)
+    async def get_transaction(self, tx_hash: str, channel: str):
+        return await self.call_async("GetTx",
+                                     loopchain_pb2.GetTxRequest(tx_hash=tx_hash, channel=channel),
+                                     self.REST_GRPC_TIMEOUT)
 
-    def get_invoke_result(self, tx_hash, channel):
-        return self.call("GetInvokeResult",
-                         loopchain_pb2.GetInvokeResultRequest(tx_hash=tx_hash, channel=channel),
-                         self.REST_GRPC_TIMEOUT)
+    async def get_invoke_result(self, tx_hash, channel):
+        return await self.call_async("GetInvokeResult",
+                                     loopchain_pb2.GetInvokeResultRequest(tx_hash=tx_hash, channel=channel),
+                                     self.REST_GRPC_TIMEOUT)
 
-    def request(self, channel, code, params):
-        response = self.call(
+    async def request(self, channel, code, params):
+        response = await self.call_async(
             "Request", loopchain_pb2.Message(
                 code=code,
                 channel=channel,
@@ -58,7 +58,8 @@ def get_channel_name_from_json(request_body: dict) -> str:
 class ServerComponents(metaclass=SingletonMetaClass):
     def __init__(self):
         self.__app = Sanic(__name__)
-        self.__app.config.KEEP_ALIVE = False
+        self.__app.config.KEEP_ALIVE = True
+        self.__app.config.KEEP_ALIVE_TIMEOUT = conf.REST_KEEP_ALIVE_TIMEOUT
 
         # Decide whether to create context or not according to whether SSL is applied
         if conf.REST_SSL_TYPE == conf.SSLAuthType.none:
@@ -101,21 +102,21 @@ class ServerComponents(metaclass=SingletonMetaClass):
         self.__app.add_route(Status.as_view(), '/api/v1/status/peer')
         self.__app.add_route(Avail.as_view(), '/api/v1/avail/peer')
 
-    def query(self, data, channel):
-        return PeerServiceStub().call("Query",
-                                      loopchain_pb2.QueryRequest(params=data, channel=channel),
-                                      PeerServiceStub.REST_SCORE_QUERY_TIMEOUT)
+    async def query(self, data, channel):
+        return await PeerServiceStub().call_async("Query",
+                                                  loopchain_pb2.QueryRequest(params=data, channel=channel),
+                                                  PeerServiceStub.REST_SCORE_QUERY_TIMEOUT)
 
-    def create_transaction(self, data, channel):
+    async def create_transaction(self, data, channel):
         # logging.debug("Grpc Create Tx Data : " + data)
-        return PeerServiceStub().call("CreateTx",
-                                      loopchain_pb2.CreateTxRequest(data=data, channel=channel),
-                                      PeerServiceStub.REST_GRPC_TIMEOUT)
+        return await PeerServiceStub().call_async("CreateTx",
+                                                  loopchain_pb2.CreateTxRequest(data=data, channel=channel),
+                                                  PeerServiceStub.REST_GRPC_TIMEOUT)
 
-    def get_transaction(self, tx_hash, channel):
-        return PeerServiceStub().call("GetTx",
-                                      loopchain_pb2.GetTxRequest(tx_hash=tx_hash, channel=channel),
-                                      PeerServiceStub.REST_GRPC_TIMEOUT)
+    async def get_transaction(self, tx_hash, channel):
+        return await PeerServiceStub().call_async("GetTx",
+                                                  loopchain_pb2.GetTxRequest(tx_hash=tx_hash, channel=channel),
+                                                  PeerServiceStub.REST_GRPC_TIMEOUT)
 
     def ready(self, amqp_target, amqp_key):
         StubCollection().amqp_target = amqp_target
@@ -173,7 +174,7 @@ class Query(HTTPMethodView):
             channel = get_channel_name_from_json(request.json)
 
             try:
-                grpc_response = ServerComponents().query(request_body_dump, channel)
+                grpc_response = await ServerComponents().query(request_body_dump, channel)
                 if grpc_response is None:
                     query_data['response'] = str(grpc_response)
                     query_data['response_code'] = str(message_code.Response.not_treat_message_code)
@@ -235,7 +236,7 @@ class Transaction(HTTPMethodView):
         tx_data = dict()
 
         if utils.is_hex(tx_hash):
-            grpc_response = ServerComponents().get_transaction(tx_hash, get_channel_name_from_args(args))
+            grpc_response = await ServerComponents().get_transaction(tx_hash, get_channel_name_from_args(args))
             tx_data['response_code'] = str(grpc_response.response_code)
             tx_data['data'] = ""
             if len(grpc_response.data) is not 0:
@@ -265,7 +266,7 @@ class Transaction(HTTPMethodView):
         request_body = json.dumps(request.json)
         logging.debug("Transaction Request Body : " + request_body)
         channel = get_channel_name_from_json(request.json)
-        grpc_response = ServerComponents().create_transaction(request_body, channel)
+        grpc_response = await ServerComponents().create_transaction(request_body, channel)
 
         tx_data = dict()
 
@@ -287,7 +288,7 @@ class InvokeResult(HTTPMethodView):
         if utils.is_hex(tx_hash):
             logging.debug('tx_hash : ' + tx_hash)
             channel_name = get_channel_name_from_args(args)
-            grpc_response = PeerServiceStub().get_invoke_result(channel=channel_name, tx_hash=tx_hash)
+            grpc_response = await PeerServiceStub().get_invoke_result(channel=channel_name, tx_hash=tx_hash)
             verify_result['response_code'] = str(grpc_response.response_code)
             if len(grpc_response.result) is not 0:
                 try:
@@ -307,13 +308,13 @@ class InvokeResult(HTTPMethodView):
 
 class Status(HTTPMethodView):
     async def get(self, request):
-        return response.json(PeerServiceStub().get_status(get_channel_name_from_args(request.raw_args)))
+        return response.json(await PeerServiceStub().get_status(get_channel_name_from_args(request.raw_args)))
 
 
 class Avail(HTTPMethodView):
     async def get(self, request):
         status = HTTPStatus.OK
-        result = PeerServiceStub().get_status(
+        result = await PeerServiceStub().get_status(
             get_channel_name_from_args(request.raw_args)
         )
 
@@ -346,7 +347,7 @@ class Blocks(HTTPMethodView):
             block_hash = args['hash']
 
             if utils.is_hex(block_hash):
-                grpc_response = PeerServiceStub().get_block(channel=channel, block_hash=block_hash)
+                grpc_response = await PeerServiceStub().get_block(channel=channel, block_hash=block_hash)
                 logging.debug(f"response : {grpc_response}")
                 block_data['block_hash'] = grpc_response.block_hash
                 block_data['block_data_json'] = json.loads(grpc_response.block_data_json)
@@ -365,8 +366,8 @@ class Blocks(HTTPMethodView):
                 block_data['response_code'] = str(message_code.Response.fail_validate_params.value)
                 block_data['message'] = "Invalid transaction hash."
         else:
-            block_hash = PeerServiceStub().get_last_block_hash(channel=channel)
-            grpc_response = PeerServiceStub().get_block(channel=channel, block_hash=block_hash)
+            block_hash = await PeerServiceStub().get_last_block_hash(channel=channel)
+            grpc_response = await PeerServiceStub().get_block(channel=channel, block_hash=block_hash)
             logging.debug(f"response : {grpc_response}")
             block_data['response_code'] = grpc_response.response_code
             block_data['block_hash'] = grpc_response.block_hash
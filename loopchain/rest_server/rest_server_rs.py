@@ -42,7 +42,8 @@ def get_channel_name_from_args(args) -> str:
 class ServerComponents(metaclass=SingletonMetaClass):
     def __init__(self):
         self.__app = Sanic(__name__)
-        self.__app.config.KEEP_ALIVE = False
+        self.__app.config.KEEP_ALIVE = True
+        self.__app.config.KEEP_ALIVE_TIMEOUT = conf.REST_KEEP_ALIVE_TIMEOUT
 
         # SSL 적용 여부에 따라 context 생성 여부를 결정한다.
         if conf.REST_SSL_TYPE is conf.SSLAuthType.none:
@@ -86,7 +87,7 @@ class ServerComponents(metaclass=SingletonMetaClass):
     def get_peer_list(self, channel):
         return self.__stub_to_rs_service.call(
             "GetPeerList",
-            loopchain_pb2.CommonRequest(request="", group_id=conf.ALL_GROUP_ID, channel=channel))
+            loopchain_pb2.CommonRequest(request="", group_id=conf.ALL_GROUP_ID, channel=channel, peer_list_version=0))
 
     def get_leader_peer(self, channel):
         return self.__stub_to_rs_service.call(
@@ -159,8 +160,7 @@ class Peer(HTTPMethodView):
             grpc_response = ServerComponents().get_peer_list(channel)
 
             peer_manager = PeerManager(channel)
-            peer_list_data = pickle.loads(grpc_response.peer_list)
-            peer_manager.load(peer_list_data, False)
+            peer_manager.load_delta(grpc_response.peer_list_delta)
 
             all_peer_list = []
             connected_peer_list = []
@@ -199,8 +199,7 @@ class Peer(HTTPMethodView):
             grpc_response = ServerComponents().get_peer_list(channel)
 
             peer_manager = PeerManager(channel)
-            peer_list_data = pickle.loads(grpc_response.peer_list)
-            peer_manager.load(peer_list_data, False)
+            peer_manager.load_delta(grpc_response.peer_list_delta)
 
             async_futures: List[grpc.Future] = []
             for peer_id in peer_manager.peer_list[conf.ALL_GROUP_ID]:
@@ -26,7 +26,7 @@ from loopchain.baseservice.plugin_bases import Plugins
 from loopchain.scoreservice import ScoreInnerService
 from loopchain.tools.score_helper import ScoreHelper
 from loopchain.utils import loggers
-from loopchain.utils.message_queue import StubCollection
+from loopchain.utils.message_queue import StubCollection, connect_service
 
 
 if TYPE_CHECKING:
@@ -83,9 +83,6 @@ class ScoreService:
         stopwatch_duration = timeit.default_timer() - stopwatch_start
         logging.info(f"Start Score Service start duration({stopwatch_duration})")
 
-        self.__inner_service.serve(
-            exclusive=True,
-            connection_attempts=conf.AMQP_CONNECTION_ATTEMPS,
-            retry_delay=conf.AMQP_RETRY_DELAY)
+        self.__inner_service.loop.create_task(connect_service(self.__inner_service, exclusive=True))
         self.__inner_service.serve_all()
         self.__inner_service.loop.close()
@@ -0,0 +1,104 @@
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Rebuild the index of txs by address from the blocks in the block DB offline.
+
+usage: python3 -m loopchain.tools.address_index_rebuilder <block db path>
+
+Stop the peer before running it. The index and the pickled tx lists by address of old versions are deleted first,
+so it is safe to run again after it is interrupted.
+"""
+
+import argparse
+import logging
+import sys
+
+import leveldb
+
+from loopchain import configure as conf
+from loopchain.blockchain import AddressTxIndex, BlockChain, BlockRecord, BlockSerializer, TransactionVersioner
+
+BATCH_BLOCK_COUNT = 100
+
+
+def clear(db) -> int:
+    address_tx_index = AddressTxIndex(db)
+    batch = leveldb.WriteBatch()
+    deleted_count = address_tx_index.clear(batch)
+
+    prefix = conf.TX_LIST_ADDRESS_PREFIX
+    for key in db.RangeIter(key_from=prefix, include_value=False):
+        key = bytes(key)
+        if not key.startswith(prefix):
+            break
+        batch.Delete(key)
+        deleted_count += 1
+
+    db.Write(batch, sync=True)
+    return deleted_count
+
+
+def get_block_dumped(db, height: int):
+    height_key = BlockChain.BLOCK_HEIGHT_KEY + height.to_bytes(conf.BLOCK_HEIGHT_BYTES_LEN, byteorder='big')
+    try:
+        block_hash_encoded = db.Get(height_key)
+    except KeyError:
+        return None
+    return BlockRecord.loads(db.Get(bytes(block_hash_encoded)))
+
+
+def rebuild(db_path: str):
+    db = leveldb.LevelDB(db_path, create_if_missing=False)
+    deleted_count = clear(db)
+    logging.info(f"deleted {deleted_count} keys of tx lists by address")
+
+    address_tx_index = AddressTxIndex(db)
+    tx_versioner = TransactionVersioner()
+    counts = {}
+    tx_count = 0
+
+    batch = leveldb.WriteBatch()
+    height = 1  # txs of the genesis block are not indexed.
+    while True:
+        block_dumped = get_block_dumped(db, height)
+        if block_dumped is None:
+            break
+
+        block_serializer = BlockSerializer.new(block_dumped["version"], tx_versioner)
+        block = block_serializer.deserialize(block_dumped, trusted=True)
+        for tx in block.body.transactions.values():
+            address_tx_index.put(batch, tx.from_address.hex_hx(), tx.hash.hex(), counts)
+            tx_count += 1
+
+        if height % BATCH_BLOCK_COUNT == 0:
+            db.Write(batch, sync=True)
+            batch = leveldb.WriteBatch()
+            logging.info(f"indexed {tx_count} txs until block height({height})")
+        height += 1
+
+    db.Write(batch, sync=True)
+    logging.info(f"indexed {tx_count} txs of {len(counts)} addresses in {height - 1} blocks of {db_path}")
+    return tx_count
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Rebuild the index of txs by address from blocks.")
+    parser.add_argument("db_path", help="path of the block DB. e.g. .storage/db_127.0.0.1:7100_icon_dex")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    rebuild(args.db_path)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
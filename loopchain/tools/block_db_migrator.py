@@ -0,0 +1,108 @@
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Convert records of the block DB between JSON and the binary format offline.
+
+usage: python3 -m loopchain.tools.block_db_migrator <block db path> [--to-json]
+
+Stop the peer before running it. A record which is already in the target format is skipped,
+so it is safe to run again after it is interrupted.
+Records written while BLOCK_DB_BINARY_RECORD is True can not be read by older versions. To roll back to such a
+version, convert them with --to-json and set BLOCK_DB_BINARY_RECORD to False before starting the peer again.
+"""
+
+import argparse
+import json
+import logging
+import sys
+
+import leveldb
+
+from loopchain.blockchain import BlockRecord, TxInfoRecord
+
+BATCH_SIZE = 1000
+
+
+def get_record_class(record: dict):
+    if "confirmed_transaction_list" in record and "height" in record and "block_hash" in record:
+        return BlockRecord
+    if "transaction" in record and "block_hash" in record and "tx_index" in record:
+        return TxInfoRecord
+    return None
+
+
+def convert_record(value: bytes, to_json=False):
+    """
+    :return: converted value or None if the value is not a record of a block or tx info.
+    """
+    for record_class in (BlockRecord, TxInfoRecord):
+        if record_class.is_binary(value):
+            return json.dumps(record_class.loads(value)).encode("utf-8") if to_json else None
+
+    if to_json or not value.startswith(b"{"):
+        return None
+
+    try:
+        record = json.loads(value)
+    except ValueError:
+        return None
+
+    record_class = get_record_class(record) if isinstance(record, dict) else None
+    return record_class.dumps(record) if record_class else None
+
+
+def migrate(db_path: str, to_json=False):
+    db = leveldb.LevelDB(db_path, create_if_missing=False)
+
+    converted_count = 0
+    size_before = 0
+    size_after = 0
+
+    batch = leveldb.WriteBatch()
+    batch_count = 0
+    for key, value in db.RangeIter(include_value=True):
+        converted = convert_record(bytes(value), to_json)
+        if converted is None:
+            continue
+
+        batch.Put(key, converted)
+        batch_count += 1
+        converted_count += 1
+        size_before += len(value)
+        size_after += len(converted)
+
+        if batch_count >= BATCH_SIZE:
+            db.Write(batch, sync=True)
+            batch = leveldb.WriteBatch()
+            batch_count = 0
+            logging.info(f"converted {converted_count} records")
+
+    if batch_count:
+        db.Write(batch, sync=True)
+
+    logging.info(f"converted {converted_count} records of {db_path}: {size_before} bytes -> {size_after} bytes")
+    return converted_count
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Convert records of the block DB between JSON and binary.")
+    parser.add_argument("db_path", help="path of the block DB. e.g. .storage/db_127.0.0.1:7100_icon_dex")
+    parser.add_argument("--to-json", action="store_true", help="convert binary records back to JSON")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    migrate(args.db_path, args.to_json)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
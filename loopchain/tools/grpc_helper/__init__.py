@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from .grpc_helper import *
+from .grpc_channel_pool import *
 from .grpc_connector import *
 from .grpc_secure_key import *
 from .grpc_patcher import *
\ No newline at end of file
@@ -0,0 +1,120 @@
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""gRPC client channels shared in a process"""
+
+import logging
+import threading
+import time
+from functools import partial
+
+import grpc
+
+from loopchain import configure as conf
+from loopchain.components import SingletonMetaClass
+from loopchain.tools.grpc_helper.grpc_helper import GRPCHelper
+
+
+class GRPCChannelPool(metaclass=SingletonMetaClass):
+    """A channel for each (target, SSL auth type) shared by all stubs of a process.
+
+    A channel reconnects by itself, so it is kept while it works and replaced only when it has failed.
+    A replaced channel is closed after conf.GRPC_RETIRED_CHANNEL_CLOSE_DELAY, when calls of its stubs are over.
+    The connectivity of channels is tracked by subscription.
+    """
+
+    FAILED_STATES = (grpc.ChannelConnectivity.TRANSIENT_FAILURE, grpc.ChannelConnectivity.SHUTDOWN)
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__channels = {}  # (target, ssl_auth_type): channel
+        self.__states = {}  # (target, ssl_auth_type): grpc.ChannelConnectivity
+        self.__callbacks = {}  # (target, ssl_auth_type): connectivity callback of the channel
+        self.__retired_channels = []  # (time to close, channel) of replaced channels in the order of replacement
+        self.__created_count = 0
+        self.__closed_count = 0
+
+    def get_channel(self, target, ssl_auth_type: conf.SSLAuthType=None) -> grpc.Channel:
+        key = self.__get_key(target, ssl_auth_type)
+        with self.__lock:
+            channel = self.__channels.get(key)
+            if channel is None:
+                channel = self.__create_channel(key)
+            return channel
+
+    def renew_failed_channel(self, target, ssl_auth_type: conf.SSLAuthType=None) -> grpc.Channel:
+        """Replace the channel if it has failed. A new channel connects right away without reconnect backoff.
+        The old one is closed later for stubs still using it.
+        """
+        key = self.__get_key(target, ssl_auth_type)
+        with self.__lock:
+            self.__close_retired_channels()
+            channel = self.__channels.get(key)
+            if channel is not None and self.__states.get(key) not in self.FAILED_STATES:
+                return channel
+
+            if channel is not None:
+                logging.debug(f"renew gRPC channel({key}) state({self.__states.get(key)})")
+                channel.unsubscribe(self.__callbacks.pop(key))
+                self.__retired_channels.append((time.monotonic() + conf.GRPC_RETIRED_CHANNEL_CLOSE_DELAY, channel))
+            return self.__create_channel(key)
+
+    def is_healthy(self, target, ssl_auth_type: conf.SSLAuthType=None) -> bool:
+        return self.__states.get(self.__get_key(target, ssl_auth_type)) not in self.FAILED_STATES
+
+    def get_status(self) -> dict:
+        with self.__lock:
+            self.__close_retired_channels()
+            states = list(self.__states.values())
+            retired_count = len(self.__retired_channels)
+        status = {
+            "channel_count": len(states),
+            "retired_count": retired_count,
+            "created_count": self.__created_count,
+            "closed_count": self.__closed_count
+        }
+        for state in grpc.ChannelConnectivity:
+            status[state.name.lower()] = states.count(state)
+        return status
+
+    @staticmethod
+    def __get_key(target, ssl_auth_type):
+        return target, conf.GRPC_SSL_TYPE if ssl_auth_type is None else ssl_auth_type
+
+    def __create_channel(self, key):
+        target, ssl_auth_type = key
+        channel = GRPCHelper().create_client_channel(target, ssl_auth_type, conf.GRPC_SSL_KEY_LOAD_TYPE,
+                                                     GRPCHelper.get_channel_options())
+        self.__channels[key] = channel
+        self.__states[key] = grpc.ChannelConnectivity.IDLE
+        self.__created_count += 1
+
+        # try_to_connect makes the connection before the first call.
+        callback = partial(self.__update_state, key, channel)
+        self.__callbacks[key] = callback
+        channel.subscribe(callback, try_to_connect=True)
+        return channel
+
+    def __close_retired_channels(self):
+        now = time.monotonic()
+        while self.__retired_channels and self.__retired_channels[0][0] <= now:
+            _, channel = self.__retired_channels.pop(0)
+            # grpc.Channel.close is in grpcio 1.12 or later. An older channel is closed when it is collected.
+            close = getattr(channel, "close", None)
+            if close is not None:
+                close()
+            self.__closed_count += 1
+
+    def __update_state(self, key, channel, state: grpc.ChannelConnectivity):
+        if self.__channels.get(key) is channel:
+            self.__states[key] = state
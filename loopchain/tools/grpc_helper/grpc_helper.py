@@ -54,12 +54,45 @@ class GRPCHelper(metaclass=SingletonMetaClass):
 
         logging.info(f"Server now listen: {host}, secure level : {str(ssl_auth_type)}")
 
-    def create_client_channel(self, host, ssl_auth_type: conf.SSLAuthType=None, key_load_type: conf.KeyLoadType=None):
+    @staticmethod
+    def get_channel_options():
+        """options of a pooled channel. Keepalive pings are sent only if conf.GRPC_KEEPALIVE,
+        since servers without get_server_options close the connections which send them.
+        """
+        options = [
+            ("grpc.max_send_message_length", conf.GRPC_MAX_MESSAGE_LENGTH),
+            ("grpc.max_receive_message_length", conf.GRPC_MAX_MESSAGE_LENGTH),
+            ("grpc.max_reconnect_backoff_ms", conf.GRPC_MAX_RECONNECT_BACKOFF * 1000)
+        ]
+        if conf.GRPC_KEEPALIVE:
+            options += [
+                ("grpc.keepalive_time_ms", conf.GRPC_KEEPALIVE_TIME * 1000),
+                ("grpc.keepalive_timeout_ms", conf.GRPC_KEEPALIVE_TIMEOUT * 1000),
+                ("grpc.keepalive_permit_without_calls", 1),
+                ("grpc.http2.max_pings_without_data", 0),
+                ("grpc.http2.min_time_between_pings_ms", conf.GRPC_KEEPALIVE_TIME * 1000)
+            ]
+        return options
+
+    @staticmethod
+    def get_server_options():
+        """options of a server which accepts keepalive pings from the channels of get_channel_options"""
+        return [
+            ("grpc.max_send_message_length", conf.GRPC_MAX_MESSAGE_LENGTH),
+            ("grpc.max_receive_message_length", conf.GRPC_MAX_MESSAGE_LENGTH),
+            ("grpc.keepalive_permit_without_calls", 1),
+            ("grpc.http2.max_pings_without_data", 0),
+            ("grpc.http2.min_ping_interval_without_data_ms", conf.GRPC_KEEPALIVE_TIME * 1000 // 2)
+        ]
+
+    def create_client_channel(self, host, ssl_auth_type: conf.SSLAuthType=None, key_load_type: conf.KeyLoadType=None,
+                              options=None):
         """
 
         :param host: Target host you want to connect
         :param ssl_auth_type: It notices that which type of SSL auth is used. None : conf.GRPC_SSL_TYPE
         :param key_load_type: It determines where keys has to be loaded. None : conf.GRPC_SSL_KEY_LOAD_TYPE
+        :param options: channel options of gRPC
         :return: grpc channel
         """
         if ssl_auth_type is None:
@@ -71,7 +104,7 @@ class GRPCHelper(metaclass=SingletonMetaClass):
         self.__keys.reset(ssl_auth_type, key_load_type)
 
         connector: GRPCConnector = self.__connectors[ssl_auth_type]
-        channel = connector.create_client_channel(self.__keys, host, ssl_auth_type)
+        channel = connector.create_client_channel(self.__keys, host, ssl_auth_type, options)
 
         logging.info(f"Client Channel : {host}, secure level : {str(ssl_auth_type)}")
 
@@ -0,0 +1,74 @@
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Rebuild the tx hash filter from the blocks in the block DB offline.
+
+usage: python3 -m loopchain.tools.tx_hash_filter_rebuilder <block db path>
+
+Stop the peer before running it. Run it before TX_HASH_FILTER is enabled on a chain which has
+TX_HASH_FILTER_SAVE_INTERVAL blocks or more, and again after TX_HASH_FILTER_CAPACITY or TX_HASH_FILTER_ERROR_RATE
+is changed. Without a filter to use, BlockChain does not use the filter on such a chain.
+"""
+
+import argparse
+import logging
+import sys
+
+import leveldb
+
+from loopchain import configure as conf
+from loopchain.blockchain import BlockChain, BlockSerializer, TransactionVersioner, TxHashFilter
+from loopchain.tools.address_index_rebuilder import get_block_dumped
+
+LOG_BLOCK_COUNT = 1000
+
+
+def rebuild(db_path: str) -> TxHashFilter:
+    db = leveldb.LevelDB(db_path, create_if_missing=False)
+    tx_hash_filter = TxHashFilter(conf.TX_HASH_FILTER_CAPACITY, conf.TX_HASH_FILTER_ERROR_RATE)
+    tx_versioner = TransactionVersioner()
+
+    height = 0
+    while True:
+        block_dumped = get_block_dumped(db, height)
+        if block_dumped is None:
+            break
+
+        block_serializer = BlockSerializer.new(block_dumped["version"], tx_versioner)
+        block = block_serializer.deserialize(block_dumped, trusted=True)
+        for tx_hash in block.body.transactions:
+            tx_hash_filter.add(tx_hash)
+        tx_hash_filter.height = height
+
+        if height % LOG_BLOCK_COUNT == 0:
+            logging.info(f"added {tx_hash_filter.count} txs until block height({height})")
+        height += 1
+
+    db.Put(BlockChain.TX_HASH_FILTER_KEY, tx_hash_filter.dumps(), sync=True)
+    status = tx_hash_filter.get_status()
+    logging.info(f"saved the tx hash filter of {status['count']} txs in {height} blocks of {db_path}, "
+                 f"{status['bytes']} bytes, expected false positive rate({status['expected_false_positive_rate']})")
+    return tx_hash_filter
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Rebuild the tx hash filter from blocks.")
+    parser.add_argument("db_path", help="path of the block DB. e.g. .storage/db_127.0.0.1:7100_icon_dex")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    rebuild(args.db_path)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -34,7 +34,7 @@ import zlib
 from binascii import unhexlify
 from contextlib import closing
 from decimal import Decimal
-from fluent import event
+from fluent import asyncsender, event
 from jsonrpcclient import HTTPClient
 from jsonrpcclient.exceptions import ReceivedErrorResponse
 from pathlib import Path
@@ -42,7 +42,7 @@ from subprocess import PIPE, Popen, TimeoutExpired
 
 from loopchain import configure as conf
 from loopchain.protos import loopchain_pb2, message_code
-from loopchain.tools.grpc_helper import GRPCHelper
+from loopchain.tools.grpc_helper import GRPCChannelPool
 
 apm_event = None
 block_dumps = None
@@ -88,6 +88,9 @@ def long_to_bytes (val, endianness='big'):
 def exit_and_msg(msg):
     exit_msg = "Service Stop by: " + msg
     logging.exception(exit_msg)
+    # the records in the log queue are written before the process is killed.
+    for handler in logging.getLogger().handlers:
+        handler.flush()
     os.killpg(0, signal.SIGKILL)
 
 
@@ -122,7 +125,7 @@ def load_user_score(path):
 
 def get_stub_to_server(target, stub_class, time_out_seconds=None, is_check_status=True,
                        ssl_auth_type: conf.SSLAuthType=conf.SSLAuthType.none):
-    """gRPC connection to server
+    """gRPC connection to server. The channel is shared in the process by GRPCChannelPool.
 
     :return: stub to server
     """
@@ -136,7 +139,7 @@ def get_stub_to_server(target, stub_class, time_out_seconds=None, is_check_statu
     while stub is None and duration < time_out_seconds:
         try:
             logging.debug("(util) get stub to server target: " + str(target))
-            channel = GRPCHelper().create_client_channel(target, ssl_auth_type, conf.GRPC_SSL_KEY_LOAD_TYPE)
+            channel = GRPCChannelPool().renew_failed_channel(target, ssl_auth_type)
             stub = stub_class(channel)
             if is_check_status:
                 stub.Request(loopchain_pb2.Message(code=message_code.Request.status), conf.GRPC_TIMEOUT)
@@ -477,7 +480,10 @@ def no_send_apm_event(peer_id, event_param):
 
 
 def send_apm_event(peer_id, event_param):
-    event.Event(peer_id, event_param)
+    if conf.LOG_ASYNC:
+        event.Event(peer_id, event_param, sender=asyncsender.get_global_sender())
+    else:
+        event.Event(peer_id, event_param)
 
 
 # ------------------- data utils ----------------------------
@@ -79,12 +79,27 @@ class CustomAiohttpClient(AsyncClient):
         return None
 
 
+_client_session: aiohttp.ClientSession = None
+
+
+def get_client_session() -> aiohttp.ClientSession:
+    """A session with pooled keep-alive connections shared by requests to other nodes in this process.
+    It must be called in the event loop which the session is used in.
+    """
+    global _client_session
+    if _client_session is None or _client_session.closed:
+        connector = aiohttp.TCPConnector(limit=conf.REST_CLIENT_POOL_LIMIT,
+                                         limit_per_host=conf.REST_CLIENT_POOL_SIZE,
+                                         keepalive_timeout=conf.REST_KEEP_ALIVE_TIMEOUT)
+        _client_session = aiohttp.ClientSession(connector=connector)
+    return _client_session
+
+
 async def redirect_request_to_rs(message, rs_target, version=conf.ApiVersion.v3):
     method_name = 'icx_sendTransaction'
     rs_url = util.normalize_request_url(f"{'https' if conf.SUBSCRIBE_USE_HTTPS else 'http'}://{rs_target}", version)
-    async with aiohttp.ClientSession() as session:
-        result = await CustomAiohttpClient(session, rs_url).request(method_name, message)
-        util.logger.spam(f"json_rpc_dispatcher:redirect_request_to_rs::{method_name}/{result}")
+    result = await CustomAiohttpClient(get_client_session(), rs_url).request(method_name, message)
+    util.logger.spam(f"json_rpc_dispatcher:redirect_request_to_rs::{method_name}/{result}")
 
     return result
 
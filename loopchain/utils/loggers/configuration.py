@@ -22,8 +22,9 @@ import traceback
 
 from functools import partial, reduce
 from operator import or_
-from fluent import sender
+from fluent import asyncsender, sender
 from loopchain import configure as conf
+from .log_queue_handler import LogQueueHandler
 from .sized_timed_file_handler import SizedTimedRotatingFileHandler
 
 
@@ -53,6 +54,8 @@ class LogConfiguration:
         self._log_level = None
         self._log_format = None
         self._log_file_path = None
+        self._stream_handler = None
+        self._queue_handler = None
 
     def update_logger(self, logger: logging.Logger=None):
         if logger is None:
@@ -79,7 +82,13 @@ class LogConfiguration:
             logger.setLevel(self._log_level)
 
         if self.log_monitor:
-            sender.setup('loopchain', host=self.log_monitor_host, port=self.log_monitor_port)
+            if conf.LOG_ASYNC:
+                if asyncsender.get_global_sender() is not None:
+                    asyncsender.close()
+                asyncsender.setup('loopchain', host=self.log_monitor_host, port=self.log_monitor_port,
+                                  queue_maxsize=conf.LOG_QUEUE_SIZE, queue_circular=True)
+            else:
+                sender.setup('loopchain', host=self.log_monitor_host, port=self.log_monitor_port)
 
     def _update_log_color_set(self, logger):
         # level SPAM value is 5
@@ -114,10 +123,15 @@ class LogConfiguration:
                 'debug': {'color': 'green'},
                 'warning': {'color': 'yellow'}}
 
-        coloredlogs.install(logger=logger,
-                            fmt=self._log_format,
-                            datefmt="%m%d %H:%M:%S",
-                            level=self._log_level)
+        if self._queue_handler is None:
+            coloredlogs.install(logger=logger,
+                                fmt=self._log_format,
+                                datefmt="%m%d %H:%M:%S",
+                                level=self._log_level)
+        elif self._stream_handler is not None:
+            # the stream handler is in the queue handler, not in the logger.
+            self._stream_handler.setFormatter(coloredlogs.ColoredFormatter(fmt=self._log_format,
+                                                                           datefmt="%m%d %H:%M:%S"))
 
     def _update_log_file_path(self):
         log_file_name = self.log_file_prefix + "{SERVICE_TYPE}{CHANNEL_NAME}{SCORE_PACKAGE}"
@@ -137,12 +151,18 @@ class LogConfiguration:
                 (conf.LogOutputType[flag.lower()] for flag in self.log_output_type.split('|')))
 
     def _update_handlers(self, logger):
+        old_queue_handlers = []
+
         logging._acquireLock()
         try:
             for handler in logger.handlers[:]:
                 logger.removeHandler(handler)
+                if isinstance(handler, LogQueueHandler):
+                    old_queue_handlers.append(handler)
 
             handlers = []
+            self._stream_handler = None
+            self._queue_handler = None
 
             partial_new_excepthook = new_excepthook
             partial_new_print_exception = new_print_exception
@@ -150,6 +170,7 @@ class LogConfiguration:
             if self.log_output_type & conf.LogOutputType.console:
                 stream_handler = self._create_stream_handler()
                 handlers.append(stream_handler)
+                self._stream_handler = stream_handler
 
                 partial_new_excepthook = partial(partial_new_excepthook, console=True)
                 partial_new_print_exception = partial(partial_new_print_exception, console=True)
@@ -169,6 +190,12 @@ class LogConfiguration:
                 sys.excepthook = partial(partial_new_excepthook, output_file=None)
                 traceback.print_exception = partial(partial_new_print_exception, output_file=None)
 
+            if conf.LOG_ASYNC and handlers:
+                for handler in handlers:
+                    handler.setFormatter(logging.Formatter(self._log_format, "%m%d %H:%M:%S"))
+                self._queue_handler = LogQueueHandler(handlers, conf.LOG_QUEUE_SIZE)
+                handlers = [self._queue_handler]
+
             logging.basicConfig(handlers=handlers,
                                 format=self._log_format,
                                 datefmt="%m%d %H:%M:%S",
@@ -176,6 +203,10 @@ class LogConfiguration:
         finally:
             logging._releaseLock()
 
+        # the listeners write the remaining records before they stop.
+        for handler in old_queue_handlers:
+            handler.close()
+
     def _create_file_handler(self):
         if os.path.exists(self.log_file_location):
             if not os.path.isdir(self.log_file_location):
@@ -0,0 +1,114 @@
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+
+class _FlushMarker:
+    def __init__(self):
+        self.written = threading.Event()
+
+
+class _LogQueueListener(QueueListener):
+    def enqueue_sentinel(self):
+        # wait for a room in the full queue to stop.
+        self.queue.put(self._sentinel)
+
+    def handle(self, record):
+        if isinstance(record, _FlushMarker):
+            record.written.set()
+        else:
+            super().handle(record)
+
+
+class LogQueueHandler(QueueHandler):
+    """Put log records to a bounded queue without blocking the logging thread.
+    A listener thread formats the records and writes them by the handlers.
+    Records are dropped and counted while the queue is full.
+    """
+
+    def __init__(self, handlers: list, queue_size: int):
+        super().__init__(queue.Queue(queue_size))
+        self.handlers = handlers
+        self.queue_size = queue_size
+        self.listener: _LogQueueListener = None
+        self.dropped_count = 0
+        self.__reported_dropped_count = 0
+        self.__pid = None
+
+        self.__start_listener()
+
+    def __start_listener(self):
+        self.queue = queue.Queue(self.queue_size)
+        self.listener = _LogQueueListener(self.queue, *self.handlers, respect_handler_level=True)
+        self.listener.start()
+        self.__pid = os.getpid()
+
+    def prepare(self, record: logging.LogRecord):
+        """Merge args into the message here, as args may be changed before the listener writes the record.
+        The listener formats the record by the formatter of each handler.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            if self.dropped_count > self.__reported_dropped_count:
+                self.queue.put_nowait(self.__make_dropped_record())
+                self.__reported_dropped_count = self.dropped_count
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped_count += 1
+
+    def emit(self, record: logging.LogRecord):
+        # a forked process does not have the listener thread of its parent.
+        if self.__pid != os.getpid():
+            self.__start_listener()
+        super().emit(record)
+
+    def flush(self, timeout=5.0):
+        """Wait until the listener writes the records which are in the queue now."""
+        if self.listener is None or self.__pid != os.getpid():
+            return
+
+        flush_marker = _FlushMarker()
+        try:
+            self.queue.put(flush_marker, timeout=timeout)
+        except queue.Full:
+            return
+        flush_marker.written.wait(timeout)
+
+    def close(self):
+        """Stop the listener after it writes the records in the queue."""
+        if self.listener is not None and self.__pid == os.getpid():
+            self.listener.stop()
+        self.listener = None
+        super().close()
+
+    def __make_dropped_record(self):
+        return logging.makeLogRecord({
+            "name": "root",
+            "levelno": logging.WARNING,
+            "levelname": logging.getLevelName(logging.WARNING),
+            "filename": os.path.basename(__file__),
+            "msg": f"{self.dropped_count - self.__reported_dropped_count} log records are dropped "
+                   f"as the log queue is full. ({self.dropped_count} records in total)"
+        })
@@ -13,3 +13,4 @@
 # limitations under the License.
 
 from .stub_collection import StubCollection
+from .local_message_queue import LocalMessageQueueServer, LocalMessageQueueStub, connect_service
@@ -0,0 +1,374 @@
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Call message queue tasks of a process on the same host through a Unix domain socket, without a broker"""
+
+import asyncio
+import functools
+import inspect
+import itertools
+import logging
+import os
+import pickle
+import socket
+import stat
+import struct
+import threading
+from types import SimpleNamespace
+from typing import TypeVar, Generic, Union
+
+from earlgrey import (MessageQueueService, MessageQueueException, MessageQueueType, MESSAGE_QUEUE_TYPE_KEY,
+                      TASK_ATTR_DICT)
+
+from loopchain import configure as conf
+
+T = TypeVar('T')
+
+# A frame is the size of the pickled data in 4 bytes and the data.
+# request: (call_id, task name, kwargs), call_id is 0 for a worker task which has no reply.
+# reply: (call_id, result)
+_FRAME_HEADER = struct.Struct(">I")
+_QUEUE_INFO = "__queue_info__"
+
+_servers = {}  # { route_key : LocalMessageQueueServer }
+
+
+def get_local_address(route_key: str) -> str:
+    return os.path.join(conf.LOCAL_MESSAGE_QUEUE_PATH, f"{route_key}.sock")
+
+
+def check_local_directory(path: str, create=False):
+    """Check that only the current user can put a socket in the directory,
+    since frames received on the sockets in it are unpickled.
+
+    :param path: directory of Unix domain sockets
+    :param create: create the directory with mode 0o700 if it does not exist
+    """
+    if create:
+        os.makedirs(path, mode=0o700, exist_ok=True)
+
+    path_stat = os.lstat(path)
+    if not stat.S_ISDIR(path_stat.st_mode):
+        raise PermissionError(f"The local message queue path({path}) is not a directory.")
+    if path_stat.st_uid != os.getuid():
+        raise PermissionError(f"The local message queue path({path}) is not owned by the current user.")
+    if path_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise PermissionError(f"The local message queue path({path}) is writable by group or others.")
+
+
+async def connect_service(service: MessageQueueService, **kwargs):
+    """Connect the inner service to RabbitMQ, or serve its tasks on a Unix domain socket if LOCAL_MESSAGE_QUEUE.
+
+    :param service: inner service of peer, channel or score
+    :param kwargs: arguments of MessageQueueService.connect, ex) exclusive=True
+    """
+    if conf.LOCAL_MESSAGE_QUEUE:
+        server = LocalMessageQueueServer(service._route_key, service._task)
+        await server.start()
+        _servers[service._route_key] = server
+    else:
+        await service.connect(conf.AMQP_CONNECTION_ATTEMPS, conf.AMQP_RETRY_DELAY, **kwargs)
+
+
+def _dumps_frame(data) -> bytes:
+    data_pickled = pickle.dumps(data)
+    return _FRAME_HEADER.pack(len(data_pickled)) + data_pickled
+
+
+async def _read_frame(reader: asyncio.StreamReader):
+    header = await reader.readexactly(_FRAME_HEADER.size)
+    return pickle.loads(await reader.readexactly(_FRAME_HEADER.unpack(header)[0]))
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    data = bytearray(size)
+    view = memoryview(data)
+    while size:
+        received = sock.recv_into(view, size)
+        if received == 0:
+            raise ConnectionError("The local message queue is closed.")
+        view = view[received:]
+        size -= received
+    return bytes(data)
+
+
+def _recv_frame(sock: socket.socket):
+    header = _recv_exactly(sock, _FRAME_HEADER.size)
+    return pickle.loads(_recv_exactly(sock, _FRAME_HEADER.unpack(header)[0]))
+
+
+def _get_tasks(task) -> dict:
+    """:return: { name : (method of the task, MessageQueueType) } of methods decorated by message_queue_task"""
+    tasks = {}
+    for attribute_name in dir(task):
+        try:
+            attribute = getattr(task, attribute_name)
+            task_attr: dict = getattr(attribute, TASK_ATTR_DICT)
+        except AttributeError:
+            pass
+        else:
+            tasks[attribute_name] = (attribute, task_attr[MESSAGE_QUEUE_TYPE_KEY])
+    return tasks
+
+
+class LocalMessageQueueServer:
+    """Run tasks requested on a Unix domain socket, as MessageQueueService does for a queue of RabbitMQ.
+    Each request runs in its own asyncio task like a message of the queue. Priorities of tasks are not used.
+    """
+
+    def __init__(self, route_key: str, task, address: Union[str, tuple] = None):
+        """
+        :param route_key: queue name of the service
+        :param task: task object of the service
+        :param address: path of the Unix domain socket or (host, port) of TCP. The path of route_key by default.
+        """
+        self.__address = address or get_local_address(route_key)
+        self.__tasks = {name: func for name, (func, _) in _get_tasks(task).items()}
+        self.__server: asyncio.AbstractServer = None
+        self.__writers = set()
+        self.__pending_count = 0
+
+    @property
+    def address(self):
+        return self.__address
+
+    async def start(self):
+        if isinstance(self.__address, str):
+            check_local_directory(os.path.dirname(self.__address), create=True)
+            try:
+                address_stat = os.lstat(self.__address)
+            except FileNotFoundError:
+                pass
+            else:
+                # a socket left by the previous run of the service is replaced, other files are not touched.
+                if not stat.S_ISSOCK(address_stat.st_mode):
+                    raise PermissionError(f"The local message queue address({self.__address}) is not a socket.")
+                os.remove(self.__address)
+            self.__server = await asyncio.start_unix_server(self.__on_connection, self.__address)
+        else:
+            self.__server = await asyncio.start_server(self.__on_connection, *self.__address)
+        logging.info(f"LocalMessageQueueServer serves at ({self.__address})")
+
+    def close(self):
+        if self.__server is not None:
+            self.__server.close()
+            self.__server = None
+        for writer in self.__writers:
+            writer.close()
+        if isinstance(self.__address, str) and os.path.exists(self.__address):
+            os.remove(self.__address)
+
+    async def __on_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        write_lock = asyncio.Lock()
+        self.__writers.add(writer)
+        try:
+            while True:
+                call_id, task_name, kwargs = await _read_frame(reader)
+                asyncio.ensure_future(self.__run_task(writer, write_lock, call_id, task_name, kwargs))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.__writers.discard(writer)
+            writer.close()
+
+    async def __run_task(self, writer: asyncio.StreamWriter, write_lock: asyncio.Lock, call_id, task_name, kwargs):
+        self.__pending_count += 1
+        try:
+            if task_name == _QUEUE_INFO:
+                result = self.__pending_count - 1
+            elif task_name in self.__tasks:
+                # message_queue_task returns an exception of the task as MessageQueueException.
+                result = await self.__tasks[task_name](**kwargs)
+            else:
+                result = MessageQueueException(f"There is no task({task_name}).")
+        finally:
+            self.__pending_count -= 1
+
+        if not call_id or writer.transport.is_closing():
+            return
+
+        try:
+            reply = _dumps_frame((call_id, result))
+        except Exception as e:
+            reply = _dumps_frame((call_id, MessageQueueException(f"Fail to send the result of {task_name}. ({e})")))
+
+        async with write_lock:
+            writer.write(reply)
+            await writer.drain()
+
+
+class LocalMessageQueueStub(Generic[T]):
+    """Call tasks of a LocalMessageQueueServer with async_task and sync_task, as MessageQueueStub does.
+    sync_task uses a blocking socket for each thread.
+    """
+
+    def __init__(self, task_type: type, route_key: str, address: Union[str, tuple] = None):
+        """
+        :param task_type: TaskType of the MessageQueueStub, ex) ChannelInnerStub.TaskType
+        :param route_key: queue name of the service
+        :param address: path of the Unix domain socket or (host, port) of TCP. The path of route_key by default.
+        """
+        self.__task_type = task_type
+        self.__address = address or get_local_address(route_key)
+        self.__call_ids = itertools.count(1)
+
+        self.__reader: asyncio.StreamReader = None
+        self.__writer: asyncio.StreamWriter = None
+        self.__write_lock: asyncio.Lock = None
+        self.__futures = {}  # { call_id : asyncio.Future }
+
+        self._async_task = self.__create_task_stub(self._call_async_task)
+        self._thread_local = _Local()
+
+    async def connect(self, connection_attempts=None, retry_delay=None):
+        """Connect to the server. It retries while the server is not started yet."""
+        connection_attempts = connection_attempts or 1
+        for attempt in range(1, connection_attempts + 1):
+            try:
+                await self.__open()
+                return
+            except (FileNotFoundError, ConnectionError):
+                if attempt == connection_attempts:
+                    raise
+                logging.debug(f"LocalMessageQueueStub retry to connect ({self.__address}) ({attempt})")
+                await asyncio.sleep(retry_delay or 0)
+
+    def async_task(self) -> T:
+        return self._async_task
+
+    def sync_task(self) -> T:
+        if self._thread_local.sync_task is None:
+            self._thread_local.sync_task = self.__create_task_stub(self._call_sync_task)
+        return self._thread_local.sync_task
+
+    def sync_info(self):
+        return _LocalQueueInfo(self)
+
+    def close(self):
+        """Close the connection of async_task and the socket of sync_task in this thread."""
+        if self.__writer is not None:
+            self.__writer.close()
+            self.__reader = self.__writer = None
+        if self._thread_local.sock is not None:
+            self._thread_local.sock.close()
+            self._thread_local.sock = None
+
+    def __create_task_stub(self, call):
+        task_stub = object.__new__(self.__task_type)  # not calling __init__
+        for task_name, (func, message_queue_type) in _get_tasks(task_stub).items():
+            is_rpc = message_queue_type == MessageQueueType.RPC
+            setattr(task_stub, task_name, functools.partial(call, task_name, func, is_rpc))
+        return task_stub
+
+    async def __open(self):
+        if isinstance(self.__address, str):
+            check_local_directory(os.path.dirname(self.__address))
+            self.__reader, self.__writer = await asyncio.open_unix_connection(self.__address)
+        else:
+            self.__reader, self.__writer = await asyncio.open_connection(*self.__address)
+        self.__write_lock = asyncio.Lock()
+        asyncio.ensure_future(self.__receive(self.__reader, self.__writer))
+
+    async def __receive(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                call_id, result = await _read_frame(reader)
+                future = self.__futures.pop(call_id, None)
+                if future is not None and not future.done():
+                    future.set_result(result)
+        except (asyncio.IncompleteReadError, ConnectionError) as e:
+            if self.__writer is writer:
+                logging.warning(f"LocalMessageQueueStub connection lost ({self.__address}) ({e})")
+        finally:
+            writer.close()
+            if self.__writer is writer:
+                self.__reader = self.__writer = None
+
+            for future in self.__futures.values():
+                if not future.done():
+                    future.set_exception(ConnectionError(f"Connection lost ({self.__address})"))
+            self.__futures.clear()
+
+    async def _call_async_task(self, task_name, func, is_rpc, *args, **kwargs):
+        params = inspect.signature(func).bind(*args, **kwargs)
+        params.apply_defaults()
+
+        if self.__writer is None:
+            await self.__open()
+
+        call_id = next(self.__call_ids) if is_rpc else 0
+        if is_rpc:
+            future = asyncio.get_event_loop().create_future()
+            self.__futures[call_id] = future
+
+        async with self.__write_lock:
+            self.__writer.write(_dumps_frame((call_id, task_name, dict(params.arguments))))
+            await self.__writer.drain()
+
+        if not is_rpc:
+            return None
+
+        result = await future
+        if isinstance(result, MessageQueueException):
+            logging.error(result)
+            raise result
+        return result
+
+    def _call_sync_task(self, task_name, func, is_rpc, *args, **kwargs):
+        params = inspect.signature(func).bind(*args, **kwargs)
+        params.apply_defaults()
+        return self._call_sync(task_name, dict(params.arguments), is_rpc)
+
+    def _call_sync(self, task_name, kwargs: dict, is_rpc=True):
+        sock = self._thread_local.sock
+        if sock is None:
+            if isinstance(self.__address, str):
+                check_local_directory(os.path.dirname(self.__address))
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            else:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.connect(self.__address)
+            self._thread_local.sock = sock
+
+        call_id = next(self.__call_ids) if is_rpc else 0
+        try:
+            sock.sendall(_dumps_frame((call_id, task_name, kwargs)))
+            if not is_rpc:
+                return None
+            # a socket of a thread has one call at a time, so the next reply is of this call.
+            _, result = _recv_frame(sock)
+        except OSError:
+            self._thread_local.sock = None
+            sock.close()
+            raise
+
+        if isinstance(result, MessageQueueException):
+            logging.error(result)
+            raise result
+        return result
+
+
+class _LocalQueueInfo:
+    def __init__(self, stub: LocalMessageQueueStub):
+        self.__stub = stub
+
+    def queue_info(self):
+        """:return: the count of tasks running in the server, in the form of queue_declare of pika"""
+        message_count = self.__stub._call_sync(_QUEUE_INFO, {})
+        return SimpleNamespace(method=SimpleNamespace(message_count=message_count))
+
+
+class _Local(threading.local):
+    sock: socket.socket = None
+    sync_task = None
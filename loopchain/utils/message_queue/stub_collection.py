@@ -16,6 +16,7 @@ import logging
 
 from typing import Dict, TYPE_CHECKING
 from loopchain.components import SingletonMetaClass
+from .local_message_queue import LocalMessageQueueStub
 
 if TYPE_CHECKING:
     from loopchain.peer import PeerInnerStub
@@ -38,7 +39,7 @@ class StubCollection(metaclass=SingletonMetaClass):
         from loopchain.peer import PeerInnerStub
 
         queue_name = conf.PEER_QUEUE_NAME_FORMAT.format(amqp_key=self.amqp_key)
-        self.peer_stub = PeerInnerStub(self.amqp_target, queue_name, conf.AMQP_USERNAME, conf.AMQP_PASSWORD)
+        self.peer_stub = self.__create_stub(PeerInnerStub, queue_name)
         await self.peer_stub.connect(conf.AMQP_CONNECTION_ATTEMPS, conf.AMQP_RETRY_DELAY)
         return self.peer_stub
 
@@ -48,7 +49,7 @@ class StubCollection(metaclass=SingletonMetaClass):
 
         queue_name = conf.CHANNEL_QUEUE_NAME_FORMAT.format(
             channel_name=channel_name, amqp_key=self.amqp_key)
-        stub = ChannelInnerStub(self.amqp_target, queue_name, conf.AMQP_USERNAME, conf.AMQP_PASSWORD)
+        stub = self.__create_stub(ChannelInnerStub, queue_name)
         await stub.connect(conf.AMQP_CONNECTION_ATTEMPS, conf.AMQP_RETRY_DELAY)
         self.channel_stubs[channel_name] = stub
 
@@ -61,7 +62,7 @@ class StubCollection(metaclass=SingletonMetaClass):
 
         queue_name = conf.SCORE_QUEUE_NAME_FORMAT.format(
             score_package_name=score_package_name, channel_name=channel_name, amqp_key=self.amqp_key)
-        stub = ScoreInnerStub(self.amqp_target, queue_name, conf.AMQP_USERNAME, conf.AMQP_PASSWORD)
+        stub = self.__create_stub(ScoreInnerStub, queue_name)
         await stub.connect(conf.AMQP_CONNECTION_ATTEMPS, conf.AMQP_RETRY_DELAY)
         self.score_stubs[channel_name] = stub
         return stub
@@ -77,3 +78,11 @@ class StubCollection(metaclass=SingletonMetaClass):
         await stub.connect(conf.AMQP_CONNECTION_ATTEMPS, conf.AMQP_RETRY_DELAY)
         self.icon_score_stubs[channel_name] = stub
         return stub
+
+    def __create_stub(self, stub_type, queue_name):
+        """:return: a stub of RabbitMQ, or a stub of a Unix domain socket if LOCAL_MESSAGE_QUEUE"""
+        from loopchain import configure as conf
+
+        if conf.LOCAL_MESSAGE_QUEUE:
+            return LocalMessageQueueStub(stub_type.TaskType, queue_name)
+        return stub_type(self.amqp_target, queue_name, conf.AMQP_USERNAME, conf.AMQP_PASSWORD)
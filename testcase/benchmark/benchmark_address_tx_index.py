@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark AddressTxIndex.put on an address with many txs"""
+
+import logging
+import os
+import time
+import unittest
+
+import leveldb
+
+import testcase.unittest.test_util as test_util
+from loopchain.blockchain import AddressTxIndex
+from loopchain.utils import loggers
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class BenchmarkAddressTxIndex(unittest.TestCase):
+    db_name = 'address_tx_index_benchmark_db'
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.db = test_util.make_level_db(self.db_name)
+        self.address_tx_index = AddressTxIndex(self.db)
+
+    def tearDown(self):
+        self.db = None
+        self.address_tx_index = None
+        leveldb.DestroyDB(self.db_name)
+        os.system(f"rm -rf ./{self.db_name}*")
+
+    def __put(self, address, tx_hashes):
+        batch = leveldb.WriteBatch()
+        counts = {}
+        for tx_hash in tx_hashes:
+            self.address_tx_index.put(batch, address, tx_hash, counts)
+        self.db.Write(batch)
+
+    def test_put(self):
+        """Time of adding a tx of an address which has many txs already"""
+        self.__put("hx1", [f"{i:064x}" for i in range(10000)])
+
+        start_time = time.perf_counter()
+        for i in range(100):
+            self.__put("hx1", [f"{i:064x}"])
+        logging.debug(f"put 100 txs to an address with 10000 txs : {time.perf_counter() - start_time:.4f}s")
+
+
+if __name__ == '__main__':
+    unittest.main()
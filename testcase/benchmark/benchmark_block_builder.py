@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark the CPU time after the score invoke with BlockBuilder.replace_commit_state"""
+
+import logging
+import os
+import time
+import unittest
+
+from secp256k1 import PrivateKey
+
+import testcase.unittest.test_util as test_util
+from loopchain.blockchain import BlockBuilder, BlockVerifier, TransactionVersioner
+from loopchain.utils import loggers
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class BenchmarkBlockBuilder(unittest.TestCase):
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.tx_versioner = TransactionVersioner()
+        self.private_key = PrivateKey()
+
+    def __rebuild_with_commit_state(self, block, commit_state):
+        """The way of score invoke in old versions"""
+        block_builder = BlockBuilder.from_new(block, self.tx_versioner)
+        block_builder.commit_state = commit_state
+        return block_builder.build()
+
+    def test_invoke_profile(self):
+        """CPU time per block of 1000 txs after the score invoke.
+
+        leader: attaching commit_state and verifying its own candidate block.
+        follower: verifying a block with invoke_func.
+        """
+        block = test_util.create_block(self.private_key, 1000, self.tx_versioner)
+        commit_state = {"icon_dex": os.urandom(32).hex()}
+        block_verifier = BlockVerifier.new(block.header.version, self.tx_versioner)
+        result = {}
+
+        start_time = time.process_time()
+        candidate_block = self.__rebuild_with_commit_state(block, commit_state)
+        block_verifier.verify(candidate_block, None)
+        result["leader", "old"] = time.process_time() - start_time
+
+        start_time = time.process_time()
+        candidate_block = BlockBuilder.replace_commit_state(block, commit_state)
+        block_verifier.verify_prevalidated(candidate_block, None)
+        result["leader", "new"] = time.process_time() - start_time
+
+        block_verifier.invoke_func = lambda block_: (self.__rebuild_with_commit_state(block_, commit_state), {})
+        start_time = time.process_time()
+        block_verifier.verify_loosely(candidate_block, None)
+        result["follower", "old"] = time.process_time() - start_time
+
+        block_verifier.invoke_func = lambda block_: (BlockBuilder.replace_commit_state(block_, commit_state), {})
+        start_time = time.process_time()
+        block_verifier.verify_loosely(candidate_block, None)
+        result["follower", "new"] = time.process_time() - start_time
+
+        logging.debug(f"CPU time after invoke of a block with 1000 txs : "
+                      f"leader old({result['leader', 'old']:.3f}s) new({result['leader', 'new']:.3f}s), "
+                      f"follower old({result['follower', 'old']:.3f}s) new({result['follower', 'new']:.3f}s)")
+
+
+if __name__ == '__main__':
+    unittest.main()
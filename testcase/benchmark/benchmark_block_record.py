@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark reading blocks from BlockRecord and JSON records"""
+
+import json
+import logging
+import time
+import unittest
+
+from secp256k1 import PrivateKey
+
+import testcase.unittest.test_util as test_util
+from loopchain.blockchain import BlockRecord, BlockSerializer, TransactionVersioner
+from loopchain.utils import loggers
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class BenchmarkBlockRecord(unittest.TestCase):
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.tx_versioner = TransactionVersioner()
+        self.private_key = PrivateKey()
+
+    def tearDown(self):
+        pass
+
+    def __serialize(self, block):
+        block_serializer = BlockSerializer.new(block.header.version, self.tx_versioner)
+        return json.loads(json.dumps(block_serializer.serialize(block)))
+
+    def test_read_block(self):
+        block = test_util.create_block(self.private_key, 1000, self.tx_versioner)
+        block_dumped = self.__serialize(block)
+        block_serializer = BlockSerializer.new(block.header.version, self.tx_versioner)
+
+        records = {
+            "json": json.dumps(block_dumped).encode("utf-8"),
+            "binary": BlockRecord.dumps(block_dumped)
+        }
+        for name, record in records.items():
+            start_time = time.perf_counter()
+            for _ in range(20):
+                block_serializer.deserialize(BlockRecord.loads(record), trusted=True)
+            elapsed_time = time.perf_counter() - start_time
+
+            logging.debug(f"{name} record of a block(1000 txs) : "
+                          f"size({len(record)} bytes) read 20 blocks({elapsed_time:.3f}s)")
+
+
+if __name__ == '__main__':
+    unittest.main()
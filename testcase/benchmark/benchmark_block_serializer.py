@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark verifying and trusted BlockSerializer.deserialize"""
+
+import json
+import logging
+import time
+import unittest
+
+from secp256k1 import PrivateKey
+
+import testcase.unittest.test_util as test_util
+from loopchain.blockchain import BlockSerializer, TransactionVersioner
+from loopchain.utils import loggers
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class BenchmarkBlockSerializer(unittest.TestCase):
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.tx_versioner = TransactionVersioner()
+        self.private_key = PrivateKey()
+
+    def tearDown(self):
+        pass
+
+    def test_deserialize(self):
+        """Compare the time of find_block_by_height which loads a block from DB and deserializes it."""
+        block = test_util.create_block(self.private_key, 1000, self.tx_versioner)
+        block_serializer = BlockSerializer.new(block.header.version, self.tx_versioner)
+        block_serialized = json.dumps(block_serializer.serialize(block)).encode("utf-8")
+
+        result = {}
+        for trusted in (False, True):
+            start_time = time.perf_counter()
+            for _ in range(20):
+                block_serializer.deserialize(json.loads(block_serialized), trusted=trusted)
+            result[trusted] = time.perf_counter() - start_time
+
+        logging.debug(f"find_block_by_height 20 blocks(1000 txs) : "
+                      f"verifying({result[False]:.3f}s) trusted({result[True]:.3f}s)")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark BlockStreamSync against BlockSync with a stand-in peer service"""
+
+import json
+import logging
+import os
+import time
+import unittest
+
+import grpc
+from secp256k1 import PrivateKey
+
+import loopchain.utils as util
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.blockchain import (Address, BlockBuilder, BlockRecord, BlockSerializer, BlockVersioner, Hash32,
+                                  TransactionBuilder, TransactionVersioner)
+from loopchain.protos import loopchain_pb2, loopchain_pb2_grpc
+from loopchain.utils import loggers
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class BenchmarkBlockStreamSync(unittest.TestCase):
+    block_count = 300
+    tx_count = 20
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.tx_versioner = TransactionVersioner()
+        self.block_versioner = BlockVersioner()
+        self.private_key = PrivateKey()
+
+        self.blocks = self.__create_blocks()
+        block_records = [self.__dumps_record(block) for block in self.blocks]
+
+        self.peer_service = test_util.StandInPeerService(blocks=self.blocks, block_records=block_records)
+        self.peer_stub = loopchain_pb2_grpc.PeerServiceStub(grpc.insecure_channel(self.peer_service.start()))
+
+    def tearDown(self):
+        self.peer_service.stop()
+
+    def __create_blocks(self):
+        blocks = []
+        prev_hash = Hash32(os.urandom(Hash32.size))
+        for height in range(self.block_count):
+            block_builder = BlockBuilder.new("0.1a", self.tx_versioner)
+            block_builder.height = height
+            block_builder.prev_hash = prev_hash
+            block_builder.peer_private_key = self.private_key
+
+            for i in range(self.tx_count):
+                tx_builder = TransactionBuilder.new("0x3", self.tx_versioner)
+                tx_builder.private_key = self.private_key
+                tx_builder.to_address = Address.fromhex_address("hx3f376559204079671b6a8df481c976e7d51b3c7c")
+                tx_builder.value = height * self.tx_count + i
+                tx_builder.step_limit = 100000000
+                tx_builder.nid = 3
+                tx = tx_builder.build()
+                block_builder.transactions[tx.hash] = tx
+
+            block = block_builder.build()
+            blocks.append(block)
+            prev_hash = block.header.hash
+        return blocks
+
+    def __dumps_record(self, block):
+        block_serializer = BlockSerializer.new(block.header.version, self.tx_versioner)
+        return BlockRecord.dumps(json.loads(json.dumps(block_serializer.serialize(block))))
+
+    def __load_record(self, block_record):
+        """as BlockChain.load_block_record"""
+        block_dumped = BlockRecord.loads(block_record)
+        block_version = self.block_versioner.get_version(self.block_versioner.get_height(block_dumped))
+        return BlockSerializer.new(block_version, self.tx_versioner).deserialize(block_dumped)
+
+    def __sync_by_block(self):
+        blocks = []
+        for height in range(self.block_count):
+            response = self.peer_stub.BlockSync(loopchain_pb2.BlockSyncRequest(block_height=height),
+                                                conf.GRPC_TIMEOUT)
+            blocks.append(util.block_loads(response.block))
+        return blocks
+
+    def __sync_by_stream(self):
+        """request all blocks by a stream, as BlockManager requests a range of BLOCK_STREAM_SYNC_RANGE_SIZE"""
+        blocks = []
+        for response in self.peer_stub.BlockStreamSync(loopchain_pb2.BlockRangeSyncRequest(
+                start_height=0, count=self.block_count), conf.GRPC_TIMEOUT):
+            blocks.append(self.__load_record(response.block))
+        return blocks
+
+    def test_sync(self):
+        """Blocks per second of BlockSync for each block and of BlockStreamSync for each range"""
+        start_time = time.perf_counter()
+        self.__sync_by_block()
+        block_sync_seconds = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        self.__sync_by_stream()
+        stream_sync_seconds = time.perf_counter() - start_time
+
+        logging.debug(f"sync {self.block_count} blocks of {self.tx_count} txs : "
+                      f"BlockSync({self.block_count / block_sync_seconds:.1f} blocks/s) "
+                      f"BlockStreamSync({self.block_count / stream_sync_seconds:.1f} blocks/s)")
+
+
+if __name__ == '__main__':
+    unittest.main()
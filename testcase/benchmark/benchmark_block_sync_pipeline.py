@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark BlockSyncPipeline against one request per block"""
+
+import logging
+import time
+import unittest
+
+import testcase.unittest.test_util as test_util
+from loopchain.peer.block_sync_pipeline import BlockSyncPipeline
+from loopchain.utils import loggers
+from testcase.unittest.test_block_sync_pipeline import FakeNetwork
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class BenchmarkBlockSyncPipeline(unittest.TestCase):
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+
+    def tearDown(self):
+        pass
+
+    def test_sync(self):
+        """Compare one request per block with the pipeline when each request takes 10ms."""
+        max_height = 199
+        peer_stubs = ["peer0", "peer1", "peer2", "peer3"]
+
+        network = FakeNetwork(max_height=max_height, latency=0.01)
+        start_time = time.perf_counter()
+        for height in range(max_height + 1):
+            blocks, _ = next(network.fetch(peer_stubs[height % len(peer_stubs)], height, 1))
+            network.commit(blocks[0], max_height)
+        sequential_time = time.perf_counter() - start_time
+
+        network = FakeNetwork(max_height=max_height, latency=0.01, range_limit=1)
+        pipeline = BlockSyncPipeline(peer_stubs,
+                                     fetch_func=network.fetch,
+                                     verify_func=network.verify,
+                                     commit_func=network.commit,
+                                     start_height=0,
+                                     max_height=max_height,
+                                     range_size=1,
+                                     window=8)
+        start_time = time.perf_counter()
+        pipeline.run()
+        pipeline_time = time.perf_counter() - start_time
+
+        self.assertEqual(network.committed, list(range(max_height + 1)))
+        logging.debug(f"sync {max_height + 1} blocks : sequential({sequential_time:.3f}s) "
+                      f"pipeline({pipeline_time:.3f}s) {pipeline.blocks_per_second:.1f} blocks/s")
+
+
+if __name__ == '__main__':
+    unittest.main()
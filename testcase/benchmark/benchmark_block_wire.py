@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark BlockWire against pickle+zlib"""
+
+import logging
+import pickle
+import time
+import unittest
+import zlib
+
+from secp256k1 import PrivateKey
+
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.blockchain import BlockSerializer, BlockVersioner, BlockWire, TransactionVersioner
+from loopchain.utils import loggers
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class BenchmarkBlockWire(unittest.TestCase):
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.tx_versioner = TransactionVersioner()
+        self.block_versioner = BlockVersioner()
+        self.private_key = PrivateKey()
+
+    def tearDown(self):
+        pass
+
+    def __dumps(self, block, zip_threshold=0):
+        """as BlockChain.dumps_block_wire"""
+        block_dumped = BlockSerializer.new(block.header.version, self.tx_versioner).serialize(block)
+        block_dumped["confirm_prev_block"] = block.body.confirm_prev_block
+        return BlockWire.dumps(block_dumped, zip_threshold)
+
+    def __loads(self, block_wire):
+        """as BlockChain.loads_block_wire"""
+        block_version = self.block_versioner.get_version(BlockWire.get_height(block_wire))
+        return BlockSerializer.new(block_version, self.tx_versioner).deserialize(BlockWire.loads(block_wire))
+
+    def test_block_wire(self):
+        """encode/decode time and size of pickle+zlib and BlockWire for blocks of 1k and 10k txs"""
+        for tx_count in (1000, 10000):
+            block = test_util.create_block(self.private_key, tx_count, self.tx_versioner)
+
+            start_time = time.perf_counter()
+            block_pickled = zlib.compress(pickle.dumps(block))
+            pickle_dumps_seconds = time.perf_counter() - start_time
+            start_time = time.perf_counter()
+            pickle.loads(zlib.decompress(block_pickled))
+            pickle_loads_seconds = time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            block_wire = self.__dumps(block, conf.BLOCK_WIRE_ZIP_THRESHOLD)
+            wire_dumps_seconds = time.perf_counter() - start_time
+            start_time = time.perf_counter()
+            BlockWire.loads_header(block_wire)
+            wire_header_seconds = time.perf_counter() - start_time
+            start_time = time.perf_counter()
+            self.__loads(block_wire)
+            wire_loads_seconds = time.perf_counter() - start_time
+
+            logging.debug(f"block of {tx_count} txs : "
+                          f"pickle+zlib(dumps {pickle_dumps_seconds:.3f}s, loads {pickle_loads_seconds:.3f}s, "
+                          f"{len(block_pickled)} bytes) "
+                          f"BlockWire(dumps {wire_dumps_seconds:.3f}s, header {wire_header_seconds * 1000:.3f}ms, "
+                          f"loads with tx hashes {wire_loads_seconds:.3f}s, {len(block_wire)} bytes)")
+
+
+if __name__ == '__main__':
+    unittest.main()
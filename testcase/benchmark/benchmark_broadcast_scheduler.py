@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark the tx relay of BroadcastScheduler with a stand-in peer service"""
+
+import logging
+import time
+import unittest
+
+from secp256k1 import PrivateKey
+
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.baseservice import BroadcastCommand, BroadcastScheduler, ObjectManager
+from loopchain.blockchain import Address, TransactionBuilder, TransactionVersioner
+from loopchain.utils import loggers
+from testcase.unittest.test_broadcast_scheduler import StandInChannelService
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class BenchmarkBroadcastScheduler(unittest.TestCase):
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.__origin_max_tx_count = conf.MAX_TX_COUNT_IN_ADDTX_LIST
+        self.__origin_zip_threshold = conf.ADDTX_LIST_ZIP_THRESHOLD
+
+        self.tx_versioner = TransactionVersioner()
+        self.private_key = PrivateKey()
+        ObjectManager().channel_service = StandInChannelService()
+
+    def tearDown(self):
+        conf.MAX_TX_COUNT_IN_ADDTX_LIST = self.__origin_max_tx_count
+        conf.ADDTX_LIST_ZIP_THRESHOLD = self.__origin_zip_threshold
+        ObjectManager().channel_service = None
+
+    def __create_txs(self, count):
+        txs = []
+        for i in range(count):
+            tx_builder = TransactionBuilder.new("0x3", self.tx_versioner)
+            tx_builder.private_key = self.private_key
+            tx_builder.to_address = Address.fromhex_address("hx3f376559204079671b6a8df481c976e7d51b3c7c")
+            tx_builder.value = i
+            tx_builder.step_limit = 100000000
+            tx_builder.nid = 3
+            txs.append(tx_builder.build())
+        return txs
+
+    def __relay(self, txs):
+        """relay txs to a stand-in peer
+
+        :return: tx relay status, seconds until the peer receives all txs
+        """
+        peer_service = test_util.StandInPeerService()
+        peer_service.start()
+
+        broadcast_scheduler = BroadcastScheduler(channel=conf.LOOPCHAIN_DEFAULT_CHANNEL)
+        broadcast_scheduler.start()
+        try:
+            broadcast_scheduler.schedule_job(BroadcastCommand.SUBSCRIBE, peer_service.target).result()
+
+            start_time = time.perf_counter()
+            for tx in txs:
+                broadcast_scheduler.schedule_job(BroadcastCommand.CREATE_TX, (tx, self.tx_versioner))
+            peer_service.wait_tx_count(len(txs))
+            elapsed = time.perf_counter() - start_time
+
+            return broadcast_scheduler.get_tx_relay_status(), elapsed
+        finally:
+            broadcast_scheduler.stop()
+            broadcast_scheduler.wait()
+            peer_service.stop()
+
+    def test_tx_relay(self):
+        """Relay 5000 txs with AddTxList of 32 txs as before and with the size-aware AddTxList"""
+        txs = self.__create_txs(5000)
+
+        conf.MAX_TX_COUNT_IN_ADDTX_LIST = 32
+        conf.ADDTX_LIST_ZIP_THRESHOLD = 0
+        fixed_status, fixed_seconds = self.__relay(txs)
+
+        conf.MAX_TX_COUNT_IN_ADDTX_LIST = self.__origin_max_tx_count
+        conf.ADDTX_LIST_ZIP_THRESHOLD = 64 * 1024
+        coalesced_status, coalesced_seconds = self.__relay(txs)
+
+        logging.debug(f"relay {len(txs)} txs : "
+                      f"32 txs per AddTxList({fixed_seconds:.3f}s, {fixed_status['tx_list_count']} messages, "
+                      f"avg latency {fixed_status['avg_latency_seconds']:.3f}s) "
+                      f"size-aware AddTxList({coalesced_seconds:.3f}s, {coalesced_status['tx_list_count']} messages, "
+                      f"avg latency {coalesced_status['avg_latency_seconds']:.3f}s, "
+                      f"sizes {coalesced_status['tx_list_size']})")
+
+
+if __name__ == '__main__':
+    unittest.main()
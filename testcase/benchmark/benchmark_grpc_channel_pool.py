@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark the first call on a new gRPC channel and on the pooled channel"""
+
+import logging
+import time
+import unittest
+
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.protos import loopchain_pb2, loopchain_pb2_grpc
+from loopchain.tools.grpc_helper import GRPCChannelPool, GRPCHelper
+from loopchain.utils import loggers
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class BenchmarkGRPCChannelPool(unittest.TestCase):
+    call_count = 100
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.peer_service = test_util.StandInPeerService()
+        self.target = self.peer_service.start(options=GRPCHelper.get_server_options())
+
+    def tearDown(self):
+        self.peer_service.stop()
+
+    def test_first_call(self):
+        """The first call on a new channel for every call as before and on the pooled channel"""
+        request = loopchain_pb2.StatusRequest(request="")
+
+        start_time = time.perf_counter()
+        for _ in range(self.call_count):
+            channel = GRPCHelper().create_client_channel(self.target, conf.SSLAuthType.none)
+            loopchain_pb2_grpc.PeerServiceStub(channel).GetStatus(request, conf.GRPC_TIMEOUT)
+        new_channel_seconds = (time.perf_counter() - start_time) / self.call_count
+
+        start_time = time.perf_counter()
+        for _ in range(self.call_count):
+            channel = GRPCChannelPool().get_channel(self.target, conf.SSLAuthType.none)
+            loopchain_pb2_grpc.PeerServiceStub(channel).GetStatus(request, conf.GRPC_TIMEOUT)
+        pooled_channel_seconds = (time.perf_counter() - start_time) / self.call_count
+
+        logging.debug(f"first call latency : new channel({new_channel_seconds * 1000:.2f}ms) "
+                      f"pooled channel({pooled_channel_seconds * 1000:.2f}ms) "
+                      f"pool status({GRPCChannelPool().get_status()})")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark LocalMessageQueueServer and LocalMessageQueueStub against a stand-in broker"""
+
+import asyncio
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.utils import loggers
+from loopchain.utils.message_queue import LocalMessageQueueServer, LocalMessageQueueStub
+from testcase.unittest.test_local_message_queue import StandInBroker, StandInTask
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class BenchmarkLocalMessageQueue(unittest.TestCase):
+    route_key = "Channel.local_mq_benchmark"
+    server_port = 7921
+    broker_port = 7922
+    call_count = 2000
+    data = os.urandom(1024)
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.__origin_local_message_queue_path = conf.LOCAL_MESSAGE_QUEUE_PATH
+        conf.LOCAL_MESSAGE_QUEUE_PATH = tempfile.mkdtemp()
+
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever)
+        self.thread.start()
+
+        self.task = StandInTask()
+        self.server = LocalMessageQueueServer(self.route_key, self.task)
+        self.tcp_server = LocalMessageQueueServer(self.route_key, self.task, (conf.IP_LOCAL, self.server_port))
+        self.broker = StandInBroker((conf.IP_LOCAL, self.server_port))
+        self.__run(self.server.start())
+        self.__run(self.tcp_server.start())
+        self.__run(self.broker.start(self.broker_port))
+
+        self.stub = LocalMessageQueueStub(StandInTask, self.route_key)
+        self.broker_stub = LocalMessageQueueStub(StandInTask, self.route_key, (conf.IP_LOCAL, self.broker_port))
+        self.__run(self.stub.connect())
+        self.__run(self.broker_stub.connect())
+
+    def tearDown(self):
+        self.loop.call_soon_threadsafe(self.stub.close)
+        self.loop.call_soon_threadsafe(self.broker_stub.close)
+        self.loop.call_soon_threadsafe(self.server.close)
+        self.loop.call_soon_threadsafe(self.tcp_server.close)
+        self.loop.call_soon_threadsafe(self.broker.close)
+        self.__run(asyncio.sleep(0.1))
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+        shutil.rmtree(conf.LOCAL_MESSAGE_QUEUE_PATH, True)
+        conf.LOCAL_MESSAGE_QUEUE_PATH = self.__origin_local_message_queue_path
+
+    def __run(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result(conf.GRPC_TIMEOUT)
+
+    def __call_sync(self, stub):
+        """:return: seconds per call"""
+        start_time = time.perf_counter()
+        for _ in range(self.call_count):
+            stub.sync_task().echo(self.data)
+        return (time.perf_counter() - start_time) / self.call_count
+
+    def __call_async(self, stub):
+        """:return: calls per second"""
+        async def _call_all():
+            await asyncio.gather(*(stub.async_task().echo(self.data) for _ in range(self.call_count)))
+
+        start_time = time.perf_counter()
+        self.__run(_call_all())
+        return self.call_count / (time.perf_counter() - start_time)
+
+    def test_call(self):
+        """Latency of sync calls and throughput of async calls through the stand-in broker and the local socket"""
+        broker_latency = self.__call_sync(self.broker_stub)
+        local_latency = self.__call_sync(self.stub)
+        broker_throughput = self.__call_async(self.broker_stub)
+        local_throughput = self.__call_async(self.stub)
+
+        logging.debug(f"{self.call_count} calls of {len(self.data)} bytes : "
+                      f"broker(latency {broker_latency * 1000000:.1f}us, {broker_throughput:.1f} calls/s) "
+                      f"local(latency {local_latency * 1000000:.1f}us, {local_throughput:.1f} calls/s)")
+
+
+if __name__ == '__main__':
+    unittest.main()
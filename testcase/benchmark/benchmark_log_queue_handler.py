@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark tx intake logging in the calling thread and by LogQueueHandler"""
+
+import logging
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+import verboselogs
+from secp256k1 import PrivateKey
+
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.blockchain import (Address, TransactionBuilder, TransactionSerializer, TransactionVerifier,
+                                  TransactionVersioner)
+from loopchain.utils import loggers
+from loopchain.utils.loggers.log_queue_handler import LogQueueHandler
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class BenchmarkLogQueueHandler(unittest.TestCase):
+    tx_count = 2000
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.logger = verboselogs.VerboseLogger("benchmark_log_queue_handler")
+        self.logger.propagate = False
+        self.log_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        for handler in self.logger.handlers[:]:
+            self.logger.removeHandler(handler)
+            handler.close()
+        shutil.rmtree(self.log_dir, True)
+
+    def __create_tx_jsons(self):
+        tx_versioner = TransactionVersioner()
+        private_key = PrivateKey()
+
+        tx_jsons = []
+        for i in range(self.tx_count):
+            tx_builder = TransactionBuilder.new("0x3", tx_versioner)
+            tx_builder.private_key = private_key
+            tx_builder.to_address = Address.fromhex_address("hx3f376559204079671b6a8df481c976e7d51b3c7c")
+            tx_builder.value = i
+            tx_builder.step_limit = 100000000
+            tx_builder.nid = 3
+            tx = tx_builder.build()
+            tx_jsons.append(TransactionSerializer.new(tx.version, tx_versioner).to_full_data(tx))
+        return tx_versioner, tx_jsons
+
+    def __intake_txs(self, tx_versioner, tx_jsons):
+        """as ChannelInnerTask.add_tx_list, it logs each tx at spam and debug level.
+
+        :return: txs per second
+        """
+        start_time = time.perf_counter()
+        for tx_json in tx_jsons:
+            tx_version = tx_versioner.get_version(tx_json)
+            tx = TransactionSerializer.new(tx_version, tx_versioner).from_(tx_json)
+            self.logger.spam("add_tx_list: tx_json(%s)", tx_json)
+            TransactionVerifier.new(tx_version, tx_versioner).verify(tx)
+            self.logger.debug("add_tx_list: tx(%s) is verified", tx.hash.hex())
+        return len(tx_jsons) / (time.perf_counter() - start_time)
+
+    def test_tx_intake(self):
+        """Tx intake throughput logging to a file at INFO and SPAM, in the calling thread and in the listener"""
+        tx_versioner, tx_jsons = self.__create_tx_jsons()
+
+        results = []
+        for is_async in (False, True):
+            for level in (logging.INFO, verboselogs.SPAM):
+                file_handler = logging.FileHandler(os.path.join(self.log_dir, f"{is_async}_{level}.log"))
+                file_handler.setFormatter(logging.Formatter(conf.LOG_FORMAT))
+                handler = LogQueueHandler([file_handler], conf.LOG_QUEUE_SIZE) if is_async else file_handler
+                self.logger.addHandler(handler)
+                self.logger.setLevel(level)
+
+                txs_per_second = self.__intake_txs(tx_versioner, tx_jsons)
+
+                self.logger.removeHandler(handler)
+                handler.close()
+                file_handler.close()
+                results.append(f"{'async' if is_async else 'sync'} {logging.getLevelName(level)}"
+                               f"({txs_per_second:.1f} txs/s)")
+
+        logging.debug(f"intake {self.tx_count} txs : {' '.join(results)}")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark MerkleTree against the hex string merkle tree"""
+
+import logging
+import os
+import time
+import unittest
+
+import testcase.unittest.test_util as test_util
+from loopchain.blockchain import MerkleTree
+from loopchain.utils import loggers
+from testcase.unittest.test_merkle_tree import build_hex_merkle_tree_root_hash
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class BenchmarkMerkleTree(unittest.TestCase):
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+
+    def test_root_hash(self):
+        """Compare the time of the merkle tree root hash of 10k txs"""
+        tx_hashes = [os.urandom(32) for _ in range(10000)]
+
+        start_time = time.perf_counter()
+        for _ in range(10):
+            build_hex_merkle_tree_root_hash(tx_hashes)
+        hex_seconds = (time.perf_counter() - start_time) / 10
+
+        start_time = time.perf_counter()
+        for _ in range(10):
+            MerkleTree(tx_hashes)
+        bytes_seconds = (time.perf_counter() - start_time) / 10
+
+        merkle_tree = MerkleTree(tx_hashes[:-100])
+        start_time = time.perf_counter()
+        merkle_tree.extend(tx_hashes[-100:])
+        incremental_seconds = time.perf_counter() - start_time
+
+        logging.debug(f"merkle tree root hash of 10000 txs : hex({hex_seconds:.4f}s) bytes({bytes_seconds:.4f}s) "
+                      f"incremental 100 txs({incremental_seconds:.4f}s)")
+
+
+if __name__ == '__main__':
+    unittest.main()
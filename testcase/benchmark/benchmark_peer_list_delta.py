@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark peer list deltas of ConnectPeer against pickled peer lists with an in-process RadioStation"""
+
+import json
+import logging
+import os
+import shutil
+import time
+import unittest
+
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.baseservice import ObjectManager
+from loopchain.protos import loopchain_pb2
+from loopchain.radiostation import AdminManager, OuterService
+from loopchain.utils import loggers
+from testcase.unittest.test_peer_list_delta import StandInRadioStationService
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class BenchmarkPeerListDelta(unittest.TestCase):
+    peer_count = 500
+    delta_channel = "peer_list_delta_channel"
+    level_db_identity = "peer_list_delta_benchmark"
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.__origin_enable_heartbeat = conf.ENABLE_RADIOSTATION_HEARTBEAT
+        self.__origin_enable_channel_auth = conf.ENABLE_CHANNEL_AUTH
+        self.__origin_channel_manage_data_path = conf.CHANNEL_MANAGE_DATA_PATH
+        conf.ENABLE_RADIOSTATION_HEARTBEAT = False
+        conf.ENABLE_CHANNEL_AUTH = False
+        conf.CHANNEL_MANAGE_DATA_PATH = os.path.join(conf.LOOPCHAIN_ROOT_PATH,
+                                                     "testcase/unittest/channel_manage_data_for_test.json")
+
+        self.channel = conf.LOOPCHAIN_DEFAULT_CHANNEL
+        self.__start_rs()
+
+    def tearDown(self):
+        conf.ENABLE_RADIOSTATION_HEARTBEAT = self.__origin_enable_heartbeat
+        conf.ENABLE_CHANNEL_AUTH = self.__origin_enable_channel_auth
+        conf.CHANNEL_MANAGE_DATA_PATH = self.__origin_channel_manage_data_path
+        ObjectManager().rs_service = None
+        shutil.rmtree(os.path.join(conf.DEFAULT_STORAGE_PATH, f"db_{self.level_db_identity}_admin"), True)
+
+    def __start_rs(self):
+        """Start RS in process, it loads the peer list from its db at the first ConnectPeer."""
+        # the db of the previous RS is closed first.
+        ObjectManager().rs_service = None
+        ObjectManager().rs_service = StandInRadioStationService(AdminManager(self.level_db_identity))
+        self.rs_outer_service = OuterService()
+
+    def __connect_peer(self, number, peer_list_version=None, channel=None):
+        peer_id = f"peer-{number:04d}"
+        request = loopchain_pb2.ConnectPeerRequest(
+            channel=channel or self.channel,
+            peer_object=b'',
+            peer_id=peer_id,
+            peer_target=f"{conf.IP_LOCAL}:{10000 + number}",
+            group_id=peer_id)
+        if peer_list_version is not None:
+            request.peer_list_version = peer_list_version
+
+        response = self.rs_outer_service.ConnectPeer(request, None)
+        self.assertEqual(response.status, 0)
+        return response
+
+    def __join_peers(self, channel, is_delta):
+        """All peers join and reconnect once with the peer list version from their join.
+
+        :return: peer list versions of peers, bytes of replies
+        """
+        peer_list_versions = []
+        reply_bytes = 0
+
+        for number in range(self.peer_count):
+            response = self.__connect_peer(number, 0 if is_delta else None, channel)
+            reply_bytes += response.ByteSize()
+            if is_delta:
+                peer_list_versions.append(json.loads(response.peer_list_delta)["version"])
+
+        for number in range(self.peer_count):
+            response = self.__connect_peer(number, peer_list_versions[number] if is_delta else None, channel)
+            reply_bytes += response.ByteSize()
+
+        return peer_list_versions, reply_bytes
+
+    def test_join(self):
+        """Reply bytes and time of 500 peers joining and reconnecting with pickled peer lists and deltas"""
+        start_time = time.perf_counter()
+        _, pickle_reply_bytes = self.__join_peers(self.channel, is_delta=False)
+        pickle_seconds = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        _, delta_reply_bytes = self.__join_peers(self.delta_channel, is_delta=True)
+        delta_seconds = time.perf_counter() - start_time
+
+        logging.debug(f"{self.peer_count} peers join and reconnect : "
+                      f"pickled peer list({pickle_seconds:.3f}s, {pickle_reply_bytes} bytes) "
+                      f"peer list delta({delta_seconds:.3f}s, {delta_reply_bytes} bytes)")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark the heartbeat and leader rotation of PeerManager with stand-in peers"""
+
+import logging
+import time
+import unittest
+
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.baseservice import PeerInfo, PeerManager, PeerStatus
+from loopchain.utils import loggers
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class BenchmarkPeerManager(unittest.TestCase):
+    dead_peer_port = 7908
+
+    peer_count = 20
+    hung_peer_count = 2
+    dead_peer_count = 3
+    delay = 0.2
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.__origin_probe_timeout = conf.GRPC_TIMEOUT_PEER_PROBE
+        conf.GRPC_TIMEOUT_PEER_PROBE = 1
+
+        leader_service = test_util.StandInPeerService("BlockGenerate", delay=self.delay)
+        peer_service = test_util.StandInPeerService("Vote", delay=self.delay)
+        hung_peer_service = test_util.StandInPeerService("Vote", delay=conf.GRPC_TIMEOUT_PEER_PROBE * 3)
+        self.peer_services = [leader_service, peer_service, hung_peer_service]
+        for service in self.peer_services:
+            service.start(max_workers=self.peer_count + 10)
+
+        self.peer_manager = PeerManager(conf.LOOPCHAIN_DEFAULT_CHANNEL)
+        ports = [leader_service.port] + [peer_service.port] * self.peer_count \
+            + [hung_peer_service.port] * self.hung_peer_count + [self.dead_peer_port] * self.dead_peer_count
+        for index, port in enumerate(ports):
+            self.peer_manager.add_peer(
+                PeerInfo(f"peer-{index}", conf.ALL_GROUP_ID, f"{conf.IP_LOCAL}:{port}", order=index + 1))
+
+    def tearDown(self):
+        conf.GRPC_TIMEOUT_PEER_PROBE = self.__origin_probe_timeout
+        for service in self.peer_services:
+            service.stop()
+
+    def test_check_peer_status(self):
+        """Time of a heartbeat round which probes peers concurrently, against probing them one by one"""
+        self.peer_manager.check_peer_status()
+
+        heartbeat_status = self.peer_manager.get_heartbeat_status()
+        serial_seconds = (self.peer_count + 1) * self.delay + self.hung_peer_count * conf.GRPC_TIMEOUT_PEER_PROBE
+        logging.debug(f"heartbeat : {heartbeat_status} (one by one : {serial_seconds:.1f}s at least)")
+
+
+    def test_next_alive_peer(self):
+        """Time of leader rotation to an alive peer, which reads the result of the health check in background"""
+        for peer_id in self.peer_manager.peer_list[conf.ALL_GROUP_ID]:
+            self.peer_manager.update_peer_status(peer_id, peer_status=PeerStatus.connected)
+        start_time = time.perf_counter()
+        self.peer_manager.check_peer_health()
+        health_check_seconds = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        self.peer_manager.get_next_leader_peer(current_leader_peer_id="peer-20", is_only_alive=True)
+        rotation_seconds = time.perf_counter() - start_time
+
+        logging.debug(f"leader rotation to an alive peer : {rotation_seconds * 1000:.3f}ms "
+                      f"(health check in background {health_check_seconds:.3f}s)")
+
+if __name__ == '__main__':
+    unittest.main()
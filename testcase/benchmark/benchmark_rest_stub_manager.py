@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark citizen block sync over REST with and without keep-alive"""
+
+import logging
+import time
+import unittest
+
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.baseservice import RestStubManager
+from loopchain.utils import loggers
+from testcase.unittest.test_rest_stub_manager import StandInServer, create_stand_in_app
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class BenchmarkRestStubManager(unittest.TestCase):
+    port = 7903
+    block_count = 300
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+
+    def __sync_blocks(self, keep_alive: bool):
+        """Request blocks as BlockManager.__block_request_by_citizen does.
+
+        :return: blocks per second
+        """
+        server = StandInServer(create_stand_in_app(keep_alive, self.block_count), self.port)
+        server.start()
+        try:
+            rest_stub = RestStubManager(f"{conf.IP_LOCAL}:{self.port}", for_rs_target=False)
+            start_time = time.perf_counter()
+            for height in range(self.block_count):
+                rest_stub.call("GetBlockByHeight", {
+                    'channel': conf.LOOPCHAIN_DEFAULT_CHANNEL,
+                    'height': str(height)
+                })
+                rest_stub.call("Status")
+            return self.block_count / (time.perf_counter() - start_time)
+        finally:
+            server.stop()
+
+    def test_block_sync(self):
+        """Blocks per second of citizen sync over REST.
+        The server without keep-alive closes every connection, so a connection is made for every request as before.
+        """
+        closing_blocks_per_second = self.__sync_blocks(keep_alive=False)
+        keep_alive_blocks_per_second = self.__sync_blocks(keep_alive=True)
+
+        logging.debug(f"REST sync of {self.block_count} blocks : "
+                      f"connection per request({closing_blocks_per_second:.1f} blocks/s) "
+                      f"keep-alive({keep_alive_blocks_per_second:.1f} blocks/s)")
+
+
+if __name__ == '__main__':
+    unittest.main()
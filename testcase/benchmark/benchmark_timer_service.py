@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark the loop lag of TimerService with a blocking callback"""
+
+import asyncio
+import logging
+import time
+import unittest
+
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.baseservice import Timer, TimerService
+from loopchain.utils import loggers
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class BenchmarkTimerService(unittest.TestCase):
+    blocking_seconds = 2
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+
+    def test_loop_lag(self):
+        """A blocking callback delays all timers in the loop, a callback waiting for an executor does not."""
+        def blocking_call_back():
+            time.sleep(self.blocking_seconds)
+
+        async def executor_call_back():
+            await asyncio.get_event_loop().run_in_executor(None, time.sleep, self.blocking_seconds)
+
+        for name, call_back in (("blocking", blocking_call_back), ("executor", executor_call_back)):
+            timer_service = TimerService()
+            timer_service.start()
+
+            timer_service.add_timer(name, Timer(target=name, duration=0, callback=call_back))
+            time.sleep(self.blocking_seconds + conf.TIMER_LOOP_LAG_INTERVAL * 2)
+            logging.debug(f"{name} callback loop lag : {timer_service.get_loop_lag()}")
+            timer_service.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark TransactionBatchVerifier against verifying txs one by one"""
+
+import logging
+import os
+import time
+import unittest
+
+from secp256k1 import PrivateKey
+
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.blockchain import (Address, TransactionBuilder, TransactionVerifier, TransactionBatchVerifier,
+                                  TransactionVersioner)
+from loopchain.utils import loggers
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class BenchmarkTransactionBatchVerifier(unittest.TestCase):
+    tx_count = 5000
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.tx_versioner = TransactionVersioner()
+        self.private_key = PrivateKey()
+        self.__origin_tx_batch_verify_workers = conf.TX_BATCH_VERIFY_WORKERS
+        conf.TX_BATCH_VERIFY_WORKERS = os.cpu_count() or 1
+
+    def tearDown(self):
+        TransactionBatchVerifier.shutdown()
+        conf.TX_BATCH_VERIFY_WORKERS = self.__origin_tx_batch_verify_workers
+
+    def __create_txs(self, count):
+        txs = []
+        for i in range(count):
+            tx_builder = TransactionBuilder.new("0x3", self.tx_versioner)
+            tx_builder.private_key = self.private_key
+            tx_builder.to_address = Address.fromhex_address("hx3f376559204079671b6a8df481c976e7d51b3c7c")
+            tx_builder.value = i
+            tx_builder.step_limit = 100000000
+            tx_builder.nid = 3
+            txs.append(tx_builder.build())
+        return txs
+
+    def test_verify(self):
+        txs = self.__create_txs(self.tx_count)
+
+        start_time = time.perf_counter()
+        for tx in txs:
+            TransactionVerifier.new(tx.version, self.tx_versioner).verify(tx)
+        sequential_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        results = TransactionBatchVerifier(self.tx_versioner).verify(txs)
+        batch_time = time.perf_counter() - start_time
+
+        self.assertTrue(all(result is None for result in results))
+        logging.info(f"verify {len(txs)} txs : sequential({sequential_time:.3f}s) "
+                     f"batch({batch_time:.3f}s) workers({conf.TX_BATCH_VERIFY_WORKERS})")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark TransactionPool against AgingCache"""
+
+import logging
+import time
+import unittest
+
+import loopchain.utils as util
+import testcase.unittest.test_util as test_util
+from loopchain.baseservice.aging_cache import AgingCache
+from loopchain.baseservice.transaction_pool import TransactionPool
+from loopchain.blockchain import TransactionStatusInQueue
+from loopchain.utils import loggers
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class BenchmarkTransactionPool(unittest.TestCase):
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+
+    def tearDown(self):
+        pass
+
+    @staticmethod
+    def __make_pool(pool_class, size):
+        pool = pool_class(max_age_seconds=60, default_item_status=TransactionStatusInQueue.normal)
+        for i in range(size):
+            pool[f"tx_{i}"] = f"value_{i}"
+        return pool
+
+    def test_makeup_block(self):
+        """Compare the time to take txs for one block as the backlog grows.
+        Previous blocks leave their txs in the queue as added_to_block until add_block pops them.
+        """
+        tx_count_in_block = 1000
+        for backlog in (5000, 10000, 20000):
+            result = {}
+            for pool_class in (AgingCache, TransactionPool):
+                pool = self.__make_pool(pool_class, backlog)
+                for _ in range(backlog // 2):
+                    pool.get_item_in_status(TransactionStatusInQueue.normal, TransactionStatusInQueue.added_to_block)
+
+                start_time = time.perf_counter()
+                for _ in range(tx_count_in_block):
+                    tx = pool.get_item_in_status(TransactionStatusInQueue.normal,
+                                                 TransactionStatusInQueue.added_to_block)
+                    self.assertIsNotNone(tx)
+                result[pool_class.__name__] = time.perf_counter() - start_time
+
+            logging.debug(f"makeup block({tx_count_in_block} txs) backlog({backlog}) : "
+                          f"AgingCache({result['AgingCache']:.6f}s) TransactionPool({result['TransactionPool']:.6f}s)")
+            util.logger.spam(f"speed up x{result['AgingCache'] / result['TransactionPool']:.1f}")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark TxHashFilter against the block DB"""
+
+import logging
+import os
+import time
+import unittest
+
+import leveldb
+
+import testcase.unittest.test_util as test_util
+from loopchain.blockchain import Hash32, TxHashFilter
+from loopchain.utils import loggers
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class BenchmarkTxHashFilter(unittest.TestCase):
+    db_name = 'tx_hash_filter_benchmark_db'
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+
+    def tearDown(self):
+        leveldb.DestroyDB(self.db_name)
+        os.system(f"rm -rf ./{self.db_name}*")
+
+    @staticmethod
+    def __new_tx_hashes(count):
+        return [Hash32(os.urandom(32)) for _ in range(count)]
+
+    def test_check(self):
+        """Time of checking new txs with the filter and with the block DB"""
+        tx_count = 100000
+        db = test_util.make_level_db(self.db_name)
+        tx_hash_filter = TxHashFilter(tx_count, 0.001)
+
+        batch = leveldb.WriteBatch()
+        for tx_hash in self.__new_tx_hashes(tx_count):
+            tx_hash_filter.add(tx_hash)
+            batch.Put(tx_hash.hex().encode(), os.urandom(300))
+        db.Write(batch)
+
+        new_tx_hashes = self.__new_tx_hashes(10000)
+        start_time = time.perf_counter()
+        for tx_hash in new_tx_hashes:
+            try:
+                db.Get(tx_hash.hex().encode())
+            except KeyError:
+                pass
+        db_seconds = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        for tx_hash in new_tx_hashes:
+            tx_hash_filter.check(tx_hash)
+        filter_seconds = time.perf_counter() - start_time
+
+        logging.debug(f"check {len(new_tx_hashes)} new txs in {tx_count} txs : "
+                      f"block DB({db_seconds:.4f}s) filter({filter_seconds:.4f}s) "
+                      f"filter status({tx_hash_filter.get_status()})")
+
+
+if __name__ == '__main__':
+    unittest.main()
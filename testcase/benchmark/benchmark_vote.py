@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark counting the votes of a block"""
+
+import logging
+import time
+import unittest
+
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.blockchain import Vote
+from loopchain.protos import loopchain_pb2
+from loopchain.utils import loggers
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class BenchmarkVote(unittest.TestCase):
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+
+    def tearDown(self):
+        pass
+
+    def __make_audience(self, peer_count):
+        audience = {}
+        for i in range(peer_count):
+            peer_info = loopchain_pb2.PeerRequest()
+            peer_info.peer_target = f"peerid-{i}_target"
+            peer_info.peer_type = loopchain_pb2.PEER
+            peer_info.peer_id = f"peerid-{i}"
+            peer_info.group_id = "groupid-0"
+            audience[peer_info.peer_id] = peer_info
+        return audience
+
+    def test_vote(self):
+        """Time to count the votes of a block as every vote comes"""
+        for peer_count in (100, 500, 1000):
+            audience = self.__make_audience(peer_count)
+            vote = Vote("block_hash", audience)
+
+            start_time = time.perf_counter()
+            for peer_id, peer_info in audience.items():
+                vote.add_vote(peer_info.group_id, peer_id, True)
+                vote.get_result("block_hash", conf.VOTING_RATIO)
+            elapsed = time.perf_counter() - start_time
+
+            logging.debug(f"{peer_count} validators : {elapsed * 1000:.2f}ms per block, "
+                          f"{elapsed / peer_count * 1000000:.2f}us per vote")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test AddressTxIndex"""
+
+import os
+import unittest
+
+import leveldb
+
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.blockchain import AddressTxIndex, BlockchainError
+from loopchain.blockchain.blockchain import BlockChain
+from loopchain.utils import loggers
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class TestAddressTxIndex(unittest.TestCase):
+    db_name = 'address_tx_index_db'
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.db = test_util.make_level_db(self.db_name)
+        self.address_tx_index = AddressTxIndex(self.db)
+
+    def tearDown(self):
+        self.db = None
+        self.address_tx_index = None
+        leveldb.DestroyDB(self.db_name)
+        os.system(f"rm -rf ./{self.db_name}*")
+
+    def __put(self, address, tx_hashes):
+        batch = leveldb.WriteBatch()
+        counts = {}
+        for tx_hash in tx_hashes:
+            self.address_tx_index.put(batch, address, tx_hash, counts)
+        self.db.Write(batch)
+
+    def test_pages_from_newest(self):
+        # GIVEN
+        self.__put("hx1", [f"tx{i}" for i in range(5)])
+        self.__put("hx1", [f"tx{i}" for i in range(5, 7)])
+        self.__put("hx2", ["other"])
+
+        # WHEN
+        pages = []
+        index = 0
+        while True:
+            tx_hashes, index = self.address_tx_index.get_page("hx1", index, 3)
+            pages.append(tx_hashes)
+            if index == 0:
+                break
+
+        # THEN
+        self.assertEqual(self.address_tx_index.get_count("hx1"), 7)
+        self.assertEqual(pages, [["tx6", "tx5", "tx4"], ["tx3", "tx2", "tx1"], ["tx0"]])
+        self.assertEqual(self.address_tx_index.get_page("hx2", 0, 3), (["other"], 0))
+        self.assertEqual(self.address_tx_index.get_page("hx3", 0, 3), ([], 0))
+
+    def test_clear(self):
+        # GIVEN
+        self.__put("hx1", ["tx0", "tx1"])
+        self.db.Put(b"tx_list_by_address_hx10", b"legacy")
+
+        # WHEN
+        batch = leveldb.WriteBatch()
+        deleted_count = self.address_tx_index.clear(batch)
+        self.db.Write(batch)
+
+        # THEN
+        self.assertEqual(deleted_count, 3)
+        self.assertEqual(self.address_tx_index.get_page("hx1", 0, 3), ([], 0))
+        self.assertEqual(self.db.Get(b"tx_list_by_address_hx10"), bytearray(b"legacy"))
+
+    def test_has_keys(self):
+        # GIVEN
+        self.__put("hx1", ["tx0"])
+
+        # THEN
+        self.assertTrue(self.address_tx_index.has_keys(AddressTxIndex.COUNT_PREFIX))
+        self.assertFalse(self.address_tx_index.has_keys(conf.TX_LIST_ADDRESS_PREFIX))
+
+    def test_refuse_legacy_tx_lists(self):
+        """The index is not served while the tx lists of an old version are not rebuilt."""
+        # GIVEN
+        self.__put("hx1", ["tx0"])
+        self.db.Put(conf.TX_LIST_ADDRESS_PREFIX + b"hx10", b"legacy")
+        chain = BlockChain(self.db)
+
+        # WHEN
+        chain.init_block_chain()
+
+        # THEN
+        with self.assertRaises(BlockchainError):
+            chain.get_tx_list_by_address("hx1")
+
+        # WHEN the legacy lists are deleted by the rebuilder
+        self.db.Delete(conf.TX_LIST_ADDRESS_PREFIX + b"hx10")
+        chain.init_block_chain()
+
+        # THEN
+        self.assertEqual(chain.get_tx_list_by_address("hx1"), (["tx0"], 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test BlockBuilder"""
+
+import os
+import unittest
+
+from secp256k1 import PrivateKey
+
+import testcase.unittest.test_util as test_util
+from loopchain.blockchain import BlockBuilder, BlockVerifier, TransactionVersioner
+from loopchain.utils import loggers
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class TestBlockBuilder(unittest.TestCase):
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.tx_versioner = TransactionVersioner()
+        self.private_key = PrivateKey()
+
+    def __rebuild_with_commit_state(self, block, commit_state):
+        """The way of score invoke in old versions"""
+        block_builder = BlockBuilder.from_new(block, self.tx_versioner)
+        block_builder.commit_state = commit_state
+        return block_builder.build()
+
+    def test_replace_commit_state_is_same_as_rebuild(self):
+        # GIVEN
+        block = test_util.create_block(self.private_key, 10, self.tx_versioner)
+        commit_state = {"icon_dex": os.urandom(32).hex()}
+
+        # WHEN
+        replaced_block = BlockBuilder.replace_commit_state(block, commit_state)
+        rebuilt_block = self.__rebuild_with_commit_state(block, commit_state)
+
+        # THEN
+        self.assertEqual(replaced_block.header, rebuilt_block.header)
+        self.assertEqual(dict(replaced_block.header.commit_state), commit_state)
+        self.assertEqual(list(replaced_block.body.transactions), list(block.body.transactions))
+        self.assertIs(replaced_block.body, block.body)
+
+        block_verifier = BlockVerifier.new(block.header.version, self.tx_versioner)
+        block_verifier.verify_loosely(replaced_block, None)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -27,6 +27,7 @@ import testcase.unittest.test_util as test_util
 from loopchain import configure as conf
 from loopchain.baseservice import ObjectManager, ScoreResponse
 from loopchain.blockchain import Block
+from loopchain.blockchain.blockchain import _BlockWriteBatch
 from loopchain.utils import loggers
 from testcase.unittest.mock_peer import set_mock
 
@@ -49,6 +50,7 @@ class TestBlockChain(unittest.TestCase):
         # BlockChain 을 만듬
         test_db = test_util.make_level_db(self.db_name)
         self.assertIsNotNone(test_db, "DB생성 불가")
+        self.test_db = test_db
         self.chain = BlockChain(test_db)
 
     def tearDown(self):
@@ -133,9 +135,31 @@ class TestBlockChain(unittest.TestCase):
                          f"length of tx_list({len(oldest_tx_list)}) next_index({first_index})")
 
         # THEN
+        self.assertEqual(current_tx_list[0], "112233_200")
+        self.assertEqual(len(current_tx_list), conf.MAX_TX_LIST_SIZE_BY_ADDRESS)
+        self.assertEqual(last_list_index, 201 - conf.MAX_TX_LIST_SIZE_BY_ADDRESS)
+        self.assertEqual(oldest_tx_list, ["112233_0"])
+        self.assertEqual(first_index, 0)
+
+    def test_tx_list_by_address_in_batch(self):
+        """tx lists by address of a block are written at once with the batch of the block"""
+        # GIVEN
+        batch = _BlockWriteBatch()
+        for i in range(201):
+            self.chain.add_tx_to_list_by_address("ABC", "112233_" + str(i), batch)
+
+        # WHEN
+        unwritten_tx_list, _ = self.chain.get_tx_list_by_address("ABC")
+        self.test_db.Write(batch.batch)
+        current_tx_list, last_list_index = self.chain.get_tx_list_by_address("ABC")
+        oldest_tx_list, first_index = self.chain.get_tx_list_by_address("ABC", 1)
+
+        # THEN
+        self.assertEqual(unwritten_tx_list, [])
+        self.assertEqual(current_tx_list[0], "112233_200")
+        self.assertEqual(last_list_index, 201 - conf.MAX_TX_LIST_SIZE_BY_ADDRESS)
+        self.assertEqual(oldest_tx_list, ["112233_0"])
         self.assertEqual(first_index, 0)
-        self.assertEqual(last_list_index, 2)
-        self.assertEqual(len(oldest_tx_list), conf.MAX_TX_LIST_SIZE_BY_ADDRESS + 1)
 
     def test_find_block_by_height(self):
         # GIVEN
@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test that BlockChain writes a block at once and counts the commits"""
+
+import leveldb
+import os
+import unittest
+
+from secp256k1 import PrivateKey
+
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.baseservice import ObjectManager, ScoreResponse
+from loopchain.blockchain import AddressTxIndex, Epoch, TransactionVersioner
+from loopchain.blockchain.blockchain import BlockChain
+from loopchain.utils import loggers
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class StandInBlockDB:
+    """Block DB which fails to write batches. The other calls go to the DB."""
+    def __init__(self, db):
+        self.db = db
+
+    def __getattr__(self, name):
+        return getattr(self.db, name)
+
+    def Write(self, batch, sync=False):
+        raise leveldb.LevelDBError("stand-in write failure")
+
+
+class StandInBlockManager:
+    def __init__(self):
+        self.epoch = None
+        self.tx_queue = {}
+
+    def get_tx_queue(self):
+        return self.tx_queue
+
+
+class StandInInnerService:
+    def __init__(self):
+        self.peer_status = None
+
+    def notify_new_block(self):
+        pass
+
+    def update_peer_status(self, status: dict):
+        self.peer_status = status
+
+
+class StandInChannelService:
+    def __init__(self):
+        self.peer_manager = None
+        self.block_manager = StandInBlockManager()
+        self.inner_service = StandInInnerService()
+
+    def score_invoke(self, block):
+        return block, {tx_hash.hex(): {"code": ScoreResponse.SUCCESS} for tx_hash in block.body.transactions}
+
+    def score_write_precommit_state(self, block):
+        pass
+
+    def stop_leader_complain_timer(self):
+        pass
+
+
+class TestBlockCommit(unittest.TestCase):
+    db_name = 'block_commit_db'
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.private_key = PrivateKey()
+        self.tx_versioner = TransactionVersioner()
+
+        self.channel_service = StandInChannelService()
+        ObjectManager().channel_service = self.channel_service
+        self.channel_service.block_manager.epoch = Epoch(0, "leader_id")
+
+        self.test_db = test_util.make_level_db(self.db_name)
+        self.assertIsNotNone(self.test_db)
+
+    def tearDown(self):
+        ObjectManager().channel_service = None
+        del self.test_db
+        leveldb.DestroyDB(self.db_name)
+        os.system(f"rm -rf ./{self.db_name}*")
+
+    def __create_block(self, chain: BlockChain, tx_count):
+        block = test_util.create_block(self.private_key, tx_count, self.tx_versioner,
+                                       chain.block_versioner.get_version(1))
+        for tx_hash in block.body.transactions:
+            self.channel_service.block_manager.tx_queue[tx_hash.hex()] = tx_hash
+        return block
+
+    @staticmethod
+    def __get_block_keys(block):
+        """keys written with the block at height 1 without a vote"""
+        block_hash_key = block.header.hash.hex().encode(encoding='UTF-8')
+        block_height_key = \
+            BlockChain.BLOCK_HEIGHT_KEY + block.header.height.to_bytes(conf.BLOCK_HEIGHT_BYTES_LEN, byteorder='big')
+        keys = [block_hash_key, block_height_key, BlockChain.LAST_BLOCK_KEY, BlockChain.TRANSACTION_COUNT_KEY,
+                BlockChain.INVOKE_RESULT_BLOCK_HEIGHT_KEY]
+
+        txs = list(block.body.transactions.values())
+        address = txs[0].from_address.hex_hx()
+        keys.append(AddressTxIndex.get_count_key(address))
+        for sequence, tx in enumerate(txs, start=1):
+            keys.append(tx.hash.hex().encode(encoding=conf.HASH_KEY_ENCODING))
+            keys.append(AddressTxIndex.get_key(address, sequence))
+        return keys
+
+    def __get_written_keys(self, keys):
+        written_keys = []
+        for key in keys:
+            try:
+                self.test_db.Get(key)
+                written_keys.append(key)
+            except KeyError:
+                pass
+        return written_keys
+
+    def test_failed_write_leaves_no_key(self):
+        # GIVEN
+        chain = BlockChain(StandInBlockDB(self.test_db))
+        block = self.__create_block(chain, 10)
+        tx_queue = self.channel_service.block_manager.tx_queue
+
+        # WHEN
+        with self.assertRaises(leveldb.LevelDBError):
+            chain._BlockChain__add_block(block)
+
+        # THEN
+        self.assertEqual(self.__get_written_keys(self.__get_block_keys(block)), [])
+        self.assertEqual(chain.block_height, -1)
+        self.assertIsNone(chain.last_block)
+        self.assertEqual(chain.get_commit_status()["count"], 0)
+        self.assertEqual(len(tx_queue), 10)
+        self.assertIsNone(self.channel_service.inner_service.peer_status)
+
+    def test_commit_status(self):
+        # GIVEN
+        chain = BlockChain(self.test_db)
+        block = self.__create_block(chain, 10)
+        block_keys = self.__get_block_keys(block)
+
+        # WHEN
+        chain._BlockChain__add_block(block)
+        commit_status = chain.get_commit_status()
+
+        # THEN
+        self.assertEqual(self.__get_written_keys(block_keys), block_keys)
+        self.assertEqual(commit_status["count"], 1)
+        self.assertEqual(commit_status["last_keys"], len(block_keys))
+        self.assertGreater(commit_status["last_commit_seconds"], 0.0)
+        self.assertLessEqual(commit_status["last_write_seconds"], commit_status["last_commit_seconds"])
+        self.assertEqual(commit_status["max_commit_seconds"], commit_status["last_commit_seconds"])
+        self.assertEqual(commit_status["avg_commit_seconds"], commit_status["last_commit_seconds"])
+        self.assertEqual(self.channel_service.block_manager.tx_queue, {})
+        self.assertEqual(self.channel_service.inner_service.peer_status, {"block_height": 1, "total_tx": 10})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test BlockRecord and TxInfoRecord"""
+
+import json
+import unittest
+
+from secp256k1 import PrivateKey
+
+import testcase.unittest.test_util as test_util
+from loopchain.blockchain import (BlockRecord, BlockSerializer, BlockVersioner, TransactionSerializer,
+                                  TransactionVersioner, TxInfoRecord)
+from loopchain.tools.block_db_migrator import convert_record
+from loopchain.utils import loggers
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class TestBlockRecord(unittest.TestCase):
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.tx_versioner = TransactionVersioner()
+        self.private_key = PrivateKey()
+
+    def tearDown(self):
+        pass
+
+    def __serialize(self, block):
+        block_serializer = BlockSerializer.new(block.header.version, self.tx_versioner)
+        return json.loads(json.dumps(block_serializer.serialize(block)))
+
+    def test_block_record(self):
+        # GIVEN
+        block_dumped = self.__serialize(test_util.create_block(self.private_key, 10, self.tx_versioner))
+
+        # WHEN
+        record = BlockRecord.dumps(block_dumped)
+
+        # THEN
+        self.assertTrue(BlockRecord.is_binary(record))
+        self.assertEqual(BlockRecord.loads(record), block_dumped)
+        self.assertEqual(list(BlockRecord.loads(record)), list(block_dumped))
+        self.assertEqual(BlockVersioner().get_height(record), 1)
+
+    def test_block_record_from_level_db(self):
+        """LevelDB.Get returns bytearray"""
+        # GIVEN
+        block_dumped = self.__serialize(test_util.create_block(self.private_key, 2, self.tx_versioner))
+        record = BlockRecord.dumps(block_dumped)
+
+        # THEN
+        for record_read in (bytearray(record), memoryview(record)):
+            self.assertEqual(BlockRecord.loads(record_read), block_dumped)
+            self.assertEqual(BlockVersioner().get_height(record_read), 1)
+        self.assertEqual(BlockRecord.loads(bytearray(json.dumps(block_dumped).encode("utf-8"))), block_dumped)
+
+    def test_block_record_keeps_malformed_values(self):
+        # GIVEN
+        block_dumped = self.__serialize(test_util.create_block(self.private_key, 2, self.tx_versioner))
+        block_dumped["prev_block_hash"] = ""
+        block_dumped["peer_id"] = "hx" + "AB" * 20
+        block_dumped["confirmed_transaction_list"][0]["from"] = "hx1234"
+        block_dumped["confirmed_transaction_list"][1]["signature"] = "not base64"
+
+        # WHEN
+        record = BlockRecord.dumps(block_dumped)
+
+        # THEN
+        self.assertEqual(BlockRecord.loads(record), block_dumped)
+
+    def test_json_block_record(self):
+        # GIVEN
+        block_dumped = self.__serialize(test_util.create_block(self.private_key, 2, self.tx_versioner))
+        record = json.dumps(block_dumped).encode("utf-8")
+
+        # THEN
+        self.assertFalse(BlockRecord.is_binary(record))
+        self.assertEqual(BlockRecord.loads(record), block_dumped)
+        self.assertEqual(BlockVersioner().get_height(record), 1)
+
+    def test_tx_info_record(self):
+        # GIVEN
+        block = test_util.create_block(self.private_key, 1, self.tx_versioner)
+        tx = next(iter(block.body.transactions.values()))
+        tx_serializer = TransactionSerializer.new(tx.version, self.tx_versioner)
+        tx_info = {
+            'block_hash': block.header.hash.hex(),
+            'block_height': block.header.height,
+            'tx_index': hex(0),
+            'transaction': tx_serializer.to_db_data(tx),
+            'result': {'status': '0x1'}
+        }
+        tx_info = json.loads(json.dumps(tx_info))
+
+        # WHEN
+        record = TxInfoRecord.dumps(tx_info)
+
+        # THEN
+        self.assertEqual(TxInfoRecord.loads(record), tx_info)
+        self.assertEqual(TxInfoRecord.loads(json.dumps(tx_info).encode("utf-8")), tx_info)
+        self.assertEqual(TxInfoRecord.loads(bytearray(record)), tx_info)
+
+    def test_migrate_record(self):
+        # GIVEN
+        block_dumped = self.__serialize(test_util.create_block(self.private_key, 2, self.tx_versioner))
+        json_record = json.dumps(block_dumped).encode("utf-8")
+
+        # WHEN
+        record = convert_record(json_record)
+
+        # THEN
+        self.assertEqual(record, BlockRecord.dumps(block_dumped))
+        self.assertIsNone(convert_record(record))
+        self.assertIsNone(convert_record(b'{"peer_id": "hx00"}'))
+        self.assertEqual(json.loads(convert_record(record, to_json=True)), block_dumped)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test BlockSerializer"""
+
+import json
+import unittest
+
+from secp256k1 import PrivateKey
+
+import testcase.unittest.test_util as test_util
+from loopchain.blockchain import BlockSerializer, Hash32, TransactionVersioner
+from loopchain.utils import loggers
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class TestBlockSerializer(unittest.TestCase):
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.tx_versioner = TransactionVersioner()
+        self.private_key = PrivateKey()
+
+    def tearDown(self):
+        pass
+
+    def test_trusted_deserialize_is_same_as_verifying_one(self):
+        # GIVEN
+        block = test_util.create_block(self.private_key, 10, self.tx_versioner)
+        block_serializer = BlockSerializer.new(block.header.version, self.tx_versioner)
+        block_dumped = json.loads(json.dumps(block_serializer.serialize(block)))
+
+        # WHEN
+        trusted_block = block_serializer.deserialize(block_dumped, trusted=True)
+        verified_block = block_serializer.deserialize(block_dumped)
+
+        # THEN
+        self.assertEqual(trusted_block.header, verified_block.header)
+        self.assertEqual(list(trusted_block.body.transactions), list(block.body.transactions))
+        self.assertEqual(list(trusted_block.body.transactions.values()),
+                         list(verified_block.body.transactions.values()))
+
+    def test_only_trusted_deserialize_takes_tx_hash(self):
+        # GIVEN
+        block = test_util.create_block(self.private_key, 1, self.tx_versioner)
+        block_serializer = BlockSerializer.new(block.header.version, self.tx_versioner)
+        block_dumped = json.loads(json.dumps(block_serializer.serialize(block)))
+        block_dumped["confirmed_transaction_list"][0]["txHash"] = "0" * 64
+
+        # WHEN
+        trusted_block = block_serializer.deserialize(block_dumped, trusted=True)
+        verified_block = block_serializer.deserialize(block_dumped)
+
+        # THEN
+        self.assertEqual(list(trusted_block.body.transactions), [Hash32(bytes(32))])
+        self.assertEqual(list(verified_block.body.transactions), list(block.body.transactions))
+
+
+if __name__ == '__main__':
+    unittest.main()
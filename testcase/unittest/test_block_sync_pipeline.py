@@ -0,0 +1,230 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test BlockSyncPipeline"""
+
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+
+import testcase.unittest.test_util as test_util
+from loopchain.peer.block_sync_pipeline import BlockSyncPipeline
+from loopchain.utils import loggers
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+def make_block(height):
+    return SimpleNamespace(header=SimpleNamespace(height=height))
+
+
+class FakeNetwork:
+    def __init__(self, max_height, latency=0.0, range_limit=None, chunk_size=4):
+        self.max_height = max_height
+        self.latency = latency
+        self.range_limit = range_limit
+        self.chunk_size = chunk_size
+        self.bad_peers = set()
+        self.requests = []
+        self.committed = []
+        self._lock = threading.Lock()
+
+    def fetch(self, peer_stub, start_height, count):
+        with self._lock:
+            self.requests.append((peer_stub, start_height, count))
+        if peer_stub in self.bad_peers:
+            raise ConnectionError(f"{peer_stub} is down")
+
+        time.sleep(self.latency)
+        if self.range_limit:
+            count = min(count, self.range_limit)
+        end_height = min(start_height + count, self.max_height + 1)
+        for height in range(start_height, end_height, self.chunk_size):
+            yield [make_block(height) for height in range(height, min(height + self.chunk_size, end_height))], \
+                self.max_height
+
+    def verify(self, blocks):
+        pass
+
+    def commit(self, block, max_height):
+        self.committed.append(block.header.height)
+        return True
+
+
+class TestBlockSyncPipeline(unittest.TestCase):
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+
+    def tearDown(self):
+        pass
+
+    @staticmethod
+    def __make_pipeline(network, peer_stubs, start_height=0, max_height=None, **kwargs):
+        return BlockSyncPipeline(peer_stubs,
+                                 fetch_func=network.fetch,
+                                 verify_func=network.verify,
+                                 commit_func=network.commit,
+                                 start_height=start_height,
+                                 max_height=network.max_height if max_height is None else max_height,
+                                 **kwargs)
+
+    def test_commit_in_order(self):
+        # GIVEN
+        network = FakeNetwork(max_height=999)
+        pipeline = self.__make_pipeline(network, ["peer0", "peer1", "peer2"], range_size=7, window=4)
+
+        # WHEN
+        my_height = pipeline.run()
+
+        # THEN
+        self.assertEqual(my_height, 999)
+        self.assertEqual(network.committed, list(range(1000)))
+        self.assertEqual({peer_stub for peer_stub, _, _ in network.requests}, {"peer0", "peer1", "peer2"})
+
+    def test_short_reply_requests_the_rest(self):
+        # GIVEN
+        network = FakeNetwork(max_height=99, range_limit=3)
+        pipeline = self.__make_pipeline(network, ["peer0", "peer1"], range_size=10, window=2)
+
+        # WHEN
+        pipeline.run()
+
+        # THEN
+        self.assertEqual(network.committed, list(range(100)))
+
+    def test_bad_peer_is_removed(self):
+        # GIVEN
+        network = FakeNetwork(max_height=99)
+        network.bad_peers.add("peer1")
+        pipeline = self.__make_pipeline(network, ["peer0", "peer1", "peer2"], range_size=10, window=3)
+
+        # WHEN
+        pipeline.run()
+
+        # THEN
+        self.assertEqual(network.committed, list(range(100)))
+        self.assertEqual(pipeline.peer_stubs, ["peer0", "peer2"])
+
+    def test_no_peer_raises_connection_error(self):
+        # GIVEN
+        network = FakeNetwork(max_height=99)
+        network.bad_peers.update({"peer0", "peer1"})
+        pipeline = self.__make_pipeline(network, ["peer0", "peer1"], range_size=10, window=2)
+
+        # THEN
+        self.assertRaises(ConnectionError, pipeline.run)
+        self.assertEqual(network.committed, [])
+
+    def test_invalid_range_is_requested_again(self):
+        # GIVEN
+        network = FakeNetwork(max_height=49)
+        invalid_peers = {"peer0"}
+
+        def verify(blocks):
+            if blocks[0].header.height == 20 and invalid_peers:
+                invalid_peers.clear()
+                raise RuntimeError("invalid block")
+
+        network.verify = verify
+        pipeline = self.__make_pipeline(network, ["peer0", "peer1"], range_size=10, window=2)
+
+        # WHEN
+        pipeline.run()
+
+        # THEN
+        self.assertEqual(network.committed, list(range(50)))
+        self.assertEqual(len(pipeline.peer_stubs), 1)
+
+    def test_failed_commit_is_retried(self):
+        # GIVEN
+        network = FakeNetwork(max_height=29)
+        failed_heights = set()
+
+        def commit(block, max_height):
+            if block.header.height == 15 and block.header.height not in failed_heights:
+                failed_heights.add(block.header.height)
+                return False
+            network.committed.append(block.header.height)
+            return True
+
+        network.commit = commit
+        pipeline = self.__make_pipeline(network, ["peer0", "peer1"], range_size=10, window=2)
+
+        # WHEN
+        pipeline.run()
+
+        # THEN
+        self.assertEqual(network.committed, list(range(30)))
+        self.assertTrue(any(start_height == 15 for _, start_height, _ in network.requests))
+
+    def test_commit_chunks_as_they_arrive(self):
+        # GIVEN
+        network = FakeNetwork(max_height=19)
+        first_chunk_committed = threading.Event()
+        waited_results = []
+
+        def fetch(peer_stub, start_height, count):
+            yield [make_block(height) for height in range(0, 10)], network.max_height
+            waited_results.append(first_chunk_committed.wait(5))
+            yield [make_block(height) for height in range(10, 20)], network.max_height
+
+        def commit(block, max_height):
+            if block.header.height == 9:
+                first_chunk_committed.set()
+            network.committed.append(block.header.height)
+            return True
+
+        network.fetch = fetch
+        network.commit = commit
+        pipeline = self.__make_pipeline(network, ["peer0"], range_size=20, window=1)
+
+        # WHEN
+        pipeline.run()
+
+        # THEN
+        self.assertEqual(network.committed, list(range(20)))
+        self.assertEqual(waited_results, [True])
+
+    def test_follow_max_height(self):
+        # GIVEN
+        network = FakeNetwork(max_height=59)
+
+        # WHEN
+        pipeline = self.__make_pipeline(network, ["peer0"], max_height=9, range_size=10, window=2)
+        pipeline.run()
+
+        # THEN
+        self.assertEqual(pipeline.max_height, 59)
+        self.assertEqual(network.committed, list(range(60)))
+
+    def test_fixed_max_height(self):
+        # GIVEN
+        network = FakeNetwork(max_height=59)
+
+        # WHEN
+        pipeline = self.__make_pipeline(network, ["peer0"], max_height=9, follow_max_height=False,
+                                        range_size=10, window=2)
+        pipeline.run()
+
+        # THEN
+        self.assertEqual(network.committed, list(range(10)))
+
+
+if __name__ == '__main__':
+    unittest.main()
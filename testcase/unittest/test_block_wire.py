@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test BlockWire"""
+
+import os
+import pickle
+import unittest
+
+import leveldb
+from secp256k1 import PrivateKey
+
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.blockchain import BlockSerializer, BlockVersioner, BlockWire, TransactionVersioner
+from loopchain.blockchain.blockchain import BlockChain
+from loopchain.utils import loggers
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class TestBlockWire(unittest.TestCase):
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.tx_versioner = TransactionVersioner()
+        self.block_versioner = BlockVersioner()
+        self.private_key = PrivateKey()
+
+    def tearDown(self):
+        pass
+
+    def __dumps(self, block, zip_threshold=0):
+        """as BlockChain.dumps_block_wire"""
+        block_dumped = BlockSerializer.new(block.header.version, self.tx_versioner).serialize(block)
+        block_dumped["confirm_prev_block"] = block.body.confirm_prev_block
+        return BlockWire.dumps(block_dumped, zip_threshold)
+
+    def __loads(self, block_wire):
+        """as BlockChain.loads_block_wire"""
+        block_version = self.block_versioner.get_version(BlockWire.get_height(block_wire))
+        return BlockSerializer.new(block_version, self.tx_versioner).deserialize(BlockWire.loads(block_wire))
+
+    def test_block_wire(self):
+        # GIVEN
+        block = test_util.create_block(self.private_key, 10, self.tx_versioner)
+
+        for zip_threshold in (0, 1):
+            # WHEN
+            block_wire = self.__dumps(block, zip_threshold)
+            loaded_block = self.__loads(block_wire)
+
+            # THEN
+            self.assertTrue(BlockWire.is_wire(block_wire))
+            self.assertEqual(loaded_block.header, block.header)
+            self.assertEqual(loaded_block.body.confirm_prev_block, block.body.confirm_prev_block)
+            self.assertEqual(list(loaded_block.body.transactions), list(block.body.transactions))
+
+    def test_loads_header_without_body(self):
+        # GIVEN
+        block = test_util.create_block(self.private_key, 10, self.tx_versioner)
+        block_wire = self.__dumps(block, zip_threshold=1)
+
+        # WHEN the body is cut off
+        header_size = int.from_bytes(block_wire[12:16], byteorder='big')
+        block_header = BlockWire.loads_header(block_wire[:16 + header_size])
+
+        # THEN
+        self.assertEqual(block_header["block_hash"], block.header.hash.hex())
+        self.assertEqual(block_header["height"], block.header.height)
+        self.assertIsNone(block_header["confirmed_transaction_list"])
+
+    def test_plain_pickle_of_precommit_block(self):
+        """GetPrecommitBlock is read with pickle.loads by old versions, unless BLOCK_WIRE_FORMAT."""
+        # GIVEN
+        db_name = 'block_wire_db'
+        chain = BlockChain(test_util.make_level_db(db_name))
+        block = test_util.create_block(self.private_key, 10, self.tx_versioner)
+        origin_block_wire_format = conf.BLOCK_WIRE_FORMAT
+        conf.BLOCK_WIRE_FORMAT = False
+
+        try:
+            # WHEN
+            block_dumped = chain.dumps_block_wire(block, pickle_dumps=pickle.dumps)
+            old_version_block = pickle.loads(block_dumped)
+            loaded_block = chain.loads_block_wire(block_dumped, pickle_loads=pickle.loads)
+        finally:
+            conf.BLOCK_WIRE_FORMAT = origin_block_wire_format
+            chain.close_blockchain_db()
+            leveldb.DestroyDB(db_name)
+            os.system(f"rm -rf ./{db_name}*")
+
+        # THEN
+        self.assertFalse(BlockWire.is_wire(block_dumped))
+        self.assertEqual(old_version_block.header, block.header)
+        self.assertEqual(loaded_block.header, block.header)
+
+
+if __name__ == '__main__':
+    unittest.main()
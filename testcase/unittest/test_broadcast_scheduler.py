@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test the tx relay of BroadcastScheduler with a stand-in peer service"""
+
+import unittest
+
+from secp256k1 import PrivateKey
+
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.baseservice import BroadcastCommand, BroadcastScheduler, ObjectManager
+from loopchain.blockchain import Address, TransactionBuilder, TransactionVersioner
+from loopchain.utils import loggers
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class StandInChannelService:
+    def start_leader_complain_timer(self):
+        pass
+
+
+class TestBroadcastScheduler(unittest.TestCase):
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.__origin_max_tx_count = conf.MAX_TX_COUNT_IN_ADDTX_LIST
+        self.__origin_zip_threshold = conf.ADDTX_LIST_ZIP_THRESHOLD
+        self.__origin_max_stored_tx_count = conf.MAX_STORED_TX_COUNT
+
+        self.tx_versioner = TransactionVersioner()
+        self.private_key = PrivateKey()
+        ObjectManager().channel_service = StandInChannelService()
+
+    def tearDown(self):
+        conf.MAX_TX_COUNT_IN_ADDTX_LIST = self.__origin_max_tx_count
+        conf.ADDTX_LIST_ZIP_THRESHOLD = self.__origin_zip_threshold
+        conf.MAX_STORED_TX_COUNT = self.__origin_max_stored_tx_count
+        ObjectManager().channel_service = None
+
+    def __create_txs(self, count):
+        txs = []
+        for i in range(count):
+            tx_builder = TransactionBuilder.new("0x3", self.tx_versioner)
+            tx_builder.private_key = self.private_key
+            tx_builder.to_address = Address.fromhex_address("hx3f376559204079671b6a8df481c976e7d51b3c7c")
+            tx_builder.value = i
+            tx_builder.step_limit = 100000000
+            tx_builder.nid = 3
+            txs.append(tx_builder.build())
+        return txs
+
+    def __relay(self, txs):
+        """relay txs to a stand-in peer
+
+        :return: stand-in peer service, tx relay status
+        """
+        peer_service = test_util.StandInPeerService()
+        peer_service.start()
+
+        broadcast_scheduler = BroadcastScheduler(channel=conf.LOOPCHAIN_DEFAULT_CHANNEL)
+        broadcast_scheduler.start()
+        try:
+            broadcast_scheduler.schedule_job(BroadcastCommand.SUBSCRIBE, peer_service.target).result()
+
+            for tx in txs:
+                broadcast_scheduler.schedule_job(BroadcastCommand.CREATE_TX, (tx, self.tx_versioner))
+            peer_service.wait_tx_count(len(txs))
+
+            return peer_service, broadcast_scheduler.get_tx_relay_status()
+        finally:
+            broadcast_scheduler.stop()
+            broadcast_scheduler.wait()
+            peer_service.stop()
+
+    def test_coalesce_tx_list(self):
+        # GIVEN
+        txs = self.__create_txs(1000)
+        conf.ADDTX_LIST_ZIP_THRESHOLD = 64 * 1024
+
+        # WHEN
+        peer_service, relay_status = self.__relay(txs)
+
+        # THEN
+        received_tx_hashes = [tx_hash for tx_list in peer_service.tx_lists for tx_hash in tx_list]
+        self.assertEqual(sorted(received_tx_hashes), sorted(tx.hash.hex() for tx in txs))
+        self.assertTrue(all(len(tx_list) <= conf.MAX_TX_COUNT_IN_ADDTX_LIST for tx_list in peer_service.tx_lists))
+        self.assertGreater(peer_service.zipped_count, 0)
+
+        self.assertEqual(relay_status["queue_depth"], 0)
+        self.assertEqual(relay_status["queue_bytes"], 0)
+        self.assertEqual(relay_status["tx_list_count"], len(peer_service.tx_lists))
+        self.assertEqual(relay_status["zipped_tx_list_count"], peer_service.zipped_count)
+        self.assertEqual(sum(relay_status["tx_list_size"].values()), len(peer_service.tx_lists))
+
+    def test_no_zipped_tx_list_by_default(self):
+        # GIVEN
+        txs = self.__create_txs(1000)
+
+        # WHEN
+        peer_service, relay_status = self.__relay(txs)
+
+        # THEN
+        received_tx_hashes = [tx_hash for tx_list in peer_service.tx_lists for tx_hash in tx_list]
+        self.assertEqual(sorted(received_tx_hashes), sorted(tx.hash.hex() for tx in txs))
+        self.assertEqual(peer_service.zipped_count, 0)
+        self.assertEqual(relay_status["zipped_tx_list_count"], 0)
+
+    def test_tx_relay_backpressure(self):
+        # GIVEN
+        conf.MAX_STORED_TX_COUNT = 10
+        broadcast_scheduler = BroadcastScheduler(channel=conf.LOOPCHAIN_DEFAULT_CHANNEL)
+
+        # WHEN the scheduler does not send stored txs
+        for tx in self.__create_txs(conf.MAX_STORED_TX_COUNT):
+            self.assertFalse(broadcast_scheduler.is_tx_relay_full())
+            broadcast_scheduler.schedule_job(BroadcastCommand.CREATE_TX, (tx, self.tx_versioner))
+
+        # THEN
+        self.assertTrue(broadcast_scheduler.is_tx_relay_full())
+        relay_status = broadcast_scheduler.get_tx_relay_status()
+        self.assertEqual(relay_status["queue_depth"], conf.MAX_STORED_TX_COUNT)
+        self.assertEqual(relay_status["rejected_tx"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
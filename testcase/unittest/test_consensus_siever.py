@@ -0,0 +1,297 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test ConsensusSiever with a stand-in block manager and channel service"""
+
+import asyncio
+import os
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from secp256k1 import PrivateKey
+
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.baseservice import ObjectManager
+from loopchain.baseservice.transaction_pool import TransactionPool
+from loopchain.blockchain import BlockVersioner, ExternalAddress, TransactionStatusInQueue, TransactionVersioner
+from loopchain.channel.channel_property import ChannelProperty
+from loopchain.peer.consensus_siever import ConsensusSiever
+from loopchain.utils import loggers
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class StandInVote:
+    def __init__(self, result=True):
+        self.result = result
+
+    def get_result(self, block_hash, voting_ratio):
+        return self.result
+
+
+class StandInCandidateBlocks:
+    def __init__(self):
+        self.blocks = {}
+        self.vote = StandInVote()
+
+    def get_vote(self, block_hash):
+        return self.vote
+
+    def add_block(self, block):
+        self.blocks[block.header.hash] = block
+
+
+class StandInBlockChain:
+    def __init__(self, last_block):
+        self.block_versioner = BlockVersioner()
+        self.tx_versioner = TransactionVersioner()
+        self.last_block = last_block
+        self.last_unconfirmed_block = None
+        self.committed_tx_hashes = set()
+
+    def has_tx(self, tx_hash):
+        return tx_hash in self.committed_tx_hashes
+
+
+class StandInBlockManager:
+    def __init__(self, blockchain):
+        self.channel_name = conf.LOOPCHAIN_DEFAULT_CHANNEL
+        self.consensus_lock = threading.Lock()
+        self.consensus_executor = ThreadPoolExecutor(1, 'ConsensusThread')
+        self.candidate_blocks = StandInCandidateBlocks()
+        self.tx_queue = TransactionPool(max_age_seconds=conf.MAX_TX_QUEUE_AGING_SECONDS,
+                                        default_item_status=TransactionStatusInQueue.normal)
+        self.blockchain = blockchain
+        self.invoke_results = {}
+        self.added_blocks = []
+        self.add_block_threads = []
+        self.on_add_block = None
+
+    def get_blockchain(self):
+        return self.blockchain
+
+    def get_tx_queue(self):
+        return self.tx_queue
+
+    def add_block(self, block, vote=None):
+        self.add_block_threads.append(threading.current_thread())
+        self.added_blocks.append(block)
+        if self.on_add_block:
+            self.on_add_block()
+
+    def set_invoke_results(self, block_hash, invoke_results):
+        self.invoke_results[block_hash] = invoke_results
+
+    def vote_unconfirmed_block(self, block_hash, is_validated):
+        pass
+
+    def broadcast_send_unconfirmed_block(self, block):
+        pass
+
+
+class StandInTimerService:
+    def __init__(self, loop):
+        self.loop = loop
+        self.timer_list = {}
+
+    def get_event_loop(self):
+        return self.loop
+
+    def add_timer(self, key, timer):
+        self.timer_list[key] = timer
+
+    def stop_timer(self, key):
+        self.timer_list.pop(key, None)
+
+
+class StandInPeerAuth:
+    def __init__(self, private_key):
+        self.private_key = private_key
+
+
+class StandInChannelService:
+    def __init__(self, block_manager, timer_service, private_key):
+        self.block_manager = block_manager
+        self.timer_service = timer_service
+        self.peer_auth = StandInPeerAuth(private_key)
+        self.score_invoke_threads = []
+        self.on_score_invoke = None
+
+    def score_invoke(self, block):
+        self.score_invoke_threads.append(threading.current_thread())
+        if self.on_score_invoke:
+            self.on_score_invoke()
+        return block, {tx_hash.hex(): {} for tx_hash in block.body.transactions}
+
+
+class TestConsensusSiever(unittest.TestCase):
+    tx_count = 5
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.private_key = PrivateKey()
+        self.tx_versioner = TransactionVersioner()
+        self.loop = asyncio.new_event_loop()
+
+        self.__origin_peer_id = ChannelProperty().peer_id
+        ChannelProperty().peer_id = ExternalAddress(os.urandom(ExternalAddress.size)).hex_hx()
+
+        last_block = test_util.create_block(self.private_key, 1, self.tx_versioner)
+        self.blockchain = StandInBlockChain(last_block)
+        self.block_manager = StandInBlockManager(self.blockchain)
+        self.channel_service = StandInChannelService(
+            self.block_manager, StandInTimerService(self.loop), self.private_key)
+        ObjectManager().channel_service = self.channel_service
+
+        self.siever = ConsensusSiever(self.block_manager)
+        self.siever.start_timer(self.channel_service.timer_service)
+
+    def tearDown(self):
+        ObjectManager().channel_service = None
+        ChannelProperty().peer_id = self.__origin_peer_id
+        self.block_manager.consensus_executor.shutdown()
+        self.loop.close()
+
+    def __add_txs(self):
+        block = test_util.create_block(self.private_key, self.tx_count, self.tx_versioner)
+        for tx in block.body.transactions.values():
+            self.block_manager.tx_queue[tx.hash.hex()] = tx
+        return list(block.body.transactions)
+
+    def __get_tx_statuses(self, tx_hashes):
+        return [self.block_manager.tx_queue.get_item_status(tx_hash.hex()) for tx_hash in tx_hashes]
+
+    def test_consensus_makes_candidate_block(self):
+        # GIVEN
+        tx_hashes = self.__add_txs()
+
+        # WHEN
+        self.loop.run_until_complete(self.siever.consensus())
+
+        # THEN
+        candidate_block = self.blockchain.last_unconfirmed_block
+        self.assertIsNotNone(candidate_block)
+        self.assertEqual(list(self.block_manager.candidate_blocks.blocks), [candidate_block.header.hash])
+        self.assertEqual(candidate_block.header.height, self.blockchain.last_block.header.height + 1)
+        self.assertEqual(candidate_block.header.prev_hash, self.blockchain.last_block.header.hash)
+        self.assertEqual(sorted(candidate_block.body.transactions), sorted(tx_hashes))
+        self.assertIn(candidate_block.header.hash.hex(), self.block_manager.invoke_results)
+        self.assertEqual(self.__get_tx_statuses(tx_hashes), [TransactionStatusInQueue.added_to_block] * self.tx_count)
+
+        # the score is invoked in the executor, not in the event loop of the timer service.
+        self.assertEqual(len(self.channel_service.score_invoke_threads), 1)
+        self.assertIsNot(self.channel_service.score_invoke_threads[0], threading.current_thread())
+        self.assertFalse(self.block_manager.consensus_lock.locked())
+
+    def test_makeup_block_fills_size_of_rejected_txs(self):
+        # GIVEN txs which are committed already come first in the queue.
+        rejected_tx_hashes = self.__add_txs()
+        self.blockchain.committed_tx_hashes.update(rejected_tx_hashes)
+        tx_hashes = self.__add_txs()
+
+        tx = self.block_manager.tx_queue[tx_hashes[0].hex()]
+        origin_max_tx_size = conf.MAX_TX_SIZE_IN_BLOCK
+        conf.MAX_TX_SIZE_IN_BLOCK = tx.size(self.tx_versioner) * 3
+
+        # WHEN
+        try:
+            block_builder = self.siever._makeup_block()
+        finally:
+            conf.MAX_TX_SIZE_IN_BLOCK = origin_max_tx_size
+
+        # THEN
+        self.assertEqual(list(block_builder.transactions), tx_hashes[:3])
+        self.assertEqual(self.__get_tx_statuses(tx_hashes[3:]), [TransactionStatusInQueue.normal] * 2)
+
+    def test_consensus_skips_round_in_progress(self):
+        # GIVEN
+        tx_hashes = self.__add_txs()
+        self.block_manager.consensus_lock.acquire()
+
+        # WHEN
+        try:
+            self.loop.run_until_complete(self.siever.consensus())
+        finally:
+            self.block_manager.consensus_lock.release()
+
+        # THEN
+        self.assertIsNone(self.blockchain.last_unconfirmed_block)
+        self.assertEqual(self.block_manager.candidate_blocks.blocks, {})
+        self.assertEqual(self.channel_service.score_invoke_threads, [])
+        self.assertEqual(self.__get_tx_statuses(tx_hashes), [TransactionStatusInQueue.normal] * self.tx_count)
+
+    def test_consensus_adds_voted_unconfirmed_block(self):
+        # GIVEN
+        tx_hashes = self.__add_txs()
+        unconfirmed_block = test_util.create_block(self.private_key, 1, self.tx_versioner)
+        self.blockchain.last_unconfirmed_block = unconfirmed_block
+
+        # WHEN
+        self.loop.run_until_complete(self.siever.consensus())
+
+        # THEN
+        self.assertEqual(self.block_manager.added_blocks, [unconfirmed_block])
+        self.assertIsNot(self.block_manager.add_block_threads[0], threading.current_thread())
+        self.assertEqual(self.siever.made_block_count, 1)
+        self.assertIsNot(self.blockchain.last_unconfirmed_block, unconfirmed_block)
+        self.assertEqual(self.__get_tx_statuses(tx_hashes), [TransactionStatusInQueue.added_to_block] * self.tx_count)
+
+    def test_stop_while_building_candidate_block(self):
+        # GIVEN
+        tx_hashes = self.__add_txs()
+        self.channel_service.on_score_invoke = self.siever.stop
+
+        # WHEN
+        self.loop.run_until_complete(self.siever.consensus())
+
+        # THEN
+        self.assertIsNone(self.blockchain.last_unconfirmed_block)
+        self.assertEqual(self.block_manager.candidate_blocks.blocks, {})
+        self.assertEqual(self.__get_tx_statuses(tx_hashes), [TransactionStatusInQueue.normal] * self.tx_count)
+        self.assertFalse(self.block_manager.consensus_lock.locked())
+
+    def test_stop_while_adding_unconfirmed_block(self):
+        # GIVEN
+        tx_hashes = self.__add_txs()
+        self.blockchain.last_unconfirmed_block = test_util.create_block(self.private_key, 1, self.tx_versioner)
+        self.block_manager.on_add_block = self.siever.stop
+
+        # WHEN
+        self.loop.run_until_complete(self.siever.consensus())
+
+        # THEN
+        self.assertEqual(len(self.block_manager.added_blocks), 1)
+        self.assertEqual(self.channel_service.score_invoke_threads, [])
+        self.assertEqual(self.__get_tx_statuses(tx_hashes), [TransactionStatusInQueue.normal] * self.tx_count)
+
+    def test_stopped_siever_does_not_start_round(self):
+        # GIVEN
+        tx_hashes = self.__add_txs()
+        self.siever.stop()
+
+        # WHEN
+        self.loop.run_until_complete(self.siever.consensus())
+
+        # THEN
+        self.assertIsNone(self.blockchain.last_unconfirmed_block)
+        self.assertEqual(self.__get_tx_statuses(tx_hashes), [TransactionStatusInQueue.normal] * self.tx_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
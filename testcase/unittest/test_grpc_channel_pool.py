@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test GRPCChannelPool with a stand-in peer service"""
+
+import time
+import unittest
+
+import grpc
+
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.baseservice import StubManager
+from loopchain.protos import loopchain_pb2, loopchain_pb2_grpc
+from loopchain.tools.grpc_helper import GRPCChannelPool, GRPCHelper
+from loopchain.utils import loggers
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class TestGRPCChannelPool(unittest.TestCase):
+    dead_port = 7910
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.peer_service = test_util.StandInPeerService()
+        self.target = self.peer_service.start(options=GRPCHelper.get_server_options())
+
+    def tearDown(self):
+        self.peer_service.stop()
+
+    def test_share_channel(self):
+        # GIVEN
+        channel = GRPCChannelPool().get_channel(self.target, conf.SSLAuthType.none)
+        created_count = GRPCChannelPool().get_status()["created_count"]
+
+        # WHEN
+        stub_manager1 = StubManager.get_stub_manager_to_server(self.target, loopchain_pb2_grpc.PeerServiceStub)
+        stub_manager2 = StubManager.get_stub_manager_to_server(self.target, loopchain_pb2_grpc.PeerServiceStub)
+        stub_manager1.call("GetStatus", loopchain_pb2.StatusRequest(request=""), is_stub_reuse=False)
+        stub_manager2.call("GetStatus", loopchain_pb2.StatusRequest(request=""), is_stub_reuse=False)
+
+        # THEN
+        self.assertEqual(GRPCChannelPool().get_status()["created_count"], created_count)
+        self.assertTrue(GRPCChannelPool().is_healthy(self.target, conf.SSLAuthType.none))
+        self.assertIs(GRPCChannelPool().renew_failed_channel(self.target, conf.SSLAuthType.none), channel)
+
+    def test_renew_failed_channel(self):
+        # GIVEN
+        dead_target = f"{conf.IP_LOCAL}:{self.dead_port}"
+        channel = GRPCChannelPool().get_channel(dead_target, conf.SSLAuthType.none)
+
+        # WHEN
+        with self.assertRaises(grpc.RpcError):
+            loopchain_pb2_grpc.PeerServiceStub(channel).GetStatus(loopchain_pb2.StatusRequest(request=""), 1)
+        time.sleep(0.5)
+
+        # THEN
+        self.assertFalse(GRPCChannelPool().is_healthy(dead_target, conf.SSLAuthType.none))
+        renewed_channel = GRPCChannelPool().renew_failed_channel(dead_target, conf.SSLAuthType.none)
+        self.assertIsNot(renewed_channel, channel)
+        self.assertIs(GRPCChannelPool().get_channel(dead_target, conf.SSLAuthType.none), renewed_channel)
+
+    def test_close_renewed_channels(self):
+        # GIVEN
+        renew_count = 3
+        dead_target = f"{conf.IP_LOCAL}:{self.dead_port + 1}"
+        origin_close_delay = conf.GRPC_RETIRED_CHANNEL_CLOSE_DELAY
+        conf.GRPC_RETIRED_CHANNEL_CLOSE_DELAY = 0
+        channel = GRPCChannelPool().get_channel(dead_target, conf.SSLAuthType.none)
+        status = GRPCChannelPool().get_status()
+
+        # WHEN
+        try:
+            for _ in range(renew_count):
+                with self.assertRaises(grpc.RpcError):
+                    loopchain_pb2_grpc.PeerServiceStub(channel).GetStatus(loopchain_pb2.StatusRequest(request=""), 1)
+                time.sleep(0.5)
+                channel = GRPCChannelPool().renew_failed_channel(dead_target, conf.SSLAuthType.none)
+            renewed_status = GRPCChannelPool().get_status()
+        finally:
+            conf.GRPC_RETIRED_CHANNEL_CLOSE_DELAY = origin_close_delay
+
+        # THEN one channel is left for the target.
+        self.assertEqual(renewed_status["channel_count"], status["channel_count"])
+        self.assertEqual(renewed_status["created_count"], status["created_count"] + renew_count)
+        self.assertEqual(renewed_status["closed_count"], status["closed_count"] + renew_count)
+        self.assertEqual(renewed_status["retired_count"], 0)
+        self.assertIs(GRPCChannelPool().get_channel(dead_target, conf.SSLAuthType.none), channel)
+
+    def test_keepalive_options(self):
+        origin_keepalive = conf.GRPC_KEEPALIVE
+        try:
+            # WHEN
+            conf.GRPC_KEEPALIVE = False
+            option_names = [name for name, _ in GRPCHelper.get_channel_options()]
+            conf.GRPC_KEEPALIVE = True
+            keepalive_options = dict(GRPCHelper.get_channel_options())
+        finally:
+            conf.GRPC_KEEPALIVE = origin_keepalive
+
+        # THEN servers of old versions do not get pings unless it is enabled.
+        self.assertNotIn("grpc.keepalive_time_ms", option_names)
+        self.assertNotIn("grpc.keepalive_permit_without_calls", option_names)
+        self.assertEqual(keepalive_options["grpc.keepalive_time_ms"], conf.GRPC_KEEPALIVE_TIME * 1000)
+        self.assertEqual(keepalive_options["grpc.keepalive_permit_without_calls"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
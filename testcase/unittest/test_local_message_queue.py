@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test LocalMessageQueueServer and LocalMessageQueueStub against a stand-in broker"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from earlgrey import MessageQueueException, MessageQueueType, message_queue_task
+
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.utils import loggers
+from loopchain.utils.message_queue import LocalMessageQueueServer, LocalMessageQueueStub
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class StandInTask:
+    def __init__(self):
+        self.values = []
+
+    @message_queue_task
+    async def echo(self, data):
+        return data
+
+    @message_queue_task(type_=MessageQueueType.Worker)
+    def notify(self, value):
+        self.values.append(value)
+
+    @message_queue_task
+    async def fail(self):
+        raise RuntimeError("stand-in task fails")
+
+
+class StandInBroker:
+    """It relays each message to the server after receiving the whole message, as RabbitMQ does over TCP."""
+    def __init__(self, server_address):
+        self.server_address = server_address
+        self.server = None
+
+    async def start(self, port):
+        self.server = await asyncio.start_server(self.__on_connection, conf.IP_LOCAL, port)
+
+    def close(self):
+        self.server.close()
+
+    async def __on_connection(self, client_reader, client_writer):
+        server_reader, server_writer = await asyncio.open_connection(*self.server_address)
+        asyncio.ensure_future(self.__relay(server_reader, client_writer))
+        await self.__relay(client_reader, server_writer)
+
+    @staticmethod
+    async def __relay(reader, writer):
+        try:
+            while True:
+                header = await reader.readexactly(4)
+                body = await reader.readexactly(int.from_bytes(header, "big"))
+                writer.write(header + body)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+class TestLocalMessageQueue(unittest.TestCase):
+    route_key = "Channel.local_mq_test"
+    server_port = 7921
+    broker_port = 7922
+    data = os.urandom(1024)
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.__origin_local_message_queue_path = conf.LOCAL_MESSAGE_QUEUE_PATH
+        conf.LOCAL_MESSAGE_QUEUE_PATH = tempfile.mkdtemp()
+
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever)
+        self.thread.start()
+
+        self.task = StandInTask()
+        self.server = LocalMessageQueueServer(self.route_key, self.task)
+        self.tcp_server = LocalMessageQueueServer(self.route_key, self.task, (conf.IP_LOCAL, self.server_port))
+        self.broker = StandInBroker((conf.IP_LOCAL, self.server_port))
+        self.__run(self.server.start())
+        self.__run(self.tcp_server.start())
+        self.__run(self.broker.start(self.broker_port))
+
+        self.stub = LocalMessageQueueStub(StandInTask, self.route_key)
+        self.broker_stub = LocalMessageQueueStub(StandInTask, self.route_key, (conf.IP_LOCAL, self.broker_port))
+        self.__run(self.stub.connect())
+        self.__run(self.broker_stub.connect())
+
+    def tearDown(self):
+        self.loop.call_soon_threadsafe(self.stub.close)
+        self.loop.call_soon_threadsafe(self.broker_stub.close)
+        self.loop.call_soon_threadsafe(self.server.close)
+        self.loop.call_soon_threadsafe(self.tcp_server.close)
+        self.loop.call_soon_threadsafe(self.broker.close)
+        self.__run(asyncio.sleep(0.1))
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+
+        shutil.rmtree(conf.LOCAL_MESSAGE_QUEUE_PATH, True)
+        conf.LOCAL_MESSAGE_QUEUE_PATH = self.__origin_local_message_queue_path
+
+    def __run(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result(conf.GRPC_TIMEOUT)
+
+    @staticmethod
+    def __wait_for(condition, timeout=conf.GRPC_TIMEOUT):
+        deadline = time.monotonic() + timeout
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_sync_and_async_task(self):
+        # WHEN
+        sync_result = self.stub.sync_task().echo(self.data)
+        async_result = self.__run(self.stub.async_task().echo(data=self.data))
+        self.stub.sync_task().notify(1)
+        self.__run(self.stub.async_task().notify(2))
+        # notify has no reply, so wait for the server to run it.
+        self.__wait_for(lambda: len(self.task.values) == 2)
+
+        # THEN
+        self.assertEqual(sync_result, self.data)
+        self.assertEqual(async_result, self.data)
+        self.assertEqual(self.stub.sync_info().queue_info().method.message_count, 0)
+        self.assertEqual(sorted(self.task.values), [1, 2])
+
+    def test_task_exception(self):
+        with self.assertRaises(MessageQueueException):
+            self.stub.sync_task().fail()
+
+        with self.assertRaises(MessageQueueException):
+            self.__run(self.stub.async_task().fail())
+
+    def test_task_through_broker(self):
+        # WHEN
+        sync_result = self.broker_stub.sync_task().echo(self.data)
+        async_result = self.__run(self.broker_stub.async_task().echo(data=self.data))
+
+        # THEN
+        self.assertEqual(sync_result, self.data)
+        self.assertEqual(async_result, self.data)
+
+    def test_refuse_unsafe_path(self):
+        # GIVEN
+        unsafe_path = os.path.join(conf.LOCAL_MESSAGE_QUEUE_PATH, "unsafe")
+        os.mkdir(unsafe_path)
+        os.chmod(unsafe_path, 0o777)
+        unsafe_server = LocalMessageQueueServer(self.route_key, self.task, os.path.join(unsafe_path, "unsafe.sock"))
+        unsafe_stub = LocalMessageQueueStub(StandInTask, self.route_key, os.path.join(unsafe_path, "unsafe.sock"))
+
+        file_path = os.path.join(conf.LOCAL_MESSAGE_QUEUE_PATH, "file.sock")
+        with open(file_path, "w") as f:
+            f.write("not a socket")
+        file_server = LocalMessageQueueServer(self.route_key, self.task, file_path)
+
+        # THEN
+        self.assertEqual(os.stat(conf.LOCAL_MESSAGE_QUEUE_PATH).st_mode & 0o077, 0)
+        with self.assertRaises(PermissionError):
+            self.__run(unsafe_server.start())
+        with self.assertRaises(PermissionError):
+            unsafe_stub.sync_task().echo(self.data)
+        with self.assertRaises(PermissionError):
+            self.__run(file_server.start())
+        self.assertTrue(os.path.isfile(file_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test LogQueueHandler"""
+
+import logging
+import os
+import time
+import unittest
+
+import verboselogs
+
+import loopchain.utils as util
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.utils import loggers
+from loopchain.utils.loggers.log_queue_handler import LogQueueHandler
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class StandInHandler(logging.Handler):
+    """It keeps the messages of records and takes the delay to write each record."""
+    def __init__(self, delay=0):
+        super().__init__()
+        self.delay = delay
+        self.messages = []
+
+    def emit(self, record):
+        time.sleep(self.delay)
+        self.messages.append(self.format(record))
+
+
+class TestLogQueueHandler(unittest.TestCase):
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.logger = verboselogs.VerboseLogger("test_log_queue_handler")
+        self.logger.propagate = False
+
+    def tearDown(self):
+        for handler in self.logger.handlers[:]:
+            self.logger.removeHandler(handler)
+            handler.close()
+
+    def test_drop_records_over_queue_size(self):
+        # GIVEN
+        handler = StandInHandler(delay=0.01)
+        queue_handler = LogQueueHandler([handler], queue_size=10)
+        self.logger.addHandler(queue_handler)
+
+        # WHEN
+        for i in range(100):
+            self.logger.info("record %d", i)
+        time.sleep(0.5)
+        self.logger.info("record after drops")
+        queue_handler.close()
+
+        # THEN
+        records = [message for message in handler.messages if message.startswith("record")]
+        drop_warnings = [message for message in handler.messages if "log records are dropped" in message]
+        self.assertGreater(queue_handler.dropped_count, 0)
+        self.assertEqual(len(records) + queue_handler.dropped_count, 101)
+        self.assertEqual(records[-1], "record after drops")
+        self.assertTrue(drop_warnings[-1].endswith(f"({queue_handler.dropped_count} records in total)"))
+
+    def test_write_records_in_queue_at_close(self):
+        # GIVEN
+        handler = StandInHandler()
+        queue_handler = LogQueueHandler([handler], queue_size=conf.LOG_QUEUE_SIZE)
+        self.logger.addHandler(queue_handler)
+
+        # WHEN
+        for i in range(1000):
+            self.logger.info("record %d", i)
+        queue_handler.close()
+
+        # THEN
+        self.assertEqual(queue_handler.dropped_count, 0)
+        self.assertEqual(handler.messages, [f"record {i}" for i in range(1000)])
+
+    def test_make_message_when_logged(self):
+        # GIVEN
+        handler = StandInHandler()
+        queue_handler = LogQueueHandler([handler], queue_size=conf.LOG_QUEUE_SIZE)
+        self.logger.addHandler(queue_handler)
+        peers = {"peer0": 0}
+
+        # WHEN
+        self.logger.info("peers(%s)", peers)
+        for i in range(1, 1000):
+            peers[f"peer{i}"] = i
+        queue_handler.close()
+
+        # THEN
+        self.assertEqual(handler.messages, ["peers({'peer0': 0})"])
+
+    def test_write_last_record_before_exit(self):
+        # GIVEN
+        handler = StandInHandler(delay=0.01)
+        queue_handler = LogQueueHandler([handler], queue_size=conf.LOG_QUEUE_SIZE)
+        root_logger = logging.getLogger()
+        root_logger.addHandler(queue_handler)
+
+        messages_at_exit = []
+        origin_killpg = os.killpg
+        os.killpg = lambda pgid, sig: messages_at_exit.extend(handler.messages)
+
+        # WHEN
+        try:
+            for i in range(10):
+                root_logger.warning("record %d", i)
+            util.exit_and_msg("stand-in fatal error")
+        finally:
+            os.killpg = origin_killpg
+            root_logger.removeHandler(queue_handler)
+            queue_handler.close()
+
+        # THEN the records are written before the process is killed
+        self.assertEqual(messages_at_exit[:10], [f"record {i}" for i in range(10)])
+        self.assertTrue(messages_at_exit[-1].startswith("Service Stop by: stand-in fatal error"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test SizedLRUCache"""
+
+import unittest
+
+import testcase.unittest.test_util as test_util
+from loopchain.baseservice.lru_cache import SizedLRUCache
+from loopchain.utils import loggers
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class TestSizedLRUCache(unittest.TestCase):
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+
+    def tearDown(self):
+        pass
+
+    def test_evict_least_recently_used_by_size(self):
+        # GIVEN
+        cache = SizedLRUCache(max_size=100)
+        for i in range(4):
+            cache.put(i, f"value_{i}", 25)
+
+        # WHEN
+        cache.get(0)
+        cache.put(4, "value_4", 30)
+
+        # THEN
+        self.assertEqual(list(cache.d), [3, 0, 4])
+        self.assertEqual(cache.size, 80)
+
+    def test_put_again_replaces_size(self):
+        # GIVEN
+        cache = SizedLRUCache(max_size=100)
+        cache.put("a", "value", 60)
+
+        # WHEN
+        cache.put("a", "new value", 10)
+
+        # THEN
+        self.assertEqual(cache.get("a"), "new value")
+        self.assertEqual(cache.size, 10)
+
+    def test_item_larger_than_max_size_is_not_cached(self):
+        # GIVEN
+        cache = SizedLRUCache(max_size=100)
+        cache.put("a", "value", 60)
+
+        # WHEN
+        cache.put("b", "value", 101)
+
+        # THEN
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+
+    def test_status(self):
+        # GIVEN
+        cache = SizedLRUCache(max_size=100)
+        cache.put("a", "value", 10)
+
+        # WHEN
+        cache.get("a")
+        cache.get("a")
+        cache.get("b")
+        cache.pop("a")
+
+        # THEN
+        self.assertEqual(cache.get_status(), {"count": 0, "size": 0, "max_size": 100, "hit": 2, "miss": 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test MerkleTree"""
+
+import hashlib
+import os
+import unittest
+
+import testcase.unittest.test_util as test_util
+from loopchain.blockchain import BlockBuilder, Hash32, MerkleTree, TransactionVersioner
+from loopchain.utils import loggers
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+def build_hex_merkle_tree_root_hash(tx_hashes):
+    """The merkle tree root hash on hex strings of old versions"""
+    mt_list = [tx_hash.hex() for tx_hash in tx_hashes]
+    while len(mt_list) > 1:
+        if len(mt_list) % 2 == 1:
+            mt_list.append(mt_list[-1])
+        mt_list = [hashlib.sha256(mt_list[i].encode('UTF-8') + mt_list[i + 1].encode('UTF-8')).hexdigest()
+                   for i in range(0, len(mt_list), 2)]
+
+    if mt_list:
+        return bytes.fromhex(mt_list[0])
+    return bytes(32)
+
+
+class TestMerkleTree(unittest.TestCase):
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+
+    def test_root_is_same_as_hex_tree(self):
+        for count in range(0, 40):
+            tx_hashes = [os.urandom(32) for _ in range(count)]
+            self.assertEqual(MerkleTree(tx_hashes).root, build_hex_merkle_tree_root_hash(tx_hashes), count)
+
+    def test_incremental_root(self):
+        # GIVEN
+        tx_hashes = [os.urandom(32) for _ in range(37)]
+        merkle_tree = MerkleTree()
+
+        # WHEN THEN
+        for index, tx_hash in enumerate(tx_hashes):
+            merkle_tree.append(tx_hash)
+            self.assertEqual(merkle_tree.root, build_hex_merkle_tree_root_hash(tx_hashes[:index + 1]))
+
+        merkle_tree.extend(os.urandom(32) for _ in range(11))
+        self.assertEqual(merkle_tree.root, MerkleTree(merkle_tree.leaves).root)
+
+    def test_proof(self):
+        # GIVEN
+        tx_hashes = [os.urandom(32) for _ in range(13)]
+        merkle_tree = MerkleTree(tx_hashes)
+
+        # WHEN THEN
+        for index, tx_hash in enumerate(tx_hashes):
+            proof = merkle_tree.get_proof(index)
+            self.assertTrue(MerkleTree.verify_proof(tx_hash, proof, merkle_tree.root))
+            self.assertFalse(MerkleTree.verify_proof(os.urandom(32), proof, merkle_tree.root))
+
+        self.assertRaises(IndexError, merkle_tree.get_proof, len(tx_hashes))
+
+    def test_block_builder_updates_tree_incrementally(self):
+        # GIVEN
+        block_builder = BlockBuilder.new("0.1a", TransactionVersioner())
+        tx_hashes = [Hash32(os.urandom(32)) for _ in range(10)]
+        for tx_hash in tx_hashes[:5]:
+            block_builder.transactions[tx_hash] = None
+        merkle_tree = block_builder.build_merkle_tree()
+
+        # WHEN
+        for tx_hash in tx_hashes[5:]:
+            block_builder.transactions[tx_hash] = None
+        block_builder.reset_cache()
+
+        # THEN
+        self.assertIs(block_builder.build_merkle_tree(), merkle_tree)
+        self.assertEqual(block_builder.build_merkle_tree_root_hash(), build_hex_merkle_tree_root_hash(tx_hashes))
+        self.assertTrue(MerkleTree.verify_proof(tx_hashes[7], block_builder.get_merkle_proof(tx_hashes[7]),
+                                                block_builder.merkle_tree_root_hash))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test peer list deltas of ConnectPeer with an in-process RadioStation"""
+
+import json
+import os
+import shutil
+import unittest
+
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.baseservice import ObjectManager, PeerManager
+from loopchain.protos import loopchain_pb2
+from loopchain.radiostation import AdminManager, OuterService
+from loopchain.utils import loggers
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class StandInChannelManager:
+    """Stand-in of ChannelManager of RS which has peer managers only"""
+    def __init__(self):
+        self.peer_managers = {}
+
+    def get_peer_manager(self, channel_name=None) -> PeerManager:
+        return self.peer_managers.setdefault(channel_name, PeerManager(channel_name))
+
+    def set_peer_manager(self, channel, peer_manager):
+        self.peer_managers[channel] = peer_manager
+
+    def remove_audience(self, channel, peer_target):
+        pass
+
+
+class StandInRadioStationService:
+    def __init__(self, admin_manager):
+        self.admin_manager = admin_manager
+        self.channel_manager = StandInChannelManager()
+
+
+class TestPeerListDelta(unittest.TestCase):
+    level_db_identity = "peer_list_delta_test"
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.__origin_enable_heartbeat = conf.ENABLE_RADIOSTATION_HEARTBEAT
+        self.__origin_enable_channel_auth = conf.ENABLE_CHANNEL_AUTH
+        self.__origin_channel_manage_data_path = conf.CHANNEL_MANAGE_DATA_PATH
+        conf.ENABLE_RADIOSTATION_HEARTBEAT = False
+        conf.ENABLE_CHANNEL_AUTH = False
+        conf.CHANNEL_MANAGE_DATA_PATH = os.path.join(conf.LOOPCHAIN_ROOT_PATH,
+                                                     "testcase/unittest/channel_manage_data_for_test.json")
+
+        self.channel = conf.LOOPCHAIN_DEFAULT_CHANNEL
+        self.__start_rs()
+
+    def tearDown(self):
+        conf.ENABLE_RADIOSTATION_HEARTBEAT = self.__origin_enable_heartbeat
+        conf.ENABLE_CHANNEL_AUTH = self.__origin_enable_channel_auth
+        conf.CHANNEL_MANAGE_DATA_PATH = self.__origin_channel_manage_data_path
+        ObjectManager().rs_service = None
+        shutil.rmtree(os.path.join(conf.DEFAULT_STORAGE_PATH, f"db_{self.level_db_identity}_admin"), True)
+
+    def __start_rs(self):
+        """Start RS in process, it loads the peer list from its db at the first ConnectPeer."""
+        # the db of the previous RS is closed first.
+        ObjectManager().rs_service = None
+        ObjectManager().rs_service = StandInRadioStationService(AdminManager(self.level_db_identity))
+        self.rs_outer_service = OuterService()
+
+    def __connect_peer(self, number, peer_list_version=None):
+        peer_id = f"peer-{number:04d}"
+        request = loopchain_pb2.ConnectPeerRequest(
+            channel=self.channel,
+            peer_object=b'',
+            peer_id=peer_id,
+            peer_target=f"{conf.IP_LOCAL}:{10000 + number}",
+            group_id=peer_id)
+        if peer_list_version is not None:
+            request.peer_list_version = peer_list_version
+
+        response = self.rs_outer_service.ConnectPeer(request, None)
+        self.assertEqual(response.status, 0)
+        return response
+
+    def test_reconnect_with_delta(self):
+        # GIVEN
+        first_response = self.__connect_peer(0, 0)
+        peer_manager = PeerManager(self.channel)
+        peer_list_version, _, _ = peer_manager.load_delta(first_response.peer_list_delta)
+        for number in range(1, 10):
+            self.__connect_peer(number, 0)
+
+        # WHEN
+        response = self.__connect_peer(0, peer_list_version)
+        peer_list_version, changed_peers, removed_peers = peer_manager.load_delta(response.peer_list_delta)
+
+        # THEN
+        rs_peer_manager = ObjectManager().rs_service.channel_manager.get_peer_manager(self.channel)
+        self.assertFalse(json.loads(response.peer_list_delta)["full"])
+        self.assertEqual(peer_list_version, rs_peer_manager.peer_list_data.version)
+        self.assertEqual(len(changed_peers), 9)
+        self.assertEqual(removed_peers, [])
+        self.assertEqual(set(peer_manager.peer_list[conf.ALL_GROUP_ID]),
+                         set(rs_peer_manager.peer_list[conf.ALL_GROUP_ID]))
+        self.assertEqual(peer_manager.peer_leader[conf.ALL_GROUP_ID], rs_peer_manager.peer_leader[conf.ALL_GROUP_ID])
+
+    def test_delta_keeps_status_update_time(self):
+        # GIVEN
+        for number in range(3):
+            self.__connect_peer(number, 0)
+        response = self.__connect_peer(0, 0)
+
+        # WHEN
+        peer_manager = PeerManager(self.channel)
+        peer_manager.load_delta(response.peer_list_delta)
+
+        # THEN
+        rs_peer_manager = ObjectManager().rs_service.channel_manager.get_peer_manager(self.channel)
+        for peer_id, peer in rs_peer_manager.peer_list[conf.ALL_GROUP_ID].items():
+            self.assertEqual(peer_manager.peer_list[conf.ALL_GROUP_ID][peer_id].status_update_time,
+                             peer.status_update_time)
+
+    def test_delta_of_removed_peer(self):
+        # GIVEN
+        for number in range(3):
+            self.__connect_peer(number, 0)
+        response = self.__connect_peer(0, 0)
+        peer_manager = PeerManager(self.channel)
+        peer_list_version, _, _ = peer_manager.load_delta(response.peer_list_delta)
+
+        # WHEN
+        rs_peer_manager = ObjectManager().rs_service.channel_manager.get_peer_manager(self.channel)
+        rs_peer_manager.remove_peer("peer-0002", "peer-0002")
+        response = self.__connect_peer(0, peer_list_version)
+        _, _, removed_peers = peer_manager.load_delta(response.peer_list_delta)
+
+        # THEN
+        self.assertEqual([peer.peer_id for peer in removed_peers], ["peer-0002"])
+        self.assertEqual(set(peer_manager.peer_list[conf.ALL_GROUP_ID]), {"peer-0000", "peer-0001"})
+
+    def test_load_saved_peer_list(self):
+        # GIVEN
+        for number in range(10):
+            self.__connect_peer(number, 0)
+        rs_peer_manager = ObjectManager().rs_service.channel_manager.get_peer_manager(self.channel)
+        rs_peer_manager.remove_peer("peer-0005", "peer-0005")
+        ObjectManager().rs_service.admin_manager.save_peer_manager(self.channel, rs_peer_manager)
+        peer_list_version = rs_peer_manager.peer_list_data.version
+
+        # WHEN RS restarts
+        self.__start_rs()
+        response = self.__connect_peer(0, peer_list_version)
+
+        # THEN the peer list is loaded at the version and the delta has no change
+        rs_peer_manager = ObjectManager().rs_service.channel_manager.get_peer_manager(self.channel)
+        delta = json.loads(response.peer_list_delta)
+        self.assertEqual(len(rs_peer_manager.peer_list[conf.ALL_GROUP_ID]), 9)
+        self.assertNotIn("peer-0005", rs_peer_manager.peer_list[conf.ALL_GROUP_ID])
+        self.assertEqual(rs_peer_manager.peer_leader[conf.ALL_GROUP_ID], 1)
+        self.assertFalse(delta["full"])
+        self.assertEqual(delta["version"], peer_list_version)
+        self.assertEqual(delta["peers"], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test the heartbeat and leader rotation of PeerManager with stand-in peers"""
+
+import unittest
+
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.baseservice import PeerInfo, PeerManager, PeerOrderRing, PeerStatus
+from loopchain.utils import loggers
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class TestPeerManager(unittest.TestCase):
+    dead_peer_port = 7908
+
+    peer_count = 20
+    hung_peer_count = 2
+    dead_peer_count = 3
+    delay = 0.2
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.__origin_probe_timeout = conf.GRPC_TIMEOUT_PEER_PROBE
+        self.__origin_enable_peer_health_tracker = conf.ENABLE_PEER_HEALTH_TRACKER
+        conf.GRPC_TIMEOUT_PEER_PROBE = 1
+
+        leader_service = test_util.StandInPeerService("BlockGenerate", delay=self.delay)
+        peer_service = test_util.StandInPeerService("Vote", delay=self.delay)
+        hung_peer_service = test_util.StandInPeerService("Vote", delay=conf.GRPC_TIMEOUT_PEER_PROBE * 3)
+        self.peer_services = [leader_service, peer_service, hung_peer_service]
+        for service in self.peer_services:
+            service.start(max_workers=self.peer_count + 10)
+
+        self.peer_manager = PeerManager(conf.LOOPCHAIN_DEFAULT_CHANNEL)
+        ports = [leader_service.port] + [peer_service.port] * self.peer_count \
+            + [hung_peer_service.port] * self.hung_peer_count + [self.dead_peer_port] * self.dead_peer_count
+        for index, port in enumerate(ports):
+            self.peer_manager.add_peer(
+                PeerInfo(f"peer-{index}", conf.ALL_GROUP_ID, f"{conf.IP_LOCAL}:{port}", order=index + 1))
+
+    def tearDown(self):
+        conf.GRPC_TIMEOUT_PEER_PROBE = self.__origin_probe_timeout
+        conf.ENABLE_PEER_HEALTH_TRACKER = self.__origin_enable_peer_health_tracker
+        for service in self.peer_services:
+            service.stop()
+
+    def test_check_peer_status_concurrently(self):
+        # WHEN
+        delete_peer_list = self.peer_manager.check_peer_status()
+
+        # THEN
+        heartbeat_status = self.peer_manager.get_heartbeat_status()
+        self.assertEqual(delete_peer_list, [])
+        self.assertEqual(heartbeat_status["count"], 1)
+        self.assertEqual(heartbeat_status["peer_count"], self.peer_manager.get_peer_count())
+        self.assertEqual(heartbeat_status["fail_count"], self.hung_peer_count + self.dead_peer_count)
+        # the peers of a stand-in service are probed at the same time.
+        self.assertGreater(self.peer_services[1].max_in_flight_count, 1)
+        self.assertGreater(self.peer_services[2].max_in_flight_count, 1)
+
+    def test_peer_order_ring(self):
+        # GIVEN
+        peer_order_ring = PeerOrderRing([3, 1, 5])
+
+        # WHEN
+        peer_order_ring.add(4)
+        peer_order_ring.add(2)
+        peer_order_ring.add(6)
+
+        # THEN
+        self.assertEqual([peer_order_ring.next(order) for order in range(1, 7)], [2, 3, 4, 5, 6, 1])
+
+        # WHEN
+        peer_order_ring.remove(6)
+        peer_order_ring.remove(1)
+        peer_order_ring.add(7)
+
+        # THEN
+        self.assertEqual(len(peer_order_ring), 5)
+        self.assertNotIn(1, peer_order_ring)
+        self.assertEqual([peer_order_ring.next(order) for order in (2, 5, 7)], [3, 7, 2])
+
+    def __check_health_of_connected_peers(self):
+        """the last peer which responds is peer-20, hung and dead peers are after it."""
+        for peer_id in self.peer_manager.peer_list[conf.ALL_GROUP_ID]:
+            self.peer_manager.update_peer_status(peer_id, peer_status=PeerStatus.connected)
+        self.peer_manager.check_peer_health()
+
+    def test_next_alive_peer_without_calls(self):
+        # GIVEN
+        self.__check_health_of_connected_peers()
+        request_counts = [service.request_count for service in self.peer_services]
+
+        # WHEN
+        next_peer = self.peer_manager.get_next_leader_peer(current_leader_peer_id="peer-20", is_only_alive=False)
+        next_alive_peer = self.peer_manager.get_next_leader_peer(current_leader_peer_id="peer-20",
+                                                                 is_only_alive=True)
+
+        # THEN
+        self.assertEqual(next_peer.peer_id, "peer-21")
+        self.assertEqual(next_alive_peer.peer_id, "peer-0")
+        self.assertEqual([service.request_count for service in self.peer_services], request_counts)
+
+    def test_next_leader_skips_dead_peers_with_health_tracker(self):
+        # GIVEN
+        self.__check_health_of_connected_peers()
+
+        # WHEN
+        conf.ENABLE_PEER_HEALTH_TRACKER = False
+        next_peer = self.peer_manager.get_next_leader_peer(current_leader_peer_id="peer-20")
+        conf.ENABLE_PEER_HEALTH_TRACKER = True
+        next_alive_peer = self.peer_manager.get_next_leader_peer(current_leader_peer_id="peer-20")
+
+        # THEN
+        self.assertEqual(next_peer.peer_id, "peer-21")
+        self.assertEqual(next_alive_peer.peer_id, "peer-0")
+
+
+if __name__ == '__main__':
+    unittest.main()
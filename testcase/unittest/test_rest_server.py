@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test the REST server of a peer with a stand-in peer service"""
+
+import asyncio
+import unittest
+
+import aiohttp
+from sanic import Sanic
+
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.rest_server import PeerServiceStub
+from loopchain.rest_server.rest_server import Status
+from loopchain.utils import loggers
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class TestRestServer(unittest.TestCase):
+    request_count = 100
+    # both sides of the connections are in this process, so they are limited under the default limit of open files.
+    connection_limit = 400
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+
+        # It answers GetStatus after a delay, as a channel busy with other requests does.
+        self.peer_service = test_util.StandInPeerService(block_height=1, delay=0.05)
+        self.peer_service.start(max_workers=100)
+
+        PeerServiceStub().set_stub_port(self.peer_service.port, conf.IP_LOCAL)
+        self.api_port = test_util.get_free_port()
+
+        self.app = Sanic(__name__)
+        self.app.add_route(Status.as_view(), '/api/v1/status/peer')
+
+    def tearDown(self):
+        self.peer_service.stop()
+
+    async def __request_status(self, session: aiohttp.ClientSession):
+        async with session.get(f"http://{conf.IP_LOCAL}:{self.api_port}/api/v1/status/peer") as response:
+            return await response.json()
+
+    async def __run_parallel_requests(self):
+        server = await self.app.create_server(host=conf.IP_LOCAL, port=self.api_port)
+        try:
+            connector = aiohttp.TCPConnector(limit=self.connection_limit)
+            async with aiohttp.ClientSession(connector=connector) as session:
+                return await asyncio.gather(*[self.__request_status(session) for _ in range(self.request_count)])
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    def test_parallel_status_requests(self):
+        """Fire parallel /api/v1/status/peer requests. The handler must not block the event loop while it waits,
+        so the requests reach the peer service at the same time.
+        """
+        # WHEN
+        results = asyncio.get_event_loop().run_until_complete(self.__run_parallel_requests())
+
+        # THEN
+        self.assertEqual(len(results), self.request_count)
+        self.assertTrue(all(result["block_height"] == 1 for result in results))
+        self.assertGreater(self.peer_service.max_in_flight_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
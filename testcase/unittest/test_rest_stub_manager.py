@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test RestStubManager with a stand-in REST server of a node"""
+
+import asyncio
+import threading
+import time
+import unittest
+
+from sanic import Sanic, response
+
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.baseservice import RestStubManager
+from loopchain.utils import loggers
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+def create_stand_in_app(keep_alive: bool, max_height: int):
+    app = Sanic(f"stand_in_{keep_alive}")
+    app.config.KEEP_ALIVE = keep_alive
+
+    async def node_dispatch(request):
+        height = int(request.json["params"]["height"])
+        block = {
+            "height": height,
+            "confirmed_transaction_list": [{"txHash": f"{i:064x}", "from": f"hx{i:040x}"} for i in range(50)]
+        }
+        return response.json({"jsonrpc": "2.0", "result": {"block": block}, "id": request.json["id"]})
+
+    async def status(request):
+        return response.json({"block_height": max_height})
+
+    app.add_route(node_dispatch, '/api/node', methods=['POST'])
+    app.add_route(status, '/api/v1/status/peer/')
+    return app
+
+
+class StandInServer:
+    def __init__(self, app, port):
+        self.__app = app
+        self.__port = port
+        self.__loop = asyncio.new_event_loop()
+        self.__thread = threading.Thread(target=self.__run)
+
+    def __run(self):
+        asyncio.set_event_loop(self.__loop)
+        server = self.__loop.run_until_complete(self.__app.create_server(host=conf.IP_LOCAL, port=self.__port))
+        self.__loop.run_forever()
+        server.close()
+        self.__loop.run_until_complete(server.wait_closed())
+
+    def start(self):
+        self.__thread.start()
+        time.sleep(0.5)
+
+    def stop(self):
+        self.__loop.call_soon_threadsafe(self.__loop.stop)
+        self.__thread.join()
+
+
+class TestRestStubManager(unittest.TestCase):
+    port = 7903
+    block_count = 10
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+
+    def __sync_blocks(self, keep_alive: bool):
+        """Request blocks as BlockManager.__block_request_by_citizen does."""
+        server = StandInServer(create_stand_in_app(keep_alive, self.block_count), self.port)
+        server.start()
+        try:
+            rest_stub = RestStubManager(f"{conf.IP_LOCAL}:{self.port}", for_rs_target=False)
+            for height in range(self.block_count):
+                block_result = rest_stub.call("GetBlockByHeight", {
+                    'channel': conf.LOOPCHAIN_DEFAULT_CHANNEL,
+                    'height': str(height)
+                })
+                max_height_result = rest_stub.call("Status")
+
+                self.assertEqual(block_result["block"]["height"], height)
+                self.assertEqual(max_height_result.json()["block_height"], self.block_count)
+        finally:
+            server.stop()
+
+    def test_block_sync_with_keep_alive(self):
+        self.__sync_blocks(keep_alive=True)
+
+    def test_block_sync_without_keep_alive(self):
+        """The server without keep-alive closes every connection, so a connection is made for every request."""
+        self.__sync_blocks(keep_alive=False)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test StatusCollector with stand-in MQ stubs"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+import unittest
+from types import SimpleNamespace
+
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.peer.status_collector import StatusCollector
+from loopchain.utils import loggers
+from loopchain.utils.message_queue import StubCollection
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class StandInStub:
+    """Stand-in of a MQ stub which counts broker round-trips"""
+    def __init__(self, delay):
+        self.delay = delay
+        self.block_height = 10
+        self.get_status_count = 0
+        self.queue_info_count = 0
+
+    def async_task(self):
+        return self
+
+    def sync_info(self):
+        return self
+
+    async def get_status(self):
+        self.get_status_count += 1
+        await asyncio.sleep(self.delay)
+        return {
+            "status": "Service is online: 0",
+            "state": "Vote",
+            "peer_type": "0",
+            "peer_id": "peer-0",
+            "block_height": self.block_height,
+            "unconfirmed_block_height": -1,
+            "total_tx": self.block_height,
+            "leader_complaint": 1
+        }
+
+    def queue_info(self):
+        self.queue_info_count += 1
+        time.sleep(self.delay)
+        return SimpleNamespace(method=SimpleNamespace(message_count=0))
+
+
+class TestStatusCollector(unittest.TestCase):
+    delay = 0.01
+    request_count = 1000
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.__origin_collect_interval = conf.STATUS_COLLECT_INTERVAL
+        conf.STATUS_COLLECT_INTERVAL = 60
+
+        self.channel = conf.LOOPCHAIN_DEFAULT_CHANNEL
+        self.stub = StandInStub(self.delay)
+        StubCollection().peer_stub = self.stub
+        StubCollection().channel_stubs[self.channel] = self.stub
+        StubCollection().icon_score_stubs[self.channel] = self.stub
+
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever)
+        self.thread.start()
+        self.status_collector = StatusCollector()
+
+    def tearDown(self):
+        conf.STATUS_COLLECT_INTERVAL = self.__origin_collect_interval
+        StubCollection().peer_stub = None
+        StubCollection().channel_stubs.pop(self.channel, None)
+        StubCollection().icon_score_stubs.pop(self.channel, None)
+
+        self.loop.call_soon_threadsafe(self.status_collector.stop)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+
+    def __start(self):
+        self.loop.call_soon_threadsafe(self.status_collector.start, self.loop, [self.channel])
+        time.sleep(self.delay * 10)
+
+    def test_serve_snapshot_without_mq_calls(self):
+        # GIVEN
+        self.__start()
+        get_status_count, queue_info_count = self.stub.get_status_count, self.stub.queue_info_count
+
+        # WHEN
+        start_time = time.perf_counter()
+        for _ in range(self.request_count):
+            snapshot = self.status_collector.get_snapshot(self.channel)
+        elapsed = (time.perf_counter() - start_time) / self.request_count
+
+        # THEN
+        logging.debug(f"status snapshot : {elapsed * 1000000:.2f}us per request "
+                      f"(3 MQ round-trips per request before, at least {self.delay * 3 * 1000:.0f}ms)")
+        self.assertEqual(self.stub.get_status_count, get_status_count)
+        self.assertEqual(self.stub.queue_info_count, queue_info_count)
+        self.assertEqual(json.loads(snapshot.reply.status)["mq"]["channel"]["message_count"], 0)
+        self.assertEqual(snapshot.reply.block_height, self.stub.block_height)
+
+    def test_refresh_on_update_status(self):
+        # GIVEN
+        self.__start()
+        get_status_count = self.stub.get_status_count
+
+        # WHEN a block is added
+        self.stub.block_height += 1
+        self.loop.call_soon_threadsafe(self.status_collector.update_status, self.channel,
+                                       {"block_height": self.stub.block_height})
+
+        # THEN
+        time.sleep(self.delay * 10)
+        snapshot = self.status_collector.get_snapshot(self.channel)
+        self.assertEqual(snapshot.reply.block_height, self.stub.block_height)
+        self.assertEqual(self.stub.get_status_count, get_status_count + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
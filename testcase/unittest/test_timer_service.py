@@ -161,6 +161,37 @@ class TestTimerService(unittest.TestCase):
 
         timer_service.stop()
 
+    def test_loop_lag(self):
+        """Lags of the loop are measured on the time of the loop. The clock of the loop is stubbed here."""
+        # GIVEN
+        timer_service = TimerService()
+        loop = timer_service.get_event_loop()
+        clock = {"now": 100.0}
+        loop.time = lambda: clock["now"]
+
+        origin_interval = conf.TIMER_LOOP_LAG_INTERVAL
+        conf.TIMER_LOOP_LAG_INTERVAL = 0  # asyncio.sleep(0) yields without a timer of the loop.
+        lags = [0.2, conf.TIMER_LOOP_LAG_WARNING + 0.5, 0.1]
+
+        # WHEN
+        measure_loop_lag = timer_service._TimerService__measure_loop_lag()
+        try:
+            measure_loop_lag.send(None)
+            for lag in lags:
+                clock["now"] += lag
+                measure_loop_lag.send(None)
+        finally:
+            measure_loop_lag.close()
+            conf.TIMER_LOOP_LAG_INTERVAL = origin_interval
+            loop.close()
+
+        # THEN
+        loop_lag = timer_service.get_loop_lag()
+        logging.debug(f"loop lag : {loop_lag}")
+        self.assertAlmostEqual(loop_lag["last_seconds"], lags[-1])
+        self.assertAlmostEqual(loop_lag["max_seconds"], max(lags))
+        self.assertAlmostEqual(loop_lag["avg_seconds"], sum(lags) / len(lags))
+        self.assertEqual(loop_lag["warning_count"], 1)
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test TransactionBatchVerifier"""
+
+import dataclasses
+import unittest
+
+from secp256k1 import PrivateKey
+
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.blockchain import Address, TransactionBuilder, TransactionBatchVerifier, TransactionVersioner
+from loopchain.utils import loggers
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class TestTransactionBatchVerifier(unittest.TestCase):
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.tx_versioner = TransactionVersioner()
+        self.private_key = PrivateKey()
+        self.__origin_tx_batch_verify_workers = conf.TX_BATCH_VERIFY_WORKERS
+        conf.TX_BATCH_VERIFY_WORKERS = 2
+
+    def tearDown(self):
+        TransactionBatchVerifier.shutdown()
+        conf.TX_BATCH_VERIFY_WORKERS = self.__origin_tx_batch_verify_workers
+
+    def __create_txs(self, count):
+        txs = []
+        for i in range(count):
+            tx_builder = TransactionBuilder.new("0x3", self.tx_versioner)
+            tx_builder.private_key = self.private_key
+            tx_builder.to_address = Address.fromhex_address("hx3f376559204079671b6a8df481c976e7d51b3c7c")
+            tx_builder.value = i
+            tx_builder.step_limit = 100000000
+            tx_builder.nid = 3
+            txs.append(tx_builder.build())
+        return txs
+
+    def test_verify_returns_result_of_each_tx(self):
+        # GIVEN
+        txs = self.__create_txs(conf.TX_BATCH_VERIFY_MIN_SIZE * 2)
+        txs[3] = dataclasses.replace(txs[3], signature=txs[4].signature)
+
+        # WHEN
+        results = TransactionBatchVerifier(self.tx_versioner).verify(txs)
+
+        # THEN
+        self.assertIsNotNone(TransactionBatchVerifier._executor)
+        self.assertEqual(len(results), len(txs))
+        self.assertIsInstance(results[3], RuntimeError)
+        self.assertTrue(all(result is None for index, result in enumerate(results) if index != 3))
+
+    def test_verify_small_batch_in_calling_process(self):
+        # GIVEN
+        txs = self.__create_txs(2)
+
+        # WHEN
+        results = TransactionBatchVerifier(self.tx_versioner).verify_loosely(txs)
+
+        # THEN
+        self.assertEqual(results, [None, None])
+        self.assertIsNone(TransactionBatchVerifier._executor)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test TransactionPool"""
+
+import time
+import unittest
+
+import testcase.unittest.test_util as test_util
+from loopchain.baseservice.transaction_pool import TransactionPool
+from loopchain.blockchain import TransactionStatusInQueue
+from loopchain.utils import loggers
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class TestTransactionPool(unittest.TestCase):
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+
+    def tearDown(self):
+        pass
+
+    @staticmethod
+    def __make_pool(pool_class, size):
+        pool = pool_class(max_age_seconds=60, default_item_status=TransactionStatusInQueue.normal)
+        for i in range(size):
+            pool[f"tx_{i}"] = f"value_{i}"
+        return pool
+
+    def test_get_item_in_status_is_fifo(self):
+        # GIVEN
+        pool = self.__make_pool(TransactionPool, 10)
+
+        # WHEN
+        items = [pool.get_item_in_status(TransactionStatusInQueue.normal, TransactionStatusInQueue.added_to_block)
+                 for _ in range(11)]
+
+        # THEN
+        self.assertEqual(items[:10], [f"value_{i}" for i in range(10)])
+        self.assertIsNone(items[10])
+        self.assertEqual(len(pool), 10)
+        self.assertTrue(pool.is_empty_in_status(TransactionStatusInQueue.normal))
+        self.assertEqual(pool.count_in_status(TransactionStatusInQueue.added_to_block), 10)
+
+    def test_set_item_status(self):
+        # GIVEN
+        pool = self.__make_pool(TransactionPool, 10)
+
+        # WHEN
+        pool.set_item_status("tx_0", TransactionStatusInQueue.precommited_to_block)
+
+        # THEN
+        self.assertEqual(pool.get_item_status("tx_0"), TransactionStatusInQueue.precommited_to_block)
+        self.assertEqual(
+            pool.get_item_in_status(TransactionStatusInQueue.normal, TransactionStatusInQueue.normal), "value_1")
+        self.assertEqual(pool.pop_item_in_status(TransactionStatusInQueue.precommited_to_block).value, "value_0")
+        self.assertNotIn("tx_0", pool)
+        self.assertEqual(len(pool), 9)
+
+    def test_pop_removes_from_status_index(self):
+        # GIVEN
+        pool = self.__make_pool(TransactionPool, 10)
+
+        # WHEN
+        for i in range(5):
+            pool.pop(f"tx_{i}")
+        pool.pop("tx_unknown", None)
+
+        # THEN
+        self.assertEqual(len(pool), 5)
+        self.assertEqual(pool.count_in_status(TransactionStatusInQueue.normal), 5)
+        self.assertEqual(
+            pool.get_item_in_status(TransactionStatusInQueue.normal, TransactionStatusInQueue.normal), "value_5")
+
+    def test_set_again_renews_item(self):
+        # GIVEN
+        pool = self.__make_pool(TransactionPool, 3)
+        pool.set_item_status("tx_0", TransactionStatusInQueue.added_to_block)
+
+        # WHEN
+        pool["tx_0"] = "renewed"
+
+        # THEN
+        self.assertEqual(list(pool), ["tx_1", "tx_2", "tx_0"])
+        self.assertEqual(pool.get_item_status("tx_0"), TransactionStatusInQueue.normal)
+        self.assertEqual(pool.count_in_status(TransactionStatusInQueue.added_to_block), 0)
+
+    def test_expire(self):
+        # GIVEN
+        pool = TransactionPool(max_age_seconds=1, default_item_status=TransactionStatusInQueue.normal)
+        for i in range(10):
+            pool[i] = f"value_{i}"
+        pool.set_item_status(3, TransactionStatusInQueue.added_to_block)
+
+        # WHEN
+        time.sleep(2)
+        pool["new"] = "new"
+
+        # THEN
+        self.assertEqual(len(pool), 1)
+        self.assertEqual(pool.count_in_status(TransactionStatusInQueue.normal), 1)
+        self.assertTrue(pool.is_empty_in_status(TransactionStatusInQueue.added_to_block))
+
+
+if __name__ == '__main__':
+    unittest.main()
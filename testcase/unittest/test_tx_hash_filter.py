@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2018 ICON Foundation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test TxHashFilter"""
+
+import os
+import unittest
+
+import leveldb
+from secp256k1 import PrivateKey
+
+import testcase.unittest.test_util as test_util
+from loopchain import configure as conf
+from loopchain.blockchain import BlockRecord, BlockSerializer, Hash32, TransactionVersioner, TxHashFilter
+from loopchain.blockchain.blockchain import BlockChain
+from loopchain.utils import loggers
+
+loggers.set_preset_type(loggers.PresetType.develop)
+loggers.update_preset()
+
+
+class TestTxHashFilter(unittest.TestCase):
+    capacity = 1000
+    error_rate = 0.01
+
+    def setUp(self):
+        test_util.print_testname(self._testMethodName)
+        self.tx_hash_filter = TxHashFilter(self.capacity, self.error_rate)
+
+    def tearDown(self):
+        pass
+
+    @staticmethod
+    def __new_tx_hashes(count):
+        return [Hash32(os.urandom(32)) for _ in range(count)]
+
+    def test_grow_without_false_negatives(self):
+        # GIVEN
+        tx_hashes = self.__new_tx_hashes(self.capacity * 10)
+        new_tx_hashes = self.__new_tx_hashes(100000)
+
+        # WHEN
+        added = [self.tx_hash_filter.add(tx_hash) for tx_hash in tx_hashes]
+        false_positive_count = sum(1 for tx_hash in new_tx_hashes if tx_hash in self.tx_hash_filter)
+
+        # THEN
+        status = self.tx_hash_filter.get_status()
+        self.assertGreater(status["slices"], 1)
+        self.assertEqual(status["count"], added.count(True))
+        self.assertTrue(all(tx_hash in self.tx_hash_filter for tx_hash in tx_hashes))
+        self.assertFalse(self.tx_hash_filter.add(tx_hashes[0]))
+        # the measured rate has a margin for the sampling error.
+        self.assertLess(false_positive_count / len(new_tx_hashes), self.error_rate * 1.2)
+        self.assertLess(status["expected_false_positive_rate"], self.error_rate)
+
+    def test_status_of_checks(self):
+        # GIVEN
+        tx_hashes = self.__new_tx_hashes(100)
+        for tx_hash in tx_hashes:
+            self.tx_hash_filter.add(tx_hash)
+
+        # WHEN
+        hits = [self.tx_hash_filter.check(tx_hash) for tx_hash in tx_hashes + self.__new_tx_hashes(100)]
+        self.tx_hash_filter.count_false_positive()
+
+        # THEN
+        status = self.tx_hash_filter.get_status()
+        self.assertEqual(status["checks"], 200)
+        self.assertEqual(status["hits"], hits.count(True))
+        self.assertEqual(status["false_positives"], 1)
+        self.assertEqual(status["false_positive_rate"], 1 / (200 - hits.count(True) + 1))
+
+    def test_dumps_and_loads(self):
+        # GIVEN
+        tx_hashes = self.__new_tx_hashes(self.capacity * 3)
+        for tx_hash in tx_hashes:
+            self.tx_hash_filter.add(tx_hash)
+        self.tx_hash_filter.height = 10
+
+        # WHEN
+        dumped = self.tx_hash_filter.dumps()
+        tx_hash_filter = TxHashFilter.loads(dumped, self.capacity, self.error_rate)
+
+        # THEN
+        self.assertEqual(tx_hash_filter.height, 10)
+        self.assertEqual(tx_hash_filter.count, self.tx_hash_filter.count)
+        self.assertEqual(tx_hash_filter.dumps(), dumped)
+        self.assertTrue(all(tx_hash in tx_hash_filter for tx_hash in tx_hashes))
+
+        self.assertRaises(ValueError, TxHashFilter.loads, dumped, self.capacity * 2, self.error_rate)
+        self.assertRaises(ValueError, TxHashFilter.loads, dumped[:-1], self.capacity, self.error_rate)
+        self.assertRaises(ValueError, TxHashFilter.loads, b"", self.capacity, self.error_rate)
+
+    def test_load_from_block_db(self):
+        """A chain of TX_HASH_FILTER_SAVE_INTERVAL blocks or more uses only a saved filter."""
+        # GIVEN a block DB with the last block at height 1
+        db_name = 'tx_hash_filter_db'
+        db = test_util.make_level_db(db_name)
+        block = test_util.create_block(PrivateKey(), 1)
+        block_hash_encoded = block.header.hash.hex().encode(encoding='UTF-8')
+        block_serializer = BlockSerializer.new(block.header.version, TransactionVersioner())
+        db.Put(block_hash_encoded, BlockRecord.dumps(block_serializer.serialize(block)))
+        db.Put(BlockChain.LAST_BLOCK_KEY, block_hash_encoded)
+
+        origin_tx_hash_filter = conf.TX_HASH_FILTER
+        origin_save_interval = conf.TX_HASH_FILTER_SAVE_INTERVAL
+        conf.TX_HASH_FILTER = True
+        conf.TX_HASH_FILTER_SAVE_INTERVAL = 1
+        try:
+            # WHEN there is no filter saved
+            chain = BlockChain(db)
+            chain.init_block_chain()
+            status_without_filter = chain.get_tx_hash_filter_status()
+
+            # WHEN a filter is saved by tools/tx_hash_filter_rebuilder
+            tx_hash_filter = TxHashFilter(conf.TX_HASH_FILTER_CAPACITY, conf.TX_HASH_FILTER_ERROR_RATE)
+            tx_hash_filter.add(Hash32(os.urandom(32)))
+            tx_hash_filter.height = 1
+            db.Put(BlockChain.TX_HASH_FILTER_KEY, tx_hash_filter.dumps())
+            chain.init_block_chain()
+            status_with_filter = chain.get_tx_hash_filter_status()
+        finally:
+            conf.TX_HASH_FILTER = origin_tx_hash_filter
+            conf.TX_HASH_FILTER_SAVE_INTERVAL = origin_save_interval
+            chain = db = None
+            leveldb.DestroyDB(db_name)
+            os.system(f"rm -rf ./{db_name}*")
+
+        # THEN
+        self.assertEqual(status_without_filter, {})
+        self.assertEqual(status_with_filter["count"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
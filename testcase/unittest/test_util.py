@@ -23,17 +23,24 @@ import logging
 import multiprocessing
 import os
 import random
+import socket
+import threading
 import time
+from concurrent import futures
 from sys import platform
 
+import grpc
+
 import loopchain
 import loopchain.utils as util
 from loopchain import configure as conf
 from loopchain.baseservice import ObjectManager, StubManager, Block, CommonSubprocess
-from loopchain.blockchain import Transaction, TransactionBuilder, TransactionVersioner, Address
+from loopchain.baseservice.tx_item_helper import unzip_tx_list_message
+from loopchain.blockchain import (Transaction, TransactionBuilder, TransactionVersioner, Address, BlockBuilder,
+                                  Hash32)
 from loopchain.components import SingletonMetaClass
 from loopchain.peer import PeerService, Signer
-from loopchain.protos import loopchain_pb2, loopchain_pb2_grpc
+from loopchain.protos import loopchain_pb2, loopchain_pb2_grpc, message_code
 from loopchain.radiostation import RadioStationService
 from loopchain.utils import loggers
 from loopchain.utils.message_queue import StubCollection
@@ -173,6 +180,13 @@ def print_testname(testname):
     print("======================================================================")
 
 
+def get_free_port():
+    """Get a port which is free now, for a server whose port is needed before it starts."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((conf.IP_LOCAL, 0))
+        return sock.getsockname()[1]
+
+
 def make_level_db(db_name=""):
     db_default_path = './' + (db_name, "db_test")[db_name == ""]
     db_path = db_default_path
@@ -247,6 +261,33 @@ def create_basic_tx(peer_auth: Signer) -> Transaction:
     return tx_builder.build()
 
 
+def create_block(private_key, tx_count, tx_versioner=None, block_version="0.1a"):
+    """create a block at height 1 with txs of version 0x3
+
+    :param private_key: PrivateKey of secp256k1 to sign the block and txs
+    :param tx_count: the number of txs in the block
+    :param tx_versioner:
+    :param block_version: version of the block, 0.1a by default
+    :return: block
+    """
+    tx_versioner = tx_versioner or TransactionVersioner()
+    block_builder = BlockBuilder.new(block_version, tx_versioner)
+    block_builder.height = 1
+    block_builder.prev_hash = Hash32(os.urandom(Hash32.size))
+    block_builder.peer_private_key = private_key
+
+    for i in range(tx_count):
+        tx_builder = TransactionBuilder.new("0x3", tx_versioner)
+        tx_builder.private_key = private_key
+        tx_builder.to_address = Address.fromhex_address("hx3f376559204079671b6a8df481c976e7d51b3c7c")
+        tx_builder.value = i
+        tx_builder.step_limit = 100000000
+        tx_builder.nid = 3
+        tx = tx_builder.build()
+        block_builder.transactions[tx.hash] = tx
+    return block_builder.build()
+
+
 def create_default_peer_auth() -> Signer:
     channel = list(conf.CHANNEL_OPTION)[0]
     peer_auth = Signer(channel)
@@ -282,6 +323,105 @@ def add_genesis_block():
     return block
 
 
+class StandInPeerService(loopchain_pb2_grpc.PeerServiceServicer):
+    """A gRPC peer service in the test process. It answers after a delay, as a busy peer does,
+    and counts the requests in flight. It keeps the tx hashes of each AddTxList.
+    It serves blocks as PeerOuterService does, without the MQ hop.
+    """
+
+    def __init__(self, state="Vote", block_height=10, delay=0.0, blocks=None, block_records=None):
+        """
+        :param blocks: blocks from height 0 for BlockSync
+        :param block_records: block DB records of the blocks for BlockStreamSync
+        """
+        self.state = state
+        self.block_height = block_height
+        self.delay = delay
+        self.blocks = blocks or []
+        self.block_records = block_records or []
+        self.tx_lists = []
+        self.zipped_count = 0
+        self.request_count = 0
+        self.in_flight_count = 0
+        self.max_in_flight_count = 0  # requests which are being answered at the same time
+        self.condition = threading.Condition()
+        self.grpc_server = None
+        self.port = None
+        self.target = None
+
+    def start(self, port=0, max_workers=10, options=None):
+        """serve at the port, or a free port if it is 0.
+
+        :return: target of the service
+        """
+        self.grpc_server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers), options=options)
+        loopchain_pb2_grpc.add_PeerServiceServicer_to_server(self, self.grpc_server)
+        self.port = self.grpc_server.add_insecure_port(f"{conf.IP_LOCAL}:{port}")
+        self.grpc_server.start()
+        self.target = f"{conf.IP_LOCAL}:{self.port}"
+        return self.target
+
+    def stop(self):
+        self.grpc_server.stop(0)
+
+    def __wait_delay(self):
+        with self.condition:
+            self.request_count += 1
+            self.in_flight_count += 1
+            self.max_in_flight_count = max(self.max_in_flight_count, self.in_flight_count)
+        try:
+            time.sleep(self.delay)
+        finally:
+            with self.condition:
+                self.in_flight_count -= 1
+
+    def Request(self, request, context):
+        self.__wait_delay()
+        return loopchain_pb2.Message(code=message_code.Response.success,
+                                     meta=json.dumps({"state": self.state, "block_height": self.block_height}))
+
+    def GetStatus(self, request, context):
+        self.__wait_delay()
+        return loopchain_pb2.StatusReply(status=json.dumps({"status": "Service is online: 0",
+                                                            "state": self.state,
+                                                            "block_height": self.block_height}),
+                                         block_height=self.block_height,
+                                         total_tx=0)
+
+    def AddTxList(self, request, context):
+        with self.condition:
+            if request.zipped_tx_list:
+                self.zipped_count += 1
+            self.tx_lists.append([json.loads(tx.tx_json)["txHash"] for tx in unzip_tx_list_message(request).tx_list])
+            self.condition.notify_all()
+        return loopchain_pb2.CommonReply(response_code=message_code.Response.success, message="success")
+
+    def BlockSync(self, request, context):
+        block = self.blocks[request.block_height]
+        return loopchain_pb2.BlockSyncReply(
+            response_code=message_code.Response.success,
+            block_height=block.header.height,
+            max_block_height=len(self.blocks) - 1,
+            block=util.block_dumps(block))
+
+    def BlockStreamSync(self, request, context):
+        block_records = self.block_records[request.start_height:request.start_height + request.count]
+        if not block_records:
+            yield loopchain_pb2.BlockStreamReply(
+                response_code=message_code.Response.fail_wrong_block_height,
+                max_block_height=len(self.blocks) - 1)
+
+        for block_record in block_records:
+            yield loopchain_pb2.BlockStreamReply(
+                response_code=message_code.Response.success,
+                max_block_height=len(self.blocks) - 1,
+                block=block_record)
+
+    def wait_tx_count(self, count, timeout=30):
+        with self.condition:
+            self.condition.wait_for(lambda: sum(len(tx_list) for tx_list in self.tx_lists) >= count, timeout)
+
+
 class TestServerManager(metaclass=SingletonMetaClass):
     """
 
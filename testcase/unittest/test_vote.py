@@ -16,12 +16,13 @@
 # limitations under the License.
 """Test Vote Object"""
 import logging
+import pickle
 import unittest
 
 import testcase.unittest.test_util as test_util
 from loopchain import configure as conf
 from loopchain.baseservice import PeerManager, PeerInfo
-from loopchain.blockchain import Vote
+from loopchain.blockchain import Vote, VoteType
 from loopchain.protos import loopchain_pb2
 from loopchain.utils import loggers
 
@@ -151,6 +152,68 @@ class TestVote(unittest.TestCase):
         # THEN
         self.assertTrue(vote.is_failed_vote("block_hash", 0.51))
 
+    def __make_audience(self, peer_count, group_count):
+        peer_infos = [self.__make_peer_info(f"peerid-{i}", f"groupid-{i % group_count}") for i in range(peer_count)]
+        return {peer_info.peer_id: peer_info for peer_info in peer_infos}
+
+    def test_tally_on_revote(self):
+        # GIVEN
+        audience = self.__make_audience(4, 1)
+        vote = Vote("block_hash", audience)
+        vote.add_vote("groupid-0", "peerid-0", True)
+        vote.add_vote("groupid-0", "peerid-1", True)
+        vote.add_vote("groupid-0", "peerid-2", True)
+        self.assertTrue(vote.get_result("block_hash", 0.51))
+
+        # WHEN peers change their votes
+        vote.add_vote("groupid-0", "peerid-1", False)
+        vote.add_vote("groupid-0", "peerid-2", False)
+
+        # THEN
+        self.assertEqual(vote.get_result_detail("block_hash", 0.51), (False, 0, 0, 1, 1, 4, 0.51))
+
+        vote.add_vote("groupid-0", "peerid-3", False)
+        self.assertEqual(vote.get_result_detail("block_hash", 0.51), (False, 0, 1, 1, 1, 4, 0.51))
+        self.assertTrue(vote.is_failed_vote("block_hash", 0.51))
+
+    def test_conflicting_results(self):
+        # GIVEN a leader complain vote of 10 peers
+        audience = self.__make_audience(10, 1)
+        vote = Vote("block_hash", audience, vote_type=VoteType.leader_complain)
+
+        # WHEN a peer votes another leader
+        vote.add_vote("groupid-0", "peerid-0", "new_leader_b")
+        for i in range(1, 10):
+            vote.add_vote("groupid-0", f"peerid-{i}", "new_leader_a")
+
+        # THEN agreed peers must vote the same result.
+        self.assertEqual(vote.get_result_detail("block_hash", 0.67), (False, 1, 1, 1, 10, 10, 0.67))
+
+        # WHEN the peer votes the same leader again
+        vote.add_vote("groupid-0", "peerid-0", "new_leader_a")
+
+        # THEN
+        self.assertEqual(vote.get_result_detail("block_hash", 0.67), ("new_leader_a", 1, 1, 1, 10, 10, 0.67))
+
+    def test_save_and_load(self):
+        # GIVEN
+        audience = self.__make_audience(10, 2)
+        vote = Vote("block_hash", audience)
+        for i in range(7):
+            vote.add_vote(f"groupid-{i % 2}", f"peerid-{i}", i != 3)
+
+        # WHEN
+        vote_dumped = Vote.save_to(vote)
+        loaded_vote = Vote.load_from(vote_dumped)
+        unpickled_vote = Vote.load_from(pickle.dumps(vote))
+
+        # THEN
+        self.assertEqual(loaded_vote.votes, vote.votes)
+        self.assertEqual(loaded_vote.get_result_detail("block_hash", 0.51), vote.get_result_detail("block_hash", 0.51))
+        self.assertEqual(unpickled_vote.get_result_detail("block_hash", 0.51),
+                         vote.get_result_detail("block_hash", 0.51))
+        self.assertLess(len(vote_dumped), len(pickle.dumps(vote)))
+
 
 if __name__ == '__main__':
     unittest.main()